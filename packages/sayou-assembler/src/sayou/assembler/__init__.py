@@ -1,9 +1,14 @@
-from .builder.graph_builder import GraphBuilder
-from .builder.vector_builder import VectorBuilder
-from .pipeline import AssemblerPipeline
-from .plugins.code_graph_builder import CodeGraphBuilder
-from .plugins.cypher_builder import CypherBuilder
-from .plugins.timeline_builder import TimelineBuilder
+from typing import TYPE_CHECKING
+
+from sayou.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .builder.graph_builder import GraphBuilder
+    from .builder.vector_builder import VectorBuilder
+    from .pipeline import AssemblerPipeline
+    from .plugins.code_graph_builder import CodeGraphBuilder
+    from .plugins.cypher_builder import CypherBuilder
+    from .plugins.timeline_builder import TimelineBuilder
 
 __all__ = [
     "AssemblerPipeline",
@@ -13,3 +18,16 @@ __all__ = [
     "CypherBuilder",
     "TimelineBuilder",
 ]
+
+# Sub-modules (and their heavy dependencies) load on first attribute access.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "GraphBuilder": ".builder.graph_builder",
+        "VectorBuilder": ".builder.vector_builder",
+        "AssemblerPipeline": ".pipeline",
+        "CodeGraphBuilder": ".plugins.code_graph_builder",
+        "CypherBuilder": ".plugins.cypher_builder",
+        "TimelineBuilder": ".plugins.timeline_builder",
+    },
+)
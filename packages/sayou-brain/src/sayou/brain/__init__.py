@@ -1,8 +1,13 @@
-from .pipelines.bypass import BypassPipeline
-from .pipelines.normal import NormalPipeline
-from .pipelines.standard import StandardPipeline
-from .pipelines.structure import StructurePipeline
-from .pipelines.transfer import TransferPipeline
+from typing import TYPE_CHECKING
+
+from sayou.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .pipelines.bypass import BypassPipeline
+    from .pipelines.normal import NormalPipeline
+    from .pipelines.standard import StandardPipeline
+    from .pipelines.structure import StructurePipeline
+    from .pipelines.transfer import TransferPipeline
 
 __all__ = [
     "BypassPipeline",
@@ -11,3 +16,15 @@ __all__ = [
     "NormalPipeline",
     "StandardPipeline",
 ]
+
+# Sub-modules (and their heavy dependencies) load on first attribute access.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BypassPipeline": ".pipelines.bypass",
+        "NormalPipeline": ".pipelines.normal",
+        "StandardPipeline": ".pipelines.standard",
+        "StructurePipeline": ".pipelines.structure",
+        "TransferPipeline": ".pipelines.transfer",
+    },
+)
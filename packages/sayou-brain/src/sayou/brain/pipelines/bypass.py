@@ -2,6 +2,7 @@ from typing import Any, Dict, Iterator
 
 from sayou.connector import ConnectorPipeline
 from sayou.core.decorators import measure_time
+from sayou.core.payload import SpooledPayload
 from sayou.core.schemas import SayouPacket
 from sayou.loader import LoaderPipeline
 
@@ -156,6 +157,11 @@ class BypassPipeline(BaseBrainPipeline):
             except Exception as exc:
                 self._log(f"[Phase 2] Write error on item {i}: {exc}", level="error")
                 stats["failed"] += 1
+            finally:
+                # Spilled payloads are streamed by the writer; drop any temp
+                # file once it is on disk.
+                if isinstance(packet.data, SpooledPayload):
+                    packet.data.close()
 
         self._emit("on_finish", result_data=stats, success=True)
         self._log(f"Bypass complete. {stats}")
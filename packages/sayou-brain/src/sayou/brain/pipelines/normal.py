@@ -4,6 +4,7 @@ from sayou.assembler import AssemblerPipeline
 from sayou.chunking import ChunkingPipeline
 from sayou.connector import ConnectorPipeline
 from sayou.core.decorators import measure_time
+from sayou.core.payload import SpooledPayload
 from sayou.core.schemas import SayouNode, SayouOutput
 from sayou.loader import LoaderPipeline
 from sayou.refinery import RefineryPipeline
@@ -164,6 +165,12 @@ class NormalPipeline(BaseBrainPipeline):
 
             stats["extracted"] += 1
             raw_data = packet.data
+            # The Refinery works on in-memory text and bytes.
+            if isinstance(raw_data, SpooledPayload):
+                try:
+                    raw_data = raw_data.read()
+                finally:
+                    packet.data.close()
 
             # Refinery
             input_doc = self.refinery.run(
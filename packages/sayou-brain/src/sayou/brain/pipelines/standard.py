@@ -4,8 +4,11 @@ from typing import Any, Dict, List
 from sayou.assembler import AssemblerPipeline
 from sayou.chunking import ChunkingPipeline
 from sayou.connector import ConnectorPipeline
+from sayou.core.budget import estimate_size, resolve_budget
 from sayou.core.decorators import measure_time
+from sayou.core.payload import SpooledPayload
 from sayou.core.schemas import SayouNode, SayouOutput
+from sayou.core.tracing import SPAN_ID_KEY, TRACE_ID_KEY, get_tracer
 from sayou.document import DocumentPipeline
 from sayou.loader import LoaderPipeline
 from sayou.refinery import RefineryPipeline
@@ -137,6 +140,20 @@ class StandardPipeline(BaseBrainPipeline):
             strategies: Per-stage strategy overrides (keys: connector, document,
                         refinery, chunking, wrapper, assembler, loader).
         """
+        with get_tracer().start_span(
+            "standard.ingest", source=source, destination=destination or ""
+        ):
+            return self._ingest(source, destination, strategies, **kwargs)
+
+    def _ingest(
+        self,
+        source: str,
+        destination: str = None,
+        strategies: Dict[str, str] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Body of ``ingest()``, executed inside the run-level span."""
+        tracer = get_tracer()
         self._emit("on_start", input_data={"source": source, "type": "standard"})
         strategies = strategies or {}
         stats: Dict[str, Any] = {"processed": 0, "failed": 0, "files_count": 0}
@@ -150,6 +167,11 @@ class StandardPipeline(BaseBrainPipeline):
         run_config = {**self.config._config, **kwargs}
         self._log(f"StandardPipeline: {source} -> {destination}")
 
+        # A byte cap becomes one budget shared by every stage of this run.
+        budget = resolve_budget(run_config.get("memory_budget"), name="standard")
+        if budget is not None:
+            run_config["memory_budget"] = budget
+
         # ── Phase 1: Extract ─────────────────────────────────────────
         self._log("[1/6] Extracting...")
         try:
@@ -180,104 +202,256 @@ class StandardPipeline(BaseBrainPipeline):
             "[2/6] Processing files (Document → Refinery → Chunking → Wrapper)..."
         )
         accumulated_nodes: List[SayouNode] = []
+        node_bytes = 0
+        batches = 0
+
+        # Nodes that fill the budget are assembled and loaded right away when
+        # the destination takes batches; otherwise they stay resident until
+        # the single assembly at the end of the run.
+        flush_nodes = budget is not None and self.loader.supports_incremental(
+            destination, strategies.get("loader", "auto")
+        )
+        over_budget_logged = False
 
-        for packet in packets:
-            stats["files_count"] += 1
+        if budget is not None:
+            # Release each packet's bytes before the connector fetches the next.
+            packets = budget.bounded(packets)
 
-            if not packet.success:
-                self._log(f"Packet failed: {packet.error}", level="warning")
-                stats["failed"] += 1
-                continue
+        for packet in packets:
+            packet_span = tracer.start_span(
+                "packet", parent=self._packet_parent(tracer, packet.meta)
+            )
+            with packet_span:
+                stats["files_count"] += 1
 
-            file_name = "unknown"
-            try:
-                file_name = packet.task.meta.get("filename", "unknown_source")
-                raw_data = packet.data
-            except Exception as exc:
-                self._log(f"Meta extraction error: {exc}", level="error")
-                self._emit("on_error", error=exc)
-                continue
+                if not packet.success:
+                    self._log(f"Packet failed: {packet.error}", level="warning")
+                    stats["failed"] += 1
+                    continue
 
-            # Step 1: Document parsing (binary data only)
-            doc_obj = None
-            if isinstance(raw_data, bytes):
+                file_name = "unknown"
                 try:
-                    doc_obj = self.document.run(
-                        raw_data,
-                        file_name,
-                        strategy=strategies.get("document", "auto"),
-                        **run_config,
-                    )
+                    file_name = packet.task.meta.get("filename", "unknown_source")
+                    raw_data = packet.data
+                    packet_span.set_attribute("file", file_name)
+                    tracer.inject(packet.meta, packet_span)
                 except Exception as exc:
-                    self._log(
-                        f"Document parsing failed for {file_name}: {exc}",
-                        level="debug",
-                    )
+                    self._log(f"Meta extraction error: {exc}", level="error")
+                    self._emit("on_error", error=exc)
+                    continue
+
+                # Content-addressed cache: digest the source once and let
+                # every stage derive its key from it.  The file name is part
+                # of the digest: blocks and chunks carry it as metadata.
+                stage_config = run_config
+                cache = run_config.get("cache")
+                if cache is not None and isinstance(
+                    raw_data, (bytes, str, SpooledPayload)
+                ):
+                    stage_config = {
+                        **run_config,
+                        "cache_digest": cache.digest((file_name, raw_data)),
+                    }
+
+                # Step 1: Document parsing (binary data only)
+                doc_obj = None
+                if isinstance(raw_data, (bytes, SpooledPayload)):
                     try:
-                        raw_data = raw_data.decode("utf-8")
-                    except UnicodeDecodeError:
+                        with tracer.start_span("document.run", file=file_name):
+                            doc_obj = self.document.run(
+                                raw_data,
+                                file_name,
+                                strategy=strategies.get("document", "auto"),
+                                **stage_config,
+                            )
+                    except Exception as exc:
                         self._log(
-                            f"Cannot decode {file_name}. Skipping.", level="error"
+                            f"Document parsing failed for {file_name}: {exc}",
+                            level="debug",
+                        )
+                        try:
+                            raw_data = raw_data.decode("utf-8")
+                        except UnicodeDecodeError:
+                            self._log(
+                                f"Cannot decode {file_name}. Skipping.", level="error"
+                            )
+                            stats["failed"] += 1
+                            continue
+
+                # Spilled payloads are only needed for parsing; release the
+                # mapping / temp file before the remaining stages run.
+                if isinstance(packet.data, SpooledPayload):
+                    packet.data.close()
+
+                # Step 2: Refinery
+                try:
+                    refine_input = doc_obj if doc_obj else raw_data
+                    ref_strat = strategies.get("refinery") or (
+                        "standard_doc" if doc_obj else "auto"
+                    )
+                    with tracer.start_span("refinery.run", file=file_name):
+                        blocks = self.refinery.run(
+                            refine_input, strategy=ref_strat, **stage_config
                         )
-                        stats["failed"] += 1
+                    if not blocks:
+                        self._log(f"Refinery returned empty blocks for {file_name}.")
                         continue
+                except Exception as exc:
+                    self._log(f"Refinery error on {file_name}: {exc}", level="error")
+                    stats["failed"] += 1
+                    self._emit("on_error", error=exc)
+                    continue
 
-            # Step 2: Refinery
-            try:
-                refine_input = doc_obj if doc_obj else raw_data
-                ref_strat = strategies.get("refinery") or (
-                    "standard_doc" if doc_obj else "auto"
-                )
-                blocks = self.refinery.run(
-                    refine_input, strategy=ref_strat, **run_config
-                )
-                if not blocks:
-                    self._log(f"Refinery returned empty blocks for {file_name}.")
+                # Step 3: Chunking
+                try:
+                    with tracer.start_span("chunking.run", file=file_name):
+                        all_chunks = self.chunking.run(
+                            blocks,
+                            strategy=strategies.get("chunking", "auto"),
+                            **stage_config,
+                        )
+                    if not all_chunks:
+                        self._log(f"No chunks generated for {file_name}.")
+                        continue
+                    for chunk in all_chunks:
+                        tracer.inject(chunk.metadata, packet_span)
+                except Exception as exc:
+                    self._log(f"Chunking error on {file_name}: {exc}", level="error")
+                    stats["failed"] += 1
+                    self._emit("on_error", error=exc)
                     continue
-            except Exception as exc:
-                self._log(f"Refinery error on {file_name}: {exc}", level="error")
-                stats["failed"] += 1
-                self._emit("on_error", error=exc)
-                continue
 
-            # Step 3: Chunking
-            try:
-                all_chunks = self.chunking.run(
-                    blocks,
-                    strategy=strategies.get("chunking", "auto"),
-                    **run_config,
-                )
-                if not all_chunks:
-                    self._log(f"No chunks generated for {file_name}.")
+                # Step 4: Wrapper
+                try:
+                    with tracer.start_span("wrapper.run", file=file_name):
+                        wrapper_out = self.wrapper.run(
+                            all_chunks,
+                            strategy=strategies.get("wrapper", "auto"),
+                            **run_config,
+                        )
+                    if wrapper_out and wrapper_out.nodes:
+                        accumulated_nodes.extend(wrapper_out.nodes)
+                        if budget is not None:
+                            added = estimate_size(wrapper_out.nodes)
+                            budget.hold(added)
+                            node_bytes += added
+                        stats["processed"] += 1
+                        self._log(f"Processed: {file_name}")
+                except Exception as exc:
+                    self._log(f"Wrapper error on {file_name}: {exc}", level="error")
+                    stats["failed"] += 1
                     continue
-            except Exception as exc:
-                self._log(f"Chunking error on {file_name}: {exc}", level="error")
-                stats["failed"] += 1
-                self._emit("on_error", error=exc)
-                continue
 
-            # Step 4: Wrapper
-            try:
-                wrapper_out = self.wrapper.run(
-                    all_chunks,
-                    strategy=strategies.get("wrapper", "auto"),
-                    **run_config,
-                )
-                if wrapper_out and wrapper_out.nodes:
-                    accumulated_nodes.extend(wrapper_out.nodes)
-                    stats["processed"] += 1
-                    self._log(f"Processed: {file_name}")
-            except Exception as exc:
-                self._log(f"Wrapper error on {file_name}: {exc}", level="error")
-                stats["failed"] += 1
-                continue
+                if budget is None or node_bytes < budget.max_bytes:
+                    continue
+                if flush_nodes:
+                    self._load_batch(
+                        accumulated_nodes,
+                        source,
+                        destination,
+                        strategies,
+                        run_config,
+                        stats,
+                        append=batches > 0,
+                    )
+                    batches += 1
+                    budget.unhold(node_bytes)
+                    node_bytes = 0
+                    accumulated_nodes = []
+                elif not over_budget_logged:
+                    self._log(
+                        f"Nodes held for assembly exceed the memory budget "
+                        f"({node_bytes} > {budget.max_bytes} bytes); "
+                        f"'{destination}' cannot be loaded in batches.",
+                        level="warning",
+                    )
+                    over_budget_logged = True
 
-        # ── Phase 3: Assemble ─────────────────────────────────────────
-        if not accumulated_nodes:
+        try:
+            self._assemble_and_load(
+                accumulated_nodes,
+                source,
+                destination,
+                strategies,
+                run_config,
+                stats,
+                batches=batches,
+            )
+        finally:
+            if budget is not None:
+                budget.unhold(node_bytes)
+        return stats
+
+    @staticmethod
+    def _packet_parent(tracer: Any, meta: Dict[str, Any]) -> Any:
+        """
+        Parent context carried in ``meta``, if it belongs to the active trace.
+
+        Ids from any other trace were left in a reused meta dict by an
+        earlier run; they are removed so the packet span (and everything
+        injected from it) hangs off the current ingest span instead.
+        """
+        context = tracer.extract(meta)
+        if context is None:
+            return None
+        active = tracer.current_span()
+        if getattr(active, "trace_id", None) == context.trace_id:
+            return context
+        meta.pop(TRACE_ID_KEY, None)
+        meta.pop(SPAN_ID_KEY, None)
+        return None
+
+    def _assemble_and_load(
+        self,
+        accumulated_nodes: List[SayouNode],
+        source: str,
+        destination: str,
+        strategies: Dict[str, str],
+        run_config: Dict[str, Any],
+        stats: Dict[str, Any],
+        batches: int = 0,
+    ) -> None:
+        """
+        Phases 3–4 of ``ingest()``: assemble nodes and load the result.
+
+        ``batches`` is the number of node batches this run already flushed
+        to the destination; the remaining nodes are appended to them.
+        """
+        if not accumulated_nodes and not batches:
             self._log("No nodes collected from any source. Aborting.", level="warning")
             self._emit("on_error", error="No nodes generated.")
-            return stats
+            return
+
+        if accumulated_nodes and not self._load_batch(
+            accumulated_nodes,
+            source,
+            destination,
+            strategies,
+            run_config,
+            stats,
+            append=batches > 0,
+        ):
+            return
+
+        self._emit("on_finish", result_data=stats, success=True)
+        self._log(f"Stats: {stats}")
+
+    def _load_batch(
+        self,
+        accumulated_nodes: List[SayouNode],
+        source: str,
+        destination: str,
+        strategies: Dict[str, str],
+        run_config: Dict[str, Any],
+        stats: Dict[str, Any],
+        append: bool = False,
+    ) -> bool:
+        """Assemble ``accumulated_nodes`` and load them; False if assembly fails."""
+        tracer = get_tracer()
+        if append:
+            run_config = {**run_config, "mode": "a"}
 
+        # ── Phase 3: Assemble ─────────────────────────────────────────
         self._log(
             f"[5/6] Assembling {len(accumulated_nodes)} nodes from "
             f"{stats['processed']} file(s)..."
@@ -288,29 +462,31 @@ class StandardPipeline(BaseBrainPipeline):
                 nodes=accumulated_nodes,
                 metadata={"source_count": stats["processed"], "origin": source},
             )
-            payload = self.assembler.run(
-                final_output,
-                strategy=strategies.get("assembler", "auto"),
-                **run_config,
-            )
+            with tracer.start_span("assembler.run", nodes=len(accumulated_nodes)):
+                payload = self.assembler.run(
+                    final_output,
+                    strategy=strategies.get("assembler", "auto"),
+                    **run_config,
+                )
             if not payload:
                 self._log("Assembler returned empty payload.", level="warning")
         except Exception as exc:
             self._log(f"[5/6] Assembly failed: {exc}", level="error")
             stats["failed"] += 1
             self._emit("on_error", error=exc)
-            return stats
+            return False
 
         # ── Phase 4: Load ─────────────────────────────────────────────
         if payload:
             self._log(f"[6/6] Loading to '{destination}'...")
             try:
-                success = self.loader.run(
-                    payload,
-                    destination,
-                    strategy=strategies.get("loader", "auto"),
-                    **run_config,
-                )
+                with tracer.start_span("loader.run", destination=destination):
+                    success = self.loader.run(
+                        payload,
+                        destination,
+                        strategy=strategies.get("loader", "auto"),
+                        **run_config,
+                    )
                 if success:
                     self._log(f"Pipeline complete. Output: {destination}")
                 else:
@@ -320,7 +496,4 @@ class StandardPipeline(BaseBrainPipeline):
                 self._log(f"[6/6] Load failed: {exc}", level="error")
                 stats["failed"] += 1
                 self._emit("on_error", error=exc)
-
-        self._emit("on_finish", result_data=stats, success=True)
-        self._log(f"Stats: {stats}")
-        return stats
+        return True
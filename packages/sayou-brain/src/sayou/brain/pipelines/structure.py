@@ -5,6 +5,7 @@ from sayou.assembler import AssemblerPipeline
 from sayou.chunking import ChunkingPipeline
 from sayou.connector import ConnectorPipeline
 from sayou.core.decorators import measure_time
+from sayou.core.payload import SpooledPayload
 from sayou.core.schemas import SayouBlock, SayouNode, SayouOutput
 from sayou.loader import LoaderPipeline
 from sayou.wrapper import WrapperPipeline
@@ -230,9 +231,15 @@ class StructurePipeline(BaseBrainPipeline):
         Convert a raw Connector packet into a SayouBlock for the Chunking stage.
 
         Handles dict payloads (GitHub connector), SayouBlock pass-throughs,
-        and raw bytes / strings.  Returns None if the packet cannot be used.
+        and raw bytes / strings / spilled payloads.  Returns None if the
+        packet cannot be used.
         """
         raw = packet.data
+        if isinstance(raw, SpooledPayload):
+            try:
+                raw = raw.read()
+            finally:
+                packet.data.close()
 
         if isinstance(raw, dict):
             content = raw.get("content", "")
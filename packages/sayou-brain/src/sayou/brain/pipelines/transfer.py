@@ -3,6 +3,7 @@ from typing import Any, Dict
 
 from sayou.connector import ConnectorPipeline
 from sayou.core.decorators import measure_time
+from sayou.core.payload import SpooledPayload
 from sayou.loader import LoaderPipeline
 from sayou.refinery import RefineryPipeline
 
@@ -143,6 +144,11 @@ class TransferPipeline(BaseBrainPipeline):
             current_data = packet.data
 
             if use_refinery:
+                # The Refinery works on in-memory text and bytes; without it
+                # a spilled payload goes to the Loader as-is and is streamed.
+                if isinstance(current_data, SpooledPayload):
+                    current_data = current_data.read()
+                    packet.data.close()
                 try:
                     processed = self.refinery.run(
                         current_data,
@@ -179,6 +185,9 @@ class TransferPipeline(BaseBrainPipeline):
             except Exception as exc:
                 self._log(f"[Phase 2] Load error: {exc}", level="error")
                 stats["failed"] += 1
+            finally:
+                if isinstance(packet.data, SpooledPayload):
+                    packet.data.close()
 
         self._emit("on_finish", result_data=stats, success=True)
         self._log(f"Transfer complete. {stats}")
@@ -0,0 +1,99 @@
+"""
+Import-time regression tests.
+
+Each case runs a fresh interpreter with ``python -X importtime`` and parses
+the per-module report, so the numbers are not skewed by modules this test
+session has already imported.
+
+Covers:
+- ``import sayou.brain`` stays cheap and loads no sub-package pipelines.
+- Building pipelines (which registers every parser/fetcher plugin) does
+  not import heavy third-party dependencies; they load on first use.
+"""
+
+import subprocess
+import sys
+from typing import Dict, Set, Tuple
+
+import pytest
+
+# Third-party packages that must only be imported by the component using them.
+HEAVY_MODULES = (
+    "fitz",
+    "pymupdf",
+    "openpyxl",
+    "docx",
+    "pptx",
+    "PIL",
+    "pandas",
+    "numpy",
+    "networkx",
+    "rich",
+    "pyvis",
+    "requests",
+    "bs4",
+)
+
+# Cumulative budget for ``import sayou.brain`` in microseconds.  The eager
+# version took ~750 ms; the lazy one is dominated by pydantic (~25 ms).
+IMPORT_BUDGET_US = 300_000
+
+
+def _run(code: str) -> Tuple[Dict[str, int], Set[str]]:
+    """
+    Run ``code`` in a fresh interpreter under ``-X importtime``.
+
+    Returns:
+        ``(times, modules)``: cumulative µs per module from the importtime
+        report, and every name in ``sys.modules`` at exit.  The latter also
+        catches modules loaded through ``importlib.import_module``, which
+        the importtime report does not list.
+    """
+    script = code + "\nimport sys\nprint('\\n'.join(sys.modules))\n"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    if proc.returncode != 0:
+        pytest.skip(f"sayou stack not importable here: {proc.stderr[-300:]}")
+
+    times: Dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times, set(proc.stdout.split())
+
+
+def _heavy(modules: Set[str]) -> Set[str]:
+    return {name for name in modules if name.split(".")[0] in HEAVY_MODULES}
+
+
+class TestImportTime:
+    def test_package_import_is_lazy(self):
+        times, modules = _run("import sayou.brain")
+
+        assert "sayou.brain.pipelines.standard" not in modules
+        assert not any(name.startswith("sayou.document") for name in modules)
+        assert times["sayou.brain"] < IMPORT_BUDGET_US, times["sayou.brain"]
+
+    def test_pipeline_construction_defers_heavy_dependencies(self):
+        _, modules = _run(
+            "from sayou.brain import StandardPipeline\n"
+            "from sayou.document import DocumentPipeline\n"
+            "StandardPipeline()\n"
+            "DocumentPipeline()\n"
+        )
+
+        assert "sayou.document.parser.pdf_parser" in modules  # plugins registered
+        assert _heavy(modules) == set()
+
+    def test_dependency_loads_on_first_use(self):
+        _, modules = _run(
+            "from sayou.document.parser.pdf_parser import fitz\nfitz.open\n"
+        )
+        assert "fitz" in modules
@@ -7,6 +7,7 @@ Each pipeline is verified for:
 - Callback propagation
 - Empty / failed packet handling
 - Stats dict structure
+- Trace context on chunks (StandardPipeline)
 - process() facade
 """
 
@@ -274,6 +275,81 @@ class TestStandardPipeline:
         stats = self.p.ingest("src://x", destination="./out/")
         assert set(stats.keys()) >= {"processed", "failed", "files_count"}
 
+    def test_trace_ids_injected_into_chunk_metadata(self):
+        from sayou.core.schemas import SayouChunk
+        from sayou.core.tracing import (SPAN_ID_KEY, TRACE_ID_KEY,
+                                        InMemorySpanExporter, Tracer,
+                                        set_tracer)
+
+        packet = _packet(data="plain text")
+        # Stale ids from an earlier run must not become the parent.
+        packet.meta = {TRACE_ID_KEY: "f" * 32, SPAN_ID_KEY: "f" * 16}
+        _setup_connector(self.p, [packet])
+        self.p.refinery.run.return_value = [MagicMock()]
+        chunks = [SayouChunk(content="a"), SayouChunk(content="b")]
+        self.p.chunking.run.return_value = chunks
+        self.p.wrapper.run.return_value = None
+
+        exporter = InMemorySpanExporter()
+        previous = set_tracer(Tracer(exporter))
+        try:
+            self.p.ingest("src://x", destination="./out/")
+        finally:
+            set_tracer(previous)
+
+        spans = {span.name: span for span in exporter.spans}
+        packet_span, ingest_span = spans["packet"], spans["standard.ingest"]
+        assert packet_span.trace_id == ingest_span.trace_id
+        assert packet_span.parent_id == ingest_span.span_id
+        for chunk in chunks:
+            assert chunk.metadata[TRACE_ID_KEY] == packet_span.trace_id
+            assert chunk.metadata[SPAN_ID_KEY] == packet_span.span_id
+
+    def _over_budget_run(self, incremental):
+        from sayou.core.budget import MemoryBudget
+        from sayou.core.schemas import SayouChunk, SayouNode
+
+        budget = MemoryBudget(1000, name="test")
+        _setup_connector(self.p, [_packet(data=f"text {i}") for i in range(5)])
+        self.p.refinery.run.return_value = [MagicMock()]
+        self.p.chunking.run.return_value = [SayouChunk(content="a")]
+        self.p.wrapper.run.side_effect = lambda *a, **k: SayouOutput(
+            nodes=[
+                SayouNode(
+                    node_id=str(id(a)),
+                    node_class="Chunk",
+                    attributes={"schema:text": "x" * 600},
+                )
+            ]
+        )
+        resident = []
+        self.p.assembler.run.side_effect = lambda output, **k: (
+            resident.append(budget.in_use) or [n.node_id for n in output.nodes]
+        )
+        self.p.loader.supports_incremental.return_value = incremental
+        self.p.loader.run.return_value = True
+
+        stats = self.p.ingest("src://x", destination="out.jsonl", memory_budget=budget)
+        assert stats["processed"] == 5
+        assert budget.in_use == 0
+        return resident
+
+    def test_run_over_budget_flushes_nodes_in_batches(self):
+        resident = self._over_budget_run(incremental=True)
+
+        loads = self.p.loader.run.call_args_list
+        assert [len(c.args[0]) for c in loads] == [2, 2, 1]
+        assert [c.kwargs.get("mode") for c in loads] == [None, "a", "a"]
+        # Never more than one packet's nodes past the cap.
+        assert max(resident) < 1000 + 700
+
+    def test_run_over_budget_holds_nodes_without_incremental_writer(self):
+        resident = self._over_budget_run(incremental=False)
+
+        (load,) = self.p.loader.run.call_args_list
+        assert len(load.args[0]) == 5
+        assert resident[0] > 1000
+
 
 # ---------------------------------------------------------------------------
 # BaseBrainPipeline shared behaviour
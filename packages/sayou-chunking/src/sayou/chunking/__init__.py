@@ -1,3 +1,16 @@
-from .pipeline import ChunkingPipeline
+from typing import TYPE_CHECKING
+
+from sayou.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .pipeline import ChunkingPipeline
 
 __all__ = ["ChunkingPipeline"]
+
+# Sub-modules (and their heavy dependencies) load on first attribute access.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ChunkingPipeline": ".pipeline",
+    },
+)
@@ -1,6 +1,6 @@
 import importlib
 import pkgutil
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type
 
 from sayou.core.base_component import BaseComponent
 from sayou.core.decorators import safe_run
@@ -150,7 +150,12 @@ class ChunkingPipeline(BaseComponent):
         Args:
             input_data (Any): Text string, Dict, or SayouBlock list.
             strategy (str): The splitting strategy to use (default: 'auto').
-            **kwargs: Runtime configuration options.
+            **kwargs: Runtime configuration options.  A ``cache`` entry
+                      (``sayou.core.cache.BaseCache``) returns previously
+                      generated chunks for identical input and config;
+                      ``cache_digest`` supplies a precomputed digest, which
+                      must cover the source name as well as the content
+                      (chunks carry it as metadata).
 
         Returns:
             List[SayouChunk]: A list of generated Chunk objects.
@@ -165,6 +170,26 @@ class ChunkingPipeline(BaseComponent):
         run_config = {**self.global_config, **kwargs}
         self._emit("on_start", input_data={"strategy": strategy})
 
+        cache = run_config.get("cache")
+        cache_key = None
+        if cache is not None:
+            cache_key = cache.key(
+                self.component_name,
+                input_data,
+                run_config,
+                digest=run_config.get("cache_digest"),
+                strategy=strategy,
+                source=self._source_name(input_data),
+            )
+            cached = cache.get(cache_key, component=self.component_name)
+            if cached is not None:
+                self._emit(
+                    "on_finish",
+                    result_data={"chunks_count": len(cached)},
+                    success=True,
+                )
+                return cached
+
         # ----------------------------------------------------------------------
         # 2. Flattening & Content Extraction (The Critical Fix)
         # ----------------------------------------------------------------------
@@ -172,58 +197,9 @@ class ChunkingPipeline(BaseComponent):
         raw_items = input_data if isinstance(input_data, list) else [input_data]
         flattened_blocks: List[SayouBlock] = []
 
-        def _extract_and_flatten(item: Any, parent_meta: dict = None):
-            """Helper to recursively extract content and maintain metadata."""
-            if parent_meta is None:
-                parent_meta = {}
-
-            # Case A: List -> Recurse
-            if isinstance(item, list):
-                for sub in item:
-                    _extract_and_flatten(sub, parent_meta)
-                return
-
-            # Case B: Dict -> Extract keys -> Recurse or Create Block
-            if isinstance(item, dict):
-                content = item.get("content")
-                current_meta = parent_meta.copy()
-                current_meta.update(item.get("metadata", {}))
-
-                # Forward top-level "config" into the block's metadata so
-                # splitters can read chunk_size, chunk_overlap, etc.
-                if "config" in item:
-                    existing_config = current_meta.get("config", {})
-                    current_meta["config"] = {**existing_config, **item["config"]}
-
-                doc_type = item.get("type", "text")
-
-                if isinstance(content, list):
-                    _extract_and_flatten(content, current_meta)
-                elif content:
-                    flattened_blocks.append(
-                        SayouBlock(
-                            content=str(content), metadata=current_meta, type=doc_type
-                        )
-                    )
-                return
-
-            # Case C: SayouBlock -> Check content
-            if isinstance(item, SayouBlock):
-                if isinstance(item.content, list):
-                    _extract_and_flatten(item.content, item.metadata)
-                else:
-                    flattened_blocks.append(item)
-                return
-
-            # Case D: String -> Create Block
-            if isinstance(item, str) and item.strip():
-                flattened_blocks.append(
-                    SayouBlock(content=item, metadata=parent_meta, type="text")
-                )
-
         for raw in raw_items:
             try:
-                _extract_and_flatten(raw)
+                flattened_blocks.extend(self._flatten(raw))
             except Exception as e:
                 self._log(f"Error during flattening: {e}", level="error")
 
@@ -237,63 +213,184 @@ class ChunkingPipeline(BaseComponent):
         all_results = []
 
         for i, target_block in enumerate(flattened_blocks):
-            if not target_block.content:
-                continue
+            all_results.extend(self._split_block(i, target_block, strategy, run_config))
 
-            splitter_cls = self._resolve_splitter(target_block, strategy)
+        self._log(f"[PIPELINE] Finished. Generated {len(all_results)} chunks.")
 
-            if not splitter_cls:
-                self._log(
-                    f"No suitable splitter for item {i}. Preserving as-is.",
-                    level="warning",
-                )
-                all_results.append(
-                    SayouChunk(
-                        content=target_block.content,
-                        metadata={**target_block.metadata, "error": "no_splitter"},
-                    )
-                )
-                continue
+        # Fallback chunks from failed splitters are not worth remembering.
+        if cache_key is not None and not any(
+            "error" in chunk.metadata for chunk in all_results
+        ):
+            cache.set(cache_key, all_results)
 
-            self._log(
-                f"Routing Item {i} ({target_block.type}) -> {splitter_cls.component_name}"
-            )
+        self._emit(
+            "on_finish", result_data={"chunks_count": len(all_results)}, success=True
+        )
 
-            splitter = splitter_cls()
+        return all_results
 
-            for cb in self._callbacks:
-                splitter.add_callback(cb)
+    def run_stream(
+        self,
+        input_stream: Iterable[Any],
+        strategy: str = "auto",
+        **kwargs,
+    ) -> Iterator[SayouChunk]:
+        """
+        Chunk a stream of inputs, yielding chunks as each item is split.
 
-            splitter.initialize(**run_config)
+        Pairs with ``DocumentPipeline.run_stream`` and
+        ``BaseNormalizer.normalize_stream``: only the block being split is
+        held in memory.  Items are flattened exactly as in ``run``; stage
+        caching is not applied to streams.
 
-            try:
-                chunks = splitter.split(target_block)
+        Args:
+            input_stream (Iterable[Any]): Blocks, dicts or strings.
+            strategy (str): The splitting strategy to use (default: 'auto').
+            **kwargs: Runtime configuration options.
 
-                if isinstance(chunks, list):
-                    all_results.extend(chunks)
-                else:
-                    all_results.append(chunks)
+        Yields:
+            SayouChunk: Generated chunks in input order.
+        """
+        run_config = {**self.global_config, **kwargs}
+        self._emit("on_start", input_data={"strategy": strategy, "stream": True})
 
+        count = 0
+        index = 0
+        for raw in input_stream:
+            try:
+                blocks = list(self._flatten(raw))
             except Exception as e:
-                self._log(f"Splitter execution failed: {e}", level="error")
-                self._emit("on_error", error=e)
-                all_results.append(
-                    SayouChunk(
-                        content=target_block.content,
-                        metadata={
-                            "error": str(e),
-                            "failed_splitter": splitter.component_name,
-                        },
-                    )
+                self._log(f"Error during flattening: {e}", level="error")
+                continue
+
+            for target_block in blocks:
+                for chunk in self._split_block(
+                    index, target_block, strategy, run_config
+                ):
+                    count += 1
+                    yield chunk
+                index += 1
+
+        self._log(f"[PIPELINE] Stream finished. Generated {count} chunks.")
+        self._emit("on_finish", result_data={"chunks_count": count}, success=True)
+
+    @staticmethod
+    def _source_name(input_data: Any) -> Optional[str]:
+        """``source`` metadata of the first input block, if it has one."""
+        first = input_data[0] if isinstance(input_data, list) else input_data
+        if isinstance(first, SayouBlock):
+            meta = first.metadata
+        elif isinstance(first, dict):
+            meta = first.get("metadata")
+        else:
+            return None
+        return meta.get("source") if isinstance(meta, dict) else None
+
+    def _flatten(self, item: Any, parent_meta: dict = None) -> Iterator[SayouBlock]:
+        """Recursively extract content blocks while maintaining metadata."""
+        if parent_meta is None:
+            parent_meta = {}
+
+        # Case A: List -> Recurse
+        if isinstance(item, list):
+            for sub in item:
+                yield from self._flatten(sub, parent_meta)
+            return
+
+        # Case B: Dict -> Extract keys -> Recurse or Create Block
+        if isinstance(item, dict):
+            content = item.get("content")
+            current_meta = parent_meta.copy()
+            current_meta.update(item.get("metadata", {}))
+
+            # Forward top-level "config" into the block's metadata so
+            # splitters can read chunk_size, chunk_overlap, etc.
+            if "config" in item:
+                existing_config = current_meta.get("config", {})
+                current_meta["config"] = {**existing_config, **item["config"]}
+
+            doc_type = item.get("type", "text")
+
+            if isinstance(content, list):
+                yield from self._flatten(content, current_meta)
+            elif content:
+                yield SayouBlock(
+                    content=str(content), metadata=current_meta, type=doc_type
                 )
+            return
 
-        self._log(f"[PIPELINE] Finished. Generated {len(all_results)} chunks.")
+        # Case C: SayouBlock -> Check content
+        if isinstance(item, SayouBlock):
+            if isinstance(item.content, list):
+                yield from self._flatten(item.content, item.metadata)
+            else:
+                yield item
+            return
 
-        self._emit(
-            "on_finish", result_data={"chunks_count": len(all_results)}, success=True
+        # Case D: String -> Create Block
+        if isinstance(item, str) and item.strip():
+            yield SayouBlock(content=item, metadata=parent_meta, type="text")
+
+    def _split_block(
+        self,
+        i: int,
+        target_block: SayouBlock,
+        strategy: str,
+        run_config: Dict[str, Any],
+    ) -> List[SayouChunk]:
+        """
+        Route a single flattened block to its splitter.
+
+        Failures are logged and the block is preserved as a fallback chunk
+        carrying an ``error`` entry in its metadata.
+        """
+        if not target_block.content:
+            return []
+
+        splitter_cls = self._resolve_splitter(target_block, strategy)
+
+        if not splitter_cls:
+            self._log(
+                f"No suitable splitter for item {i}. Preserving as-is.",
+                level="warning",
+            )
+            return [
+                SayouChunk(
+                    content=target_block.content,
+                    metadata={**target_block.metadata, "error": "no_splitter"},
+                )
+            ]
+
+        self._log(
+            f"Routing Item {i} ({target_block.type}) -> {splitter_cls.component_name}"
         )
 
-        return all_results
+        splitter = splitter_cls()
+
+        for cb in self._callbacks:
+            splitter.add_callback(cb)
+
+        splitter.initialize(**run_config)
+
+        try:
+            chunks = splitter.split(target_block)
+
+            if isinstance(chunks, list):
+                return chunks
+            return [chunks]
+
+        except Exception as e:
+            self._log(f"Splitter execution failed: {e}", level="error")
+            self._emit("on_error", error=e)
+            return [
+                SayouChunk(
+                    content=target_block.content,
+                    metadata={
+                        "error": str(e),
+                        "failed_splitter": splitter.component_name,
+                    },
+                )
+            ]
 
     def _resolve_splitter(
         self,
@@ -8,6 +8,7 @@ Covers:
 - No-splitter preservation path (chunk tagged with error="no_splitter")
 - _callbacks propagation to each instantiated splitter
 - TypeError guard in _register_manual
+- run_stream parity and laziness
 """
 
 import pytest
@@ -182,6 +183,38 @@ class TestEdgeInputs:
         assert len(chunks) >= 2
 
 
+# ---------------------------------------------------------------------------
+# run_stream
+# ---------------------------------------------------------------------------
+
+
+class TestRunStream:
+    ITEMS = [
+        {"content": "Alpha. " * 20, "metadata": {"id": "a"}},
+        SayouBlock(type="text", content="Beta. " * 20, metadata={"id": "b"}),
+        "Gamma",
+    ]
+
+    def test_stream_matches_run(self, pipeline):
+        batch = pipeline.run(list(self.ITEMS), strategy="recursive", chunk_size=40)
+        streamed = list(
+            pipeline.run_stream(iter(self.ITEMS), strategy="recursive", chunk_size=40)
+        )
+        assert [c.content for c in streamed] == [c.content for c in batch]
+
+    def test_stream_pulls_one_item_at_a_time(self, pipeline):
+        pulled = []
+
+        def items():
+            for item in self.ITEMS:
+                pulled.append(item)
+                yield item
+
+        stream = pipeline.run_stream(items(), strategy="recursive")
+        next(stream)
+        assert len(pulled) == 1
+
+
 # ---------------------------------------------------------------------------
 # _register_manual guard
 # ---------------------------------------------------------------------------
@@ -1,5 +1,7 @@
 import os
+from typing import Union
 
+from sayou.core.payload import DEFAULT_SPOOL_THRESHOLD, SpooledPayload
 from sayou.core.registry import register_component
 from sayou.core.schemas import SayouTask
 
@@ -14,12 +16,18 @@ class FileFetcher(BaseFetcher):
     This fetcher reads binary data directly from the path specified in `task.uri`.
     It handles basic file I/O operations and raises wrapped exceptions if the file
     is inaccessible or missing.
+
+    Files larger than ``SPOOL_THRESHOLD`` bytes (overridable per task via
+    ``task.params["spool_threshold"]``) are not read into memory; the packet
+    carries a ``SpooledPayload`` referencing the file in place.
     """
 
     component_name = "FileFetcher"
     SUPPORTED_TYPES = ["file"]
 
-    def _do_fetch(self, task: SayouTask) -> bytes:
+    SPOOL_THRESHOLD: int = DEFAULT_SPOOL_THRESHOLD
+
+    def _do_fetch(self, task: SayouTask) -> Union[bytes, SpooledPayload]:
         """
         Read a file from the local file system.
 
@@ -27,7 +35,8 @@ class FileFetcher(BaseFetcher):
             task (SayouTask): The task containing the file path in `task.uri`.
 
         Returns:
-            bytes: The raw binary content of the file.
+            bytes | SpooledPayload: The raw binary content of the file, or a
+                path-backed payload for files above the spool threshold.
 
         Raises:
             FileNotFoundError: If the file does not exist.
@@ -38,5 +47,5 @@ class FileFetcher(BaseFetcher):
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        with open(file_path, "rb") as f:
-            return f.read()
+        threshold = task.params.get("spool_threshold", self.SPOOL_THRESHOLD)
+        return SpooledPayload.from_path(file_path, threshold=threshold)
@@ -1,17 +1,14 @@
 from urllib.parse import urljoin
 
-import requests
-
-try:
-    from bs4 import BeautifulSoup
-except ImportError:
-    BeautifulSoup = None
-
+from sayou.core.html import get_html_backend
+from sayou.core.lazy import lazy_import
 from sayou.core.registry import register_component
 from sayou.core.schemas import SayouTask
 
 from ..interfaces.base_fetcher import BaseFetcher
 
+requests = lazy_import("requests")
+
 
 @register_component("fetcher")
 class RequestsFetcher(BaseFetcher):
@@ -21,18 +18,29 @@ class RequestsFetcher(BaseFetcher):
     Retrieves HTML content via HTTP requests. It supports optional CSS selector
     extraction (via `task.params['selectors']`) and automatically discovers
     hyperlinks on the page to support the `WebCrawlGenerator` feedback loop.
+
+    Pages are parsed with BeautifulSoup by default; a faster backend
+    (``"auto"``, "selectolax" or "lxml"; see ``sayou.core.html``) can be
+    chosen per task via ``task.params["html_backend"]``.
+
+    Attributes:
+        HTML_BACKEND (str): Default backend name; ``"bs4"`` so output does
+            not depend on which parsers are installed.
     """
 
     component_name = "RequestsFetcher"
     SUPPORTED_TYPES = ["requests"]
 
+    HTML_BACKEND: str = "bs4"
+
     def _do_fetch(self, task: SayouTask) -> dict:
         """
         Fetch a web page and extract data/links.
 
         Args:
             task (SayouTask): The task containing the URL in `task.uri`.
-                            `task.params` may contain 'selectors'.
+                            `task.params` may contain 'selectors' and
+                            'html_backend'.
 
         Returns:
             dict: A dictionary containing extracted text, raw preview,
@@ -40,35 +48,34 @@ class RequestsFetcher(BaseFetcher):
 
         Raises:
             requests.RequestException: For network-related errors.
-            ImportError: If BeautifulSoup is not installed.
+            ImportError: If no HTML parser is installed.
         """
-        if not BeautifulSoup:
-            raise ImportError("BeautifulSoup4 not installed.")
+        selectors = task.params.get("selectors", {})
+        html_document = get_html_backend(
+            task.params.get("html_backend", self.HTML_BACKEND), css=bool(selectors)
+        )
 
         headers = {"User-Agent": "Sayou-Connector/0.1.0"}
         resp = requests.get(task.uri, headers=headers, timeout=10)
         resp.raise_for_status()
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        doc = html_document(resp.text)
         extracted_data = {}
 
         # 1. Selectors logic
-        selectors = task.params.get("selectors", {})
         if selectors:
             for key, sel in selectors.items():
-                el = soup.select(sel)
-                if el:
-                    extracted_data[key] = "\n".join(
-                        [e.get_text(strip=True) for e in el]
-                    )
+                texts = doc.select_text(sel)
+                if texts:
+                    extracted_data[key] = "\n".join(texts)
 
         if not extracted_data:
             extracted_data["_raw_preview"] = resp.text[:200]
 
         # 2. Link extraction logic
         found_links = set()
-        for a in soup.find_all("a", href=True):
-            abs_link = urljoin(task.uri, a["href"])
+        for href in doc.links():
+            abs_link = urljoin(task.uri, href)
             if abs_link.startswith("http"):
                 found_links.add(abs_link)
 
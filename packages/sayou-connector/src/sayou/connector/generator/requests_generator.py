@@ -53,6 +53,7 @@ class RequestsGenerator(BaseGenerator):
         link_pattern: str = ".*",
         selectors: dict = None,
         max_depth: int = 1,
+        html_backend: str = None,
         **kwargs,
     ):
         """
@@ -63,6 +64,8 @@ class RequestsGenerator(BaseGenerator):
             link_pattern (str): Regex pattern to filter links to follow.
             selectors (Optional[dict]): CSS selectors to extract specific data from pages.
             max_depth (int): Maximum depth to traverse from the seed URL.
+            html_backend (Optional[str]): HTML parser for the fetcher
+                ("auto", "selectolax", "lxml", "bs4"); bs4 by default.
             **kwargs: Ignored additional arguments.
         """
         self.queue = deque([(source, 0)])
@@ -70,21 +73,28 @@ class RequestsGenerator(BaseGenerator):
         self.link_regex = re.compile(link_pattern)
         self.selectors = selectors or {}
         self.max_depth = max_depth
+        self.html_backend = html_backend
 
     def _do_generate(self, source: str, **kwargs) -> Iterator[SayouTask]:
         """
-        Yield tasks from the crawling queue.
+        Yield tasks from the crawling queue, reporting the URLs still
+        waiting as a ``queue_depth`` event (queue ``"crawl_frontier"``).
 
         Yields:
             Iterator[SayouTask]: Tasks for URLs in the queue.
         """
         while self.queue:
             url, depth = self.queue.popleft()
-            yield SayouTask(
-                source_type="requests",
-                uri=url,
-                params={"selectors": self.selectors, "depth": depth},
+            self._emit(
+                "on_event",
+                event_name="queue_depth",
+                payload=len(self.queue),
+                queue="crawl_frontier",
             )
+            params = {"selectors": self.selectors, "depth": depth}
+            if self.html_backend:
+                params["html_backend"] = self.html_backend
+            yield SayouTask(source_type="requests", uri=url, params=params)
 
     def _do_feedback(self, result: SayouPacket):
         """
@@ -3,7 +3,7 @@ from time import sleep
 from typing import Any
 
 from sayou.core.base_component import BaseComponent
-from sayou.core.decorators import measure_time
+from sayou.core.decorators import is_retryable, measure_time
 from sayou.core.schemas import SayouPacket, SayouTask
 
 from ..core.exceptions import FetcherError
@@ -24,6 +24,9 @@ class BaseFetcher(BaseComponent):
         FETCH_MAX_RETRIES (int): Maximum number of fetch attempts (default: 3).
             Set to 1 to disable retries.
         FETCH_RETRY_DELAY (float): Seconds to wait between retries (default: 1.0).
+
+    Errors classified as fatal by ``sayou.core.decorators.is_retryable``
+    (missing files, permission errors, bad input) are not retried.
     """
 
     component_name = "BaseFetcher"
@@ -69,7 +72,7 @@ class BaseFetcher(BaseComponent):
 
             except Exception as e:
                 last_exc = e
-                if attempt < self.FETCH_MAX_RETRIES:
+                if attempt < self.FETCH_MAX_RETRIES and is_retryable(e):
                     self._log(
                         f"Fetch attempt {attempt}/{self.FETCH_MAX_RETRIES} failed "
                         f"({e}). Retrying in {self.FETCH_RETRY_DELAY}s.",
@@ -78,9 +81,10 @@ class BaseFetcher(BaseComponent):
                     sleep(self.FETCH_RETRY_DELAY)
                 else:
                     self._log(
-                        f"Fetch failed after {self.FETCH_MAX_RETRIES} attempts: {e}",
+                        f"Fetch failed after {attempt} attempt(s): {e}",
                         level="error",
                     )
+                    break
 
         self._emit("on_error", error=last_exc)
         wrapped_error = FetcherError(
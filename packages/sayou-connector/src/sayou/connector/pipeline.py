@@ -3,6 +3,7 @@ import pkgutil
 from typing import Dict, Iterator, List, Optional, Type
 
 from sayou.core.base_component import BaseComponent
+from sayou.core.budget import resolve_budget
 from sayou.core.decorators import safe_run
 from sayou.core.registry import COMPONENT_REGISTRY
 from sayou.core.schemas import SayouPacket, SayouTask
@@ -173,6 +174,11 @@ class ConnectorPipeline(BaseComponent):
             source (str): The root source (e.g., file path, URL, connection string).
             strategy (str): The name of the generator strategy to use (default: "auto").
             **kwargs: Additional arguments passed to the Generator's initialize method.
+                      ``memory_budget`` (a ``MemoryBudget`` or a byte cap)
+                      makes the loop wait before yielding a packet while
+                      packets of *other* producers hold the budget.  Packets
+                      this run yielded never block it, so a plain
+                      ``for packet in run(...)`` loop cannot deadlock.
 
         Yields:
             Iterator[SayouPacket]: A stream of packets containing fetched data.
@@ -193,6 +199,11 @@ class ConnectorPipeline(BaseComponent):
         generator.initialize(source=source, **kwargs)
         self._log(f"Connector started using strategy '{strategy}' on '{source}'")
 
+        budget = resolve_budget(kwargs.get("memory_budget"), name=self.component_name)
+        # Lease owner for this run: our consumer holding earlier packets
+        # must not block the next one (it is the thread we would wait on).
+        lease_owner = object()
+
         # 3. Execution Loop
         count = 0
         success_count = 0
@@ -223,6 +234,9 @@ class ConnectorPipeline(BaseComponent):
                 # 6. Handle result
                 if packet.success:
                     success_count += 1
+                    if budget is not None:
+                        # Backpressure: blocks until consumers free enough bytes.
+                        budget.track(packet, owner=lease_owner)
                     yield packet
                 else:
                     self._log(f"Fetch failed: {packet.error}")
@@ -1,7 +1,7 @@
-import io
 import os
 from typing import Any, Dict
 
+from sayou.core.payload import DEFAULT_SPOOL_THRESHOLD, PayloadWriter, SpooledPayload
 from sayou.core.registry import register_component
 from sayou.core.schemas import SayouTask
 
@@ -24,6 +24,8 @@ class GoogleDriveFetcher(BaseFetcher):
     Fetches content from Google Drive files.
     - Google Native Formats -> Converted to MS Office formats (.docx, .xlsx, .pptx)
     - Standard Files (PDF, JPG, ZIP...) -> Downloaded as original binary.
+    - Downloads above ``task.params["spool_threshold"]`` bytes spill to a
+      temporary file and are returned as a ``SpooledPayload``.
     """
 
     component_name = "GoogleDriveFetcher"
@@ -75,13 +77,19 @@ class GoogleDriveFetcher(BaseFetcher):
 
         # 2. Execute Download
         try:
-            fh = io.BytesIO()
+            fh = PayloadWriter(
+                task.params.get("spool_threshold", DEFAULT_SPOOL_THRESHOLD)
+            )
             downloader = MediaIoBaseDownload(fh, request)
             done = False
-            while done is False:
-                status, done = downloader.next_chunk()
+            try:
+                while done is False:
+                    status, done = downloader.next_chunk()
+            except BaseException:
+                fh.discard()
+                raise
 
-            raw_bytes = fh.getvalue()
+            raw_bytes = fh.finish()
 
             final_content = raw_bytes
             is_text_candidate = False
@@ -99,7 +107,11 @@ class GoogleDriveFetcher(BaseFetcher):
             ]:
                 is_text_candidate = True
 
-            if not is_google_doc and is_text_candidate:
+            if (
+                not is_google_doc
+                and is_text_candidate
+                and not isinstance(raw_bytes, SpooledPayload)
+            ):
                 detected = chardet.detect(raw_bytes)
                 encoding = detected.get("encoding")
                 confidence = detected.get("confidence", 0)
@@ -139,7 +151,7 @@ class GoogleDriveFetcher(BaseFetcher):
                         else original_name
                     ),
                     "extension": extension,
-                    "is_binary": isinstance(final_content, bytes),
+                    "is_binary": isinstance(final_content, (bytes, SpooledPayload)),
                 },
             }
 
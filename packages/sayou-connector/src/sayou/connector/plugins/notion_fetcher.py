@@ -1,12 +1,14 @@
 import re
 from typing import Any, Dict, List
 
-import requests
+from sayou.core.lazy import lazy_import
 from sayou.core.registry import register_component
 from sayou.core.schemas import SayouTask
 
 from ..interfaces.base_fetcher import BaseFetcher
 
+requests = lazy_import("requests")
+
 
 @register_component("fetcher")
 class NotionFetcher(BaseFetcher):
@@ -1,6 +1,6 @@
 from typing import Any, Dict
 
-import requests
+from sayou.core.lazy import lazy_import
 from sayou.core.registry import register_component
 from sayou.core.schemas import SayouTask
 
@@ -11,6 +11,8 @@ try:
 except ImportError:
     YouTubeTranscriptApi = None
 
+requests = lazy_import("requests")
+
 
 @register_component("fetcher")
 class YouTubeFetcher(BaseFetcher):
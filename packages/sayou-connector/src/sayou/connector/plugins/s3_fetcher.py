@@ -1,5 +1,6 @@
 from typing import Any, Dict
 
+from sayou.core.payload import DEFAULT_SPOOL_THRESHOLD, SpooledPayload
 from sayou.core.registry import register_component
 from sayou.core.schemas import SayouTask
 
@@ -15,6 +16,9 @@ except ImportError:
 class S3Fetcher(BaseFetcher):
     """
     Downloads an object from S3.
+
+    Objects larger than ``task.params["spool_threshold"]`` bytes are streamed
+    to a temporary file and returned as a ``SpooledPayload``.
     """
 
     component_name = "S3Fetcher"
@@ -31,13 +35,18 @@ class S3Fetcher(BaseFetcher):
 
         s3 = boto3.client("s3", **aws_config)
         response = s3.get_object(Bucket=bucket, Key=key)
-        raw_body = response["Body"].read()
+        threshold = task.params.get("spool_threshold", DEFAULT_SPOOL_THRESHOLD)
+        raw_body = SpooledPayload.from_stream(response["Body"], threshold=threshold)
         content_type = response.get("ContentType", "")
 
-        try:
-            content = raw_body.decode("utf-8")
-        except UnicodeDecodeError:
+        if isinstance(raw_body, SpooledPayload):
+            # Spilled objects are binary documents, never decoded in memory.
             content = raw_body
+        else:
+            try:
+                content = raw_body.decode("utf-8")
+            except UnicodeDecodeError:
+                content = raw_body
 
         filename = key.split("/")[-1]
 
@@ -1,11 +1,13 @@
 from typing import Iterator
 
-import requests
+from sayou.core.lazy import lazy_import
 from sayou.core.registry import register_component
 from sayou.core.schemas import SayouTask
 
 from ..interfaces.base_generator import BaseGenerator
 
+requests = lazy_import("requests")
+
 
 @register_component("generator")
 class VelogGenerator(BaseGenerator):
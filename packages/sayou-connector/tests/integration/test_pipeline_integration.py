@@ -96,6 +96,57 @@ class TestFileStrategy:
         assert packet.success is False
         assert packet.error is not None
 
+    def test_memory_budget_tracks_inflight_packets(self, pipeline, multi_file_dir):
+        """Each yielded packet holds its bytes until the consumer moves on."""
+        from sayou.core.budget import MemoryBudget, estimate_size
+
+        budget = MemoryBudget(10, name="connector-test")
+        packets = pipeline.run(
+            source=multi_file_dir,
+            strategy="file",
+            extensions=[".txt", ".md"],
+            memory_budget=budget,
+        )
+        seen = [(budget.in_use, estimate_size(p)) for p in budget.bounded(packets)]
+
+        assert len(seen) == 3
+        # Only the packet being consumed is accounted, even above the cap.
+        assert all(in_use == size for in_use, size in seen)
+        assert budget.in_use == 0
+
+    def test_memory_budget_smaller_than_two_files_does_not_hang(
+        self, pipeline, tmp_dir
+    ):
+        """A plain loop keeping each packet alive must not block on itself."""
+        import os
+
+        for name in ("a.txt", "b.txt", "c.txt"):
+            with open(os.path.join(tmp_dir, name), "wb") as f:
+                f.write(b"x" * 1000)
+
+        packets = []
+        for packet in pipeline.run(
+            source=tmp_dir, strategy="file", extensions=[".txt"], memory_budget=1500
+        ):
+            packets.append(packet)
+
+        assert len(packets) == 3
+
+    def test_large_file_is_spooled_not_read(self, txt_file):
+        """Files above spool_threshold arrive as a path-backed payload."""
+        from sayou.connector.fetcher.file_fetcher import FileFetcher
+        from sayou.core.payload import SpooledPayload
+        from sayou.core.schemas import SayouTask
+
+        task = SayouTask(source_type="file", uri=txt_file, params={})
+        assert FileFetcher().fetch(task).data == b"Hello Sayou"
+
+        task.params["spool_threshold"] = 4
+        packet = FileFetcher().fetch(task)
+        assert isinstance(packet.data, SpooledPayload)
+        assert packet.data.path == txt_file
+        assert packet.data.startswith(b"Hello")
+
 
 # ---------------------------------------------------------------------------
 # SQLite strategy
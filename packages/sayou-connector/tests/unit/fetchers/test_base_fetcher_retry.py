@@ -12,6 +12,7 @@ Covers:
 - FETCH_MAX_RETRIES=1 disables retrying (one attempt only).
 - Returned packet always has the original task attached.
 - FETCH_RETRY_DELAY is respected (mocked via sleep).
+- Fatal errors (e.g. FileNotFoundError) are not retried.
 """
 
 from unittest.mock import MagicMock, call, patch
@@ -125,3 +126,14 @@ class TestBaseFetcherRetry:
         fetcher = CountingFetcher(fail_times=99)
         packet = fetcher.fetch(_task())
         assert "CountingFetcher" in packet.error
+
+    def test_fatal_error_is_not_retried(self):
+        class MissingFetcher(CountingFetcher):
+            def _do_fetch(self, task):
+                self._call_count += 1
+                raise FileNotFoundError(task.uri)
+
+        fetcher = MissingFetcher()
+        packet = fetcher.fetch(_task())
+        assert packet.success is False
+        assert fetcher._call_count == 1
@@ -4,7 +4,8 @@ Unit tests for RequestsGenerator.
 Covers:
 - can_handle: http/https returns 1.0, www. returns 0.8, other returns 0.0.
 - Queue initialised with the seed URL at depth 0.
-- _do_generate yields tasks from the queue.
+- _do_generate yields tasks from the queue (with the chosen HTML backend)
+  and reports the frontier size as queue_depth.
 - Feedback: new links below max_depth are added to the queue.
 - Feedback: links at or beyond max_depth are ignored.
 - Feedback: already-visited URLs are not re-queued.
@@ -94,6 +95,33 @@ class TestGenerate:
         task = next(gen._do_generate("https://example.com"))
         assert task.params["depth"] == 0
 
+    def test_html_backend_passed_to_fetcher(self):
+        gen = RequestsGenerator()
+        gen.initialize(source="https://example.com", html_backend="lxml")
+        task = next(gen._do_generate("https://example.com"))
+        assert task.params["html_backend"] == "lxml"
+
+    def test_html_backend_omitted_by_default(self):
+        task = next(_generator()._do_generate("https://example.com"))
+        assert "html_backend" not in task.params
+
+    def test_reports_frontier_depth(self):
+        gen = _generator()
+        gen.queue.append(("https://example.com/a", 1))
+        events = []
+
+        class Recorder:
+            def on_event(self, event_name, payload=None, **kwargs):
+                events.append((event_name, payload, kwargs["queue"]))
+
+        gen.add_callback(Recorder())
+        list(gen._do_generate("https://example.com"))
+
+        assert events == [
+            ("queue_depth", 1, "crawl_frontier"),
+            ("queue_depth", 0, "crawl_frontier"),
+        ]
+
 
 # ---------------------------------------------------------------------------
 # Feedback — link discovery
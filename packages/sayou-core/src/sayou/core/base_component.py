@@ -31,6 +31,10 @@ class BaseComponent(ABC):
 
     component_name: str = "BaseComponent"
 
+    # (callbacks list, its length, {event_method: handlers}); rebuilt by
+    # ``_emit`` whenever ``_callbacks`` is replaced or grows.
+    _dispatch = None
+
     def __init__(self) -> None:
         self.logger = logging.getLogger(self.component_name)
         if not self.logger.handlers:
@@ -84,19 +88,57 @@ class BaseComponent(ABC):
         Exceptions raised by callbacks are caught and logged as warnings so
         that a misbehaving observer never interrupts the pipeline.
 
+        Handlers are resolved once per event method (through
+        ``BaseCallback.bind``) and callbacks that do not override the
+        method are skipped, so an event nobody listens to costs one
+        attribute check.
+
         Args:
             event_method: The method name to call on each callback
                           (e.g. ``"on_start"``, ``"on_finish"``).
             **kwargs: Arguments forwarded to the callback method.
         """
+        callbacks = self._callbacks
+        if not callbacks:
+            return
+        dispatch = self._dispatch
+        if (
+            dispatch is None
+            or dispatch[0] is not callbacks
+            or dispatch[1] != len(callbacks)
+        ):
+            dispatch = self._dispatch = (callbacks, len(callbacks), {})
+        handlers = dispatch[2].get(event_method)
+        if handlers is None:
+            handlers = dispatch[2][event_method] = self._resolve_handlers(event_method)
+        for callback, handler in handlers:
+            try:
+                handler(component_name=self.component_name, **kwargs)
+            except Exception as exc:
+                self._log(
+                    f"Callback {type(callback).__name__}.{event_method} "
+                    f"raised: {exc}",
+                    level="warning",
+                )
+
+    def _resolve_handlers(self, event_method: str) -> list:
+        default = getattr(BaseCallback, event_method, None)
+        handlers = []
         for callback in self._callbacks:
-            handler = getattr(callback, event_method, None)
-            if callable(handler):
-                try:
-                    handler(component_name=self.component_name, **kwargs)
-                except Exception as exc:
-                    self._log(
-                        f"Callback {type(callback).__name__}.{event_method} "
-                        f"raised: {exc}",
-                        level="warning",
-                    )
+            target = callback
+            if isinstance(callback, BaseCallback):
+                target = callback.bind(self.component_name)
+            handler = getattr(target, event_method, None)
+            if not callable(handler):
+                continue
+            # Inherited no-op: nobody is listening for this event.
+            if default is not None and getattr(handler, "__func__", None) is default:
+                continue
+            handlers.append((callback, handler))
+        return handlers
+
+    def __getstate__(self) -> dict:
+        # Bound handlers may hold locks / thread-locals; copies rebuild them.
+        state = self.__dict__.copy()
+        state.pop("_dispatch", None)
+        return state
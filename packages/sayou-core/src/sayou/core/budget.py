@@ -0,0 +1,254 @@
+"""
+Byte-accounted memory budget shared by pipeline stages.
+
+A ``MemoryBudget`` caps the bytes of payload data in flight.  Producers
+(``ConnectorPipeline``) call :meth:`MemoryBudget.track` on every packet
+before handing it on; when the cap is reached they block until consumers
+release earlier packets.  Consumers release either explicitly
+(:meth:`release_obj`, or by iterating through :meth:`bounded`) or
+implicitly when the tracked object is garbage-collected.
+
+Deadlock safety
+───────────────
+A request never waits while nothing else is in flight, so a single item
+larger than the cap always makes progress.  Requests made on behalf of an
+``owner`` do not wait on bytes that owner itself holds either: a generator
+that tracks its packets with ``owner=`` is never blocked by the packets its
+single-threaded consumer still references, however many it keeps.  Long-lived *resident* data (e.g. nodes accumulated for
+assembly) is accounted with ``hold()``: it counts toward usage and
+throttles concurrent producers, but is not something a producer waits on.
+Its owner bounds it instead: ``StandardPipeline`` loads held nodes in
+batches once they fill the budget, when the destination writer is
+``INCREMENTAL``.
+
+Usage is exported as ``sayou_memory_inflight_bytes{budget=...}``
+alongside the configured ``sayou_memory_limit_bytes`` and the cumulative
+``sayou_memory_wait_seconds_total``.
+"""
+
+import threading
+import time
+import weakref
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
+
+from .metrics import get_registry
+from .payload import SpooledPayload
+
+
+class MemoryBudget:
+    """
+    Counting semaphore over bytes with blocking admission.
+
+    Args:
+        max_bytes: Soft cap on in-flight bytes.
+        name: Label used in metrics (one series per budget).
+        timeout: Default seconds :meth:`acquire` waits before admitting the
+            request anyway; ``None`` waits indefinitely.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        name: str = "default",
+        timeout: Optional[float] = None,
+    ):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_bytes = int(max_bytes)
+        self.name = name
+        self.timeout = timeout
+
+        self._cond = threading.Condition()
+        self._inflight = 0
+        self._resident = 0
+        self._leases: Dict[int, weakref.finalize] = {}
+        self._owned: Dict[Any, int] = {}
+
+        registry = get_registry()
+        self._usage = registry.gauge(
+            "sayou_memory_inflight_bytes",
+            "Payload bytes currently held under a memory budget.",
+            budget=name,
+        )
+        self._waits = registry.counter(
+            "sayou_memory_wait_seconds_total",
+            "Time producers spent blocked on a memory budget.",
+            budget=name,
+        )
+        registry.gauge(
+            "sayou_memory_limit_bytes",
+            "Configured memory budget cap.",
+            budget=name,
+        ).set(self.max_bytes)
+
+    # ------------------------------------------------------------------
+    # Accounting
+    # ------------------------------------------------------------------
+
+    @property
+    def in_use(self) -> int:
+        """Bytes currently accounted (in flight + resident)."""
+        return self._inflight + self._resident
+
+    def acquire(
+        self, nbytes: int, timeout: Optional[float] = None, owner: Any = None
+    ) -> int:
+        """
+        Reserve ``nbytes``, blocking while the budget is exhausted.
+
+        Args:
+            nbytes: Bytes to reserve.
+            timeout: Override of the budget's default wait limit.
+            owner: Hashable token of the requester.  The call only waits
+                while bytes held by *other* owners are in flight.
+
+        Returns:
+            int: The number of bytes reserved (pass it to :meth:`release`).
+        """
+        nbytes = max(int(nbytes), 0)
+        timeout = self.timeout if timeout is None else timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._cond:
+            started = None
+            own = self._owned.get(owner, 0) if owner is not None else 0
+            while self._inflight > own and self.in_use + nbytes > self.max_bytes:
+                if started is None:
+                    started = time.perf_counter()
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+                own = self._owned.get(owner, 0) if owner is not None else 0
+            if started is not None:
+                self._waits.inc(time.perf_counter() - started)
+
+            self._inflight += nbytes
+            if owner is not None:
+                self._owned[owner] = self._owned.get(owner, 0) + nbytes
+            self._usage.set(self.in_use)
+        return nbytes
+
+    def release(self, nbytes: int, owner: Any = None) -> None:
+        """Return ``nbytes`` previously obtained from :meth:`acquire`."""
+        with self._cond:
+            self._inflight = max(self._inflight - int(nbytes), 0)
+            if owner is not None:
+                left = self._owned.get(owner, 0) - int(nbytes)
+                if left > 0:
+                    self._owned[owner] = left
+                else:
+                    self._owned.pop(owner, None)
+            self._usage.set(self.in_use)
+            self._cond.notify_all()
+
+    def hold(self, nbytes: int) -> None:
+        """Account resident bytes without waiting (see module docstring)."""
+        with self._cond:
+            self._resident += max(int(nbytes), 0)
+            self._usage.set(self.in_use)
+
+    def unhold(self, nbytes: int) -> None:
+        """Release bytes accounted with :meth:`hold`."""
+        with self._cond:
+            self._resident = max(self._resident - int(nbytes), 0)
+            self._usage.set(self.in_use)
+            self._cond.notify_all()
+
+    # ------------------------------------------------------------------
+    # Object leases
+    # ------------------------------------------------------------------
+
+    def track(self, obj: Any, nbytes: Optional[int] = None, owner: Any = None) -> int:
+        """
+        Acquire ``estimate_size(obj)`` bytes for ``obj``.
+
+        The reservation is released by :meth:`release_obj`, or automatically
+        when ``obj`` is garbage-collected.  ``owner`` is passed to
+        :meth:`acquire`.
+
+        Returns:
+            int: The number of bytes reserved.
+        """
+        nbytes = self.acquire(
+            estimate_size(obj) if nbytes is None else nbytes, owner=owner
+        )
+        key = id(obj)
+        self._leases[key] = weakref.finalize(obj, self._expire, key, nbytes, owner)
+        return nbytes
+
+    def release_obj(self, obj: Any) -> None:
+        """Release the reservation made by :meth:`track` for ``obj`` now."""
+        lease = self._leases.get(id(obj))
+        if lease is not None and lease.alive:
+            lease()
+
+    def bounded(self, items: Iterable[Any]) -> Iterator[Any]:
+        """
+        Iterate ``items``, releasing each one before pulling the next.
+
+        Wrap a consumer loop with it so a synchronous producer is never
+        blocked by the item the same thread just finished with.
+        """
+        for item in items:
+            try:
+                yield item
+            finally:
+                self.release_obj(item)
+
+    def _expire(self, key: int, nbytes: int, owner: Any = None) -> None:
+        self._leases.pop(key, None)
+        self.release(nbytes, owner)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "max_bytes": self.max_bytes,
+            "inflight": self._inflight,
+            "resident": self._resident,
+            "in_use": self.in_use,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"MemoryBudget(name={self.name!r}, in_use={self.in_use}, "
+            f"max_bytes={self.max_bytes})"
+        )
+
+
+def resolve_budget(
+    value: Union[None, int, MemoryBudget], name: str = "default"
+) -> Optional[MemoryBudget]:
+    """Accept a ``MemoryBudget``, a byte cap, or ``None`` from run config."""
+    if value is None or isinstance(value, MemoryBudget):
+        return value
+    return MemoryBudget(int(value), name=name)
+
+
+def estimate_size(obj: Any, _depth: int = 0) -> int:
+    """
+    Best-effort resident byte size of a payload, without copying it.
+
+    Bytes-likes and strings count their length; spilled payloads count
+    zero (their data is on disk); models, dicts and lists are summed
+    recursively over their values.
+    """
+    if isinstance(obj, (bytes, bytearray)):
+        return len(obj)
+    if isinstance(obj, str):
+        return len(obj)
+    if isinstance(obj, memoryview):
+        return obj.nbytes
+    if isinstance(obj, SpooledPayload):
+        return 0 if obj.is_spilled else len(obj)
+    if _depth >= 4:
+        return 0
+    if isinstance(obj, dict):
+        return sum(estimate_size(v, _depth + 1) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        if obj and isinstance(obj[0], float):
+            return 8 * len(obj)
+        return sum(estimate_size(v, _depth + 1) for v in obj)
+    fields = getattr(type(obj), "model_fields", None)
+    if fields:
+        return sum(estimate_size(getattr(obj, name), _depth + 1) for name in fields)
+    return 0
@@ -0,0 +1,555 @@
+import hashlib
+import json
+import os
+import pickle
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+import types
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from .metrics import get_registry
+from .payload import SpooledPayload
+
+# ---------------------------------------------------------------------------
+# Content-addressed stage cache
+#
+# A stage result is a pure function of (input content, component, config),
+# so it is stored under
+#
+#     blake2b(component ‖ content digest ‖ config fingerprint)
+#
+# Re-ingesting an unchanged corpus then skips parse / refine / chunk / embed
+# for every file whose bytes and configuration did not change.
+#
+# Pipelines pick the cache up from their run config (``cache=...``), so it
+# can be set once on a Brain pipeline and reaches every stage:
+#
+#     StandardPipeline(cache=SqliteCache("~/.cache/sayou/stages.db"))
+# ---------------------------------------------------------------------------
+
+# Run-config keys that must never influence a cache key: the caches
+# themselves, a precomputed digest, and live objects whose repr is not stable.
+NON_FINGERPRINT_KEYS = frozenset(
+    {
+        "cache",
+        "cache_digest",
+        "client",
+        "embedding_fn",
+        "memory_budget",
+        "ocr_cache",
+    }
+)
+
+_DIGEST_SIZE = 20
+
+
+def content_digest(content: Any) -> str:
+    """
+    Return a stable hex digest of ``content``.
+
+    Bytes, spooled payloads and strings are hashed directly; Pydantic
+    models via their JSON form; lists / tuples element-wise; anything else
+    via canonical JSON.
+    """
+    h = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+    _feed(h, content)
+    return h.hexdigest()
+
+
+def _feed(h: "hashlib._Hash", content: Any) -> None:
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        h.update(b"b%d:" % len(content))
+        h.update(content)
+    elif isinstance(content, SpooledPayload):
+        # Same digest as the equivalent bytes, hashed through the mmap view.
+        h.update(b"b%d:" % len(content))
+        h.update(content.view())
+    elif isinstance(content, str):
+        data = content.encode("utf-8", "surrogatepass")
+        h.update(b"s%d:" % len(data))
+        h.update(data)
+    elif hasattr(content, "model_dump_json"):
+        data = content.model_dump_json().encode("utf-8")
+        h.update(b"m%s:%d:" % (type(content).__name__.encode(), len(data)))
+        h.update(data)
+    elif isinstance(content, (list, tuple)):
+        h.update(b"l%d:" % len(content))
+        for item in content:
+            _feed(h, item)
+    else:
+        data = _canonical_json(content).encode("utf-8")
+        h.update(b"j%d:" % len(data))
+        h.update(data)
+
+
+def _canonical_json(obj: Any) -> str:
+    """
+    JSON text that is equal for equal values and distinct otherwise.
+
+    Raises:
+        TypeError: ``obj`` holds a value with no faithful encoding.  Callers
+            must not cache in that case: a type name or ``id()``-bearing
+            repr would make different configs share a key, or defeat it.
+    """
+    return json.dumps(obj, sort_keys=True, ensure_ascii=False, default=_json_default)
+
+
+def _json_default(o: Any) -> Any:
+    # Tagged so that e.g. {"a"} and ["a"] do not encode alike.
+    if isinstance(o, (set, frozenset)):
+        return {"__set__": sorted(_canonical_json(item) for item in o)}
+    if isinstance(o, re.Pattern):
+        return {"__regex__": [o.pattern, o.flags]}
+    if isinstance(o, (bytes, bytearray, memoryview)):
+        return {"__bytes__": content_digest(o)}
+    if isinstance(o, type) or (
+        isinstance(o, types.FunctionType) and "<" not in o.__qualname__
+    ):
+        # Classes (e.g. processors=[PiiMasker]) and module-level functions
+        # are identified by their import path; lambdas and closures are not.
+        return {"__ref__": f"{o.__module__}.{o.__qualname__}"}
+    if hasattr(o, "model_dump"):
+        return {"__model__": type(o).__qualname__, "fields": o.model_dump(mode="json")}
+    raise TypeError(f"Cannot fingerprint value of type {type(o).__qualname__}")
+
+
+def config_fingerprint(config: Optional[Dict[str, Any]]) -> str:
+    """
+    Stable digest of the config keys that can affect a stage's output.
+
+    Raises:
+        TypeError: A relevant value has no stable encoding (see
+            ``_canonical_json``).
+    """
+    if not config:
+        return ""
+    relevant = {k: v for k, v in config.items() if k not in NON_FINGERPRINT_KEYS}
+    return hashlib.blake2b(
+        _canonical_json(relevant).encode("utf-8"), digest_size=_DIGEST_SIZE
+    ).hexdigest()
+
+
+class BaseCache(ABC):
+    """
+    Abstract key → value store for stage results.
+
+    Values are pickled, so anything a stage returns (``Document``,
+    ``List[SayouBlock]``, ``List[SayouChunk]``, vectors) round-trips, and a
+    hit always hands back a fresh copy that the caller may mutate freely.
+    Because entries are unpickled, only point a cache at trusted storage.
+
+    Subclasses implement byte-level ``_read`` / ``_write`` / ``_delete`` /
+    ``clear`` / ``__len__`` and their own eviction policy.
+    """
+
+    name = "cache"
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def digest(content: Any) -> str:
+        """Digest ``content`` once so several stages can reuse it."""
+        return content_digest(content)
+
+    def key(
+        self,
+        component: str,
+        content: Any = None,
+        config: Optional[Dict[str, Any]] = None,
+        digest: Optional[str] = None,
+        **extra: Any,
+    ) -> Optional[str]:
+        """
+        Build the cache key for one stage invocation.
+
+        Args:
+            component: Stage / component name (e.g. ``"DocumentPipeline"``).
+            content: Stage input; ignored when ``digest`` is supplied.
+            config: Effective run config; see ``NON_FINGERPRINT_KEYS``.
+            digest: Precomputed ``content_digest`` of the input.
+            **extra: Call arguments that are not part of the config
+                     (strategy, file name, …).
+
+        Returns:
+            The key, or ``None`` when the input or config holds a value with
+            no stable encoding; ``get`` / ``set`` treat ``None`` as
+            "do not cache".
+        """
+        h = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+        h.update(component.encode("utf-8"))
+        h.update(b"\0")
+        try:
+            h.update((digest or content_digest(content)).encode("ascii"))
+            h.update(b"\0")
+            h.update(config_fingerprint(config).encode("ascii"))
+            if extra:
+                h.update(b"\0")
+                h.update(_canonical_json(extra).encode("utf-8"))
+        except TypeError:
+            return None
+        return h.hexdigest()
+
+    # ------------------------------------------------------------------
+    # Values
+    # ------------------------------------------------------------------
+
+    def get(self, key: Optional[str], component: str = "", default: Any = None) -> Any:
+        """Return the cached value for ``key`` or ``default`` on a miss."""
+        if key is None:
+            raw = None
+        else:
+            try:
+                raw = self._read(key)
+            except Exception:
+                raw = None
+
+        hit = raw is not None
+        self._record(component, hit)
+        if not hit:
+            return default
+        try:
+            return pickle.loads(raw)
+        except Exception:
+            # Unreadable entry (e.g. written by an incompatible version).
+            self._delete(key)
+            return default
+
+    def set(self, key: Optional[str], value: Any) -> None:
+        """Store ``value`` under ``key``.  ``None`` is never cached."""
+        if key is None or value is None:
+            return
+        try:
+            self._write(key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            pass
+
+    def get_or_compute(
+        self, key: Optional[str], compute: Callable[[], Any], component: str = ""
+    ) -> Any:
+        """Return the cached value or compute, store and return it."""
+        value = self.get(key, component=component)
+        if value is None:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit / miss counters for this cache instance."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": len(self),
+        }
+
+    def _record(self, component: str, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        get_registry().counter(
+            "sayou_cache_requests_total",
+            "Stage cache lookups by result.",
+            cache=self.name,
+            component=component or "unknown",
+            result="hit" if hit else "miss",
+        ).inc()
+
+    # ------------------------------------------------------------------
+    # Backend hooks
+    # ------------------------------------------------------------------
+
+    @abstractmethod
+    def _read(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _write(self, key: str, data: bytes) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+# ==============================================================================
+# Backends
+# ==============================================================================
+
+
+class MemoryCache(BaseCache):
+    """In-process LRU cache bounded by entry count and/or total bytes."""
+
+    name = "memory"
+
+    def __init__(
+        self, max_entries: Optional[int] = 1024, max_bytes: Optional[int] = None
+    ) -> None:
+        super().__init__()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _read(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            raw = self._data.get(key)
+            if raw is not None:
+                self._data.move_to_end(key)
+            return raw
+
+    def _write(self, key: str, data: bytes) -> None:
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._data[key] = data
+            self._size += len(data)
+            while self._data and (
+                (self.max_entries is not None and len(self._data) > self.max_entries)
+                or (self.max_bytes is not None and self._size > self.max_bytes)
+            ):
+                _, evicted = self._data.popitem(last=False)
+                self._size -= len(evicted)
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class FileSystemCache(BaseCache):
+    """
+    One file per entry under ``root/<k[:2]>/<k>``, LRU-evicted by mtime.
+
+    Reads refresh the entry's mtime; when the total size exceeds
+    ``max_bytes`` the least recently used files are removed until the cache
+    is back under 90 % of the limit.  Writes go through a temp file and
+    ``os.replace`` so concurrent workers never observe partial entries.
+    """
+
+    name = "filesystem"
+
+    def __init__(self, root: str, max_bytes: Optional[int] = None) -> None:
+        super().__init__()
+        self.root = os.path.abspath(os.path.expanduser(root))
+        self.max_bytes = max_bytes
+        os.makedirs(self.root, exist_ok=True)
+        self._lock = threading.Lock()
+        self._size = sum(os.path.getsize(p) for p in self._entries())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key)
+
+    def _entries(self) -> Iterable[str]:
+        for shard in os.scandir(self.root):
+            if shard.is_dir():
+                for entry in os.scandir(shard.path):
+                    if entry.is_file() and not entry.name.endswith(".tmp"):
+                        yield entry.path
+
+    def _read(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as fh:
+                data = fh.read()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def _write(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            try:
+                previous = os.path.getsize(path)
+            except OSError:
+                previous = 0
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+        with self._lock:
+            self._size += len(data) - previous
+            if self.max_bytes is not None and self._size > self.max_bytes:
+                self._evict(int(self.max_bytes * 0.9))
+
+    def _evict(self, target: int) -> None:
+        entries = []
+        for path in self._entries():
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        entries.sort()
+
+        size = sum(e[1] for e in entries)
+        for _, nbytes, path in entries:
+            if size <= target:
+                break
+            try:
+                os.unlink(path)
+                size -= nbytes
+            except OSError:
+                pass
+        self._size = size
+
+    def _delete(self, key: str) -> None:
+        path = self._path(key)
+        try:
+            nbytes = os.path.getsize(path)
+            os.unlink(path)
+        except OSError:
+            return
+        with self._lock:
+            self._size -= nbytes
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in list(self._entries()):
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+            self._size = 0
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._entries())
+
+
+class SqliteCache(BaseCache):
+    """
+    Single-file SQLite cache, LRU-evicted by last access time.
+
+    Suitable for sharing between worker processes on one host (WAL mode).
+    """
+
+    name = "sqlite"
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS stage_cache (
+            key      TEXT PRIMARY KEY,
+            value    BLOB NOT NULL,
+            size     INTEGER NOT NULL,
+            accessed REAL NOT NULL
+        )
+    """
+
+    def __init__(self, path: str, max_bytes: Optional[int] = None) -> None:
+        super().__init__()
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.max_bytes = max_bytes
+        parent = os.path.dirname(self.path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(self._SCHEMA)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS stage_cache_accessed "
+            "ON stage_cache (accessed)"
+        )
+        self._conn.commit()
+
+    def _read(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM stage_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE stage_cache SET accessed = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            self._conn.commit()
+            return row[0]
+
+    def _write(self, key: str, data: bytes) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO stage_cache (key, value, size, accessed) "
+                "VALUES (?, ?, ?, ?)",
+                (key, sqlite3.Binary(data), len(data), time.time()),
+            )
+            if self.max_bytes is not None:
+                self._evict(self.max_bytes)
+            self._conn.commit()
+
+    def _evict(self, limit: int) -> None:
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM stage_cache"
+        ).fetchone()
+        if total <= limit:
+            return
+        target = int(limit * 0.9)
+        rows = self._conn.execute(
+            "SELECT key, size FROM stage_cache ORDER BY accessed ASC"
+        ).fetchall()
+        doomed = []
+        for key, size in rows:
+            if total <= target:
+                break
+            doomed.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM stage_cache WHERE key = ?", doomed)
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM stage_cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM stage_cache")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM stage_cache").fetchone()
+        return count
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
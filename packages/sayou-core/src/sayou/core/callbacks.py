@@ -15,6 +15,16 @@ class BaseCallback(ABC):
     to override what they care about.
     """
 
+    def bind(self, component_name: str) -> "BaseCallback":
+        """
+        Return the observer that ``component_name`` should notify.
+
+        Components call this once per callback, before their first event.
+        Observers with per-component state (e.g. metric series) can return
+        an object with that state already resolved; the default is ``self``.
+        """
+        return self
+
     def on_start(self, component_name: str, input_data: Any, **kwargs) -> None:
         """
         Triggered when a component starts processing a unit of work.
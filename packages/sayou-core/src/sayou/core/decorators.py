@@ -1,18 +1,67 @@
 import functools
+import inspect
 import logging
+import ntpath
+import os
+import random
+import threading
 import time
-from typing import Any, Callable
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
+from urllib.parse import urlsplit
+
+from .exceptions import CircuitOpenError
+from .metrics import get_registry
 
 logger = logging.getLogger("sayou.core")
 
 
+@functools.lru_cache(maxsize=None)
+def _stage_of(cls: type) -> str:
+    """Map a component class to its pipeline stage (``sayou.<stage>.…``)."""
+    parts = cls.__module__.split(".")
+    return parts[1] if len(parts) > 1 and parts[0] == "sayou" else parts[0]
+
+
+def _record_duration(func: Callable, args: tuple, elapsed: float) -> None:
+    owner = args[0] if args else None
+    component = getattr(owner, "component_name", None)
+    if isinstance(component, str):
+        get_registry().histogram(
+            "sayou_call_duration_seconds",
+            "Wall-clock time of @measure_time decorated calls.",
+            stage=_stage_of(type(owner)),
+            component=component,
+            method=func.__name__,
+        ).observe(elapsed)
+    logger.debug("[Timer] %s took %.4fs", func.__qualname__, elapsed)
+
+
 def measure_time(func: Callable) -> Callable:
     """
     Measure and log the wall-clock execution time of the decorated function.
 
     The elapsed time is emitted at DEBUG level so it is invisible in normal
     operation and only surfaces when the application enables debug logging.
+    When the decorated callable is a component method, the duration is also
+    recorded in the default metrics registry as
+    ``sayou_call_duration_seconds{stage, component, method}``.
+
+    Generator functions are timed across their full iteration (until
+    exhausted or closed) rather than just the creation of the generator
+    object.
     """
+    if inspect.isgeneratorfunction(func):
+
+        @functools.wraps(func)
+        def gen_wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return (yield from func(*args, **kwargs))
+            finally:
+                _record_duration(func, args, time.perf_counter() - start)
+
+        return gen_wrapper
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
@@ -20,8 +69,7 @@ def measure_time(func: Callable) -> Callable:
         try:
             return func(*args, **kwargs)
         finally:
-            elapsed = time.perf_counter() - start
-            logger.debug("[Timer] %s took %.4fs", func.__qualname__, elapsed)
+            _record_duration(func, args, time.perf_counter() - start)
 
     return wrapper
 
@@ -54,49 +102,465 @@ def safe_run(default_return: Any = None) -> Callable:
     return decorator
 
 
+# ---------------------------------------------------------------------------
+# Retry & circuit breaking
+# ---------------------------------------------------------------------------
+
+# Errors that another attempt cannot fix: caller bugs, bad input and
+# missing or forbidden resources.  Everything else is assumed transient.
+FATAL_EXCEPTIONS: Tuple[Type[BaseException], ...] = (
+    ValueError,
+    TypeError,
+    KeyError,
+    AttributeError,
+    NotImplementedError,
+    FileNotFoundError,
+    IsADirectoryError,
+    NotADirectoryError,
+    PermissionError,
+    CircuitOpenError,
+)
+
+_CLOSED, _OPEN, _HALF_OPEN = "closed", "open", "half_open"
+_STATE_VALUES = {_CLOSED: 0, _OPEN: 1, _HALF_OPEN: 2}
+
+
+class CircuitBreaker:
+    """
+    Fail fast while a backend is down.
+
+    After ``failure_threshold`` consecutive transient failures the circuit
+    *opens*: calls are rejected with :class:`CircuitOpenError` without
+    touching the backend.  Once ``reset_timeout`` seconds have passed a
+    single trial call is let through (*half-open*); its success closes the
+    circuit, its failure re-opens it for another ``reset_timeout``.
+
+    Breakers are meant to be shared per endpoint — obtain them with
+    :func:`get_breaker` so every writer/fetcher talking to the same
+    backend sees the same state.  The state is exported as the gauge
+    ``sayou_circuit_state{breaker}`` (0 closed, 1 open, 2 half-open) and
+    rejected calls as ``sayou_circuit_rejections_total{breaker}``.
+
+    Args:
+        name: Identifier used in logs and metrics.
+        failure_threshold: Consecutive failures that open the circuit.
+        reset_timeout: Seconds to stay open before allowing a trial call.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._lock = threading.Lock()
+        self._state = _CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+        registry = get_registry()
+        self._state_gauge = registry.gauge(
+            "sayou_circuit_state",
+            "Circuit breaker state (0 closed, 1 open, 2 half-open).",
+            breaker=name,
+        )
+        self._rejections = registry.counter(
+            "sayou_circuit_rejections_total",
+            "Calls rejected because the circuit was open.",
+            breaker=name,
+        )
+        self._state_gauge.set(0)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if (
+                self._state == _OPEN
+                and time.monotonic() - self._opened_at >= self.reset_timeout
+            ):
+                return _HALF_OPEN
+            return self._state
+
+    def before_call(self) -> None:
+        """
+        Admit or reject a call.
+
+        Raises:
+            CircuitOpenError: While the circuit is open, or while another
+                caller already holds the half-open trial.
+        """
+        with self._lock:
+            if self._state == _OPEN:
+                remaining = self.reset_timeout - (time.monotonic() - self._opened_at)
+                if remaining > 0:
+                    self._reject(f"retry in {remaining:.1f}s")
+                self._set_state(_HALF_OPEN)
+            if self._state == _HALF_OPEN:
+                if self._trial_in_flight:
+                    self._reject("trial call in progress")
+                self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            if self._state != _CLOSED:
+                logger.info("[Circuit] '%s' closed.", self.name)
+                self._set_state(_CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == _HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != _OPEN:
+                    logger.warning(
+                        "[Circuit] '%s' opened after %d failure(s); "
+                        "failing fast for %.1fs.",
+                        self.name,
+                        self._failures,
+                        self.reset_timeout,
+                    )
+                self._opened_at = time.monotonic()
+                self._set_state(_OPEN)
+
+    def record_neutral(self) -> None:
+        """
+        End a call that says nothing about the backend's health (e.g. it
+        rejected a bad request): the state and failure count are left as
+        they are, and a half-open trial slot is handed back for the next call.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+    def reset(self) -> None:
+        """Force the circuit closed (mainly for tests and manual recovery)."""
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            self._set_state(_CLOSED)
+
+    def _set_state(self, state: str) -> None:
+        self._state = state
+        self._state_gauge.set(_STATE_VALUES[state])
+
+    def _reject(self, reason: str) -> None:
+        self._rejections.inc()
+        raise CircuitOpenError(f"Circuit '{self.name}' is open ({reason}).")
+
+    def __repr__(self) -> str:
+        return f"CircuitBreaker(name={self.name!r}, state={self.state!r})"
+
+
+# Least recently used first; trimmed to MAX_BREAKERS.
+_BREAKERS: "OrderedDict[str, CircuitBreaker]" = OrderedDict()
+_BREAKERS_LOCK = threading.Lock()
+MAX_BREAKERS = 1024
+
+
+def get_breaker(name: str, **kwargs: Any) -> CircuitBreaker:
+    """
+    Return the process-wide breaker for ``name``, creating it on first use.
+
+    ``kwargs`` (``failure_threshold``, ``reset_timeout``) only apply when the
+    breaker is created.  At most ``MAX_BREAKERS`` are kept; the least
+    recently used one is dropped (and starts closed if asked for again).
+    """
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.get(name)
+        if breaker is None:
+            breaker = _BREAKERS[name] = CircuitBreaker(name, **kwargs)
+            while len(_BREAKERS) > MAX_BREAKERS:
+                _BREAKERS.popitem(last=False)
+        else:
+            _BREAKERS.move_to_end(name)
+        return breaker
+
+
+def endpoint_of(uri: str) -> str:
+    """
+    Reduce a URI to the endpoint it talks to, for keying shared breakers.
+
+    ``postgresql://user:pw@db:5432/app`` → ``postgresql://db:5432``.  URIs
+    without a network location reduce to their scheme (``sqlite:``), and
+    plain paths to their parent directory (``/mnt/nfs/out/a.json`` →
+    ``file:/mnt/nfs/out``): files written side by side share a breaker,
+    while a failing mount does not trip writes to the local disk.
+    """
+    parsed = urlsplit(str(uri))
+    if parsed.scheme and parsed.netloc:
+        host = parsed.netloc.rsplit("@", 1)[-1]
+        return f"{parsed.scheme}://{host}"
+    if len(parsed.scheme) > 1:  # one letter is a Windows drive
+        return f"{parsed.scheme}:"
+    path = ntpath if parsed.scheme else os.path  # "C:\\..." on any platform
+    return f"file:{path.dirname(path.abspath(str(uri)))}"
+
+
+def is_retryable(
+    exc: BaseException,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    fatal: Tuple[Type[BaseException], ...] = FATAL_EXCEPTIONS,
+) -> bool:
+    """
+    Classify ``exc`` as transient (worth another attempt) or fatal.
+
+    An explicit ``retryable`` attribute on the exception wins.  Otherwise
+    the exception and its ``__cause__`` chain are checked, so a component
+    error raised ``from`` a ``ValueError`` is still treated as fatal.
+    """
+    seen = 0
+    current: Optional[BaseException] = exc
+    while current is not None and seen < 8:
+        flag = getattr(current, "retryable", None)
+        if flag is not None:
+            return bool(flag)
+        if isinstance(current, fatal):
+            return False
+        current, seen = current.__cause__, seen + 1
+    return isinstance(exc, retry_on)
+
+
+class _RetryPolicy:
+    """Shared bookkeeping for :func:`retry` and :func:`aretry`."""
+
+    def __init__(
+        self,
+        func: Callable,
+        max_retries: int,
+        delay: float,
+        backoff: float,
+        max_delay: Optional[float],
+        jitter: float,
+        timeout: Optional[float],
+        retry_on: Tuple[Type[BaseException], ...],
+        fatal: Tuple[Type[BaseException], ...],
+        breaker: Union[None, str, CircuitBreaker, Callable[..., Any]],
+    ):
+        if not 0.0 <= jitter <= 1.0:
+            raise ValueError("jitter must be between 0 and 1")
+        self.name = getattr(func, "__qualname__", repr(func))
+        self.max_retries = max(int(max_retries), 1)
+        self.delay = delay
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.timeout = timeout
+        self.retry_on = retry_on
+        self.fatal = fatal
+        self.breaker = breaker
+
+    def resolve_breaker(self, args: tuple, kwargs: dict) -> Optional[CircuitBreaker]:
+        spec = self.breaker
+        if callable(spec) and not isinstance(spec, CircuitBreaker):
+            spec = spec(*args, **kwargs)
+        if isinstance(spec, str):
+            return get_breaker(spec)
+        return spec
+
+    def deadline(self) -> Optional[float]:
+        return None if self.timeout is None else time.monotonic() + self.timeout
+
+    def wait_for(self, attempt: int) -> float:
+        """Jittered back-off before attempt ``attempt + 1``."""
+        base = self.delay * self.backoff ** (attempt - 1)
+        if self.max_delay is not None:
+            base = min(base, self.max_delay)
+        return base * random.uniform(1.0 - self.jitter, 1.0)
+
+    def on_failure(
+        self,
+        exc: Exception,
+        attempt: int,
+        breaker: Optional[CircuitBreaker],
+        deadline: Optional[float],
+    ) -> Optional[float]:
+        """
+        Record a failed attempt.
+
+        Returns:
+            Seconds to sleep before the next attempt, or ``None`` when the
+            caller should re-raise ``exc``.
+        """
+        name = self.name
+        if isinstance(exc, CircuitOpenError):
+            return None
+        if not is_retryable(exc, self.retry_on, self.fatal):
+            # A bad request says nothing about the backend's health.
+            if breaker is not None:
+                breaker.record_neutral()
+            logger.debug("[Retry] %s raised non-retryable %r.", name, exc)
+            return None
+
+        if breaker is not None:
+            breaker.record_failure()
+            if breaker.state == _OPEN:
+                return None
+        if attempt >= self.max_retries:
+            logger.error("[Retry] %s failed after %d attempts.", name, attempt)
+            return None
+
+        wait = self.wait_for(attempt)
+        if deadline is not None and time.monotonic() + wait > deadline:
+            logger.error(
+                "[Retry] %s gave up after %d attempt(s): time budget of %.1fs spent.",
+                name,
+                attempt,
+                self.timeout,
+            )
+            return None
+
+        logger.warning(
+            "[Retry] %s failed (%d/%d). Retrying in %.2fs…",
+            name,
+            attempt,
+            self.max_retries,
+            wait,
+        )
+        return wait
+
+
 def retry(
     max_retries: int = 3,
     delay: float = 1.0,
     backoff: float = 2.0,
+    *,
+    max_delay: Optional[float] = None,
+    jitter: float = 0.5,
+    timeout: Optional[float] = None,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    fatal: Tuple[Type[BaseException], ...] = FATAL_EXCEPTIONS,
+    breaker: Union[None, str, CircuitBreaker, Callable[..., Any]] = None,
 ) -> Callable:
     """
-    Retry a function on failure with exponential back-off.
+    Retry a function on transient failure with jittered exponential back-off.
 
     Args:
         max_retries: Maximum number of attempts (default 3).
         delay: Initial wait between attempts in seconds (default 1.0).
         backoff: Multiplier applied to ``delay`` after each failure
                  (default 2.0 → 1 s → 2 s → 4 s …).
+        max_delay: Upper bound on a single wait.
+        jitter: Fraction of each wait that is randomised (0 = fixed delays,
+                1 = "full jitter"); spreads out retries from many workers
+                hitting the same backend.
+        timeout: Total time budget in seconds.  No new attempt is started
+                 if its back-off would end past the budget.
+        retry_on: Exception types considered transient.
+        fatal: Exception types never retried, even when raised as the
+               ``__cause__`` of another error (see :func:`is_retryable`).
+        breaker: A :class:`CircuitBreaker`, the name of a shared breaker, or
+                 a callable receiving the call's arguments and returning
+                 either — use the latter to key the breaker by endpoint.
 
     Raises:
-        The last exception raised if all attempts are exhausted.
+        The last exception raised if all attempts are exhausted, the first
+        non-retryable one, or :class:`CircuitOpenError` while the breaker
+        is open.
     """
 
     def decorator(func: Callable) -> Callable:
+        policy = _RetryPolicy(
+            func,
+            max_retries,
+            delay,
+            backoff,
+            max_delay,
+            jitter,
+            timeout,
+            retry_on,
+            fatal,
+            breaker,
+        )
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            last_exc: Exception | None = None
-            current_delay = delay
-
-            for attempt in range(max_retries):
+            circuit = policy.resolve_breaker(args, kwargs)
+            deadline = policy.deadline()
+            attempt = 0
+            while True:
+                attempt += 1
+                if circuit is not None:
+                    circuit.before_call()
                 try:
-                    return func(*args, **kwargs)
+                    result = func(*args, **kwargs)
                 except Exception as exc:
-                    last_exc = exc
-                    logger.warning(
-                        "[Retry] %s failed (%d/%d). Retrying in %.1fs…",
-                        func.__qualname__,
-                        attempt + 1,
-                        max_retries,
-                        current_delay,
-                    )
-                    time.sleep(current_delay)
-                    current_delay *= backoff
+                    wait = policy.on_failure(exc, attempt, circuit, deadline)
+                    if wait is None:
+                        raise
+                    time.sleep(wait)
+                else:
+                    if circuit is not None:
+                        circuit.record_success()
+                    return result
 
-            logger.error(
-                "[Retry] %s failed after %d attempts.", func.__qualname__, max_retries
-            )
-            raise last_exc
+        return wrapper
+
+    return decorator
+
+
+def aretry(
+    max_retries: int = 3,
+    delay: float = 1.0,
+    backoff: float = 2.0,
+    *,
+    max_delay: Optional[float] = None,
+    jitter: float = 0.5,
+    timeout: Optional[float] = None,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    fatal: Tuple[Type[BaseException], ...] = FATAL_EXCEPTIONS,
+    breaker: Union[None, str, CircuitBreaker, Callable[..., Any]] = None,
+) -> Callable:
+    """
+    Coroutine counterpart of :func:`retry` (same arguments and semantics).
+
+    Waits with ``asyncio.sleep`` so the event loop keeps serving other
+    tasks during back-off.
+    """
+
+    import asyncio  # deferred: asyncio costs ~40 ms and most callers are sync
+
+    def decorator(func: Callable) -> Callable:
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError(f"aretry requires a coroutine function, got {func!r}")
+        policy = _RetryPolicy(
+            func,
+            max_retries,
+            delay,
+            backoff,
+            max_delay,
+            jitter,
+            timeout,
+            retry_on,
+            fatal,
+            breaker,
+        )
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            circuit = policy.resolve_breaker(args, kwargs)
+            deadline = policy.deadline()
+            attempt = 0
+            while True:
+                attempt += 1
+                if circuit is not None:
+                    circuit.before_call()
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as exc:
+                    wait = policy.on_failure(exc, attempt, circuit, deadline)
+                    if wait is None:
+                        raise
+                    await asyncio.sleep(wait)
+                else:
+                    if circuit is not None:
+                        circuit.record_success()
+                    return result
 
         return wrapper
 
@@ -14,3 +14,9 @@ class RegistryError(SayouCoreError):
     """Raised when a registry operation is invalid (e.g. unknown role)."""
 
     pass
+
+
+class CircuitOpenError(SayouCoreError):
+    """Raised without calling the backend while its circuit breaker is open."""
+
+    pass
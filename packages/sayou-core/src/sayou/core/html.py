@@ -0,0 +1,402 @@
+"""
+Pluggable HTML parsing backends.
+
+Text extraction, link discovery and boilerplate removal used to go through
+BeautifulSoup with the pure-Python ``html.parser`` — for crawls the largest
+CPU cost after network I/O.  :func:`parse_html` returns an
+:class:`HtmlDocument` backed by the fastest parser installed:
+
+========== ======================= =========================================
+Backend    Package                 Notes
+========== ======================= =========================================
+selectolax ``selectolax`` (Lexbor) HTML5 tree construction; CSS built in.
+lxml       ``lxml`` (libxml2)      CSS selectors need ``cssselect``.
+bs4        ``beautifulsoup4``      ``html.parser``; the reference behaviour.
+========== ======================= =========================================
+
+On well-formed pages every backend matches the BeautifulSoup reference:
+``text()`` joins the document's text nodes like ``get_text(separator)``,
+including BeautifulSoup's collapsing of whitespace-only strings to a single
+``"\\n"`` or ``" "`` outside ``<pre>`` / ``<textarea>``.  The fast backends
+build the tree by HTML5 / libxml2 rules, so their output differs wherever
+those rules disagree with ``html.parser``:
+
+* ``\\r\\n`` becomes ``\\n``, a newline right after ``<pre>`` is dropped,
+  and libxml2 ignores content after ``</html>``.
+* Fragments without ``<head>``: a leading ``<title>`` / ``<meta>`` moves into
+  an implied ``<head>``, so ``<title>A</title><p>x</p>`` gives ``text()``
+  ``"x"`` instead of ``"A\\nx"``.
+* ``<title>`` content is raw text: ``<title> T <b>x</b></title>`` has title
+  ``" T <b>x</b>"`` (BeautifulSoup: None).
+* Text inside ``<table>`` outside a cell is moved before the table; with
+  selectolax it merges into the preceding string (``<div>a<table>stray``
+  gives ``"astray"``, not ``"a\\nstray"``).
+
+Consumers whose output must not change with the installed packages
+(``HtmlTextNormalizer``, ``RequestsFetcher``) therefore default to ``bs4``
+and take ``"auto"`` as an opt-in.
+
+Further backends can be added with :func:`register_html_backend`.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Type
+
+from .lazy import optional_from, optional_import
+
+BeautifulSoup = optional_from("bs4", "BeautifulSoup")
+lxml_html = optional_import("lxml.html")
+etree = optional_import("lxml.etree")
+LexborHTMLParser = optional_from("selectolax.lexbor", "LexborHTMLParser")
+
+# Elements whose text is never page content.
+BOILERPLATE_TAGS = ("script", "style", "noscript", "iframe", "head")
+
+# BeautifulSoup keeps whitespace-only strings verbatim only inside these.
+_PRESERVE_WHITESPACE = frozenset({"pre", "textarea"})
+_ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+
+
+def _collapse_blank(text: str) -> str:
+    """BeautifulSoup's treatment of a whitespace-only string."""
+    return "\n" if "\n" in text else " "
+
+
+class HtmlDocument:
+    """
+    (Utility) A parsed HTML page, independent of the parser behind it.
+
+    Read ``title()`` and ``meta()`` before ``text()``: text extraction may
+    remove the excluded elements (``<head>`` by default) from the tree.
+
+    Attributes:
+        name (str): Backend name used by ``parse_html``.
+        SUPPORTS_CSS (bool): Whether ``select_text`` works when installed.
+    """
+
+    name = "base"
+    SUPPORTS_CSS = True
+
+    @classmethod
+    def available(cls, css: bool = False) -> bool:
+        """True if the backend's parser (and CSS support, if asked) is installed."""
+        raise NotImplementedError
+
+    def __init__(self, markup: str):
+        raise NotImplementedError
+
+    def title(self) -> Optional[str]:
+        """Text of the first ``<title>``, or None."""
+        raise NotImplementedError
+
+    def meta(self) -> Dict[str, str]:
+        """``<meta name|property=... content=...>`` pairs; later tags win."""
+        raise NotImplementedError
+
+    def text(
+        self, separator: str = "\n", exclude: Iterable[str] = BOILERPLATE_TAGS
+    ) -> str:
+        """
+        Visible text: every text node outside ``exclude`` elements
+        (comments skipped), joined with ``separator``.
+        """
+        raise NotImplementedError
+
+    def select_text(self, selector: str) -> List[str]:
+        """
+        Stripped text of each element matching a CSS selector, like
+        BeautifulSoup's ``get_text(strip=True)``.
+        """
+        raise NotImplementedError
+
+    def links(self) -> List[str]:
+        """``href`` of every ``<a>`` that has one, in document order."""
+        raise NotImplementedError
+
+
+# ------------------------------------------------------------------------------
+# Backends
+# ------------------------------------------------------------------------------
+
+
+class Bs4Document(HtmlDocument):
+    """BeautifulSoup with ``html.parser`` (the reference behaviour)."""
+
+    name = "bs4"
+
+    @classmethod
+    def available(cls, css: bool = False) -> bool:
+        return BeautifulSoup is not None
+
+    def __init__(self, markup: str):
+        self.soup = BeautifulSoup(markup, "html.parser")
+
+    def title(self) -> Optional[str]:
+        tag = self.soup.title
+        return str(tag.string) if tag is not None and tag.string else None
+
+    def meta(self) -> Dict[str, str]:
+        found: Dict[str, str] = {}
+        for tag in self.soup.find_all("meta"):
+            name = tag.get("name") or tag.get("property")
+            content = tag.get("content")
+            if name and content:
+                found[name] = content
+        return found
+
+    def text(
+        self, separator: str = "\n", exclude: Iterable[str] = BOILERPLATE_TAGS
+    ) -> str:
+        for tag in self.soup(list(exclude)):
+            tag.extract()
+        return self.soup.get_text(separator=separator)
+
+    def select_text(self, selector: str) -> List[str]:
+        return [el.get_text(strip=True) for el in self.soup.select(selector)]
+
+    def links(self) -> List[str]:
+        return [a["href"] for a in self.soup.find_all("a", href=True)]
+
+
+class LxmlDocument(HtmlDocument):
+    """libxml2 through ``lxml.html``; the tree is walked without copying."""
+
+    name = "lxml"
+
+    @classmethod
+    def available(cls, css: bool = False) -> bool:
+        if lxml_html is None:
+            return False
+        return not css or optional_import("cssselect") is not None
+
+    def __init__(self, markup: str):
+        if not markup.strip():
+            markup = "<html></html>"
+        try:
+            self.root = lxml_html.document_fromstring(markup)
+        except ValueError:
+            # str input with an XML encoding declaration (XHTML).
+            parser = lxml_html.HTMLParser(encoding="utf-8")
+            self.root = lxml_html.document_fromstring(
+                markup.encode("utf-8"), parser=parser
+            )
+
+    def title(self) -> Optional[str]:
+        tag = self.root.find(".//title")
+        if tag is None or len(tag):
+            return None
+        return tag.text or None
+
+    def meta(self) -> Dict[str, str]:
+        found: Dict[str, str] = {}
+        for tag in self.root.iter("meta"):
+            name = tag.get("name") or tag.get("property")
+            content = tag.get("content")
+            if name and content:
+                found[name] = content
+        return found
+
+    def text(
+        self, separator: str = "\n", exclude: Iterable[str] = BOILERPLATE_TAGS
+    ) -> str:
+        return separator.join(self._strings(self.root, frozenset(exclude)))
+
+    def select_text(self, selector: str) -> List[str]:
+        return [
+            "".join(s.strip() for s in self._strings(el, frozenset(), tail=False))
+            for el in self.root.cssselect(selector)
+        ]
+
+    def links(self) -> List[str]:
+        return [
+            href for a in self.root.iter("a") if (href := a.get("href")) is not None
+        ]
+
+    @staticmethod
+    def _strings(
+        root: "etree._Element", exclude: frozenset, tail: bool = True
+    ) -> Iterator[str]:
+        """
+        Text nodes under ``root`` in document order, in BeautifulSoup's form.
+
+        libxml2 stores text as ``.text`` (before the first child) and
+        ``.tail`` (after the element); an excluded element or a comment
+        is skipped but its tail is not.
+        """
+        preserve = 0
+        walker = etree.iterwalk(root, events=("start", "end", "comment", "pi"))
+        for event, el in walker:
+            tag = el.tag
+            if event == "start":
+                if tag in exclude:
+                    walker.skip_subtree()
+                    continue
+                if tag in _PRESERVE_WHITESPACE:
+                    preserve += 1
+                text = el.text
+            elif event == "end":
+                if tag in _PRESERVE_WHITESPACE and tag not in exclude:
+                    preserve -= 1
+                if el is root and not tail:
+                    continue
+                text = el.tail
+            else:
+                # Comment / processing instruction: only its tail is text.
+                text = el.tail
+            if text:
+                if not preserve and not text.strip(_ASCII_SPACES):
+                    text = _collapse_blank(text)
+                yield text
+
+
+class SelectolaxDocument(HtmlDocument):
+    """Lexbor (HTML5) through ``selectolax``."""
+
+    name = "selectolax"
+
+    @classmethod
+    def available(cls, css: bool = False) -> bool:
+        return LexborHTMLParser is not None
+
+    def __init__(self, markup: str):
+        self.tree = LexborHTMLParser(markup)
+
+    def title(self) -> Optional[str]:
+        tag = self.tree.css_first("title")
+        if tag is None:
+            return None
+        return tag.text(deep=True) or None
+
+    def meta(self) -> Dict[str, str]:
+        found: Dict[str, str] = {}
+        for tag in self.tree.css("meta"):
+            attrs = tag.attributes
+            name = attrs.get("name") or attrs.get("property")
+            content = attrs.get("content")
+            if name and content:
+                found[name] = content
+        return found
+
+    def text(
+        self, separator: str = "\n", exclude: Iterable[str] = BOILERPLATE_TAGS
+    ) -> str:
+        exclude = list(exclude)
+        if exclude:
+            self.tree.strip_tags(exclude)
+        root = self.tree.root
+        if root is None:
+            return ""
+        return separator.join(self._strings(root))
+
+    def select_text(self, selector: str) -> List[str]:
+        return [
+            el.text(deep=True, separator="", strip=True)
+            for el in self.tree.css(selector)
+        ]
+
+    def links(self) -> List[str]:
+        return [a.attributes.get("href") or "" for a in self.tree.css("a[href]")]
+
+    @staticmethod
+    def _strings(root) -> Iterator[str]:
+        for node in root.traverse(include_text=True):
+            if node.tag != "-text":
+                continue
+            text = node.text_content
+            if not text:
+                continue
+            if not text.strip(_ASCII_SPACES) and not _in_preserved(node):
+                text = _collapse_blank(text)
+            yield text
+
+
+def _in_preserved(node) -> bool:
+    parent = node.parent
+    while parent is not None:
+        if parent.tag in _PRESERVE_WHITESPACE:
+            return True
+        parent = parent.parent
+    return False
+
+
+# ------------------------------------------------------------------------------
+# Registry
+# ------------------------------------------------------------------------------
+
+# Fastest first: "auto" picks the first available entry.
+_BACKENDS: Dict[str, Type[HtmlDocument]] = {
+    SelectolaxDocument.name: SelectolaxDocument,
+    LxmlDocument.name: LxmlDocument,
+    Bs4Document.name: Bs4Document,
+}
+
+
+def register_html_backend(
+    cls: Type[HtmlDocument], preferred: bool = False
+) -> Type[HtmlDocument]:
+    """
+    Add (or replace) a backend under ``cls.name``.
+
+    Args:
+        cls: ``HtmlDocument`` subclass.
+        preferred: Try it before the built-in backends in ``"auto"`` mode.
+
+    Returns:
+        The class, so this can be used as a decorator.
+    """
+    global _BACKENDS
+    rest = {name: c for name, c in _BACKENDS.items() if name != cls.name}
+    if preferred:
+        _BACKENDS = {cls.name: cls, **rest}
+    else:
+        _BACKENDS = {**rest, cls.name: cls}
+    return cls
+
+
+def available_html_backends(css: bool = False) -> List[str]:
+    """Names of the installed backends, fastest first."""
+    return [name for name, cls in _BACKENDS.items() if cls.available(css)]
+
+
+def get_html_backend(name: str = "auto", css: bool = False) -> Type[HtmlDocument]:
+    """
+    Resolve a backend class.
+
+    Args:
+        name: Backend name, or ``"auto"`` for the fastest installed one.
+        css: Require CSS selector support (``select_text``).
+
+    Raises:
+        ValueError: If ``name`` is not a registered backend.
+        ImportError: If the backend (or no backend at all) is installed.
+    """
+    if name == "auto":
+        for cls in _BACKENDS.values():
+            if cls.available(css):
+                return cls
+        raise ImportError(
+            "No HTML parser installed; install selectolax, lxml or beautifulsoup4."
+        )
+
+    cls = _BACKENDS.get(name)
+    if cls is None:
+        raise ValueError(
+            f"Unknown HTML backend {name!r} (expected one of {list(_BACKENDS)})"
+        )
+    if not cls.available(css):
+        raise ImportError(f"HTML backend {name!r} is not installed.")
+    return cls
+
+
+def parse_html(markup: str, backend: str = "auto", css: bool = False) -> HtmlDocument:
+    """
+    Parse ``markup`` with the chosen (or fastest available) backend.
+
+    Args:
+        markup: HTML text.
+        backend: Backend name or ``"auto"``.
+        css: Pick a backend able to evaluate CSS selectors.
+
+    Returns:
+        HtmlDocument: The parsed page.
+    """
+    return get_html_backend(backend, css)(markup)
@@ -0,0 +1,160 @@
+"""
+Deferred imports for package ``__init__`` modules and heavy dependencies.
+
+Importing ``sayou.brain`` used to pull in every sub-package and, through
+them, PyMuPDF, openpyxl, python-docx, networkx, rich and friends — seconds
+of start-up for a worker process that may only ever touch one of them.
+The helpers below keep those costs off the import path:
+
+* :func:`lazy_exports` implements PEP 562 ``__getattr__`` / ``__dir__`` for
+  a package ``__init__``, importing each public name's module on first
+  access::
+
+      __getattr__, __dir__ = lazy_exports(
+          __name__, {"PdfParser": ".parser.pdf_parser"}
+      )
+
+* :func:`optional_import` and :func:`optional_from` replace the usual
+  ``try: import x / except ImportError: x = None`` block in a component
+  module.  They return ``None`` when the dependency is not installed (so
+  existing ``if x is None`` checks keep working), otherwise a stand-in that
+  performs the real import on first use.  :func:`lazy_import` and
+  :func:`lazy_from` are the equivalents for a required dependency: they
+  still fail at import time when the package is missing.
+
+This module must stay dependency-free: package ``__init__`` files import it.
+"""
+
+import importlib
+import importlib.util
+import sys
+import threading
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+_IMPORT_LOCK = threading.RLock()
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build PEP 562 module hooks resolving ``exports`` on demand.
+
+    Args:
+        package: ``__name__`` of the package ``__init__``.
+        exports: Public name → module path (relative to ``package`` when it
+            starts with a dot) that defines it.
+
+    Returns:
+        ``(__getattr__, __dir__)`` to assign at module level.  Resolved
+        names are cached in the package namespace, so the hook runs at most
+        once per name.
+    """
+
+    def __getattr__(name: str) -> Any:
+        target = exports.get(name)
+        if target is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(target, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
+
+
+def _is_installed(name: str) -> bool:
+    if name in sys.modules:
+        return sys.modules[name] is not None
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class _Deferred:
+    """Stand-in for a module or attribute imported on first use."""
+
+    __slots__ = ("_module", "_attr", "_target")
+
+    def __init__(self, module: str, attr: Optional[str] = None):
+        self._module = module
+        self._attr = attr
+        self._target: Any = None
+
+    def _resolve(self) -> Any:
+        if self._target is None:
+            with _IMPORT_LOCK:
+                if self._target is None:
+                    target = importlib.import_module(self._module)
+                    if self._attr is not None:
+                        target = getattr(target, self._attr)
+                    self._target = target
+        return self._target
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._resolve()(*args, **kwargs)
+
+    def __instancecheck__(self, obj: Any) -> bool:
+        return isinstance(obj, self._resolve())
+
+    def __repr__(self) -> str:
+        name = self._module + (f".{self._attr}" if self._attr else "")
+        state = "loaded" if self._target is not None else "deferred"
+        return f"<{state} import {name}>"
+
+
+def lazy_import(name: str) -> Any:
+    """
+    ``import name`` for a required dependency, executed on first use.
+
+    Raises:
+        ImportError: Immediately, if ``name`` is not installed — the same
+            failure a plain ``import`` would give, just without the cost of
+            executing the module up front.
+    """
+    module = optional_import(name)
+    if module is None:
+        raise ImportError(f"No module named {name!r}", name=name)
+    return module
+
+
+def lazy_from(module: str, attr: str) -> Any:
+    """:func:`optional_from` for a required dependency (see :func:`lazy_import`)."""
+    value = optional_from(module, attr)
+    if value is None:
+        raise ImportError(f"No module named {module!r}", name=module)
+    return value
+
+
+def optional_import(name: str) -> Optional[Any]:
+    """
+    Module ``name`` imported on first attribute access, or ``None``.
+
+    Already-imported modules are returned as-is.
+    """
+    module = sys.modules.get(name)
+    if isinstance(module, ModuleType):
+        return module
+    if not _is_installed(name.partition(".")[0]):
+        return None
+    return _Deferred(name)
+
+
+def optional_from(module: str, attr: str) -> Optional[Any]:
+    """
+    ``from module import attr`` deferred until the name is first used.
+
+    The stand-in can be called, have attributes read, and be used as the
+    second argument of ``isinstance``.  Returns ``None`` when ``module``'s
+    distribution is not installed.
+    """
+    if not _is_installed(module.partition(".")[0]):
+        return None
+    return _Deferred(module, attr)
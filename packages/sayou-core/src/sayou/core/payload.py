@@ -0,0 +1,283 @@
+"""
+Spill-to-disk binary payloads for ``SayouPacket.data``.
+
+Fetchers normally hand over the whole file as ``bytes``.  For multi-GB
+inputs that means one full copy in memory per packet in flight, so large
+payloads are represented by a ``SpooledPayload`` instead:
+
+* below ``threshold`` the bytes stay in memory (no behaviour change);
+* above it the payload is backed by a file — the original file for local
+  sources, a temporary file for downloaded ones — and read through
+  ``mmap`` or a regular file handle on demand.
+
+Consumers should not need to know which case they got::
+
+    stream = as_stream(packet.data)     # seekable binary file object
+    buffer = as_buffer(packet.data)     # bytes or read-only memoryview
+    path = payload_path(packet.data)    # file path when disk-backed, else None
+
+``SpooledPayload`` also supports the small subset of the ``bytes`` API that
+parsers use for sniffing (``len()``, ``startswith()``, slicing, ``decode()``).
+"""
+
+import io
+import mmap
+import os
+import tempfile
+from typing import BinaryIO, Iterable, Optional, Union
+
+DEFAULT_SPOOL_THRESHOLD = 64 * 1024 * 1024
+_COPY_CHUNK = 1024 * 1024
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class SpooledPayload:
+    """
+    A binary payload held in memory or backed by a file on disk.
+
+    Build one with :meth:`from_path`, :meth:`from_stream` or
+    :meth:`from_chunks`; call :meth:`close` (or use it as a context manager)
+    to release the mapping and delete any temporary file it owns.
+    """
+
+    __slots__ = ("_data", "_path", "_owned", "_size", "_file", "_mmap")
+
+    def __init__(
+        self,
+        data: Optional[bytes] = None,
+        path: Optional[str] = None,
+        owned: bool = False,
+    ):
+        if (data is None) == (path is None):
+            raise ValueError("SpooledPayload needs exactly one of data or path")
+        self._data = data
+        self._path = path
+        self._owned = owned
+        self._size = len(data) if data is not None else os.path.getsize(path)
+        self._file = None
+        self._mmap = None
+
+    # ------------------------------------------------------------------
+    # Constructors
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_path(
+        cls, path: str, threshold: int = DEFAULT_SPOOL_THRESHOLD
+    ) -> Union[bytes, "SpooledPayload"]:
+        """
+        Load a local file, referencing it in place when it is large.
+
+        Args:
+            path: File to read.
+            threshold: Files up to this many bytes are returned as ``bytes``.
+
+        Returns:
+            ``bytes`` for small files, otherwise a path-backed payload that
+            does not own (and will never delete) the file.
+        """
+        if os.path.getsize(path) <= threshold:
+            with open(path, "rb") as f:
+                return f.read()
+        return cls(path=path)
+
+    @classmethod
+    def from_stream(
+        cls, stream: BinaryIO, threshold: int = DEFAULT_SPOOL_THRESHOLD
+    ) -> Union[bytes, "SpooledPayload"]:
+        """
+        Drain a readable binary stream (e.g. an S3 ``StreamingBody``).
+
+        Args:
+            stream: Object with ``read(size)``.
+            threshold: Bytes kept in memory before spilling to a temp file.
+
+        Returns:
+            ``bytes`` if the stream fits under ``threshold``, otherwise a
+            payload owning a temporary file.
+        """
+        return cls.from_chunks(iter(lambda: stream.read(_COPY_CHUNK), b""), threshold)
+
+    @classmethod
+    def from_chunks(
+        cls, chunks: Iterable[bytes], threshold: int = DEFAULT_SPOOL_THRESHOLD
+    ) -> Union[bytes, "SpooledPayload"]:
+        """Same as :meth:`from_stream` for an iterable of byte chunks."""
+        writer = PayloadWriter(threshold)
+        try:
+            for chunk in chunks:
+                writer.write(chunk)
+        except BaseException:
+            writer.discard()
+            raise
+        return writer.finish()
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+
+    @property
+    def path(self) -> Optional[str]:
+        """Backing file path, or ``None`` for in-memory payloads."""
+        return self._path
+
+    @property
+    def is_spilled(self) -> bool:
+        return self._path is not None
+
+    def view(self) -> Union[bytes, memoryview]:
+        """Zero-copy buffer over the payload (``mmap`` when disk-backed)."""
+        if self._data is not None:
+            return self._data
+        if self._size == 0:
+            return b""
+        if self._mmap is None:
+            self._file = open(self._path, "rb")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(self._mmap)
+
+    def open(self) -> BinaryIO:
+        """Return a new seekable binary file object positioned at 0."""
+        if self._data is not None:
+            return io.BytesIO(self._data)
+        return open(self._path, "rb")
+
+    def read(self) -> bytes:
+        """Materialise the payload as ``bytes`` (copies when disk-backed)."""
+        if self._data is not None:
+            return self._data
+        with open(self._path, "rb") as f:
+            return f.read()
+
+    def close(self) -> None:
+        """Release the mapping and delete the backing file if owned."""
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # A memoryview handed out by view() is still alive; the
+                # mapping is released when it is garbage-collected.
+                pass
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._owned and self._path is not None:
+            try:
+                os.remove(self._path)
+            except OSError:
+                pass
+            self._owned = False
+
+    # ------------------------------------------------------------------
+    # bytes-like sniffing helpers
+    # ------------------------------------------------------------------
+
+    def startswith(self, prefix) -> bool:
+        if isinstance(prefix, tuple):
+            return any(self.startswith(p) for p in prefix)
+        return self[: len(prefix)] == prefix
+
+    def decode(self, encoding: str = "utf-8", errors: str = "strict") -> str:
+        return self.read().decode(encoding, errors)
+
+    def __getitem__(self, index):
+        if self._data is not None:
+            return self._data[index]
+        if isinstance(index, slice):
+            return bytes(self.view()[index])
+        return self.view()[index]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __bytes__(self) -> bytes:
+        return self.read()
+
+    def __reduce__(self):
+        # Spilled payloads cross process boundaries by path; the sending
+        # side keeps ownership of any temporary file.
+        return (SpooledPayload, (self._data, self._path))
+
+    def __enter__(self) -> "SpooledPayload":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def __repr__(self) -> str:
+        where = self._path if self._path else "memory"
+        return f"SpooledPayload(size={self._size}, backing={where!r})"
+
+
+class PayloadWriter:
+    """
+    Write-only sink that spills to a temporary file past ``threshold``.
+
+    Useful for downloaders that push into a file object (e.g. Google's
+    ``MediaIoBaseDownload``).  Call :meth:`finish` to obtain the result.
+    """
+
+    def __init__(self, threshold: int = DEFAULT_SPOOL_THRESHOLD):
+        self.threshold = threshold
+        self._buffer = io.BytesIO()
+        self._file = None
+        self._path: Optional[str] = None
+
+    def write(self, data: BytesLike) -> int:
+        if self._file is None and self._buffer.tell() + len(data) > self.threshold:
+            fd, self._path = tempfile.mkstemp(prefix="sayou-spool-")
+            self._file = os.fdopen(fd, "wb")
+            self._file.write(self._buffer.getbuffer())
+            self._buffer = None
+        target = self._file if self._file is not None else self._buffer
+        return target.write(data)
+
+    def finish(self) -> Union[bytes, SpooledPayload]:
+        """Return ``bytes`` if nothing spilled, else an owning payload."""
+        if self._file is None:
+            return self._buffer.getvalue()
+        self._file.close()
+        return SpooledPayload(path=self._path, owned=True)
+
+    def discard(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            os.remove(self._path)
+            self._file = None
+
+
+# ----------------------------------------------------------------------
+# Consumer helpers
+# ----------------------------------------------------------------------
+
+
+def as_stream(data: Union[BytesLike, SpooledPayload]) -> BinaryIO:
+    """Seekable binary file object for ``bytes`` or a ``SpooledPayload``."""
+    if isinstance(data, SpooledPayload):
+        return data.open()
+    return io.BytesIO(data)
+
+
+def as_buffer(data: Union[BytesLike, SpooledPayload]) -> BytesLike:
+    """Bytes-like object without copying (``mmap`` view when spilled)."""
+    if isinstance(data, SpooledPayload):
+        return data.view()
+    return data
+
+
+def payload_path(data: object) -> Optional[str]:
+    """Backing file path of a spilled payload, otherwise ``None``."""
+    if isinstance(data, SpooledPayload):
+        return data.path
+    return None
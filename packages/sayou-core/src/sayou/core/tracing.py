@@ -0,0 +1,445 @@
+import json
+import os
+import random
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, List, Optional
+
+# ---------------------------------------------------------------------------
+# Lightweight span tracing
+#
+# Spans follow the OpenTelemetry data model (trace id / span id / parent id,
+# start & end in unix nanoseconds, attributes, status) so exported files can
+# be fed to OTLP-aware tooling, or converted with ``to_chrome_trace()`` and
+# opened in chrome://tracing / Perfetto as a flame / timeline chart.
+#
+# Tracing is off by default: the default tracer has no exporter, so every
+# span is a shared no-op object and the overhead is one ContextVar lookup.
+# ---------------------------------------------------------------------------
+
+# Keys used to propagate trace context through SayouPacket.meta and
+# SayouChunk.metadata.
+TRACE_ID_KEY = "trace_id"
+SPAN_ID_KEY = "span_id"
+
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_SPAN_KIND_INTERNAL = 1
+
+
+def _new_trace_id() -> str:
+    return os.urandom(16).hex()
+
+
+def _new_span_id() -> str:
+    return os.urandom(8).hex()
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class SpanContext:
+    """Identifiers needed to parent a span, possibly across a process boundary."""
+
+    __slots__ = ("trace_id", "span_id", "sampled")
+
+    def __init__(self, trace_id: str, span_id: str, sampled: bool = True) -> None:
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.sampled = sampled
+
+    def __repr__(self) -> str:
+        return f"SpanContext(trace_id={self.trace_id}, span_id={self.span_id})"
+
+
+class Span:
+    """
+    A timed operation.  Use as a context manager (via ``Tracer.start_span``)
+    so the span becomes the implicit parent of spans started inside it.
+    """
+
+    __slots__ = (
+        "_tracer",
+        "_token",
+        "_t0",
+        "name",
+        "context",
+        "parent_id",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "status",
+        "status_message",
+    )
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        context: SpanContext,
+        parent_id: Optional[str],
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self._tracer = tracer
+        self._token = None
+        self.name = name
+        self.context = context
+        self.parent_id = parent_id
+        self.attributes: Dict[str, Any] = dict(attributes) if attributes else {}
+        self.status = STATUS_UNSET
+        self.status_message = ""
+        self.start_ns = time.time_ns()
+        self._t0 = time.perf_counter_ns()
+        self.end_ns: Optional[int] = None
+
+    @property
+    def trace_id(self) -> str:
+        return self.context.trace_id
+
+    @property
+    def span_id(self) -> str:
+        return self.context.span_id
+
+    @property
+    def is_recording(self) -> bool:
+        return True
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_status(self, status: int, message: str = "") -> None:
+        self.status = status
+        self.status_message = message
+
+    def end(self) -> None:
+        if self.end_ns is not None:
+            return
+        self.end_ns = self.start_ns + (time.perf_counter_ns() - self._t0)
+        self._tracer._export(self)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Return the span in the OTLP/JSON span shape."""
+        status: Dict[str, Any] = {"code": self.status}
+        if self.status_message:
+            status["message"] = self.status_message
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id or "",
+            "name": self.name,
+            "kind": _SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [
+                {"key": k, "value": _otlp_value(v)} for k, v in self.attributes.items()
+            ],
+            "status": status,
+        }
+
+    def __enter__(self) -> "Span":
+        self._token = _CURRENT_SPAN.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc is not None:
+            self.set_status(STATUS_ERROR, f"{exc_type.__name__}: {exc}")
+        elif self.status == STATUS_UNSET:
+            self.status = STATUS_OK
+        if self._token is not None:
+            _CURRENT_SPAN.reset(self._token)
+            self._token = None
+        self.end()
+
+
+class _NoopSpan:
+    """Shared stand-in for unsampled or disabled spans."""
+
+    __slots__ = ()
+
+    context = None
+    trace_id = None
+    span_id = None
+    is_recording = False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_status(self, status: int, message: str = "") -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+class _UnsampledRoot(_NoopSpan):
+    """
+    No-op span that still occupies the current-span slot so children of an
+    unsampled root are dropped too, instead of each rolling the dice again.
+    """
+
+    __slots__ = ("_token",)
+
+    def __init__(self) -> None:
+        self._token = None
+
+    def __enter__(self) -> "_UnsampledRoot":
+        self._token = _CURRENT_SPAN.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._token is not None:
+            _CURRENT_SPAN.reset(self._token)
+            self._token = None
+
+
+NOOP_SPAN = _NoopSpan()
+
+_CURRENT_SPAN: ContextVar[Any] = ContextVar("sayou_current_span", default=None)
+
+
+# ==============================================================================
+# Exporters
+# ==============================================================================
+
+
+class JsonlSpanExporter:
+    """
+    Append finished spans, one OTLP/JSON object per line, to a local file.
+
+    Writes are serialised with a lock so the exporter can be shared by
+    threads; each line is flushed immediately so a crashed run still leaves
+    a readable trace.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        self._lock = threading.Lock()
+        self._fh = open(path, "a", encoding="utf-8")
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_otlp(), ensure_ascii=False)
+        with self._lock:
+            self._fh.write(line + "\n")
+            self._fh.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._fh.closed:
+                self._fh.close()
+
+
+class InMemorySpanExporter:
+    """Collect finished spans in a list (tests and ad-hoc inspection)."""
+
+    def __init__(self) -> None:
+        self.spans: List[Span] = []
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def close(self) -> None:
+        pass
+
+
+# ==============================================================================
+# Tracer
+# ==============================================================================
+
+
+class Tracer:
+    """
+    Creates spans, decides sampling and hands finished spans to an exporter.
+
+    Sampling is head-based: the decision is taken once at the root span
+    (``sample_rate`` probability) and inherited by every descendant, so a
+    trace is either complete or absent.
+
+    Example::
+
+        tracer = configure_tracing("./traces/spans.jsonl", sample_rate=0.1)
+        with tracer.start_span("ingest", source="./docs"):
+            with tracer.start_span("document.run", file="a.pdf"):
+                ...
+    """
+
+    def __init__(self, exporter: Any = None, sample_rate: float = 1.0) -> None:
+        self.exporter = exporter
+        self.sample_rate = max(0.0, min(1.0, float(sample_rate)))
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None and self.sample_rate > 0.0
+
+    def current_span(self) -> Any:
+        """Return the active span in this context, or ``None``."""
+        return _CURRENT_SPAN.get()
+
+    def start_span(
+        self,
+        name: str,
+        parent: Optional[SpanContext] = None,
+        **attributes: Any,
+    ) -> Any:
+        """
+        Start a span named ``name``.
+
+        Args:
+            name: Operation name, e.g. ``"document.run"``.
+            parent: Explicit parent (for example one returned by
+                    ``extract()``).  Defaults to the active span.
+            **attributes: Initial span attributes.
+
+        Returns:
+            A ``Span`` — or a no-op stand-in when tracing is disabled or the
+            trace was not sampled.  Both are context managers.
+        """
+        if self.exporter is None:
+            return NOOP_SPAN
+
+        if parent is None:
+            active = _CURRENT_SPAN.get()
+            if active is not None:
+                if not active.is_recording:
+                    return NOOP_SPAN
+                parent = active.context
+
+        if parent is None:
+            if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+                return _UnsampledRoot()
+            context = SpanContext(_new_trace_id(), _new_span_id())
+            return Span(self, name, context, None, attributes)
+
+        if not parent.sampled:
+            return NOOP_SPAN
+        context = SpanContext(parent.trace_id, _new_span_id())
+        return Span(self, name, context, parent.span_id, attributes)
+
+    # ------------------------------------------------------------------
+    # Context propagation
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def inject(carrier: Dict[str, Any], span: Any = None) -> Dict[str, Any]:
+        """
+        Write the trace/span ids of ``span`` (default: the active span) into
+        ``carrier`` — typically ``SayouPacket.meta`` or chunk metadata.
+        Nothing is written for unsampled or disabled spans.
+        """
+        span = span if span is not None else _CURRENT_SPAN.get()
+        if span is not None and span.is_recording:
+            carrier[TRACE_ID_KEY] = span.trace_id
+            carrier[SPAN_ID_KEY] = span.span_id
+        return carrier
+
+    @staticmethod
+    def extract(carrier: Optional[Dict[str, Any]]) -> Optional[SpanContext]:
+        """Rebuild a ``SpanContext`` previously written by ``inject()``."""
+        if not carrier:
+            return None
+        trace_id = carrier.get(TRACE_ID_KEY)
+        span_id = carrier.get(SPAN_ID_KEY)
+        if not trace_id or not span_id:
+            return None
+        return SpanContext(trace_id, span_id)
+
+    def _export(self, span: Span) -> None:
+        exporter = self.exporter
+        if exporter is not None:
+            exporter.export(span)
+
+    def shutdown(self) -> None:
+        """Close the exporter (flushes file handles)."""
+        if self.exporter is not None:
+            self.exporter.close()
+
+
+_TRACER = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Return the process-wide tracer (disabled unless configured)."""
+    return _TRACER
+
+
+def set_tracer(tracer: Tracer) -> Tracer:
+    """Replace the process-wide tracer and return the previous one."""
+    global _TRACER
+    previous, _TRACER = _TRACER, tracer
+    return previous
+
+
+def configure_tracing(path: str, sample_rate: float = 1.0) -> Tracer:
+    """
+    Enable tracing process-wide, exporting spans to ``path`` as JSONL.
+
+    Args:
+        path: Destination file; appended to if it exists.
+        sample_rate: Fraction of root spans (e.g. ingest runs) to record.
+    """
+    tracer = Tracer(JsonlSpanExporter(path), sample_rate=sample_rate)
+    set_tracer(tracer).shutdown()
+    return tracer
+
+
+# ==============================================================================
+# Viewing
+# ==============================================================================
+
+
+def to_chrome_trace(spans: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Convert OTLP/JSON spans (as written by ``JsonlSpanExporter``) into the
+    Chrome Trace Event format, loadable in chrome://tracing or Perfetto.
+
+    Each trace becomes one "process" row so concurrent runs don't overlap::
+
+        with open("spans.jsonl") as f:
+            spans = [json.loads(line) for line in f]
+        json.dump(to_chrome_trace(spans), open("trace.json", "w"))
+    """
+    pids: Dict[str, int] = {}
+    events: List[Dict[str, Any]] = []
+
+    for span in spans:
+        start = int(span["startTimeUnixNano"])
+        end = int(span["endTimeUnixNano"])
+        pid = pids.setdefault(span["traceId"], len(pids) + 1)
+        args = {
+            a["key"]: next(iter(a["value"].values()))
+            for a in span.get("attributes", [])
+        }
+        args["span_id"] = span["spanId"]
+        if span.get("parentSpanId"):
+            args["parent_span_id"] = span["parentSpanId"]
+        events.append(
+            {
+                "name": span["name"],
+                "ph": "X",
+                "ts": start / 1000.0,
+                "dur": max(end - start, 0) / 1000.0,
+                "pid": pid,
+                "tid": pid,
+                "args": args,
+            }
+        )
+
+    events.sort(key=lambda e: e["ts"])
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
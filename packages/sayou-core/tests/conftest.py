@@ -0,0 +1,25 @@
+"""
+Shared pytest fixtures for the sayou-core test suite.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# ---------------------------------------------------------------------------
+# sys.path — core src (so the suite runs without an editable install)
+# ---------------------------------------------------------------------------
+_CORE_SRC = Path(__file__).resolve().parent.parent / "src"
+if str(_CORE_SRC) not in sys.path:
+    sys.path.insert(0, str(_CORE_SRC))
+
+from sayou.core.metrics import MetricsRegistry  # noqa: E402
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    """A fresh, isolated metrics registry."""
+    return MetricsRegistry()
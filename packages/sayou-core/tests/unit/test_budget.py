@@ -0,0 +1,148 @@
+"""
+Unit tests for sayou.core.budget.
+
+Covers:
+- Blocking admission and wake-up on release.
+- Deadlock safety: oversize items, resident bytes and an owner's own
+  leases never block alone.
+- Object leases released explicitly, via bounded(), or on garbage collection.
+- Size estimation and the exported usage gauge.
+"""
+
+import gc
+import threading
+import time
+
+import pytest
+from sayou.core.budget import MemoryBudget, estimate_size, resolve_budget
+from sayou.core.metrics import get_registry
+from sayou.core.payload import SpooledPayload
+from sayou.core.schemas import SayouNode, SayouPacket
+
+
+class TestAdmission:
+    def test_acquire_blocks_until_release(self):
+        budget = MemoryBudget(100)
+        budget.acquire(80)
+        admitted = threading.Event()
+
+        def producer():
+            budget.acquire(50)
+            admitted.set()
+
+        thread = threading.Thread(target=producer)
+        thread.start()
+        assert not admitted.wait(0.05)
+
+        budget.release(80)
+        assert admitted.wait(1.0)
+        thread.join()
+        assert budget.in_use == 50
+
+    def test_oversize_item_admitted_when_idle(self):
+        budget = MemoryBudget(10)
+        assert budget.acquire(1000) == 1000
+        assert budget.in_use == 1000
+
+    def test_timeout_admits_anyway(self):
+        budget = MemoryBudget(10, timeout=0.01)
+        budget.acquire(10)
+        start = time.perf_counter()
+        budget.acquire(10)
+        assert time.perf_counter() - start < 0.5
+        assert budget.in_use == 20
+
+    def test_resident_bytes_do_not_block_lone_producer(self):
+        budget = MemoryBudget(10)
+        budget.hold(50)
+        budget.acquire(5)  # nothing in flight: must not wait on resident data
+        assert budget.stats() == {
+            "max_bytes": 10,
+            "inflight": 5,
+            "resident": 50,
+            "in_use": 55,
+        }
+        budget.unhold(50)
+        assert budget.in_use == 5
+
+    def test_owner_not_blocked_by_own_leases(self):
+        budget = MemoryBudget(10)
+        owner = object()
+        budget.acquire(8, owner=owner)
+        budget.acquire(8, owner=owner)  # only our own bytes in flight
+        assert budget.in_use == 16
+        budget.release(16, owner)
+        assert budget.in_use == 0
+
+    def test_owner_waits_on_other_owners(self):
+        budget = MemoryBudget(10, timeout=0.05)
+        budget.acquire(8)
+        start = time.perf_counter()
+        budget.acquire(8, owner=object())
+        assert time.perf_counter() - start >= 0.04
+
+    def test_invalid_cap(self):
+        with pytest.raises(ValueError):
+            MemoryBudget(0)
+
+
+class TestLeases:
+    def test_release_obj(self):
+        budget = MemoryBudget(1000)
+        packet = SayouPacket(data=b"x" * 100)
+        assert budget.track(packet) == 100
+        budget.release_obj(packet)
+        budget.release_obj(packet)  # idempotent
+        assert budget.in_use == 0
+
+    def test_released_on_garbage_collection(self):
+        budget = MemoryBudget(1000)
+        packet = SayouPacket(data=b"x" * 100)
+        budget.track(packet)
+        del packet
+        gc.collect()
+        assert budget.in_use == 0
+
+    def test_bounded_releases_before_next_pull(self):
+        budget = MemoryBudget(150)
+        seen = []
+
+        def produce():
+            for _ in range(5):
+                packet = SayouPacket(data=b"x" * 100)
+                budget.track(packet)  # would deadlock without bounded()
+                seen.append(budget.in_use)
+                yield packet
+
+        held = list(budget.bounded(produce()))
+        assert len(held) == 5
+        assert max(seen) == 100
+        assert budget.in_use == 0
+
+
+class TestSizing:
+    def test_estimate_size(self):
+        assert estimate_size(b"abcd") == 4
+        assert estimate_size({"content": "abc", "meta": {"k": b"xy"}}) == 5
+        assert estimate_size(SayouPacket(data=b"x" * 10)) == 10
+        node = SayouNode(node_id="n", node_class="c", vector=[0.0] * 4)
+        assert estimate_size(node) == len("n") + len("c") + 32
+
+    def test_spilled_payload_counts_zero(self, tmp_path):
+        path = tmp_path / "f.bin"
+        path.write_bytes(b"x" * 100)
+        payload = SpooledPayload.from_path(str(path), threshold=0)
+        assert estimate_size(payload) == 0
+
+    def test_resolve_budget(self):
+        assert resolve_budget(None) is None
+        budget = MemoryBudget(10)
+        assert resolve_budget(budget) is budget
+        assert resolve_budget(2048).max_bytes == 2048
+
+    def test_usage_gauge(self):
+        budget = MemoryBudget(1000, name="gauge-test")
+        budget.acquire(123)
+        samples = get_registry().snapshot()["sayou_memory_inflight_bytes"]["samples"]
+        by_budget = {s["labels"]["budget"]: s["value"] for s in samples}
+        assert by_budget["gauge-test"] == 123
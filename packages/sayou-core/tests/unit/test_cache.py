@@ -0,0 +1,185 @@
+"""
+Unit tests for sayou.core.cache.
+
+Covers:
+- Key stability: content, component, config and extra arguments all matter;
+  non-fingerprint keys (the cache itself, live clients) do not.
+- Sets, regexes and bytes in a config fingerprint by value; other
+  unencodable values disable caching instead of colliding.
+- Round-trip of Pydantic models through every backend.
+- LRU eviction by entry count / byte budget.
+- Hit / miss accounting in stats() and the metrics registry.
+"""
+
+import os
+import re
+import time
+
+import pytest
+from sayou.core.cache import (
+    FileSystemCache,
+    MemoryCache,
+    SqliteCache,
+    config_fingerprint,
+    content_digest,
+)
+from sayou.core.metrics import get_registry
+from sayou.core.schemas import SayouBlock
+
+
+@pytest.fixture(params=["memory", "filesystem", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCache()
+    if request.param == "filesystem":
+        return FileSystemCache(str(tmp_path / "fs"))
+    return SqliteCache(str(tmp_path / "cache.db"))
+
+
+class TestKeys:
+    def test_digest_is_stable_and_type_aware(self):
+        assert content_digest(b"abc") == content_digest(b"abc")
+        assert content_digest(b"abc") != content_digest("abc")
+        assert content_digest([b"a", b"bc"]) != content_digest([b"ab", b"c"])
+
+    def test_pydantic_models_digest_by_value(self):
+        a = SayouBlock(type="text", content="x", metadata={"page": 1})
+        b = SayouBlock(type="text", content="x", metadata={"page": 1})
+        assert content_digest(a) == content_digest(b)
+
+    def test_fingerprint_ignores_live_objects(self):
+        base = {"chunk_size": 500}
+        assert config_fingerprint(base) == config_fingerprint(
+            {**base, "cache": MemoryCache(), "client": object()}
+        )
+        assert config_fingerprint(base) != config_fingerprint({"chunk_size": 400})
+
+    def test_key_components(self):
+        c = MemoryCache()
+        k = c.key("DocumentPipeline", b"data", {"ocr": False}, file_name="a.pdf")
+        assert k == c.key(
+            "DocumentPipeline", b"data", {"ocr": False}, file_name="a.pdf"
+        )
+        assert k != c.key(
+            "RefineryPipeline", b"data", {"ocr": False}, file_name="a.pdf"
+        )
+        assert k != c.key("DocumentPipeline", b"data", {"ocr": True}, file_name="a.pdf")
+        assert k != c.key(
+            "DocumentPipeline", b"data", {"ocr": False}, file_name="b.pdf"
+        )
+
+    def test_precomputed_digest_matches_content(self):
+        c = MemoryCache()
+        assert c.key("X", b"payload", {}) == c.key("X", digest=c.digest(b"payload"))
+
+    def test_fingerprint_encodes_sets_regexes_and_bytes_by_value(self):
+        fp = config_fingerprint
+        assert fp({"t": {"email", "rrn"}}) == fp({"t": frozenset({"rrn", "email"})})
+        assert fp({"t": {"email"}}) != fp({"t": {"rrn", "card"}})
+        assert fp({"t": {"email"}}) != fp({"t": ["email"]})
+        assert fp({"p": re.compile(r"\d+")}) != fp({"p": re.compile(r"\w+")})
+        assert fp({"p": re.compile("a")}) != fp({"p": re.compile("a", re.I)})
+        assert fp({"salt": b"one"}) != fp({"salt": b"two"})
+        assert fp({"cls": SayouBlock}) == fp({"cls": SayouBlock})
+        assert fp({"cls": SayouBlock}) != fp({"cls": MemoryCache})
+
+    def test_unencodable_config_disables_caching(self):
+        class Opaque:
+            pass
+
+        with pytest.raises(TypeError):
+            config_fingerprint({"fn": Opaque()})
+        with pytest.raises(TypeError):
+            config_fingerprint({"fn": lambda x: x})
+
+        c = MemoryCache()
+        key = c.key("X", b"data", {"fn": Opaque()})
+        assert key is None
+        c.set(key, "value")
+        assert c.get(key) is None
+        assert len(c) == 0
+
+
+class TestBackends:
+    def test_roundtrip_returns_fresh_copy(self, cache):
+        blocks = [SayouBlock(type="text", content="hello", metadata={})]
+        cache.set("k", blocks)
+
+        got = cache.get("k")
+        assert got == blocks
+        got[0].content = "mutated"
+        assert cache.get("k")[0].content == "hello"
+
+    def test_miss_returns_default(self, cache):
+        assert cache.get("absent") is None
+        assert cache.get("absent", default=[]) == []
+
+    def test_none_is_not_cached(self, cache):
+        cache.set("k", None)
+        assert len(cache) == 0
+
+    def test_get_or_compute(self, cache):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return {"v": 1}
+
+        assert cache.get_or_compute("k", compute) == {"v": 1}
+        assert cache.get_or_compute("k", compute) == {"v": 1}
+        assert len(calls) == 1
+
+    def test_clear(self, cache):
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestEviction:
+    def test_memory_lru_by_entries(self):
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # a is now most recent
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+
+    def test_filesystem_evicts_least_recently_used(self, tmp_path):
+        cache = FileSystemCache(str(tmp_path / "fs"), max_bytes=2500)
+        payload = b"x" * 1000
+        cache.set("aa01", payload)
+        cache.set("aa02", payload)
+        past = time.time() - 100
+        os.utime(cache._path("aa02"), (past, past))  # aa02 is stale
+        cache.set("aa03", payload)
+
+        assert cache.get("aa02") is None
+        assert cache.get("aa01") == payload
+        assert cache.get("aa03") == payload
+
+    def test_sqlite_evicts_least_recently_used(self, tmp_path):
+        cache = SqliteCache(str(tmp_path / "c.db"), max_bytes=2500)
+        payload = b"x" * 1000
+        cache.set("a", payload)
+        cache.set("b", payload)
+        cache.get("a")
+        cache.set("c", payload)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == payload
+
+
+class TestStats:
+    def test_hit_rate_and_metrics(self):
+        get_registry().reset()
+        cache = MemoryCache()
+        cache.set("k", "v")
+        cache.get("k", component="ChunkingPipeline")
+        cache.get("other", component="ChunkingPipeline")
+
+        assert cache.stats()["hit_rate"] == 0.5
+        samples = get_registry().snapshot()["sayou_cache_requests_total"]["samples"]
+        by_result = {s["labels"]["result"]: s["value"] for s in samples}
+        assert by_result == {"hit": 1, "miss": 1}
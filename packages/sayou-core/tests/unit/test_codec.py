@@ -0,0 +1,135 @@
+"""
+Unit tests for sayou.core.codec.
+
+Covers:
+- Round-trip of every schema type, including nesting and raw bytes.
+- float32 vector packing.
+- Frame validation (magic, version, corruption).
+- Size / speed comparison against model_dump_json.
+"""
+
+import random
+
+import pytest
+
+pytest.importorskip("msgpack")
+
+from sayou.core.codec import (  # noqa: E402
+    CODEC_VERSION,
+    MAGIC,
+    CodecError,
+    benchmark,
+    decode,
+    encode,
+)
+from sayou.core.schemas import (  # noqa: E402
+    SayouBlock,
+    SayouChunk,
+    SayouNode,
+    SayouOutput,
+    SayouPacket,
+    SayouTask,
+)
+
+
+def _output(n_nodes: int = 20, dim: int = 384) -> SayouOutput:
+    rng = random.Random(7)
+    return SayouOutput(
+        nodes=[
+            SayouNode(
+                node_id=f"sayou:doc:1_{i}",
+                node_class="sayou:Topic",
+                friendly_name=f"Chunk {i}",
+                attributes={"schema:text": "lorem ipsum " * 20, "page": i},
+                relationships={"sayou:next": [f"sayou:doc:1_{i + 1}"]},
+                vector=[rng.uniform(-1, 1) for _ in range(dim)],
+            )
+            for i in range(n_nodes)
+        ],
+        metadata={"source": "report.pdf"},
+    )
+
+
+class TestRoundTrip:
+    def test_packet_keeps_raw_bytes_and_timestamp(self):
+        packet = SayouPacket(
+            task=SayouTask(source_type="file", uri="/data/a.pdf", params={"k": 1}),
+            data=bytes(range(256)) * 100,
+            meta={"filename": "a.pdf"},
+        )
+        frame = encode(packet)
+        restored = decode(frame)
+
+        assert isinstance(restored, SayouPacket)
+        assert restored == packet
+        assert isinstance(restored.task, SayouTask)
+        # Bytes are not base64-inflated.
+        assert len(frame) < len(packet.data) + 512
+
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            SayouBlock(type="record", content={"a": 1, "b": [1, 2]}, metadata={}),
+            SayouBlock(type="text", content="안녕하세요", metadata={"page": 3}),
+            SayouChunk(content="chunk", metadata={"chunk_id": "c1"}),
+        ],
+    )
+    def test_blocks_and_chunks(self, obj):
+        assert decode(encode(obj)) == obj
+
+    def test_output_vectors_as_float32(self):
+        output = _output(n_nodes=3, dim=16)
+        restored = decode(encode(output))
+
+        assert isinstance(restored.nodes[0], SayouNode)
+        assert restored.metadata == output.metadata
+        for got, want in zip(restored.nodes, output.nodes):
+            assert got.attributes == want.attributes
+            assert got.relationships == want.relationships
+            assert got.vector == pytest.approx(want.vector, rel=1e-6, abs=1e-7)
+
+    def test_node_without_vector(self):
+        node = SayouNode(node_id="n", node_class="sayou:Topic")
+        assert decode(encode(node)).vector is None
+
+    def test_containers_of_models(self):
+        chunks = [SayouChunk(content=str(i)) for i in range(5)]
+        assert decode(encode({"chunks": chunks})) == {"chunks": chunks}
+
+
+class TestFrame:
+    def test_header(self):
+        frame = encode(SayouChunk(content="x"))
+        assert frame[:2] == MAGIC
+        assert frame[2] == CODEC_VERSION
+
+    def test_accepts_memoryview(self):
+        frame = encode(SayouChunk(content="x"))
+        assert decode(memoryview(frame)).content == "x"
+
+    def test_bad_magic(self):
+        with pytest.raises(CodecError):
+            decode(b"{}")
+
+    def test_newer_version_rejected(self):
+        frame = bytearray(encode(SayouChunk(content="x")))
+        frame[2] = CODEC_VERSION + 1
+        with pytest.raises(CodecError, match="newer"):
+            decode(bytes(frame))
+
+    def test_corrupt_body(self):
+        with pytest.raises(CodecError, match="Corrupt"):
+            decode(MAGIC + bytes((CODEC_VERSION,)) + b"\xc1")
+
+    def test_unsupported_type(self):
+        with pytest.raises(CodecError):
+            encode({"x": object()})
+
+
+class TestBenchmark:
+    def test_smaller_and_faster_than_json(self):
+        result = benchmark(_output(n_nodes=50, dim=768), repeat=5)
+
+        assert result["codec_bytes"] * 3 < result["json_bytes"]
+        assert result["codec_encode_s"] < result["json_encode_s"]
+        assert result["codec_decode_s"] < result["json_decode_s"]
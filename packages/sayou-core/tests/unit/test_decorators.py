@@ -0,0 +1,229 @@
+"""
+Unit tests for the retry / circuit-breaker decorators in sayou.core.decorators.
+
+Covers:
+- Transient failures retried; fatal ones (incl. via __cause__) raised at once.
+- Jittered back-off bounds and the total time budget.
+- Shared per-endpoint circuit breakers: open, fail fast, half-open recovery,
+  bounded registry.
+- aretry() parity for coroutines.
+"""
+
+import asyncio
+from collections import OrderedDict
+from unittest.mock import patch
+
+import pytest
+from sayou.core import decorators
+from sayou.core.decorators import (
+    CircuitBreaker,
+    aretry,
+    endpoint_of,
+    get_breaker,
+    is_retryable,
+    retry,
+)
+from sayou.core.exceptions import CircuitOpenError
+
+
+class Flaky:
+    """Raises ``exc`` for the first ``fail_times`` calls, then returns 'ok'."""
+
+    def __init__(self, fail_times, exc=ConnectionError("down")):
+        self.fail_times = fail_times
+        self.exc = exc
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        if self.calls <= self.fail_times:
+            raise self.exc
+        return "ok"
+
+
+@pytest.fixture
+def no_sleep():
+    with patch("sayou.core.decorators.time.sleep") as sleep:
+        yield sleep
+
+
+class TestClassification:
+    def test_transient_and_fatal(self):
+        assert is_retryable(ConnectionError())
+        assert is_retryable(TimeoutError())
+        assert not is_retryable(ValueError())
+        assert not is_retryable(FileNotFoundError())
+
+    def test_cause_chain_and_explicit_flag(self):
+        try:
+            try:
+                raise ValueError("bad row")
+            except ValueError as e:
+                raise RuntimeError("writer failed") from e
+        except RuntimeError as wrapped:
+            assert not is_retryable(wrapped)
+
+        exc = ValueError("actually transient")
+        exc.retryable = True
+        assert is_retryable(exc)
+
+    def test_endpoint_of(self):
+        assert endpoint_of("postgresql://u:pw@db:5432/app") == "postgresql://db:5432"
+        assert endpoint_of("/tmp/out/a.json") == endpoint_of("/tmp/out/b.json")
+        assert endpoint_of("/tmp/out/a.json") == "file:/tmp/out"
+        assert endpoint_of("/mnt/nfs/a.json") != endpoint_of("/tmp/out/a.json")
+        assert endpoint_of("C:\\out\\a.json") == "file:C:\\out"
+        assert endpoint_of("sqlite:///tmp/a.db") == "sqlite:"
+
+
+class TestRetry:
+    def test_retries_transient_until_success(self, no_sleep):
+        func = Flaky(2)
+        assert retry(max_retries=3)(func)() == "ok"
+        assert func.calls == 3
+        assert no_sleep.call_count == 2
+
+    def test_fatal_error_not_retried(self, no_sleep):
+        func = Flaky(5, exc=ValueError("bad input"))
+        with pytest.raises(ValueError):
+            retry(max_retries=3)(func)()
+        assert func.calls == 1
+        no_sleep.assert_not_called()
+
+    def test_exhausted_raises_last_exception(self, no_sleep):
+        func = Flaky(99)
+        with pytest.raises(ConnectionError):
+            retry(max_retries=4)(func)()
+        assert func.calls == 4
+
+    def test_jittered_backoff_bounds(self, no_sleep):
+        func = Flaky(99)
+        with pytest.raises(ConnectionError):
+            retry(max_retries=4, delay=1.0, backoff=2.0, jitter=0.5)(func)()
+        waits = [c.args[0] for c in no_sleep.call_args_list]
+        for wait, base in zip(waits, (1.0, 2.0, 4.0)):
+            assert base * 0.5 <= wait <= base
+
+    def test_max_delay_caps_wait(self, no_sleep):
+        func = Flaky(99)
+        with pytest.raises(ConnectionError):
+            retry(max_retries=5, delay=1.0, max_delay=1.5, jitter=0.0)(func)()
+        assert [c.args[0] for c in no_sleep.call_args_list] == [1.0, 1.5, 1.5, 1.5]
+
+    def test_time_budget_stops_early(self, no_sleep):
+        func = Flaky(99)
+        with pytest.raises(ConnectionError):
+            retry(max_retries=10, delay=1.0, jitter=0.0, timeout=2.5)(func)()
+        # sleep is mocked, so no time elapses: the 1 s and 2 s waits fit the
+        # budget, the 4 s one would overrun it.
+        assert func.calls == 3
+
+    def test_invalid_jitter(self):
+        with pytest.raises(ValueError):
+            retry(jitter=2.0)(Flaky(0))
+
+
+class TestCircuitBreaker:
+    def test_opens_and_fails_fast(self, no_sleep):
+        breaker = CircuitBreaker("db-a", failure_threshold=2, reset_timeout=60)
+        func = Flaky(99)
+        guarded = retry(max_retries=5, breaker=breaker)(func)
+
+        with pytest.raises(ConnectionError):
+            guarded()
+        assert func.calls == 2  # stopped retrying as soon as the circuit opened
+        assert breaker.state == "open"
+
+        with pytest.raises(CircuitOpenError):
+            guarded()
+        assert func.calls == 2  # backend untouched
+
+    def test_half_open_trial_closes_circuit(self, no_sleep):
+        breaker = CircuitBreaker("db-b", failure_threshold=1, reset_timeout=0.0)
+        func = Flaky(1)
+        guarded = retry(max_retries=1, breaker=breaker)(func)
+
+        with pytest.raises(ConnectionError):
+            guarded()
+        assert breaker.state == "half_open"
+        assert guarded() == "ok"
+        assert breaker.state == "closed"
+
+    def test_fatal_errors_do_not_trip_breaker(self, no_sleep):
+        breaker = CircuitBreaker("db-c", failure_threshold=1)
+        guarded = retry(breaker=breaker)(Flaky(99, exc=KeyError("x")))
+        for _ in range(3):
+            with pytest.raises(KeyError):
+                guarded()
+        assert breaker.state == "closed"
+
+    def test_fatal_error_leaves_half_open_circuit_alone(self, no_sleep):
+        breaker = CircuitBreaker("db-d", failure_threshold=1, reset_timeout=0.0)
+        with pytest.raises(ConnectionError):
+            retry(max_retries=1, breaker=breaker)(Flaky(99))()
+        assert breaker.state == "half_open"
+
+        with pytest.raises(KeyError):
+            retry(breaker=breaker)(Flaky(99, exc=KeyError("x")))()
+        assert breaker.state == "half_open"  # not closed by a bad request
+        with pytest.raises(ConnectionError):
+            retry(max_retries=1, breaker=breaker)(Flaky(99))()  # trial admitted
+        assert breaker._state == "open"
+
+    def test_breaker_shared_per_endpoint(self, no_sleep):
+        assert get_breaker("pg://shared") is get_breaker("pg://shared")
+
+        def key(destination):
+            return f"test:{endpoint_of(destination)}"
+
+        get_breaker("test:pg://host:1", failure_threshold=1)
+        first = retry(max_retries=1, breaker=key)(Flaky(99))
+        second = retry(max_retries=1, breaker=key)(Flaky(0))
+
+        with pytest.raises(ConnectionError):
+            first("pg://u@host:1/a")
+        with pytest.raises(CircuitOpenError):
+            second("pg://host:1/b")  # same endpoint, different database
+        assert second("pg://other:1/b") == "ok"
+
+    def test_breaker_registry_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(decorators, "_BREAKERS", OrderedDict())
+        monkeypatch.setattr(decorators, "MAX_BREAKERS", 2)
+
+        first = get_breaker("lru:a")
+        get_breaker("lru:b")
+        assert get_breaker("lru:a") is first  # refreshed
+        get_breaker("lru:c")  # evicts b
+
+        assert list(decorators._BREAKERS) == ["lru:a", "lru:c"]
+
+
+class TestAsyncRetry:
+    def test_retries_coroutine(self):
+        calls = []
+
+        @aretry(max_retries=3, delay=0.0)
+        async def fetch():
+            calls.append(1)
+            if len(calls) < 3:
+                raise TimeoutError()
+            return "ok"
+
+        assert asyncio.run(fetch()) == "ok"
+        assert len(calls) == 3
+
+    def test_circuit_open_rejects(self):
+        breaker = CircuitBreaker("async-db", failure_threshold=1, reset_timeout=60)
+
+        @aretry(max_retries=2, delay=0.0, breaker=breaker)
+        async def write():
+            raise ConnectionError()
+
+        with pytest.raises(ConnectionError):
+            asyncio.run(write())
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(write())
+
+    def test_requires_coroutine(self):
+        with pytest.raises(TypeError):
+            aretry()(lambda: None)
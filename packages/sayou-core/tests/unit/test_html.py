@@ -0,0 +1,175 @@
+"""
+Unit tests for sayou.core.html.
+
+Covers:
+- title / meta / text / links / select_text on every installed backend.
+- BeautifulSoup's whitespace handling (collapse, <pre>, comments, tails).
+- Fast backends agree with the BeautifulSoup reference, and the documented
+  fragment cases where they do not.
+- Backend registry: auto selection, unknown names, custom backends.
+"""
+
+import pytest
+
+from sayou.core import html as html_mod
+from sayou.core.html import (
+    HtmlDocument,
+    available_html_backends,
+    get_html_backend,
+    parse_html,
+    register_html_backend,
+)
+
+BACKENDS = available_html_backends()
+CSS_BACKENDS = available_html_backends(css=True)
+
+if not BACKENDS:
+    pytest.skip("no HTML parser installed", allow_module_level=True)
+
+PAGE = """<html><head><title>Sample Page</title>
+<meta name="description" content="A test page">
+<meta property="og:title" content="OG Title">
+<meta name="empty" content="">
+<style>body { color: red; }</style></head>
+<body>
+  <h1>Heading</h1>
+  <p class="lead">First <b>bold</b> paragraph.</p>
+  <script>var x = 1;</script>tail after script
+  <!-- a comment -->after comment
+  <pre>  keep   spacing  </pre>
+  <a href="/one">One</a> <a>no href</a> <a href="https://example.com/two">Two</a>
+</body></html>"""
+
+CORPUS = [
+    PAGE,
+    "<p>plain</p>",
+    "<div><span>a</span>   <span>b</span>\n\n<span>c</span></div>",
+    "<ul><li>one</li><li>two <i>nested</i></li></ul><noscript>js off</noscript>",
+    "<table><tr><td>1</td><td>2</td></tr></table><p>after</p>",
+    "",
+]
+
+# (markup, backend, title, text): documented divergences from bs4.
+DIVERGENT = [
+    ("<title>A</title><p>x</p>", "bs4", "A", "A\nx"),
+    ("<title>A</title><p>x</p>", "lxml", "A", "x"),
+    ("<title>A</title><p>x</p>", "selectolax", "A", "x"),
+    ("<title> T <b>x</b></title>", "bs4", None, " T \nx"),
+    ("<title> T <b>x</b></title>", "lxml", " T <b>x</b>", ""),
+    ("<title> T <b>x</b></title>", "selectolax", " T <b>x</b>", ""),
+    ("<div>a<table>stray</table></div>", "bs4", None, "a\nstray"),
+    ("<div>a<table>stray</table></div>", "lxml", None, "a\nstray"),
+    ("<div>a<table>stray</table></div>", "selectolax", None, "astray"),
+]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    return request.param
+
+
+class TestDocument:
+    def test_title(self, backend):
+        assert parse_html(PAGE, backend).title() == "Sample Page"
+
+    def test_missing_title(self, backend):
+        assert parse_html("<p>x</p>", backend).title() is None
+
+    def test_meta_skips_empty_content(self, backend):
+        assert parse_html(PAGE, backend).meta() == {
+            "description": "A test page",
+            "og:title": "OG Title",
+        }
+
+    def test_text_drops_boilerplate_and_comments(self, backend):
+        text = parse_html(PAGE, backend).text()
+        assert "Heading" in text and "bold" in text
+        assert "tail after script" in text and "after comment" in text
+        for hidden in ("Sample Page", "color: red", "var x", "a comment"):
+            assert hidden not in text
+
+    def test_text_preserves_pre_whitespace(self, backend):
+        assert "  keep   spacing  " in parse_html(PAGE, backend).text()
+
+    def test_text_collapses_blank_strings(self, backend):
+        doc = parse_html("<div><b>a</b>   <b>b</b>\n\n<b>c</b></div>", backend)
+        assert doc.text(separator="|") == "a| |b|\n|c"
+
+    def test_custom_exclude(self, backend):
+        doc = parse_html("<div><nav>menu</nav><p>body</p></div>", backend)
+        assert doc.text(exclude=("nav",)) == "body"
+
+    def test_links(self, backend):
+        assert parse_html(PAGE, backend).links() == [
+            "/one",
+            "https://example.com/two",
+        ]
+
+
+@pytest.mark.parametrize("backend", CSS_BACKENDS)
+def test_select_text(backend):
+    doc = parse_html(PAGE, backend, css=True)
+    assert doc.select_text("p.lead") == ["Firstboldparagraph."]
+    assert doc.select_text("h1, .missing") == ["Heading"]
+
+
+@pytest.mark.skipif("bs4" not in BACKENDS, reason="bs4 not installed")
+@pytest.mark.parametrize("backend", [b for b in BACKENDS if b != "bs4"])
+@pytest.mark.parametrize("markup", CORPUS)
+def test_matches_bs4_reference(backend, markup):
+    reference, fast = parse_html(markup, "bs4"), parse_html(markup, backend)
+    assert fast.title() == reference.title()
+    assert fast.meta() == reference.meta()
+    assert fast.links() == reference.links()
+    assert fast.text() == reference.text()
+
+
+@pytest.mark.parametrize("markup, backend, title, text", DIVERGENT)
+def test_documented_fragment_divergences(markup, backend, title, text):
+    if backend not in BACKENDS:
+        pytest.skip(f"{backend} not installed")
+    doc = parse_html(markup, backend)
+    assert doc.title() == title
+    assert doc.text() == text
+
+
+class TestRegistry:
+    def test_auto_picks_first_available(self):
+        assert get_html_backend().name == BACKENDS[0]
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown HTML backend"):
+            get_html_backend("nope")
+
+    def test_preferred_backend_wins_auto(self, monkeypatch):
+        monkeypatch.setattr(html_mod, "_BACKENDS", dict(html_mod._BACKENDS))
+
+        @register_html_backend
+        class Fake(HtmlDocument):
+            name = "fake"
+
+            @classmethod
+            def available(cls, css=False):
+                return True
+
+            def __init__(self, markup):
+                self.markup = markup
+
+        assert get_html_backend().name == BACKENDS[0]
+        register_html_backend(Fake, preferred=True)
+        assert available_html_backends()[0] == "fake"
+        assert parse_html("<p>x</p>").markup == "<p>x</p>"
+
+    def test_unavailable_backend(self, monkeypatch):
+        monkeypatch.setattr(html_mod, "_BACKENDS", dict(html_mod._BACKENDS))
+
+        @register_html_backend
+        class Missing(HtmlDocument):
+            name = "missing"
+
+            @classmethod
+            def available(cls, css=False):
+                return False
+
+        with pytest.raises(ImportError):
+            get_html_backend("missing")
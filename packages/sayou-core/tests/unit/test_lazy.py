@@ -0,0 +1,68 @@
+"""
+Unit tests for sayou.core.lazy.
+
+Covers:
+- PEP 562 package exports resolved and cached on first access.
+- optional_import / optional_from: None when absent, deferred otherwise.
+- lazy_import / lazy_from fail immediately for missing packages.
+"""
+
+import sys
+import types
+
+import pytest
+from sayou.core.lazy import (
+    lazy_exports,
+    lazy_from,
+    lazy_import,
+    optional_from,
+    optional_import,
+)
+
+
+class TestLazyExports:
+    def test_resolves_and_caches(self, monkeypatch):
+        pkg = types.ModuleType("fake_pkg")
+        monkeypatch.setitem(sys.modules, "fake_pkg", pkg)
+        pkg.__getattr__, pkg.__dir__ = lazy_exports(
+            "fake_pkg", {"OrderedDict": "collections"}
+        )
+
+        import collections
+
+        assert pkg.__getattr__("OrderedDict") is collections.OrderedDict
+        assert vars(pkg)["OrderedDict"] is collections.OrderedDict
+        assert "OrderedDict" in pkg.__dir__()
+
+    def test_unknown_name(self, monkeypatch):
+        pkg = types.ModuleType("fake_pkg")
+        monkeypatch.setitem(sys.modules, "fake_pkg", pkg)
+        getattr_, _ = lazy_exports("fake_pkg", {})
+        with pytest.raises(AttributeError):
+            getattr_("Missing")
+
+
+class TestDeferredImports:
+    def test_missing_package_is_none(self):
+        assert optional_import("sayou_no_such_package") is None
+        assert optional_from("sayou_no_such_package.sub", "X") is None
+
+    def test_required_missing_package_raises(self):
+        with pytest.raises(ImportError):
+            lazy_import("sayou_no_such_package")
+        with pytest.raises(ImportError):
+            lazy_from("sayou_no_such_package", "X")
+
+    def test_module_loaded_on_first_attribute(self, monkeypatch):
+        monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+        colorsys = optional_import("colorsys")
+        assert "colorsys" not in sys.modules
+        assert colorsys.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+        assert "colorsys" in sys.modules
+
+    def test_deferred_attribute_callable_and_isinstance(self):
+        Fraction = optional_from("fractions", "Fraction")
+        value = Fraction(1, 3)
+        assert isinstance(value, Fraction)
+        assert not isinstance(0.5, Fraction)
+        assert Fraction.from_float(0.5) == Fraction(1, 2)
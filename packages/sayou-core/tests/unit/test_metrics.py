@@ -0,0 +1,199 @@
+"""
+Unit tests for sayou.core.metrics and the metrics-aware ``measure_time``.
+
+Covers:
+- Counter / Gauge / Histogram primitives and get-or-create semantics.
+- Prometheus text and JSON snapshot exports.
+- MetricsCallback translating on_start / on_finish / on_error / on_event.
+- measure_time timing full generator iteration, not generator creation.
+- Recording overhead stays within the 1 % budget at 10k events/s, and
+  events nobody listens to are not dispatched.
+"""
+
+import json
+import time
+import timeit
+
+import pytest
+from sayou.core.base_component import BaseComponent
+from sayou.core.callbacks import BaseCallback
+from sayou.core.decorators import measure_time
+from sayou.core.metrics import Histogram, MetricsCallback, get_registry
+
+
+class TestPrimitives:
+    def test_counter_is_get_or_create(self, registry):
+        registry.counter("items_total", component="A").inc()
+        registry.counter("items_total", component="A").inc(2)
+        registry.counter("items_total", component="B").inc()
+
+        samples = registry.snapshot()["items_total"]["samples"]
+        by_comp = {s["labels"]["component"]: s["value"] for s in samples}
+        assert by_comp == {"A": 3.0, "B": 1.0}
+
+    def test_gauge_set_inc_dec(self, registry):
+        g = registry.gauge("depth", queue="q")
+        g.set(5)
+        g.inc()
+        g.dec(3)
+        assert g.value == 3.0
+
+    def test_histogram_buckets_are_cumulative(self):
+        h = Histogram(bounds=(0.1, 1.0))
+        for v in (0.05, 0.5, 0.5, 5.0):
+            h.observe(v)
+        assert h.count == 4
+        assert h._cumulative() == [(0.1, 1), (1.0, 3), (float("inf"), 4)]
+
+    def test_kind_conflict_raises(self, registry):
+        registry.counter("x")
+        with pytest.raises(ValueError):
+            registry.gauge("x")
+
+
+class TestExport:
+    def test_prometheus_format(self, registry):
+        registry.counter("sayou_items_total", "Items.", component="A").inc(2)
+        registry.histogram(
+            "sayou_latency_seconds", "Latency.", buckets=(0.5,), stage="doc"
+        ).observe(0.1)
+
+        text = registry.to_prometheus()
+        assert "# TYPE sayou_items_total counter" in text
+        assert 'sayou_items_total{component="A"} 2' in text
+        assert 'sayou_latency_seconds_bucket{stage="doc",le="0.5"} 1' in text
+        assert 'sayou_latency_seconds_bucket{stage="doc",le="+Inf"} 1' in text
+        assert 'sayou_latency_seconds_count{stage="doc"} 1' in text
+
+    def test_json_snapshot_roundtrip(self, registry):
+        registry.histogram("lat", buckets=(1.0,)).observe(0.2)
+        data = json.loads(registry.to_json())
+        sample = data["lat"]["samples"][0]
+        assert data["lat"]["type"] == "histogram"
+        assert sample["count"] == 1
+        assert sample["buckets"] == {"1": 1, "+Inf": 1}
+
+    def test_empty_registry_exports_empty(self, registry):
+        assert registry.to_prometheus() == ""
+        assert registry.snapshot() == {}
+
+
+class TestMetricsCallback:
+    def test_start_finish_records_latency_items_and_bytes(self, registry):
+        cb = MetricsCallback(registry)
+        cb.on_start("Fetcher", input_data=None)
+        cb.on_finish("Fetcher", result_data=b"12345", success=True)
+
+        snap = registry.snapshot()
+        assert snap["sayou_component_events_total"]["samples"][0]["value"] == 1
+        assert snap["sayou_component_bytes_total"]["samples"][0]["value"] == 5
+        assert snap["sayou_component_duration_seconds"]["samples"][0]["count"] == 1
+
+    def test_failures_counted(self, registry):
+        cb = MetricsCallback(registry)
+        cb.on_start("Parser", input_data=None)
+        cb.on_error("Parser", error=RuntimeError("boom"))
+        cb.on_finish("Parser", result_data=None, success=False)
+
+        snap = registry.snapshot()
+        assert snap["sayou_component_failures_total"]["samples"][0]["value"] == 2
+
+    def test_queue_depth_event(self, registry):
+        cb = MetricsCallback(registry)
+        cb.on_event("queue_depth", payload=7, queue="document")
+        assert registry.gauge("sayou_queue_depth", queue="document").value == 7
+
+    def test_page_parsed_event(self, registry):
+        cb = MetricsCallback(registry)
+        for seconds in (0.01, 0.2):
+            cb.on_event(
+                "page_parsed",
+                payload={"page_num": 1, "seconds": seconds},
+                component_name="PdfParser",
+            )
+        hist = registry.histogram("sayou_page_duration_seconds", component="PdfParser")
+        assert hist.count == 2
+
+    def test_works_through_component_emit(self, registry):
+        comp = BaseComponent()
+        comp.add_callback(MetricsCallback(registry))
+        comp._emit("on_start", input_data=None)
+        comp._emit("on_finish", result_data=None, success=True)
+
+        labels = registry.snapshot()["sayou_component_events_total"]["samples"][0]
+        assert labels["labels"] == {"component": "BaseComponent"}
+
+    def test_component_binds_once_and_skips_unhandled_events(self):
+        class StartsOnly(BaseCallback):
+            def __init__(self):
+                self.binds = 0
+                self.starts = 0
+
+            def bind(self, component_name):
+                self.binds += 1
+                return self
+
+            def on_start(self, component_name, input_data, **kwargs):
+                self.starts += 1
+
+        cb = StartsOnly()
+        comp = BaseComponent()
+        comp.add_callback(cb)
+        for _ in range(3):
+            comp._emit("on_start", input_data=None)
+            comp._emit("on_finish", result_data=None, success=True)
+
+        assert cb.starts == 3
+        assert cb.binds == 2  # once per event method, never per event
+        assert comp._dispatch[2]["on_finish"] == []
+
+
+class _SlowGen(BaseComponent):
+    component_name = "SlowGen"
+
+    @measure_time
+    def items(self):
+        for i in range(3):
+            time.sleep(0.01)
+            yield i
+
+
+class TestMeasureTime:
+    def test_generator_timed_across_iteration(self):
+        get_registry().reset()
+        assert list(_SlowGen().items()) == [0, 1, 2]
+
+        snap = get_registry().snapshot()["sayou_call_duration_seconds"]["samples"]
+        (sample,) = [s for s in snap if s["labels"]["component"] == "SlowGen"]
+        assert sample["labels"]["method"] == "items"
+        assert sample["count"] == 1
+        assert sample["sum"] >= 0.03
+
+    def test_plain_function_still_returns(self):
+        @measure_time
+        def add(a, b):
+            return a + b
+
+        assert add(1, 2) == 3
+
+
+class TestOverhead:
+    def test_ten_thousand_events_cost_under_budget(self, registry):
+        # What a component pays per unit of work once it has bound the
+        # callback (BaseComponent._emit does so on first use).
+        hot = MetricsCallback(registry).bind("Hot")
+
+        def unit_of_work():
+            hot.on_start("Hot", input_data=None)
+            hot.on_finish("Hot", result_data=None, success=True)
+
+        # 1 % of one second at 10k events/s is 1 us per event (one
+        # start/finish pair).  timeit disables GC; sampling for up to two
+        # seconds rides out noisy neighbours on shared CI runners, while a
+        # regression stays over budget in every round.
+        n = 1_000
+        best = float("inf")
+        deadline = time.perf_counter() + 2.0
+        while best / n >= 1e-6 and time.perf_counter() < deadline:
+            best = min(best, *timeit.repeat(unit_of_work, number=n, repeat=10))
+        assert best / n < 1e-6
@@ -0,0 +1,122 @@
+"""
+Unit tests for sayou.core.payload.
+
+Covers:
+- Threshold behaviour: small inputs stay bytes, large ones spill.
+- Temp-file ownership and cleanup; path-backed files are never deleted.
+- bytes-like sniffing API used by parsers' can_handle().
+- Consumption by zipfile / fitz without materialising the payload.
+- Cache digests identical to the equivalent bytes.
+"""
+
+import io
+import os
+import pickle
+import zipfile
+
+import pytest
+from sayou.core.cache import content_digest
+from sayou.core.payload import (
+    PayloadWriter,
+    SpooledPayload,
+    as_buffer,
+    as_stream,
+    payload_path,
+)
+
+
+@pytest.fixture
+def big_file(tmp_path):
+    path = tmp_path / "big.bin"
+    path.write_bytes(b"%PDF" + b"x" * 4096)
+    return str(path)
+
+
+class TestThreshold:
+    def test_small_file_stays_bytes(self, big_file):
+        data = SpooledPayload.from_path(big_file, threshold=1 << 20)
+        assert isinstance(data, bytes)
+
+    def test_large_file_is_referenced_in_place(self, big_file):
+        payload = SpooledPayload.from_path(big_file, threshold=100)
+        assert isinstance(payload, SpooledPayload)
+        assert payload.path == big_file
+        assert len(payload) == 4100
+
+        payload.close()
+        assert os.path.exists(big_file)  # not owned, never deleted
+
+    def test_stream_spills_to_owned_temp_file(self, tmp_path):
+        payload = SpooledPayload.from_stream(io.BytesIO(b"a" * 5000), threshold=1000)
+        assert payload.is_spilled
+        tmp = payload.path
+        assert os.path.getsize(tmp) == 5000
+
+        payload.close()
+        assert not os.path.exists(tmp)
+
+    def test_writer_below_threshold_returns_bytes(self):
+        writer = PayloadWriter(threshold=100)
+        writer.write(b"abc")
+        writer.write(b"def")
+        assert writer.finish() == b"abcdef"
+
+
+class TestBytesLikeApi:
+    def test_sniffing(self, big_file):
+        with SpooledPayload.from_path(big_file, threshold=0) as payload:
+            assert payload.startswith(b"%PDF")
+            assert payload.startswith((b"PK", b"%PDF"))
+            assert payload[:4] == b"%PDF"
+            assert payload[0] == ord("%")
+            assert bool(payload)
+            assert bytes(payload) == open(big_file, "rb").read()
+
+    def test_view_is_zero_copy_mmap(self, big_file):
+        with SpooledPayload.from_path(big_file, threshold=0) as payload:
+            view = payload.view()
+            assert isinstance(view, memoryview)
+            assert view.readonly
+            assert view[-1:] == b"x"
+            view.release()
+
+    def test_pickles_by_path(self, big_file):
+        payload = SpooledPayload.from_path(big_file, threshold=0)
+        clone = pickle.loads(pickle.dumps(payload))
+        assert clone.path == big_file
+        assert clone[:4] == b"%PDF"
+
+
+class TestConsumers:
+    def test_zipfile_reads_spilled_payload(self, tmp_path):
+        path = tmp_path / "doc.zip"
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr("word/document.xml", "<w:document/>")
+
+        payload = SpooledPayload.from_path(str(path), threshold=0)
+        with zipfile.ZipFile(as_stream(payload)) as zf:
+            assert zf.read("word/document.xml") == b"<w:document/>"
+
+    def test_fitz_opens_spilled_payload_by_path(self, tmp_path):
+        fitz = pytest.importorskip("fitz")
+        src = fitz.open()
+        src.new_page()
+        path = str(tmp_path / "a.pdf")
+        src.save(path)
+
+        payload = SpooledPayload.from_path(path, threshold=0)
+        assert payload_path(payload) == path
+        assert fitz.open(payload_path(payload), filetype="pdf").page_count == 1
+        assert fitz.open(stream=as_buffer(payload), filetype="pdf").page_count == 1
+
+    def test_helpers_pass_bytes_through(self):
+        assert as_buffer(b"abc") == b"abc"
+        assert as_stream(b"abc").read() == b"abc"
+        assert payload_path(b"abc") is None
+
+
+class TestDigest:
+    def test_digest_matches_bytes(self, big_file):
+        raw = open(big_file, "rb").read()
+        with SpooledPayload.from_path(big_file, threshold=0) as payload:
+            assert content_digest(payload) == content_digest(raw)
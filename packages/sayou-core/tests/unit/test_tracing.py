@@ -0,0 +1,134 @@
+"""
+Unit tests for sayou.core.tracing.
+
+Covers:
+- Parent/child nesting through the active-span context.
+- Context propagation via inject() / extract() on metadata dicts.
+- Head sampling: unsampled roots drop their whole subtree.
+- Error status on exceptions.
+- JSONL export in the OTLP span shape and Chrome trace conversion.
+- Disabled tracer returns a shared no-op span.
+"""
+
+import json
+
+import pytest
+from sayou.core.tracing import (NOOP_SPAN, SPAN_ID_KEY, STATUS_ERROR,
+                                STATUS_OK, TRACE_ID_KEY, InMemorySpanExporter,
+                                JsonlSpanExporter, Tracer, to_chrome_trace)
+
+
+@pytest.fixture
+def memory_tracer():
+    exporter = InMemorySpanExporter()
+    return Tracer(exporter), exporter
+
+
+class TestNesting:
+    def test_children_share_trace_and_point_to_parent(self, memory_tracer):
+        tracer, exporter = memory_tracer
+        with tracer.start_span("ingest") as root:
+            with tracer.start_span("packet") as packet:
+                with tracer.start_span("document.run"):
+                    pass
+
+        names = [s.name for s in exporter.spans]
+        assert names == ["document.run", "packet", "ingest"]
+        doc, pkt, ing = exporter.spans
+        assert {s.trace_id for s in exporter.spans} == {root.trace_id}
+        assert doc.parent_id == packet.span_id
+        assert pkt.parent_id == root.span_id
+        assert ing.parent_id is None
+        assert ing.status == STATUS_OK
+        assert ing.end_ns >= doc.end_ns
+
+    def test_current_span_restored_after_exit(self, memory_tracer):
+        tracer, _ = memory_tracer
+        assert tracer.current_span() is None
+        with tracer.start_span("outer") as outer:
+            with tracer.start_span("inner"):
+                pass
+            assert tracer.current_span() is outer
+        assert tracer.current_span() is None
+
+    def test_exception_marks_error_and_propagates(self, memory_tracer):
+        tracer, exporter = memory_tracer
+        with pytest.raises(ValueError):
+            with tracer.start_span("refinery.run"):
+                raise ValueError("bad block")
+        assert exporter.spans[0].status == STATUS_ERROR
+        assert "bad block" in exporter.spans[0].status_message
+
+
+class TestPropagation:
+    def test_inject_extract_roundtrip(self, memory_tracer):
+        tracer, exporter = memory_tracer
+        meta = {}
+        with tracer.start_span("packet") as packet:
+            tracer.inject(meta)
+
+        assert meta == {TRACE_ID_KEY: packet.trace_id, SPAN_ID_KEY: packet.span_id}
+
+        # e.g. in another worker process
+        with tracer.start_span("chunking.run", parent=tracer.extract(meta)):
+            pass
+        child = exporter.spans[-1]
+        assert child.trace_id == packet.trace_id
+        assert child.parent_id == packet.span_id
+
+    def test_extract_missing_returns_none(self):
+        assert Tracer.extract({}) is None
+        assert Tracer.extract(None) is None
+
+
+class TestSampling:
+    def test_zero_rate_records_nothing(self):
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(exporter, sample_rate=0.0)
+        meta = {}
+        with tracer.start_span("ingest"):
+            with tracer.start_span("packet") as span:
+                tracer.inject(meta, span)
+        assert exporter.spans == []
+        assert meta == {}
+
+    def test_unsampled_root_drops_children(self, monkeypatch):
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(exporter, sample_rate=0.5)
+        monkeypatch.setattr("sayou.core.tracing.random.random", lambda: 0.9)
+        with tracer.start_span("ingest"):
+            # Children must not re-roll the sampling decision.
+            monkeypatch.setattr("sayou.core.tracing.random.random", lambda: 0.0)
+            with tracer.start_span("packet"):
+                pass
+        assert exporter.spans == []
+
+    def test_disabled_tracer_is_noop(self):
+        tracer = Tracer()
+        assert tracer.start_span("anything") is NOOP_SPAN
+
+
+class TestExport:
+    def test_jsonl_otlp_shape(self, tmp_path):
+        path = tmp_path / "spans.jsonl"
+        tracer = Tracer(JsonlSpanExporter(str(path)))
+        with tracer.start_span("ingest", source="./docs", files=3):
+            with tracer.start_span("document.run"):
+                pass
+        tracer.shutdown()
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert len(lines) == 2
+        root = lines[1]
+        assert len(root["traceId"]) == 32
+        assert len(root["spanId"]) == 16
+        assert root["parentSpanId"] == ""
+        assert int(root["endTimeUnixNano"]) >= int(root["startTimeUnixNano"])
+        assert {"key": "files", "value": {"intValue": "3"}} in root["attributes"]
+        assert lines[0]["parentSpanId"] == root["spanId"]
+
+        chrome = to_chrome_trace(lines)
+        events = chrome["traceEvents"]
+        assert [e["name"] for e in events] == ["ingest", "document.run"]
+        assert all(e["ph"] == "X" for e in events)
+        assert events[0]["args"]["source"] == "./docs"
@@ -0,0 +1,87 @@
+# ── Setup
+"""
+Time and peak memory of `ExcelParser`: full object model versus streaming.
+
+The full mode loads every worksheet with openpyxl's object model (one
+`Cell` per cell) and builds a `TableCell` per cell.  The streaming mode
+(`read_only=True`) reads plain value tuples with openpyxl's read-only
+reader and emits rows in `TableElement` batches without a per-cell grid.
+
+Each measurement runs in a fresh process, so the peak RSS of one mode does
+not leak into the other.
+
+```bash
+pip install openpyxl
+python benchmark_excel.py            # 100k rows x 10 columns
+python benchmark_excel.py 500000     # the size from the original report
+```
+"""
+import io
+import multiprocessing
+import resource
+import sys
+import time
+
+import openpyxl
+
+from sayou.document.parser.excel_parser import ExcelParser
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+COLUMNS = 10
+
+
+# ── Build a Synthetic Workbook
+"""
+Mixed text / integer / float columns, written with openpyxl's write-only
+mode so generating the file stays cheap.
+"""
+
+
+def build_workbook(rows: int, columns: int) -> bytes:
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("data")
+    ws.append([f"col{c}" for c in range(columns)])
+    for r in range(rows):
+        ws.append(
+            [f"item-{r}-{c}" if c % 3 == 0 else r * c + 0.5 for c in range(columns)]
+        )
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+
+# ── Measure
+"""
+`ru_maxrss` is the process's peak resident set size (KiB on Linux); the
+difference before/after parsing is the parser's peak working memory.
+"""
+
+
+def _measure(file_bytes: bytes, read_only: bool, queue) -> None:
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    doc = ExcelParser().parse(file_bytes, "synthetic.xlsx", read_only=read_only)
+    seconds = time.perf_counter() - started
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rows = sum(len(e.data) for e in doc.pages[0].elements)
+    queue.put((seconds, (peak - baseline) / 1024, rows))
+
+
+def measure(file_bytes: bytes, read_only: bool):
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_measure, args=(file_bytes, read_only, queue))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    return result
+
+
+# ── Run
+if __name__ == "__main__":
+    file_bytes = build_workbook(ROWS, COLUMNS)
+    print(f"{ROWS} rows x {COLUMNS} columns, {len(file_bytes) / 1e6:.1f} MB")
+
+    for label, read_only in (("full", False), ("streaming", True)):
+        seconds, peak_mb, rows = measure(file_bytes, read_only)
+        print(f"{label:<10} {seconds:7.2f} s  peak +{peak_mb:7.1f} MB  rows={rows}")
@@ -0,0 +1,101 @@
+# ── Setup
+"""
+Latency and CPU per image before OCR: the PDF round-trip versus
+`ImageParser`.
+
+The old path wraps the image in a PDF (`ImageToPdfConverter`), then
+`PdfParser` renders the page back to a 200-dpi pixmap and PNG-encodes it
+for the engine.  `ImageParser` decodes the image once (JPEGs straight to
+grayscale and, above `ocr_dpi`, at reduced size) and hands the pixels to
+the engine.
+
+The OCR engine here is a stub that only decodes what it receives, so the
+numbers isolate the pipeline overhead; real recognition time grows with
+the pixel count, which is printed as well.
+
+```bash
+pip install pillow pymupdf
+python benchmark_image_ocr.py        # 20 A4 scans at 300 dpi
+python benchmark_image_ocr.py 50
+```
+"""
+import io
+import sys
+import time
+
+from PIL import Image, ImageDraw
+
+from sayou.document.converter.image_converter import ImageToPdfConverter
+from sayou.document.interfaces.base_ocr import BaseOCR, RawImage
+from sayou.document.parser.image_parser import ImageParser
+from sayou.document.parser.pdf_parser import PdfParser
+
+SCANS = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+
+# ── Build Synthetic Scans
+"""
+A4 pages at 300 dpi (2480 x 3508 px) with dark bars for text lines,
+saved as JPEG like the output of an office scanner.
+"""
+
+
+def build_scan(seed: int) -> bytes:
+    image = Image.new("RGB", (2480, 3508), "white")
+    draw = ImageDraw.Draw(image)
+    for top in range(200, 3300, 60):
+        draw.rectangle((200, top, 2280 - (seed * 37 + top) % 600, top + 24), fill=40)
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=85, dpi=(300, 300))
+    return buffer.getvalue()
+
+
+# ── Stub OCR Engine
+"""
+Decodes its input like a real engine would and records the pixel count.
+"""
+
+
+class DecodingOCR(BaseOCR):
+    component_name = "DecodingOCR"
+
+    def __init__(self):
+        super().__init__()
+        self.pixels = 0
+
+    def _do_ocr(self, image_bytes, **kwargs):
+        if isinstance(image_bytes, RawImage):
+            self.pixels += image_bytes.width * image_bytes.height
+        else:
+            image = Image.open(io.BytesIO(image_bytes))
+            image.load()
+            self.pixels += image.width * image.height
+        return "text"
+
+
+# ── Measure
+def via_pdf(scan: bytes, ocr: BaseOCR) -> None:
+    pdf = ImageToPdfConverter().convert(scan, "scan.jpg")
+    PdfParser(ocr_engine=ocr).parse(pdf, "scan.jpg.pdf")
+
+
+def native(scan: bytes, ocr: BaseOCR) -> None:
+    ImageParser(ocr_engine=ocr).parse(scan, "scan.jpg")
+
+
+def measure(label: str, run, scans) -> None:
+    ocr = DecodingOCR()
+    wall, cpu = time.perf_counter(), time.process_time()
+    for scan in scans:
+        run(scan, ocr)
+    wall = (time.perf_counter() - wall) / len(scans) * 1000
+    cpu = (time.process_time() - cpu) / len(scans) * 1000
+    megapixels = ocr.pixels / len(scans) / 1e6
+    print(f"{label:<18} {wall:7.1f} ms  cpu {cpu:7.1f} ms  {megapixels:5.1f} MP to OCR")
+
+
+# ── Run
+if __name__ == "__main__":
+    scans = [build_scan(i) for i in range(SCANS)]
+    measure("image -> PDF -> OCR", via_pdf, scans)
+    measure("ImageParser", native, scans)
@@ -0,0 +1,107 @@
+# ── Setup
+"""
+Per-image OCR latency: `TesseractOCR` versus `TesserocrOCR`.
+
+`TesseractOCR` (pytesseract) encodes each rendered page to PNG, starts a
+`tesseract` process, loads the language model and decodes the PNG again.
+`TesserocrOCR` keeps one engine resident per thread and receives the raw
+`fitz.Pixmap` buffer, so each call only recognises.
+
+Pages are rendered the way `PdfParser` renders scanned pages (`ocr_dpi`),
+and each engine is timed on exactly the input `PdfParser` would hand it.
+Engines that are not installed are skipped.
+
+```bash
+pip install pymupdf pytesseract pillow tesserocr
+python benchmark_ocr.py
+```
+"""
+import shutil
+import statistics
+import time
+
+import fitz
+
+from sayou.document.ocr import tesseract_ocr, tesserocr_ocr
+from sayou.document.ocr.tesseract_ocr import TesseractOCR
+from sayou.document.ocr.tesserocr_ocr import TesserocrOCR
+
+PAGES = 20
+DPI = 300
+LANG = "eng"
+
+
+# ── Render Sample Pages
+"""
+Build a small text-only PDF and rasterise every page once, so rendering is
+not part of the measured latency.
+"""
+
+
+def render_pages(count: int, dpi: int):
+    doc = fitz.open()
+    for i in range(count):
+        page = doc.new_page()
+        page.insert_text(
+            (72, 96),
+            f"Sample page {i + 1}\nThe quick brown fox jumps over the lazy dog.",
+            fontsize=14,
+        )
+    pixmaps = [page.get_pixmap(dpi=dpi) for page in doc]
+    doc.close()
+    return pixmaps
+
+
+# ── Measure
+"""
+`ocr_pixmap` is the call `PdfParser` makes for a scanned page: a PNG for
+`TesseractOCR`, the raw pixel buffer for `TesserocrOCR`.  The first call of
+each engine is reported separately because it includes the model load.
+"""
+
+
+def measure(engine, pixmaps):
+    started = time.perf_counter()
+    engine.ocr_pixmap(pixmaps[0])
+    first_ms = (time.perf_counter() - started) * 1000
+
+    latencies = []
+    for pix in pixmaps[1:]:
+        started = time.perf_counter()
+        engine.ocr_pixmap(pix)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return first_ms, latencies
+
+
+def report(name, first_ms, latencies):
+    latencies = sorted(latencies)
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(
+        f"{name:<14} first={first_ms:8.1f} ms  "
+        f"mean={statistics.mean(latencies):8.1f} ms  "
+        f"p50={statistics.median(latencies):8.1f} ms  "
+        f"p95={p95:8.1f} ms"
+    )
+
+
+# ── Run
+AVAILABLE = {
+    TesseractOCR: tesseract_ocr.pytesseract is not None
+    and shutil.which("tesseract") is not None,
+    TesserocrOCR: tesserocr_ocr.tesserocr is not None,
+}
+
+if __name__ == "__main__":
+    pixmaps = render_pages(PAGES, DPI)
+    print(f"{PAGES} pages at {DPI} dpi ({pixmaps[0].width}x{pixmaps[0].height})")
+
+    for engine_cls in (TesseractOCR, TesserocrOCR):
+        if not AVAILABLE[engine_cls]:
+            print(f"{engine_cls.__name__:<14} skipped (not installed)")
+            continue
+        engine = engine_cls()
+        engine.initialize(lang=LANG)
+        try:
+            report(engine_cls.__name__, *measure(engine, pixmaps))
+        finally:
+            engine.close()
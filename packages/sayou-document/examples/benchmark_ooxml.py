@@ -0,0 +1,130 @@
+# ── Setup
+"""
+Time and peak memory of `DocxParser` and `PptxParser`: object model versus
+streaming.
+
+The object-model path loads the whole package with python-docx /
+python-pptx and walks their proxy objects.  The streaming path
+(`streaming=True`) reads the document and slide parts with `iterparse`
+straight from the zip and drops every paragraph, table or shape once it
+has been converted.
+
+Each measurement runs in a fresh process, so the peak RSS of one mode does
+not leak into the other.
+
+```bash
+pip install python-docx python-pptx
+python benchmark_ooxml.py            # 20k paragraphs, 300 slides
+python benchmark_ooxml.py 100000 1000
+```
+"""
+import io
+import multiprocessing
+import resource
+import sys
+import time
+
+import docx
+from pptx import Presentation
+from pptx.util import Inches
+
+from sayou.document.parser.docx_parser import DocxParser
+from sayou.document.parser.pptx_parser import PptxParser
+
+PARAGRAPHS = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+SLIDES = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+
+
+# ── Build Synthetic Documents
+"""
+A report with headings, body text, list items and a table every 50
+paragraphs, and a deck of title + bullet slides with a text box and a
+table each.
+"""
+
+
+def build_docx(paragraphs: int) -> bytes:
+    document = docx.Document()
+    for i in range(paragraphs):
+        if i % 50 == 0:
+            document.add_heading(f"Section {i // 50}", level=1 + (i // 50) % 3)
+            table = document.add_table(rows=4, cols=4)
+            for r, row in enumerate(table.rows):
+                for c, cell in enumerate(row.cells):
+                    cell.text = f"r{r}c{c}"
+        elif i % 7 == 0:
+            document.add_paragraph(f"List item {i}", style="List Bullet")
+        else:
+            paragraph = document.add_paragraph(f"Paragraph {i}: lorem ipsum ")
+            paragraph.add_run("dolor sit amet.").bold = True
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def build_pptx(slides: int) -> bytes:
+    presentation = Presentation()
+    for i in range(slides):
+        slide = presentation.slides.add_slide(presentation.slide_layouts[1])
+        slide.shapes.title.text = f"Slide {i}"
+        body = slide.placeholders[1].text_frame
+        body.text = "First bullet"
+        for j in range(5):
+            body.add_paragraph().text = f"Bullet {j} on slide {i}"
+        box = slide.shapes.add_textbox(Inches(1), Inches(5), Inches(4), Inches(1))
+        box.text_frame.text = "Caption text"
+        shape = slide.shapes.add_table(3, 3, Inches(5), Inches(5), Inches(4), Inches(1))
+        for r in range(3):
+            for c in range(3):
+                shape.table.cell(r, c).text = f"{i}-{r}-{c}"
+        slide.notes_slide.notes_text_frame.text = f"Speaker notes {i}"
+    buffer = io.BytesIO()
+    presentation.save(buffer)
+    return buffer.getvalue()
+
+
+# ── Measure
+"""
+`ru_maxrss` is the process's peak resident set size (KiB on Linux); the
+difference before/after parsing is the parser's peak working memory.
+"""
+
+
+def _measure(parser_cls, file_bytes: bytes, file_name: str, streaming: bool, queue):
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    doc = parser_cls().parse(file_bytes, file_name, streaming=streaming)
+    seconds = time.perf_counter() - started
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    elements = sum(len(page.elements) for page in doc.pages)
+    queue.put((seconds, (peak - baseline) / 1024, elements))
+
+
+def measure(parser_cls, file_bytes: bytes, file_name: str, streaming: bool):
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    proc = ctx.Process(
+        target=_measure, args=(parser_cls, file_bytes, file_name, streaming, queue)
+    )
+    proc.start()
+    result = queue.get()
+    proc.join()
+    return result
+
+
+# ── Run
+if __name__ == "__main__":
+    cases = [
+        (DocxParser, build_docx(PARAGRAPHS), f"{PARAGRAPHS} paragraphs", "bench.docx"),
+        (PptxParser, build_pptx(SLIDES), f"{SLIDES} slides", "bench.pptx"),
+    ]
+    for parser_cls, file_bytes, label, file_name in cases:
+        print(f"{parser_cls.__name__}: {label}, {len(file_bytes) / 1e6:.1f} MB")
+        for mode, streaming in (("object model", False), ("streaming", True)):
+            seconds, peak_mb, elements = measure(
+                parser_cls, file_bytes, file_name, streaming
+            )
+            print(
+                f"  {mode:<13} {seconds:7.2f} s  peak +{peak_mb:7.1f} MB  "
+                f"elements={elements}"
+            )
@@ -0,0 +1,69 @@
+# ── Setup
+"""
+Time of `PdfParser` at each extraction level, and of a first-N preview.
+
+* `full` — plain text plus positioned text blocks and embedded images.
+* `layout` — text blocks with their bounding boxes, no images.
+* `text` — one plain-text call per page and one element per page, which
+  is all a search index needs.
+
+```bash
+pip install pymupdf
+python benchmark_pdf_levels.py        # 300 pages
+python benchmark_pdf_levels.py 2000
+```
+"""
+
+import sys
+import time
+
+import fitz
+
+from sayou.document.parser.pdf_parser import PdfParser
+
+PAGES = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+
+
+# ── Build a Synthetic PDF
+"""
+Text-heavy pages with one embedded image each, like a typical report.
+"""
+
+
+def build_pdf(pages: int) -> bytes:
+    pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 400, 300), False)
+    pixmap.clear_with(180)
+    image = pixmap.tobytes("png")
+
+    pdf = fitz.open()
+    for n in range(pages):
+        page = pdf.new_page()
+        page.insert_text((72, 60), f"Section {n}", fontsize=16)
+        for line in range(40):
+            page.insert_text(
+                (72, 90 + line * 12),
+                f"Line {line} of page {n}: lorem ipsum dolor sit amet.",
+                fontsize=9,
+            )
+        page.insert_image(fitz.Rect(300, 600, 500, 750), stream=image)
+    return pdf.tobytes()
+
+
+# ── Run
+if __name__ == "__main__":
+    file_bytes = build_pdf(PAGES)
+    parser = PdfParser()
+
+    runs = [
+        (level, {"extraction_level": level}) for level in ("full", "layout", "text")
+    ]
+    runs.append(("text, first 10", {"extraction_level": "text", "max_pages": 10}))
+
+    for label, options in runs:
+        started = time.perf_counter()
+        doc = parser.parse(file_bytes, "synthetic.pdf", **options)
+        seconds = time.perf_counter() - started
+        elements = sum(len(page.elements) for page in doc.pages)
+        print(
+            f"{label:<15} {seconds:7.2f} s  pages={doc.page_count:<5} elements={elements}"
+        )
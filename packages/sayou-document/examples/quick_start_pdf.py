@@ -100,8 +100,10 @@ for page in doc.pages:
 `TextElement` carries the extracted text in `.text` plus optional styling
 in `.style` (font name, size, bold/italic flags).
 
-`ImageElement` stores the raw image as `.image_base64` and, when an OCR
-engine is attached, the extracted text as `.ocr_text`.
+`ImageElement` keeps the raw image bytes (`.image_bytes`); Base64 is only
+produced on serialisation or via `.get_image_base64()`.  When an OCR
+engine is attached, the extracted text is stored as `.ocr_text`.  Pass
+`extract_images=False` to skip images entirely.
 
 `BoundingBox` (`.bbox`) records the element's position in points:
 `x0`, `y0` (top-left) and `x1`, `y1` (bottom-right).
@@ -149,8 +151,8 @@ print("\n=== Access Structured Elements ===")
 for e in text_elems:
     print(f"  TextElement  bbox=({e.bbox.x0:.0f},{e.bbox.y0:.0f}) text={e.text!r}")
 for e in image_elems:
-    b64_len = len(e.image_base64) if e.image_base64 else 0
-    print(f"  ImageElement bbox=({e.bbox.x0:.0f},{e.bbox.y0:.0f}) base64_len={b64_len}")
+    size = len(e.image_bytes) if e.has_image else 0
+    print(f"  ImageElement bbox=({e.bbox.x0:.0f},{e.bbox.y0:.0f}) bytes={size}")
 
 
 # ── Table of Contents
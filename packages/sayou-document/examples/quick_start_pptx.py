@@ -151,7 +151,7 @@ for slide in doc.pages:
             e.text[:40]
             if hasattr(e, "text") and isinstance(e.text, str)
             else (
-                f"base64={len(e.image_base64)} chars"
+                f"image={len(e.image_bytes or b'')} bytes"
                 if isinstance(e, ImageElement)
                 else ""
             )
@@ -1,17 +1,42 @@
-from .converter.image_converter import ImageToPdfConverter
-from .ocr.tesseract_ocr import TesseractOCR
-from .parser.docx_parser import DocxParser
-from .parser.excel_parser import ExcelParser
-from .parser.pdf_parser import PdfParser
-from .parser.pptx_parser import PptxParser
-from .pipeline import DocumentPipeline
+from typing import TYPE_CHECKING
+
+from sayou.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .converter.image_converter import ImageToPdfConverter
+    from .ocr.tesseract_ocr import TesseractOCR
+    from .ocr.tesserocr_ocr import TesserocrOCR
+    from .parser.docx_parser import DocxParser
+    from .parser.excel_parser import ExcelParser
+    from .parser.image_parser import ImageParser
+    from .parser.pdf_parser import PdfParser
+    from .parser.pptx_parser import PptxParser
+    from .pipeline import DocumentPipeline
 
 __all__ = [
     "DocumentPipeline",
     "DocxParser",
     "ExcelParser",
+    "ImageParser",
     "PdfParser",
     "PptxParser",
     "TesseractOCR",
+    "TesserocrOCR",
     "ImageToPdfConverter",
 ]
+
+# Sub-modules (and their heavy dependencies) load on first attribute access.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ImageToPdfConverter": ".converter.image_converter",
+        "TesseractOCR": ".ocr.tesseract_ocr",
+        "TesserocrOCR": ".ocr.tesserocr_ocr",
+        "DocxParser": ".parser.docx_parser",
+        "ExcelParser": ".parser.excel_parser",
+        "ImageParser": ".parser.image_parser",
+        "PdfParser": ".parser.pdf_parser",
+        "PptxParser": ".parser.pptx_parser",
+        "DocumentPipeline": ".pipeline",
+    },
+)
@@ -1,15 +1,14 @@
 import io
 
-try:
-    from PIL import Image
-except ImportError:
-    Image = None
-
+from sayou.core.lazy import optional_import
+from sayou.core.payload import as_stream
 from sayou.core.registry import register_component
 
 from ..core.exceptions import ConversionError
 from ..interfaces.base_converter import BaseConverter
 
+Image = optional_import("PIL.Image")
+
 
 @register_component("converter")
 class ImageToPdfConverter(BaseConverter):
@@ -47,7 +46,9 @@ class ImageToPdfConverter(BaseConverter):
             raise ImportError("Pillow is required for ImageToPdfConverter.")
 
         try:
-            image = Image.open(io.BytesIO(file_bytes))
+            with as_stream(file_bytes) as stream:
+                image = Image.open(stream)
+                image.load()
 
             # Convert to RGB for PDF compatibility (handles PNG transparency)
             if image.mode in ("RGBA", "LA"):
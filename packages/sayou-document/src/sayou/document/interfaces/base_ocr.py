@@ -1,15 +1,76 @@
+import copy
+import hashlib
 from abc import abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Union
 
 from sayou.core.base_component import BaseComponent
 from sayou.core.decorators import measure_time
 
+# Per-process engine of OCR pool workers (see BaseOCR.ocr_batch).
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_ocr_worker(engine: "BaseOCR") -> None:
+    """Pool initializer: keep one engine (and its loaded model) per process."""
+    _WORKER_STATE["engine"] = engine
+
+
+def _ocr_in_worker(image_bytes: bytes, kwargs: Dict[str, Any]) -> Optional[str]:
+    """Pool task: OCR one image with the worker's engine."""
+    return _WORKER_STATE["engine"]._guarded_ocr(image_bytes, **kwargs)
+
+
+class RawImage(NamedTuple):
+    """
+    Uncompressed 8-bit pixels, e.g. a rendered ``fitz.Pixmap``.
+
+    Engines with ``ACCEPTS_RAW`` consume these directly, skipping the PNG
+    encode (parser) and decode (engine) round-trip.
+    """
+
+    samples: bytes
+    width: int
+    height: int
+    channels: int
+    stride: int
+
+    @classmethod
+    def from_pixmap(cls, pixmap: Any) -> "RawImage":
+        return cls(pixmap.samples, pixmap.width, pixmap.height, pixmap.n, pixmap.stride)
+
 
 class BaseOCR(BaseComponent):
     """
     (Tier 1) Abstract base class for OCR engines.
+
+    Adds two optional accelerators on top of the ``_do_ocr`` hook:
+
+    * a result cache (any ``sayou.core.cache.BaseCache``, or a path for a
+      ``SqliteCache``) keyed by the image content hash plus the engine's
+      language and DPI, so recurring logos, stamps and headers are
+      recognised once per corpus rather than once per occurrence;
+    * a worker pool (processes, or threads for ``USE_THREADS`` engines)
+      used by ``ocr_batch`` when ``ocr_workers > 1``.
+
+    Attributes:
+        OCR_WORKERS (int): Default pool size (1 = OCR in the calling process).
+        USE_THREADS (bool): Pool with threads instead of processes; for
+            engines that release the GIL while recognising.
+        ACCEPTS_RAW (bool): ``_do_ocr`` also accepts a ``RawImage``.
     """
 
     component_name = "BaseOCR"
+    OCR_WORKERS: int = 1
+    USE_THREADS: bool = False
+    ACCEPTS_RAW: bool = False
+
+    def __init__(self):
+        super().__init__()
+        self.workers: int = self.OCR_WORKERS
+        self.cache: Optional[Any] = None
+        self._pool: Optional[Executor] = None
 
     @classmethod
     def can_handle(cls, image_bytes: bytes, lang: str = "eng") -> float:
@@ -25,13 +86,36 @@ class BaseOCR(BaseComponent):
         """
         return 0.5
 
+    def initialize(self, **kwargs):
+        """
+        Configure pooling and caching.
+
+        Args:
+            **kwargs:
+                - ocr_workers (int): Pool size for ``ocr_batch``.
+                - ocr_cache (BaseCache | str): Result cache, or a file path
+                  for a persistent ``SqliteCache``.
+        """
+        workers = kwargs.get("ocr_workers")
+        if workers is not None:
+            self.workers = max(1, int(workers))
+
+        cache = kwargs.get("ocr_cache")
+        if isinstance(cache, str):
+            from sayou.core.cache import SqliteCache
+
+            cache = SqliteCache(cache)
+        if cache is not None:
+            self.cache = cache
+
     @measure_time
-    def ocr(self, image_bytes: bytes, **kwargs) -> str:
+    def ocr(self, image_bytes: Union[bytes, RawImage], **kwargs) -> str:
         """
         Execute OCR on image bytes.
 
         Args:
-            image_bytes (bytes): Image content.
+            image_bytes (bytes | RawImage): Encoded image content, or raw
+                pixels for engines with ``ACCEPTS_RAW``.
 
         Returns:
             str: Extracted text.
@@ -39,9 +123,123 @@ class BaseOCR(BaseComponent):
         if not image_bytes:
             return ""
 
+        key = self._cache_key(self._digest(image_bytes), **kwargs)
+        if key is not None:
+            cached = self.cache.get(key, component=self.component_name)
+            if cached is not None:
+                return cached
+
+        text = self._guarded_ocr(image_bytes, **kwargs)
+        if text is None:
+            return ""
+        if key is not None:
+            self.cache.set(key, text)
+        return text
+
+    def ocr_pixmap(self, pixmap: Any, **kwargs) -> str:
+        """
+        OCR a rendered ``fitz.Pixmap``.
+
+        Raw-capable engines receive the pixel buffer as-is; others get a PNG.
+        """
+        if self.ACCEPTS_RAW:
+            return self.ocr(RawImage.from_pixmap(pixmap), **kwargs)
+        return self.ocr(pixmap.tobytes("png"), **kwargs)
+
+    def ocr_batch(self, images: Sequence[bytes], **kwargs) -> List[str]:
+        """
+        OCR several images, e.g. every embedded image of a page.
+
+        Identical images are recognised once, cached results are reused, and
+        the remaining images are spread over the worker pool when
+        ``workers > 1``.
+
+        Args:
+            images (Sequence[bytes]): Image contents.
+            **kwargs: Forwarded to ``_do_ocr``.
+
+        Returns:
+            List[str]: Extracted text per input image ("" on failure).
+        """
+        digests = [self._digest(img) if img else None for img in images]
+        unique: Dict[str, bytes] = {}
+        for digest, img in zip(digests, images):
+            if digest is not None:
+                unique.setdefault(digest, img)
+
+        texts: Dict[str, str] = {}
+        misses = []
+        for digest, img in unique.items():
+            key = self._cache_key(digest, **kwargs)
+            cached = (
+                self.cache.get(key, component=self.component_name)
+                if key is not None
+                else None
+            )
+            if cached is not None:
+                texts[digest] = cached
+            else:
+                misses.append((digest, img, key))
+
+        if self.workers > 1 and len(misses) > 1:
+            images_to_run = [img for _, img, _ in misses]
+            if self.USE_THREADS:
+                task = partial(self._guarded_ocr, **kwargs)
+                results = list(self._get_pool().map(task, images_to_run))
+            else:
+                results = list(
+                    self._get_pool().map(
+                        _ocr_in_worker, images_to_run, [kwargs] * len(misses)
+                    )
+                )
+        else:
+            results = [self._guarded_ocr(img, **kwargs) for _, img, _ in misses]
+
+        for (digest, _, key), text in zip(misses, results):
+            texts[digest] = text or ""
+            if text is not None and key is not None:
+                self.cache.set(key, text)
+
+        self._log(
+            f"OCR batch: {len(images)} images, {len(unique)} unique, "
+            f"{len(misses)} recognised.",
+            level="debug",
+        )
+        return [texts[d] if d is not None else "" for d in digests]
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def clone_for_worker(self) -> "BaseOCR":
+        """
+        Copy of this engine that is safe to ship to another process.
+
+        Callbacks, cache and pool stay behind, and the copy OCRs inline.
+        """
+        clone = copy.copy(self)
+        clone._callbacks = []
+        clone.cache = None
+        clone._pool = None
+        clone.workers = 1
+        return clone
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _guarded_ocr(
+        self, image_bytes: Union[bytes, RawImage], **kwargs
+    ) -> Optional[str]:
+        """Run ``_do_ocr`` with events; ``None`` signals a failure."""
+        size = len(
+            image_bytes.samples if isinstance(image_bytes, RawImage) else image_bytes
+        )
         self._emit(
             "on_start",
-            input_data={"image_size": len(image_bytes), "engine": self.component_name},
+            input_data={"image_size": size, "engine": self.component_name},
         )
 
         try:
@@ -54,7 +252,54 @@ class BaseOCR(BaseComponent):
         except Exception as e:
             self._emit("on_error", error=e)
             self._log(f"OCR execution failed: {e}", level="warning")
-            return ""
+            return None
+
+    @staticmethod
+    def _digest(image_bytes: Union[bytes, RawImage]) -> str:
+        h = hashlib.blake2b(digest_size=20)
+        if isinstance(image_bytes, RawImage):
+            h.update(b"raw%d:%d:%d:" % image_bytes[1:4])
+            h.update(image_bytes.samples)
+        else:
+            h.update(image_bytes)
+        return h.hexdigest()
+
+    def _cache_key(self, digest: str, **kwargs) -> Optional[str]:
+        """Cache key for an image digest under the current engine settings."""
+        if self.cache is None:
+            return None
+        return self.cache.key(
+            self.component_name,
+            config=self._cache_config(**kwargs),
+            digest=digest,
+        )
+
+    def _cache_config(self, **kwargs) -> Dict[str, Any]:
+        """
+        Settings that change the recognised text for identical pixels.
+
+        ``ocr_dpi`` is the resolution the parser rendered or downscaled the
+        image to; embedded images (``ocr_batch``) keep their own resolution
+        and are keyed without one.
+        """
+        return {
+            "lang": getattr(self, "lang", None),
+            "dpi": kwargs.get("ocr_dpi"),
+        }
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None and self.USE_THREADS:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix=self.component_name,
+            )
+        elif self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_ocr_worker,
+                initargs=(self.clone_for_worker(),),
+            )
+        return self._pool
 
     @abstractmethod
     def _do_ocr(self, image_bytes: bytes, **kwargs) -> str:
@@ -1,12 +1,12 @@
 from abc import abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 from sayou.core.base_component import BaseComponent
 from sayou.core.decorators import measure_time
 
 from ..core.exceptions import ParserError
 from ..interfaces.base_ocr import BaseOCR
-from ..models import BoundingBox, Document, ElementMetadata, ImageElement
+from ..models import BasePage, BoundingBox, Document, ElementMetadata, ImageElement
 
 
 class BaseDocumentParser(BaseComponent):
@@ -15,14 +15,26 @@ class BaseDocumentParser(BaseComponent):
 
     Provides common functionality for logging, error handling, and OCR engine integration.
     Implements the Template Method pattern via `parse` -> `_do_parse`.
+
+    Image extraction can be switched off per call with ``extract_images=False``
+    (parsers then neither read nor decode embedded images).
+
+    Embedded images are not OCR'd one by one: ``_process_image_data`` queues
+    them and the queue is handed to ``BaseOCR.ocr_batch`` once per page (and
+    whenever ``OCR_BATCH_SIZE`` images are waiting).
+
+    Attributes:
+        OCR_BATCH_SIZE (int): Queued images that trigger an early flush.
     """
 
     component_name = "BaseDocumentParser"
     SUPPORTED_TYPES: List[str] = []
+    OCR_BATCH_SIZE: int = 16
 
     def __init__(self, ocr_engine=None):
         super().__init__()
         self.ocr_engine: Optional[BaseOCR] = ocr_engine
+        self._pending_ocr: List[Tuple[ImageElement, bytes]] = []
 
     def set_ocr_engine(self, ocr_engine: Optional[BaseOCR]):
         """
@@ -80,6 +92,7 @@ class BaseDocumentParser(BaseComponent):
             document = self._do_parse(
                 file_bytes, file_name, tesseract_path=tesseract_path, **kwargs
             )
+            self._flush_ocr()
 
             if document:
                 self._log(
@@ -99,6 +112,72 @@ class BaseDocumentParser(BaseComponent):
             )
             self.logger.error(wrapped_error, exc_info=True)
             raise wrapped_error
+        finally:
+            # Images queued by a failed parse must not leak into the next one.
+            self._pending_ocr = []
+
+    def parse_iter(
+        self, file_bytes: bytes, file_name: str, **kwargs
+    ) -> Iterator[BasePage]:
+        """
+        Parse the file lazily, yielding one page (or slide/sheet) at a time.
+
+        Consumers that handle pages independently (normalizers, splitters)
+        can release each page before the next is parsed, so peak memory is
+        bounded by a single page instead of the whole Document.
+
+        Args:
+            file_bytes (bytes): Binary content of the file.
+            file_name (str): Original filename (used for extension detection).
+            **kwargs: Additional parsing options (same as ``parse``).
+
+        Yields:
+            BasePage: Parsed pages in document order.
+
+        Raises:
+            ParserError: If parsing logic encounters a critical error.
+        """
+        self._emit(
+            "on_start",
+            input_data={"filename": file_name, "parser": self.component_name},
+        )
+        self._log(f"Streaming file: {file_name} ({len(file_bytes)} bytes)")
+
+        if not file_bytes:
+            self._log("Received empty file bytes.", level="warning")
+            return
+
+        page_count = 0
+        try:
+            for page in self._iter_pages(file_bytes, file_name, **kwargs):
+                self._flush_ocr()
+                page_count += 1
+                yield page
+        except Exception as e:
+            self._emit("on_error", error=e)
+            wrapped_error = ParserError(
+                f"[{self.component_name}] Failed to parse {file_name}: {str(e)}"
+            )
+            self.logger.error(wrapped_error, exc_info=True)
+            raise wrapped_error from e
+        finally:
+            self._pending_ocr = []
+
+        self._log(f"Streamed {page_count} pages from {file_name}.")
+        self._emit("on_finish", result_data={"pages": page_count}, success=True)
+
+    def _iter_pages(
+        self, file_bytes: bytes, file_name: str, **kwargs
+    ) -> Iterator[BasePage]:
+        """
+        [Hook] Yield pages one at a time.
+
+        The default materialises the Document via ``_do_parse`` and yields
+        its pages; parsers that can produce pages independently override it.
+        """
+        document = self._do_parse(file_bytes, file_name, **kwargs)
+        if document:
+            yield from document.pages
 
     @abstractmethod
     def _do_parse(self, file_bytes: bytes, file_name: str, **kwargs) -> Document:
@@ -136,29 +215,43 @@ class BaseDocumentParser(BaseComponent):
 
         Returns:
             ImageElement: Constructed image element, possibly with OCR text.
+            The bytes are attached as-is; Base64 is only produced when the
+            element is serialised or ``get_image_base64()`` is called.
         """
-        import base64
-
-        image_base64 = base64.b64encode(image_bytes).decode("utf-8")
-        ocr_text = None
-
-        if ocr_enabled and self.ocr_engine:
-            try:
-                extracted = self.ocr_engine.ocr(image_bytes)
-                if extracted and extracted.strip():
-                    ocr_text = extracted.strip()
-                    self._log(
-                        f"OCR extracted {len(ocr_text)} chars from image {elem_id}"
-                    )
-            except Exception as e:
-                self._log(f"OCR failed for image {elem_id}: {e}", level="warning")
-
-        return ImageElement(
+        element = ImageElement(
             id=elem_id,
             type="image",
             bbox=bbox,
             meta=ElementMetadata(page_num=page_num, id=elem_id),
-            image_base64=image_base64,
             image_format=img_format,
-            ocr_text=ocr_text,
-        )
+        ).attach_data(image_bytes)
+
+        if ocr_enabled and self.ocr_engine:
+            # OCR is deferred: the element is filled in by _flush_ocr.
+            self._pending_ocr.append((element, image_bytes))
+            if len(self._pending_ocr) >= self.OCR_BATCH_SIZE:
+                self._flush_ocr()
+
+        return element
+
+    def _flush_ocr(self) -> None:
+        """
+        OCR all queued images in one ``ocr_batch`` call and fill in their
+        ``ocr_text``.
+        """
+        pending, self._pending_ocr = self._pending_ocr, []
+        if not pending or not self.ocr_engine:
+            return
+
+        try:
+            texts = self.ocr_engine.ocr_batch([data for _, data in pending])
+        except Exception as e:
+            self._log(f"OCR failed for {len(pending)} images: {e}", level="warning")
+            return
+
+        for (element, _), extracted in zip(pending, texts):
+            if extracted and extracted.strip():
+                element.ocr_text = extracted.strip()
+                self._log(
+                    f"OCR extracted {len(element.ocr_text)} chars from image {element.id}"
+                )
@@ -1,6 +1,15 @@
-from typing import Any, Dict, List, Literal, Optional, Union
-
-from pydantic import BaseModel, ConfigDict, Field
+import base64
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
+    model_serializer,
+)
 
 # ==============================================================================
 # 1. Atoms — smallest unit, Common Schema
@@ -144,6 +153,12 @@ class ImageElement(BaseElement):
 
     Can store the image data as a Base64 string (`image_base64`), a URL (`image_url`),
     or extracted text via OCR (`ocr_text`).
+
+    Parsers do not Base64-encode images up front: they attach the raw bytes
+    (or an offset/length into a larger source buffer) with `attach_data`.
+    `image_base64` stays `None` until requested via `get_image_base64()`;
+    serialisation (`model_dump`, `model_dump_json`) fills it in, so dumped
+    output is unchanged.
     """
 
     type: Literal["image"] = "image"
@@ -153,11 +168,84 @@ class ImageElement(BaseElement):
     ocr_text: Optional[str] = None
     meta: ElementMetadata
 
+    # Raw image payload: (buffer, offset, length), materialised on demand.
+    _data: Optional[Tuple[bytes, int, int]] = PrivateAttr(default=None)
+
     @property
     def text(self) -> str:
         """Returns OCR text if available."""
         return self.ocr_text or self.caption or ""
 
+    def attach_data(
+        self, data: bytes, offset: int = 0, length: Optional[int] = None
+    ) -> "ImageElement":
+        """
+        Reference raw image bytes without encoding them.
+
+        Args:
+            data (bytes): The image bytes, or a source buffer containing them.
+            offset (int): Start of the image within `data`.
+            length (int, optional): Image size; defaults to the rest of `data`.
+
+        Returns:
+            ImageElement: self, for chaining.
+        """
+        if length is None:
+            length = len(data) - offset
+        self._data = (data, offset, length)
+        return self
+
+    @property
+    def has_image(self) -> bool:
+        """True if image content is attached or already Base64-encoded."""
+        return self._data is not None or bool(self.image_base64)
+
+    @property
+    def image_bytes(self) -> Optional[bytes]:
+        """Raw image bytes (decoded from `image_base64` if nothing is attached)."""
+        if self._data is not None:
+            data, offset, length = self._data
+            if offset == 0 and length == len(data):
+                return data
+            return bytes(memoryview(data)[offset : offset + length])
+        if self.image_base64:
+            return base64.b64decode(self.image_base64)
+        return None
+
+    def get_image_base64(self) -> Optional[str]:
+        """Base64 text of the image, encoded on each call (not stored)."""
+        if self.image_base64 is not None or self._data is None:
+            return self.image_base64
+        data, offset, length = self._data
+        return base64.b64encode(memoryview(data)[offset : offset + length]).decode(
+            "ascii"
+        )
+
+    @model_serializer(mode="wrap")
+    def _serialize_image(
+        self, handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ) -> Dict[str, Any]:
+        dumped = handler(self)
+        if (
+            self._data is not None
+            and dumped.get("image_base64") is None
+            and (info.include is None or "image_base64" in info.include)
+            and not (info.exclude and "image_base64" in info.exclude)
+        ):
+            dumped["image_base64"] = self.get_image_base64()
+        return dumped
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        # Ship only the referenced slice, not the whole source buffer.
+        state = super().__getstate__()
+        if self._data is not None:
+            data, offset, length = self._data
+            if offset or length != len(data):
+                private = dict(state["__pydantic_private__"])
+                private["_data"] = (self.image_bytes, 0, length)
+                state["__pydantic_private__"] = private
+        return state
+
 
 class ChartElement(BaseElement):
     """
@@ -283,7 +371,7 @@ class Document(BaseModel):
 
     file_name: str
     file_id: str
-    doc_type: Literal["pdf", "word", "slide", "sheet", "unknown"]
+    doc_type: Literal["pdf", "word", "slide", "sheet", "image", "unknown"]
 
     metadata: DocumentMetadata = Field(default_factory=DocumentMetadata)
     page_count: int = 0
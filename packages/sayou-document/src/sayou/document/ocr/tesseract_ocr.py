@@ -1,16 +1,15 @@
-try:
-    import io
-
-    import pytesseract
-    from PIL import Image
-except ImportError:
-    pytesseract = None
+import io
 
+from sayou.core.lazy import optional_import
 from sayou.core.registry import register_component
 
 from ..core.exceptions import OCRError
 from ..interfaces.base_ocr import BaseOCR
 
+# pytesseract and Pillow are imported on the first OCR call.
+pytesseract = optional_import("pytesseract")
+Image = optional_import("PIL.Image")
+
 
 @register_component("ocr")
 class TesseractOCR(BaseOCR):
@@ -33,8 +32,10 @@ class TesseractOCR(BaseOCR):
         """
         Args:
             lang (str): Language code string (e.g., 'eng', 'kor', 'eng+kor').
-            **kwargs: Additional options.
+            **kwargs: Additional options (``ocr_workers``, ``ocr_cache``;
+                see ``BaseOCR.initialize``).
         """
+        super().initialize(**kwargs)
         self.lang = lang
         self.default_path = kwargs.get("engine_path") or kwargs.get("tesseract_path")
 
@@ -49,7 +50,7 @@ class TesseractOCR(BaseOCR):
         Returns:
             str: Extracted text.
         """
-        if not pytesseract:
+        if pytesseract is None or Image is None:
             raise ImportError("pytesseract and Pillow are required for TesseractOCR.")
 
         run_path = kwargs.get("engine_path") or kwargs.get("tesseract_path")
@@ -0,0 +1,160 @@
+import io
+import threading
+from typing import Any, Dict, List, Union
+
+from sayou.core.lazy import optional_import
+from sayou.core.registry import register_component
+
+from ..core.exceptions import OCRError
+from ..interfaces.base_ocr import BaseOCR, RawImage
+
+# tesserocr (Tesseract C API bindings) and Pillow are imported on first use.
+tesserocr = optional_import("tesserocr")
+Image = optional_import("PIL.Image")
+
+
+@register_component("ocr")
+class TesserocrOCR(BaseOCR):
+    """
+    (Tier 2) OCR through the Tesseract C API via 'tesserocr'.
+
+    Unlike ``TesseractOCR`` (one ``tesseract`` subprocess and model load per
+    image), every thread keeps a resident ``PyTessBaseAPI``: the language
+    model is loaded once and each call only recognises.  Rendered PDF pages
+    arrive as raw pixmaps, so no PNG is encoded or decoded on the way.
+
+    tesserocr releases the GIL while recognising, so ``ocr_batch`` uses a
+    thread pool (``ocr_workers`` threads, one engine each).
+
+    Opt-in: ``DocumentPipeline`` only picks it when the OCR config names it
+    (``ocr={"engine_name": "tesserocr", ...}``); ``TesseractOCR`` stays the
+    default engine whether or not the bindings are installed.
+    """
+
+    component_name = "TesserocrOCR"
+    USE_THREADS = True
+    ACCEPTS_RAW = True
+    ENGINE_NAMES = ("tesserocr", "TesserocrOCR")
+
+    def __init__(self):
+        super().__init__()
+        self.lang = "eng+kor"
+        self.tessdata_path = None
+        self.psm = None
+        self._reset_engines()
+
+    @classmethod
+    def can_handle(cls, image_bytes: bytes, engine_name: str = "default") -> float:
+        """
+        Only when selected by name (see ``ENGINE_NAMES``) and the bindings
+        are installed.
+        """
+        if tesserocr is None or engine_name not in cls.ENGINE_NAMES:
+            return 0.0
+        return 1.0
+
+    def initialize(self, lang: str = "eng+kor", **kwargs):
+        """
+        Args:
+            lang (str): Language code string (e.g., 'eng', 'kor', 'eng+kor').
+            **kwargs:
+                - tessdata_path (str): Directory holding the traineddata files.
+                - psm (int): Tesseract page segmentation mode.
+                - ``ocr_workers`` / ``ocr_cache``: see ``BaseOCR.initialize``.
+        """
+        super().initialize(**kwargs)
+        if lang != self.lang or kwargs.get("tessdata_path") != self.tessdata_path:
+            self.close()
+        self.lang = lang
+        self.tessdata_path = kwargs.get("tessdata_path")
+        self.psm = kwargs.get("psm")
+
+    def _do_ocr(self, image_bytes: Union[bytes, RawImage], **kwargs) -> str:
+        """
+        Recognise an encoded image or a raw pixel buffer.
+
+        Args:
+            image_bytes (bytes | RawImage): Encoded image, or raw 8-bit pixels.
+
+        Returns:
+            str: Extracted text.
+        """
+        if tesserocr is None:
+            raise ImportError("tesserocr is required for TesserocrOCR.")
+
+        api = self._engine()
+        try:
+            if isinstance(image_bytes, RawImage):
+                api.SetImageBytes(
+                    image_bytes.samples,
+                    image_bytes.width,
+                    image_bytes.height,
+                    image_bytes.channels,
+                    image_bytes.stride,
+                )
+            else:
+                if Image is None:
+                    raise ImportError("Pillow is required to decode encoded images.")
+                api.SetImage(Image.open(io.BytesIO(image_bytes)))
+            return api.GetUTF8Text()
+        except ImportError:
+            raise
+        except Exception as e:
+            raise OCRError(f"Tesserocr execution failed: {e}")
+        finally:
+            api.Clear()
+
+    def close(self) -> None:
+        """Stop the thread pool and release every resident engine."""
+        super().close()
+        with self._lock:
+            engines, self._engines = self._engines, []
+        for api in engines:
+            try:
+                api.End()
+            except Exception:
+                pass
+        self._local = threading.local()
+
+    # ------------------------------------------------------------------
+    # Engines
+    # ------------------------------------------------------------------
+
+    def _engine(self) -> Any:
+        """The calling thread's ``PyTessBaseAPI``, created on first use."""
+        api = getattr(self._local, "api", None)
+        if api is None:
+            options: Dict[str, Any] = {"lang": self.lang}
+            if self.tessdata_path:
+                options["path"] = self.tessdata_path
+            if self.psm is not None:
+                options["psm"] = self.psm
+            api = tesserocr.PyTessBaseAPI(**options)
+            self._local.api = api
+            with self._lock:
+                self._engines.append(api)
+            self._log(
+                f"Loaded Tesseract engine ({self.lang}) for "
+                f"{threading.current_thread().name}.",
+                level="debug",
+            )
+        return api
+
+    def _reset_engines(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._engines: List[Any] = []
+
+    # Engines, locks and thread-locals cannot cross process boundaries; a
+    # copy (pool worker, page-parallel parser) loads its own engines.
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        for name in ("_local", "_lock", "_engines", "_pool", "_dispatch"):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._pool = None
+        self._reset_engines()
@@ -1,21 +1,37 @@
-import io
-
-try:
-    from docx import Document as DocxDocument
-    from docx.enum.style import WD_STYLE_TYPE
-    from docx.oxml.ns import qn
-    from docx.table import Table
-    from docx.text.paragraph import Paragraph
-except ImportError:
-    DocxDocument = None
-
-from typing import List, Optional
+import xml.etree.ElementTree as ET
+import zipfile
+from typing import Dict, Iterator, List, Optional, Tuple
 
+from sayou.core.lazy import optional_from
+from sayou.core.payload import as_stream
 from sayou.core.registry import register_component
 
 from ..interfaces.base_parser import BaseDocumentParser
 from ..models import (BaseElement, BoundingBox, Document, ElementMetadata,
                       ImageElement, Page, TableCell, TableElement, TextElement)
+from ..utils.ooxml import OoxmlPackage, iter_complete
+
+# python-docx is imported on first use, not when the parser is registered.
+DocxDocument = optional_from("docx", "Document")
+WD_STYLE_TYPE = optional_from("docx.enum.style", "WD_STYLE_TYPE")
+qn = optional_from("docx.oxml.ns", "qn")
+Table = optional_from("docx.table", "Table")
+Paragraph = optional_from("docx.text.paragraph", "Paragraph")
+
+# WordprocessingML tags read by the streaming path.
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_P, _W_R, _W_T, _W_TBL = _W + "p", _W + "r", _W + "t", _W + "tbl"
+_W_TR, _W_TC, _W_TCPR, _W_PPR = _W + "tr", _W + "tc", _W + "tcPr", _W + "pPr"
+_W_VAL, _W_DRAWING, _W_SECTPR = _W + "val", _W + "drawing", _W + "sectPr"
+_RUN_CONTAINERS = {_W + "hyperlink", _W + "ins", _W + "smartTag"}
+_A_BLIP = "{http://schemas.openxmlformats.org/drawingml/2006/main}blip"
+_R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+
+# styles.xml spells these in lower case; python-docx reports the UI names.
+_UI_STYLE_NAMES = {
+    name.lower(): name
+    for name in ["Caption", "Footer", "Header"] + [f"Heading {i}" for i in range(1, 10)]
+}
 
 
 @register_component("parser")
@@ -26,10 +42,21 @@ class DocxParser(BaseDocumentParser):
     Uses 'python-docx' to traverse the document tree, extracting paragraphs,
     tables, and inline images from the body, headers, and footers.
     It preserves semantic structure (Headings, Lists) in 'raw_attributes'.
+
+    Large files are parsed in streaming mode instead: ``word/document.xml``
+    is read with ``iterparse`` straight from the zip, each body paragraph
+    or table is converted as soon as its end tag arrives and is then
+    dropped, and python-docx's object tree is never built.  Element ids are
+    positional (``p1:body:para{n}``) rather than object ids.
+
+    Attributes:
+        STREAMING_MIN_BYTES (int): Files at least this large are streamed
+            unless ``streaming`` is passed explicitly.
     """
 
     component_name = "DocxParser"
     SUPPORTED_TYPES = [".docx", ".doc"]
+    STREAMING_MIN_BYTES: int = 1024 * 1024
     NAMESPACES = {
         "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
         "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
@@ -62,15 +89,28 @@ class DocxParser(BaseDocumentParser):
             file_bytes (bytes): The binary content of the .docx file.
             file_name (str): Original filename.
             **kwargs: Options passed to image processing (e.g., ocr_enabled).
+                - extract_images (bool): If False, inline images are skipped.
+                - streaming (bool): Force (True) or disable (False) the
+                  streaming path; by default files of
+                  ``STREAMING_MIN_BYTES`` or more are streamed.
 
         Returns:
             Document: A document object with 'doc_type="word"'.
         """
+        extract_images = kwargs.get("extract_images", True)
+        streaming = kwargs.get("streaming")
+        if streaming is None:
+            streaming = len(file_bytes) >= self.STREAMING_MIN_BYTES
+        if streaming and file_bytes[:4] == b"PK\x03\x04":
+            return self._stream_parse(file_bytes, file_name, extract_images)
+
         if DocxDocument is None:
             raise ImportError("python-docx is required.")
 
         try:
-            doc = DocxDocument(io.BytesIO(file_bytes))
+            # python-docx reads every part up front; the stream can go.
+            with as_stream(file_bytes) as stream:
+                doc = DocxDocument(stream)
         except Exception as e:
             raise ValueError(f"Failed to load DOCX: {e}")
 
@@ -88,6 +128,7 @@ class DocxParser(BaseDocumentParser):
                     doc,
                     current_page_num,
                     f"p{current_page_num}:body:para{id(para)}",
+                    extract_images,
                 )
                 body_elements.extend(mixed_elements)
 
@@ -108,6 +149,7 @@ class DocxParser(BaseDocumentParser):
                             doc,
                             current_page_num,
                             f"p{current_page_num}:header:para{id(para)}",
+                            extract_images,
                         )
                     )
                 for table in section.header.tables:
@@ -126,6 +168,7 @@ class DocxParser(BaseDocumentParser):
                             doc,
                             current_page_num,
                             f"p{current_page_num}:footer:para{id(para)}",
+                            extract_images,
                         )
                     )
                 for table in section.footer.tables:
@@ -161,6 +204,7 @@ class DocxParser(BaseDocumentParser):
         doc: "DocxDocumentObject",
         page_num: int,
         meta_id_base: str,
+        extract_images: bool = True,
     ) -> List[BaseElement]:
         """
         Extract text and inline images from a single paragraph.
@@ -173,6 +217,7 @@ class DocxParser(BaseDocumentParser):
             doc (Document): The root document object (for image part access).
             page_num (int): Current page number (always 1 for flow documents).
             meta_id_base (str): Base ID string for generating element IDs.
+            extract_images (bool): Whether to extract inline images.
 
         Returns:
             List[BaseElement]: A list of TextElement and ImageElement objects.
@@ -207,7 +252,9 @@ class DocxParser(BaseDocumentParser):
             if run.text:
                 current_text += run.text
 
-            if "drawing" in run._element.xml:
+            # Match the element, not the namespace declarations every run
+            # carries (those mention "drawingml" too).
+            if "<w:drawing" in run._element.xml:
                 if current_text.strip():
                     results.append(
                         TextElement(
@@ -223,6 +270,8 @@ class DocxParser(BaseDocumentParser):
                     )
                     current_text = ""
 
+                if not extract_images:
+                    continue
                 image_elem = self._extract_inline_image(run, doc, page_num, ocr_enabled)
                 if image_elem:
                     image_elem.id = f"{meta_id_base}:img{len(results)}"
@@ -329,3 +378,374 @@ class DocxParser(BaseDocumentParser):
         return TableElement(
             id=meta.id, type="table", data=rows_data, cells=rows_cells, meta=meta
         )
+
+    # ------------------------------------------------------------------
+    # Streaming path (iterparse, no python-docx)
+    # ------------------------------------------------------------------
+
+    def _stream_parse(
+        self, file_bytes: bytes, file_name: str, extract_images: bool
+    ) -> Document:
+        """
+        Parse the main document part incrementally.
+
+        Body paragraphs and tables are converted as they complete and then
+        detached from the tree, so memory does not grow with the body.
+        Headers and footers are small and parsed whole.
+        """
+        try:
+            package = OoxmlPackage(file_bytes)
+        except zipfile.BadZipFile as e:
+            raise ValueError(f"Failed to load DOCX: {e}")
+
+        page_num = 1
+        body_elements: List[BaseElement] = []
+        header_elements: List[BaseElement] = []
+        footer_elements: List[BaseElement] = []
+        sections: List[ET.Element] = []
+
+        try:
+            main = next(
+                (
+                    t
+                    for kind, t in package.rels("").values()
+                    if kind == "officeDocument"
+                ),
+                "word/document.xml",
+            )
+            styles, default_style = self._read_styles(package, main)
+            ctx = _StreamContext(package, styles, default_style, extract_images)
+
+            # document > body > (p | tbl | sectPr)
+            for idx, child in enumerate(iter_complete(package.open(main), depth=2)):
+                if child.tag == _W_P:
+                    body_elements.extend(
+                        self._stream_paragraph(
+                            child, ctx, main, page_num, f"p{page_num}:body:para{idx}"
+                        )
+                    )
+                    sect = child.find(f"{_W_PPR}/{_W_SECTPR}")
+                    if sect is not None:
+                        sections.append(sect)
+                elif child.tag == _W_TBL:
+                    body_elements.append(
+                        self._stream_table(
+                            child, page_num, f"p{page_num}:body:tbl{idx}"
+                        )
+                    )
+                elif child.tag == _W_SECTPR:
+                    sections.append(child)
+
+            try:
+                self._stream_headers_footers(
+                    ctx, main, sections, page_num, header_elements, footer_elements
+                )
+            except Exception as e:
+                self._log(f"Failed to parse headers/footers: {e}", level="warning")
+        finally:
+            package.close()
+
+        page_obj = Page(
+            page_num=page_num,
+            elements=body_elements,
+            header_elements=header_elements,
+            footer_elements=footer_elements,
+            text="\n".join([e.text for e in body_elements if hasattr(e, "text")]),
+        )
+
+        return Document(
+            file_name=file_name,
+            file_id=file_name,
+            doc_type="word",
+            page_count=1,
+            pages=[page_obj],
+        )
+
+    @staticmethod
+    def _read_styles(package: OoxmlPackage, main: str) -> Tuple[Dict[str, str], str]:
+        """Paragraph style id → UI name, and the default paragraph style id."""
+        styles: Dict[str, str] = {}
+        default_style = ""
+        target = next(
+            (t for kind, t in package.rels(main).values() if kind == "styles"), None
+        )
+        if not target or not package.has(target):
+            return styles, default_style
+
+        for style in ET.fromstring(package.read(target)).iter(_W + "style"):
+            if style.get(_W + "type") != "paragraph":
+                continue
+            style_id = style.get(_W + "styleId", "")
+            name_el = style.find(_W + "name")
+            name = name_el.get(_W_VAL, style_id) if name_el is not None else style_id
+            styles[style_id] = _UI_STYLE_NAMES.get(name, name)
+            if style.get(_W + "default") in ("1", "true"):
+                default_style = style_id
+        return styles, default_style
+
+    def _stream_paragraph(
+        self,
+        p: ET.Element,
+        ctx: "_StreamContext",
+        part: str,
+        page_num: int,
+        meta_id_base: str,
+    ) -> List[BaseElement]:
+        """
+        Streaming counterpart of ``_process_paragraph_with_images``.
+
+        Args:
+            p (Element): A ``<w:p>`` element.
+            ctx (_StreamContext): Package, styles and options.
+            part (str): Part the paragraph belongs to (for image relationships).
+            page_num (int): Current page number.
+            meta_id_base (str): Base ID string for generating element IDs.
+
+        Returns:
+            List[BaseElement]: TextElement and ImageElement objects.
+        """
+        style_id = ""
+        num_pr = None
+        ppr = p.find(_W_PPR)
+        if ppr is not None:
+            pstyle = ppr.find(_W + "pStyle")
+            if pstyle is not None:
+                style_id = pstyle.get(_W_VAL, "")
+            num_pr = ppr.find(_W + "numPr")
+        if style_id not in ctx.styles:
+            style_id = ctx.default_style
+        style_name = ctx.styles.get(style_id, "Normal")
+
+        raw_attrs = {"style": style_name}
+        if style_name.startswith(("List", "목록")) or num_pr is not None:
+            raw_attrs["semantic_type"] = "list"
+            ilvl = num_pr.find(_W + "ilvl") if num_pr is not None else None
+            try:
+                raw_attrs["list_level"] = int(ilvl.get(_W_VAL))
+            except (AttributeError, TypeError, ValueError):
+                raw_attrs["list_level"] = 0
+        elif style_id.startswith("Heading"):
+            level_str = "".join(filter(str.isdigit, style_id))
+            if level_str:
+                raw_attrs["semantic_type"] = "heading"
+                raw_attrs["heading_level"] = int(level_str)
+
+        results: List[BaseElement] = []
+        current_text = ""
+        for run in _iter_runs(p):
+            current_text += _run_text(run)
+
+            drawing = next(run.iter(_W_DRAWING), None)
+            if drawing is None:
+                continue
+            if current_text.strip():
+                elem_id = f"{meta_id_base}:text{len(results)}"
+                results.append(
+                    TextElement(
+                        id=elem_id,
+                        type="text",
+                        text=current_text.strip(),
+                        meta=ElementMetadata(page_num=page_num, id=elem_id),
+                        raw_attributes=raw_attrs,
+                    )
+                )
+                current_text = ""
+
+            if not ctx.extract_images:
+                continue
+            image_elem = self._stream_inline_image(drawing, ctx, part, page_num)
+            if image_elem:
+                image_elem.id = f"{meta_id_base}:img{len(results)}"
+                image_elem.meta.id = image_elem.id
+                results.append(image_elem)
+
+        if current_text.strip():
+            results.append(
+                TextElement(
+                    id=f"{meta_id_base}:text_end",
+                    type="text",
+                    text=current_text.strip(),
+                    meta=ElementMetadata(
+                        page_num=page_num, id=f"{meta_id_base}:text_end"
+                    ),
+                    raw_attributes=raw_attrs,
+                )
+            )
+
+        return results
+
+    def _stream_inline_image(
+        self, drawing: ET.Element, ctx: "_StreamContext", part: str, page_num: int
+    ) -> Optional[ImageElement]:
+        """Read the image a ``<w:drawing>`` refers to straight from the zip."""
+        try:
+            for blip in drawing.iter(_A_BLIP):
+                rId = blip.get(_R + "embed")
+                target = ctx.package.rels(part).get(rId, ("", ""))[1]
+                if not target or not ctx.package.has(target):
+                    continue
+                return self._process_image_data(
+                    image_bytes=ctx.package.read(target),
+                    img_format=ctx.package.content_type(target).split("/")[-1] or "png",
+                    elem_id=f"img:{rId}",
+                    page_num=page_num,
+                    ocr_enabled=True,
+                )
+        except Exception as e:
+            self._log(f"DOCX image extraction error: {e}")
+        return None
+
+    def _stream_table(
+        self, tbl: ET.Element, page_num: int, meta_id: str
+    ) -> TableElement:
+        """
+        Streaming counterpart of ``_process_table``.
+
+        Horizontally merged cells repeat their text across the spanned grid
+        columns and vertically merged cells repeat the text above, as
+        python-docx's ``row.cells`` does.
+        """
+        rows_data = []
+        rows_cells = []
+        above: Dict[int, str] = {}
+
+        for r_idx, tr in enumerate(tbl.iterfind(_W_TR)):
+            current_row_data = []
+            col = 0
+            for tc in tr.iterfind(_W_TC):
+                span, continued = 1, False
+                tc_pr = tc.find(_W_TCPR)
+                if tc_pr is not None:
+                    grid_span = tc_pr.find(_W + "gridSpan")
+                    if grid_span is not None:
+                        span = max(1, int(grid_span.get(_W_VAL, 1)))
+                    v_merge = tc_pr.find(_W + "vMerge")
+                    continued = (
+                        v_merge is not None
+                        and v_merge.get(_W_VAL, "continue") == "continue"
+                    )
+
+                if continued:
+                    cell_text = above.get(col, "")
+                else:
+                    cell_text = "\n".join(
+                        "".join(_run_text(r) for r in _iter_runs(p))
+                        for p in tc.iterfind(_W_P)
+                    ).strip()
+                for _ in range(span):
+                    above[col] = cell_text
+                    current_row_data.append(cell_text)
+                    col += 1
+
+            rows_data.append(current_row_data)
+            rows_cells.append(
+                [
+                    TableCell(text=t, row_span=1, col_span=1, is_header=(r_idx == 0))
+                    for t in current_row_data
+                ]
+            )
+
+        meta = ElementMetadata(page_num=page_num, id=meta_id)
+
+        return TableElement(
+            id=meta.id, type="table", data=rows_data, cells=rows_cells, meta=meta
+        )
+
+    def _stream_headers_footers(
+        self,
+        ctx: "_StreamContext",
+        main: str,
+        sections: List[ET.Element],
+        page_num: int,
+        header_elements: List[BaseElement],
+        footer_elements: List[BaseElement],
+    ) -> None:
+        """
+        Parse each section's default header and footer.
+
+        A section without its own definition inherits the previous one, as
+        python-docx's ``section.header`` does.
+        """
+        rels = ctx.package.rels(main)
+        current: Dict[str, str] = {}
+        counter = 0
+
+        for sect in sections:
+            for ref in sect:
+                kind = ref.tag[len(_W) :].replace("Reference", "")
+                if kind in ("header", "footer") and ref.get(_W + "type") in (
+                    None,
+                    "default",
+                ):
+                    current[kind] = rels.get(ref.get(_R + "id"), ("", ""))[1]
+
+            for kind, out in (("header", header_elements), ("footer", footer_elements)):
+                part = current.get(kind)
+                if not part or not ctx.package.has(part):
+                    continue
+                root = ET.fromstring(ctx.package.read(part))
+                for p in root.iterfind(_W_P):
+                    out.extend(
+                        self._stream_paragraph(
+                            p, ctx, part, page_num, f"p{page_num}:{kind}:para{counter}"
+                        )
+                    )
+                    counter += 1
+                for tbl in root.iterfind(_W_TBL):
+                    out.append(
+                        self._stream_table(
+                            tbl, page_num, f"p{page_num}:{kind}:tbl{counter}"
+                        )
+                    )
+                    counter += 1
+
+
+# ---------------------------------------------------------------------------
+# Streaming helpers
+# ---------------------------------------------------------------------------
+
+
+class _StreamContext:
+    """Package, paragraph styles and options shared by one streaming parse."""
+
+    __slots__ = ("package", "styles", "default_style", "extract_images")
+
+    def __init__(
+        self,
+        package: OoxmlPackage,
+        styles: Dict[str, str],
+        default_style: str,
+        extract_images: bool,
+    ) -> None:
+        self.package = package
+        self.styles = styles
+        self.default_style = default_style
+        self.extract_images = extract_images
+
+
+def _iter_runs(p: ET.Element) -> Iterator[ET.Element]:
+    """``<w:r>`` children of a paragraph, including those inside hyperlinks."""
+    for child in p:
+        if child.tag == _W_R:
+            yield child
+        elif child.tag in _RUN_CONTAINERS:
+            yield from child.iterfind(_W_R)
+
+
+def _run_text(run: ET.Element) -> str:
+    """Text of a run, with tabs and line breaks as python-docx renders them."""
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == _W_T:
+            parts.append(child.text or "")
+        elif tag == _W + "tab":
+            parts.append("\t")
+        elif tag == _W + "cr" or (
+            tag == _W + "br"
+            and child.get(_W + "type", "textWrapping") == "textWrapping"
+        ):
+            parts.append("\n")
+        elif tag == _W + "noBreakHyphen":
+            parts.append("-")
+    return "".join(parts)
@@ -1,20 +1,19 @@
 import io
 import zipfile
+from typing import BinaryIO, Iterator, List, Optional
 
-try:
-    import openpyxl
-    from openpyxl.drawing.image import Image as XLImage
-except ImportError:
-    openpyxl = None
-
-from typing import List
-
+from sayou.core.lazy import optional_from, optional_import
+from sayou.core.payload import as_stream
 from sayou.core.registry import register_component
 
 from ..interfaces.base_parser import BaseDocumentParser
 from ..models import (BaseElement, Document, ElementMetadata, ImageElement,
                       Page, Sheet, TableCell, TableElement)
 
+# openpyxl is imported on first use, not when the parser is registered.
+openpyxl = optional_import("openpyxl")
+XLImage = optional_from("openpyxl.drawing.image", "Image")
+
 
 @register_component("parser")
 class ExcelParser(BaseDocumentParser):
@@ -24,10 +23,25 @@ class ExcelParser(BaseDocumentParser):
     Treats each sheet as a 'Page'. Extracts cell data as tables and
     floating images embedded in the sheet. Includes a robust recovery
     mechanism for corrupted metadata XML.
+
+    Large workbooks are parsed in streaming mode: openpyxl's ``read_only``
+    reader yields plain cell values (no Cell objects), rows are grouped
+    into ``TableElement`` batches of ``ROW_BATCH_SIZE`` and no per-cell
+    ``TableCell`` grid is built.  Read-only worksheets expose neither
+    drawings nor merged ranges, so streaming mode extracts no images and
+    leaves ``TableElement.cells`` empty.
+
+    Attributes:
+        STREAMING_MIN_BYTES (int): Files at least this large are streamed
+            unless ``read_only`` is passed explicitly; a warning names what
+            is dropped.
+        ROW_BATCH_SIZE (int): Rows per ``TableElement`` in streaming mode.
     """
 
     component_name = "ExcelParser"
     SUPPORTED_TYPES = [".xlsx", ".xlsm", ".xltx", ".xltm"]
+    STREAMING_MIN_BYTES: int = 8 * 1024 * 1024
+    ROW_BATCH_SIZE: int = 10_000
 
     @classmethod
     def can_handle(cls, file_bytes: bytes, file_name: str) -> float:
@@ -58,79 +72,219 @@ class ExcelParser(BaseDocumentParser):
             **kwargs:
                 - skip_hidden (bool): If True, ignore hidden sheets.
                 - ocr_images (bool): If True, run OCR on embedded images.
+                - extract_images (bool): If False, skip embedded images.
+                - read_only (bool): Force (True) or disable (False) streaming
+                  mode; by default files of ``STREAMING_MIN_BYTES`` or more
+                  are streamed.
+                - row_batch_size (int): Rows per table in streaming mode.
 
         Returns:
             Document: A document object with 'doc_type="sheet"'.
         """
+        pages_list = list(self._iter_pages(file_bytes, file_name, **kwargs))
+
+        return Document(
+            file_name=file_name,
+            file_id=file_name,
+            doc_type="sheet",
+            page_count=len(pages_list),
+            pages=pages_list,
+        )
+
+    def _iter_pages(
+        self, file_bytes: bytes, file_name: str, **kwargs
+    ) -> Iterator[Sheet]:
+        """Yield one Sheet per non-empty worksheet, in workbook order."""
         if openpyxl is None:
             raise ImportError("openpyxl is required for ExcelParser.")
 
-        workbook = self._load_workbook_safe(file_bytes)
-        pages_list = []
+        read_only = kwargs.get("read_only")
+        if read_only is None:
+            read_only = len(file_bytes) >= self.STREAMING_MIN_BYTES
+            if read_only:
+                self._log(
+                    f"{file_name} is {len(file_bytes)} bytes: streaming it "
+                    "read-only, without embedded images or the per-cell grid. "
+                    "Pass read_only=False to keep them.",
+                    level="warning",
+                )
+        batch_size = max(1, int(kwargs.get("row_batch_size") or self.ROW_BATCH_SIZE))
+
+        source = as_stream(file_bytes)
+        try:
+            workbook = self._load_workbook_safe(source, read_only=read_only)
+        except Exception:
+            source.close()
+            raise
         skip_hidden = kwargs.get("skip_hidden", False)
         ocr_images = kwargs.get("ocr_images", True)
+        extract_images = kwargs.get("extract_images", True)
+        if read_only:
+            self._log(f"Streaming {file_name} (read-only, {batch_size} rows/batch).")
 
-        for idx, sheet_name in enumerate(workbook.sheetnames):
-            sheet = workbook[sheet_name]
-            is_hidden = sheet.sheet_state != "visible"
-            if skip_hidden and is_hidden:
-                self._log(f"Skipping hidden sheet: {sheet_name}")
-                continue
-
-            elements_list: List[BaseElement] = []
-
-            sheet_data = []
-            rows_cells = []
-
-            for r_idx, row in enumerate(sheet.iter_rows()):
-                cleaned_row_data = []
-                current_row_cells = []
-
-                for c_idx, cell in enumerate(row):
-                    cell_text = str(cell.value) if cell.value is not None else ""
-                    cleaned_row_data.append(cell_text)
-                    cell_obj = TableCell(
-                        text=cell_text,
-                        row_span=1,
-                        col_span=1,
-                        is_header=False,
+        try:
+            for idx, sheet_name in enumerate(workbook.sheetnames):
+                sheet = workbook[sheet_name]
+                is_hidden = sheet.sheet_state != "visible"
+                if skip_hidden and is_hidden:
+                    self._log(f"Skipping hidden sheet: {sheet_name}")
+                    continue
+
+                if read_only:
+                    sheet_obj = self._stream_sheet(
+                        sheet, sheet_name, idx, is_hidden, batch_size
+                    )
+                else:
+                    sheet_obj = self._parse_sheet(
+                        sheet, sheet_name, idx, is_hidden, ocr_images, extract_images
                     )
-                    current_row_cells.append(cell_obj)
+                if sheet_obj is not None:
+                    yield sheet_obj
+        finally:
+            if read_only:
+                # Read-only workbooks keep the archive open until closed.
+                workbook.close()
+            source.close()
+
+    def _parse_sheet(
+        self,
+        sheet,
+        sheet_name: str,
+        idx: int,
+        is_hidden: bool,
+        ocr_images: bool,
+        extract_images: bool = True,
+    ) -> Optional[Sheet]:
+        """
+        Convert a single worksheet into a Sheet page.
+
+        Args:
+            sheet (Worksheet): The openpyxl worksheet object.
+            sheet_name (str): The worksheet name.
+            idx (int): The sheet index (0-based).
+            is_hidden (bool): Whether the sheet is hidden.
+            ocr_images (bool): Whether to perform OCR on embedded images.
+            extract_images (bool): Whether to extract embedded images at all.
+
+        Returns:
+            Optional[Sheet]: The sheet page, or None if it has no content.
+        """
+        elements_list: List[BaseElement] = []
 
-                if any(cleaned_row_data):
-                    sheet_data.append(cleaned_row_data)
-                    rows_cells.append(current_row_cells)
+        sheet_data = []
+        rows_cells = []
 
-            if sheet_data:
-                table_elem = TableElement(
-                    id=f"sheet:{idx}",
+        for r_idx, row in enumerate(sheet.iter_rows()):
+            cleaned_row_data = []
+            current_row_cells = []
+
+            for c_idx, cell in enumerate(row):
+                cell_text = str(cell.value) if cell.value is not None else ""
+                cleaned_row_data.append(cell_text)
+                cell_obj = TableCell(
+                    text=cell_text,
+                    row_span=1,
+                    col_span=1,
+                    is_header=False,
+                )
+                current_row_cells.append(cell_obj)
+
+            if any(cleaned_row_data):
+                sheet_data.append(cleaned_row_data)
+                rows_cells.append(current_row_cells)
+
+        if sheet_data:
+            table_elem = TableElement(
+                id=f"sheet:{idx}",
+                type="table",
+                data=sheet_data,
+                cells=rows_cells,
+                caption=f"Sheet: {sheet_name}",
+                meta=ElementMetadata(page_num=idx + 1),
+            )
+            elements_list.append(table_elem)
+
+        if extract_images:
+            elements_list.extend(self._extract_images(sheet, idx + 1, ocr_images))
+
+        if not elements_list:
+            return None
+
+        return Sheet(
+            page_num=idx + 1,
+            elements=elements_list,
+            sheet_name=sheet_name,
+            is_hidden=is_hidden,
+            sheet_index=idx,
+        )
+
+    def _stream_sheet(
+        self,
+        sheet,
+        sheet_name: str,
+        idx: int,
+        is_hidden: bool,
+        batch_size: int,
+    ) -> Optional[Sheet]:
+        """
+        Convert a read-only worksheet into a Sheet page of row batches.
+
+        Rows arrive as value tuples; each batch of ``batch_size`` non-empty
+        rows becomes one ``TableElement`` (``raw_attributes["row_offset"]``
+        gives the index of its first row within the sheet's data).
+
+        Args:
+            sheet (ReadOnlyWorksheet): The openpyxl read-only worksheet.
+            sheet_name (str): The worksheet name.
+            idx (int): The sheet index (0-based).
+            is_hidden (bool): Whether the sheet is hidden.
+            batch_size (int): Rows per TableElement.
+
+        Returns:
+            Optional[Sheet]: The sheet page, or None if it has no content.
+        """
+        elements_list: List[BaseElement] = []
+        meta = ElementMetadata(page_num=idx + 1)
+        batch: List[List[str]] = []
+        row_offset = 0
+
+        def _flush() -> None:
+            nonlocal batch, row_offset
+            n = len(elements_list)
+            # Rows were converted above; skip re-validating every cell.
+            elements_list.append(
+                TableElement.model_construct(
+                    id=f"sheet:{idx}" if n == 0 else f"sheet:{idx}:batch{n}",
                     type="table",
-                    data=sheet_data,
-                    cells=rows_cells,
+                    data=batch,
+                    cells=[],
                     caption=f"Sheet: {sheet_name}",
-                    meta=ElementMetadata(page_num=idx + 1),
-                )
-                elements_list.append(table_elem)
-
-            sheet_images = self._extract_images(sheet, idx + 1, ocr_images)
-            elements_list.extend(sheet_images)
-
-            if elements_list:
-                sheet_obj = Sheet(
-                    page_num=idx + 1,
-                    elements=elements_list,
-                    sheet_name=sheet_name,
-                    is_hidden=is_hidden,
-                    sheet_index=idx,
+                    meta=meta,
+                    bbox=None,
+                    raw_attributes={"row_offset": row_offset},
                 )
-                pages_list.append(sheet_obj)
+            )
+            row_offset += len(batch)
+            batch = []
 
-        return Document(
-            file_name=file_name,
-            file_id=file_name,
-            doc_type="sheet",
-            page_count=len(pages_list),
-            pages=pages_list,
+        for values in sheet.iter_rows(values_only=True):
+            row = ["" if v is None else str(v) for v in values]
+            if any(row):
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    _flush()
+        if batch:
+            _flush()
+
+        if not elements_list:
+            return None
+
+        return Sheet(
+            page_num=idx + 1,
+            elements=elements_list,
+            sheet_name=sheet_name,
+            is_hidden=is_hidden,
+            sheet_index=idx,
         )
 
     def _extract_images(self, sheet, page_num, ocr_enabled) -> List[ImageElement]:
@@ -164,7 +318,7 @@ class ExcelParser(BaseDocumentParser):
                         self._log(f"Image extraction error: {e}", level="warning")
         return images
 
-    def _load_workbook_safe(self, file_bytes: bytes):
+    def _load_workbook_safe(self, source: BinaryIO, read_only: bool = False):
         """
         Load workbook with fallback repair logic.
 
@@ -173,24 +327,29 @@ class ExcelParser(BaseDocumentParser):
         the ZIP structure to exclude the problematic file and retries.
 
         Args:
-            file_bytes (bytes): The raw file content.
+            source (BinaryIO): Seekable stream over the file; the caller
+                closes it (read-only workbooks read from it until closed).
+            read_only (bool): Open with openpyxl's streaming reader.
 
         Returns:
             Workbook: The loaded openpyxl Workbook object.
         """
         try:
-            return openpyxl.load_workbook(io.BytesIO(file_bytes), data_only=True)
+            return openpyxl.load_workbook(source, read_only=read_only, data_only=True)
         except (TypeError, KeyError, zipfile.BadZipFile):
             self._log("Excel load failed. Attempting repair (removing custom.xml)...")
             try:
                 repaired_buffer = io.BytesIO()
-                with zipfile.ZipFile(io.BytesIO(file_bytes), "r") as zin:
+                source.seek(0)
+                with zipfile.ZipFile(source, "r") as zin:
                     with zipfile.ZipFile(repaired_buffer, "w") as zout:
                         for item in zin.infolist():
                             if "custom.xml" not in item.filename:
                                 buffer = zin.read(item.filename)
                                 zout.writestr(item, buffer)
                 repaired_buffer.seek(0)
-                return openpyxl.load_workbook(repaired_buffer, data_only=True)
+                return openpyxl.load_workbook(
+                    repaired_buffer, read_only=read_only, data_only=True
+                )
             except Exception as e:
                 raise ValueError(f"Failed to repair Excel file: {e}")
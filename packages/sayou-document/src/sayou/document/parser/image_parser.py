@@ -0,0 +1,318 @@
+import io
+from typing import Any, Iterator, List, Optional, Tuple
+
+from sayou.core.lazy import optional_import
+from sayou.core.payload import as_stream
+from sayou.core.registry import register_component
+
+from ..interfaces.base_ocr import BaseOCR, RawImage
+from ..interfaces.base_parser import BaseDocumentParser
+from ..models import BoundingBox, Document, ElementMetadata, Page, TextElement
+
+# Pillow is imported on the first parse, not when the parser is registered.
+Image = optional_import("PIL.Image")
+ImageSequence = optional_import("PIL.ImageSequence")
+
+
+@register_component("parser")
+class ImageParser(BaseDocumentParser):
+    """
+    (Tier 2) Parser for raster images (JPEG, PNG, BMP, TIFF) using Pillow.
+
+    The image is decoded once and its own pixels are handed to the OCR
+    engine: no PDF envelope is written and no page is rendered back.
+    Before OCR the image can be
+
+    * downscaled to ``ocr_dpi`` when its embedded resolution is higher
+      (JPEGs are reduced while decoding),
+    * converted to grayscale,
+    * deskewed (rotation estimated from the horizontal projection profile).
+
+    Raw-capable engines (``ACCEPTS_RAW``) receive the pixel buffer; other
+    engines receive the original file bytes when preprocessing left the
+    pixels untouched, or a quickly compressed PNG otherwise.
+
+    Without an OCR engine (or when OCR finds no text) each page holds the
+    image itself.  Multi-frame TIFFs produce one page per frame.
+
+    Attributes:
+        OCR_DPI (int): Downscale target; images without a higher embedded
+            DPI are never resampled.
+        GRAYSCALE (bool): Default for ``grayscale``.
+        DESKEW (bool): Default for ``deskew``.
+        DESKEW_MAX_ANGLE (float): Largest skew (degrees) searched.
+        DESKEW_STEP (float): Angle resolution of the search (degrees).
+        DESKEW_SAMPLE (int): Longest side of the thumbnail scored per angle.
+    """
+
+    component_name = "ImageParser"
+    SUPPORTED_TYPES = [".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff"]
+
+    OCR_DPI: int = 300
+    GRAYSCALE: bool = True
+    DESKEW: bool = False
+    DESKEW_MAX_ANGLE: float = 5.0
+    DESKEW_STEP: float = 0.5
+    DESKEW_SAMPLE: int = 1000
+
+    @classmethod
+    def can_handle(cls, file_bytes: bytes, file_name: str) -> float:
+        """
+        Detects image formats via magic bytes, then extension.
+        """
+        if Image is None:
+            return 0.0
+        if (
+            file_bytes.startswith(b"\xff\xd8\xff")
+            or file_bytes.startswith(b"\x89PNG\r\n\x1a\n")
+            or file_bytes.startswith(b"BM")
+            or file_bytes.startswith(b"II*\x00")
+            or file_bytes.startswith(b"MM\x00*")
+        ):
+            return 1.0
+        if any(file_name.lower().endswith(ext) for ext in cls.SUPPORTED_TYPES):
+            return 0.8
+        return 0.0
+
+    def __init__(self, ocr_engine: Optional[BaseOCR] = None):
+        super().__init__()
+        if ocr_engine:
+            self.set_ocr_engine(ocr_engine)
+
+    def _do_parse(self, file_bytes: bytes, file_name: str, **kwargs) -> Document:
+        """
+        Parse image bytes into a Document with one page per frame.
+
+        Args:
+            file_bytes (bytes): Encoded image.
+            file_name (str): Original filename.
+            **kwargs:
+                - ocr_dpi (int): Downscale target (default: ``OCR_DPI``).
+                - grayscale (bool): Convert to grayscale before OCR
+                  (default: ``GRAYSCALE``).
+                - deskew (bool): Straighten skewed scans before OCR
+                  (default: ``DESKEW``).
+                - extract_images (bool): Keep the image on pages without
+                  OCR text (default: True).
+
+        Returns:
+            Document: A document object with ``doc_type="image"``.
+        """
+        pages = list(self._iter_pages(file_bytes, file_name, **kwargs))
+        return Document(
+            file_name=file_name,
+            file_id=file_name,
+            doc_type="image",
+            page_count=len(pages),
+            pages=pages,
+        )
+
+    def _iter_pages(
+        self, file_bytes: bytes, file_name: str, **kwargs
+    ) -> Iterator[Page]:
+        if Image is None:
+            raise ImportError("Pillow is required for ImageParser.")
+
+        # Pillow leaves file objects it did not open to the caller.
+        with as_stream(file_bytes) as stream:
+            image = Image.open(stream)
+            try:
+                frame_count = getattr(image, "n_frames", 1)
+                if frame_count == 1:
+                    yield self._process_frame(image, 0, file_bytes, **kwargs)
+                    return
+                for index, frame in enumerate(ImageSequence.Iterator(image)):
+                    yield self._process_frame(frame, index, None, **kwargs)
+            finally:
+                image.close()
+
+    # ------------------------------------------------------------------
+    # Frame processing
+    # ------------------------------------------------------------------
+
+    def _process_frame(
+        self, image: "Image.Image", index: int, source: Optional[bytes], **kwargs
+    ) -> Page:
+        """
+        OCR one frame, or keep it as an ImageElement.
+
+        Args:
+            image: The decoded (or lazily decodable) frame.
+            index (int): 0-based frame index.
+            source (bytes, optional): Original file bytes of a single-frame
+                image, reused when the pixels need no preprocessing.
+        """
+        page_num = index + 1
+        width, height = image.size
+        bbox = BoundingBox(x0=0, y0=0, x1=width, y1=height)
+        img_format = (image.format or "png").lower()
+        elements: List[Any] = []
+        page_text = ""
+
+        if self.ocr_engine:
+            try:
+                page_text = self._ocr_image(image, source, **kwargs)
+            except Exception as e:
+                self._log(f"OCR failed for frame {page_num}: {e}", level="warning")
+
+        if page_text:
+            elem_id = f"p{page_num}:full_ocr"
+            elements.append(
+                TextElement(
+                    id=elem_id,
+                    type="text",
+                    bbox=bbox,
+                    meta=ElementMetadata(page_num=page_num, id=elem_id),
+                    text=page_text,
+                )
+            )
+        elif kwargs.get("extract_images", True):
+            data = source if source is not None else self._encode_png(image)
+            elements.append(
+                self._process_image_data(
+                    image_bytes=data,
+                    img_format=img_format if source is not None else "png",
+                    elem_id=f"p{page_num}:image",
+                    page_num=page_num,
+                    bbox=bbox,
+                    ocr_enabled=False,
+                )
+            )
+
+        return Page(
+            page_num=page_num,
+            width=width,
+            height=height,
+            elements=elements,
+            text=page_text,
+        )
+
+    def _ocr_image(
+        self, image: "Image.Image", source: Optional[bytes], **kwargs
+    ) -> str:
+        """Preprocess the frame and hand it to the OCR engine."""
+        kwargs["ocr_dpi"] = kwargs.get("ocr_dpi") or self.OCR_DPI
+        prepared, changed = self._prepare_for_ocr(image, **kwargs)
+        if isinstance(self.ocr_engine, BaseOCR) and self.ocr_engine.ACCEPTS_RAW:
+            payload: Any = self._raw_image(prepared)
+        elif not changed and source is not None:
+            payload = source
+        else:
+            payload = self._encode_png(prepared)
+        text = self.ocr_engine.ocr(payload, **kwargs)
+        return text.strip() if text else ""
+
+    def _prepare_for_ocr(
+        self, image: "Image.Image", **kwargs
+    ) -> Tuple["Image.Image", bool]:
+        """
+        Apply downscaling, grayscale and deskew.
+
+        Returns:
+            Tuple: ``(image, changed)``; ``changed`` is False when the
+            pixels are exactly those of the input.
+        """
+        target_dpi = kwargs.get("ocr_dpi") or self.OCR_DPI
+        grayscale = kwargs.get("grayscale", self.GRAYSCALE)
+        deskew = kwargs.get("deskew", self.DESKEW)
+        changed = False
+
+        scale = self._downscale_factor(image, target_dpi)
+        target = (
+            max(1, round(image.width * scale)),
+            max(1, round(image.height * scale)),
+        )
+        if image.format == "JPEG" and (scale < 1.0 or grayscale):
+            # Let libjpeg decode at a reduced size / straight to luminance.
+            changed = bool(image.draft("L" if grayscale else image.mode, target))
+
+        if image.mode in ("RGBA", "LA", "P", "PA"):
+            image = self._flatten(image)
+            changed = True
+        if grayscale and image.mode != "L":
+            image = image.convert("L")
+            changed = True
+        elif not grayscale and image.mode not in ("L", "RGB"):
+            image = image.convert("RGB")
+            changed = True
+
+        if image.size != target:
+            image = image.resize(target, Image.BILINEAR, reducing_gap=2.0)
+            changed = True
+
+        if deskew:
+            angle = self._estimate_skew(image)
+            if angle:
+                self._log(f"Deskewing by {angle:.1f} degrees.", level="debug")
+                fill = 255 if image.mode == "L" else (255,) * len(image.getbands())
+                image = image.rotate(
+                    angle, resample=Image.BICUBIC, expand=True, fillcolor=fill
+                )
+                changed = True
+
+        return image, changed
+
+    @staticmethod
+    def _downscale_factor(image: "Image.Image", target_dpi: int) -> float:
+        """Scale that brings the embedded DPI down to ``target_dpi`` (<= 1)."""
+        dpi = image.info.get("dpi")
+        try:
+            source_dpi = float(dpi[0]) if dpi else 0.0
+        except (TypeError, ValueError, IndexError):
+            source_dpi = 0.0
+        if source_dpi <= target_dpi or target_dpi <= 0:
+            return 1.0
+        return target_dpi / source_dpi
+
+    def _estimate_skew(self, gray: "Image.Image") -> float:
+        """
+        Angle (degrees, counter-clockwise) that best aligns text lines.
+
+        Each candidate rotation of a binarised thumbnail is scored by the
+        variance of its row sums: text lines parallel to the x-axis give
+        sharply alternating dark and blank rows.
+        """
+        if gray.mode != "L":
+            gray = gray.convert("L")
+        sample = gray.copy()
+        sample.thumbnail((self.DESKEW_SAMPLE, self.DESKEW_SAMPLE))
+        ink = sample.point(lambda v: 255 if v < 128 else 0)
+
+        best_angle, best_score = 0.0, -1.0
+        steps = int(self.DESKEW_MAX_ANGLE / self.DESKEW_STEP)
+        for step in range(-steps, steps + 1):
+            angle = step * self.DESKEW_STEP
+            rotated = ink.rotate(angle, resample=Image.NEAREST)
+            rows = rotated.resize((1, rotated.height), Image.BOX).tobytes()
+            mean = sum(rows) / len(rows)
+            score = sum((r - mean) ** 2 for r in rows)
+            if score > best_score:
+                best_angle, best_score = angle, score
+        return best_angle
+
+    @staticmethod
+    def _flatten(image: "Image.Image") -> "Image.Image":
+        """Composite transparent / palette images onto white."""
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        return background
+
+    @staticmethod
+    def _raw_image(image: "Image.Image") -> RawImage:
+        if image.mode not in ("L", "RGB"):
+            image = image.convert("RGB")
+        channels = len(image.getbands())
+        return RawImage(
+            image.tobytes(),
+            image.width,
+            image.height,
+            channels,
+            image.width * channels,
+        )
+
+    @staticmethod
+    def _encode_png(image: "Image.Image") -> bytes:
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG", compress_level=1)
+        return buffer.getvalue()
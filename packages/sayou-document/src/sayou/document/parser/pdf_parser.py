@@ -1,12 +1,38 @@
-from typing import Any, Dict, Optional
-
-import fitz
+import copy
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from sayou.core.lazy import lazy_import
+from sayou.core.payload import as_buffer, payload_path
 from sayou.core.registry import register_component
 
 from ..interfaces.base_ocr import BaseOCR
 from ..interfaces.base_parser import BaseDocumentParser
-from ..models import (BaseElement, BoundingBox, Document, ElementMetadata,
-                      ImageElement, Page, TextElement)
+from ..models import (BaseElement, BoundingBox, Document, DocumentMetadata,
+                      ElementMetadata, ImageElement, Page, TextElement)
+
+# PyMuPDF is imported on the first parse, not when the parser is registered.
+fitz = lazy_import("fitz")
+
+# Per-process state of page-parallel workers (see PdfParser._iter_pages_parallel).
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_page_worker(parser: "PdfParser", file_bytes: Any) -> None:
+    """Pool initializer: open the document once per worker process."""
+    _WORKER_STATE["parser"] = parser
+    _WORKER_STATE["doc"] = parser._load_document(file_bytes)
+
+
+def _parse_page_shard(
+    page_nums: List[int], file_name: str, options: Dict[str, Any]
+) -> List[Tuple[Page, float]]:
+    """Pool task: parse the given 0-based pages of the worker's document."""
+    parser = _WORKER_STATE["parser"]
+    doc = _WORKER_STATE["doc"]
+    return [parser._timed_page(doc, n, file_name, **options) for n in page_nums]
 
 
 @register_component("parser")
@@ -17,11 +43,47 @@ class PdfParser(BaseDocumentParser):
     Supports high-fidelity extraction of text blocks and images.
     Features 'Smart Scan Detection': automatically applies OCR to whole pages
     if extracted text content is insufficient.
+
+    Large documents can be parsed page-parallel: consecutive page ranges are
+    sharded across a process pool whose workers each open the document once
+    (from the same bytes, or by path for spilled payloads) and the pages are
+    merged back in order, so the result is identical to the sequential path.
+
+    Extraction levels trade fidelity for speed (``extraction_level``):
+    ``"text"`` makes one plain-text call per page and emits a single
+    TextElement per page, ``"layout"`` adds positioned text blocks but no
+    images, and ``"full"`` also extracts (and OCRs) embedded images.
+    ``pages`` / ``max_pages`` restrict parsing to a page selection or a
+    first-N preview.
+
+    Attributes:
+        PAGE_WORKERS (int): Default worker processes (1 = sequential).
+            Override per call with ``page_workers``; 0 uses every CPU.
+        PARALLEL_MIN_PAGES (int): Documents shorter than this are always
+            parsed sequentially — pool start-up would dominate.
+        SHARDS_PER_WORKER (int): Page ranges per worker; more, smaller
+            shards even out pages with very different costs (e.g. OCR).
+        PAGE_OPTIONS (tuple): Per-page parse options forwarded to workers
+            (the rest of the run config may not be picklable).
+        EXTRACTION_LEVEL (str): Default ``extraction_level``
+            (``"text"``, ``"layout"`` or ``"full"``).
     """
 
     component_name = "PdfParser"
     SUPPORTED_TYPES = [".pdf"]
 
+    PAGE_WORKERS: int = 1
+    PARALLEL_MIN_PAGES: int = 32
+    SHARDS_PER_WORKER: int = 4
+    PAGE_OPTIONS: Tuple[str, ...] = (
+        "ocr_dpi",
+        "ocr_images",
+        "extract_images",
+        "extraction_level",
+    )
+    EXTRACTION_LEVELS: Tuple[str, ...] = ("text", "layout", "full")
+    EXTRACTION_LEVEL: str = "full"
+
     @classmethod
     def can_handle(cls, file_bytes: bytes, file_name: str) -> float:
         """
@@ -50,18 +112,28 @@ class PdfParser(BaseDocumentParser):
             file_name (str): Original filename.
             **kwargs:
                 - ocr_dpi (int): Resolution for rendering pages for OCR (default: 200).
+                - extract_images (bool): Extract embedded images (default: True).
+                - page_workers (int): Worker processes for page-parallel
+                  parsing (default: ``PAGE_WORKERS``; 0 = all CPUs).
+                - extraction_level (str): ``"text"``, ``"layout"`` or
+                  ``"full"`` (default: ``EXTRACTION_LEVEL``).
+                - pages (str | Iterable[int]): 1-based pages to parse, e.g.
+                  ``"1-3,7"``, ``"10-"`` or ``range(1, 4)`` (default: all).
+                - max_pages (int): Parse at most the first N selected pages.
 
         Returns:
-            Document: A document object with 'doc_type="pdf"'.
+            Document: A document object with 'doc_type="pdf"'.  When only
+            part of the file was parsed, ``metadata.extra["total_pages"]``
+            holds the page count of the whole file.
         """
         # 1. Load PDF
         doc = self._load_document(file_bytes)
-        pages_list = []
 
         # 2. Iterate pages
-        for page_num in range(doc.page_count):
-            page_obj = self._process_page(doc, page_num, file_name)
-            pages_list.append(page_obj)
+        pages_list = list(self._generate_pages(doc, file_bytes, file_name, **kwargs))
+        metadata = DocumentMetadata()
+        if len(pages_list) < doc.page_count:
+            metadata.extra = {"total_pages": doc.page_count}
 
         # 3. Extract table of contents
         toc_list = []
@@ -80,26 +152,195 @@ class PdfParser(BaseDocumentParser):
             file_name=file_name,
             file_id=file_name,
             doc_type="pdf",
+            metadata=metadata,
             page_count=len(pages_list),
             pages=pages_list,
             toc=toc_list,
         )
 
-    def _load_document(self, file_bytes: bytes) -> fitz.Document:
+    def _iter_pages(
+        self, file_bytes: bytes, file_name: str, **kwargs
+    ) -> Iterator[Page]:
+        """Yield pages as they are parsed; the TOC is not extracted."""
+        doc = self._load_document(file_bytes)
+        try:
+            yield from self._generate_pages(doc, file_bytes, file_name, **kwargs)
+        finally:
+            doc.close()
+
+    def _generate_pages(
+        self, doc: "fitz.Document", file_bytes: bytes, file_name: str, **kwargs
+    ) -> Iterator[Page]:
+        """Parse pages sequentially, or sharded across worker processes."""
+        level = kwargs.get("extraction_level") or self.EXTRACTION_LEVEL
+        if level not in self.EXTRACTION_LEVELS:
+            raise ValueError(
+                f"Unknown extraction_level '{level}' "
+                f"(expected one of {', '.join(self.EXTRACTION_LEVELS)})."
+            )
+        kwargs["extraction_level"] = level
+
+        page_nums = self._select_pages(
+            doc.page_count, kwargs.get("pages"), kwargs.get("max_pages")
+        )
+        workers = self._page_workers(kwargs.get("page_workers"), len(page_nums))
+        if workers > 1:
+            options = {k: kwargs[k] for k in self.PAGE_OPTIONS if k in kwargs}
+            timed_pages = self._iter_pages_parallel(
+                file_bytes, file_name, page_nums, workers, **options
+            )
+        else:
+            timed_pages = (
+                self._timed_page(doc, page_num, file_name, **kwargs)
+                for page_num in page_nums
+            )
+
+        for page_obj, seconds in timed_pages:
+            self._record_page_time(page_obj.page_num, seconds)
+            yield page_obj
+
+    def _load_document(self, file_bytes: bytes) -> "fitz.Document":
         """Safe wrapper to open PDF stream with fitz."""
         try:
-            return fitz.open(stream=file_bytes, filetype="pdf")
+            path = payload_path(file_bytes)
+            if path:
+                # Spilled payload: let MuPDF page the file in on demand.
+                return fitz.open(path, filetype="pdf")
+            return fitz.open(stream=as_buffer(file_bytes), filetype="pdf")
         except Exception as e:
             raise ValueError(f"fitz failed to open PDF: {e}")
 
+    # ------------------------------------------------------------------
+    # Page scheduling
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _select_pages(
+        page_count: int,
+        pages: Union[str, Iterable[int], None] = None,
+        max_pages: Optional[int] = None,
+    ) -> List[int]:
+        """
+        Resolve a page selection to sorted, 0-based page indices.
+
+        Args:
+            page_count (int): Pages in the document.
+            pages: 1-based page numbers, either an iterable or a string of
+                comma-separated numbers and ranges (``"1-3,7"``, ``"10-"``).
+                Pages beyond the document are ignored.
+            max_pages (int, optional): Keep only the first N selected pages.
+
+        Raises:
+            ValueError: If ``pages`` is not a valid page specification.
+        """
+        if pages is None:
+            selected: Iterable[int] = range(page_count)
+        else:
+            if isinstance(pages, str):
+                numbers = set()
+                for part in pages.replace(" ", "").split(","):
+                    if not part:
+                        continue
+                    first, sep, last = part.partition("-")
+                    try:
+                        start = int(first) if first else 1
+                        stop = (int(last) if last else page_count) if sep else start
+                    except ValueError:
+                        raise ValueError(f"Invalid page range '{part}'.")
+                    numbers.update(range(start, stop + 1))
+            else:
+                numbers = {int(n) for n in pages}
+            selected = sorted(n - 1 for n in numbers if 1 <= n <= page_count)
+
+        page_nums = list(selected)
+        if max_pages is not None:
+            page_nums = page_nums[: max(0, int(max_pages))]
+        return page_nums
+
+    def _page_workers(self, requested: Optional[int], page_count: int) -> int:
+        """Resolve the worker count for a document of ``page_count`` pages."""
+        workers = self.PAGE_WORKERS if requested is None else int(requested)
+        if workers == 0:
+            workers = os.cpu_count() or 1
+        if page_count < self.PARALLEL_MIN_PAGES:
+            return 1
+        return max(1, min(workers, page_count))
+
+    def _iter_pages_parallel(
+        self,
+        file_bytes: Any,
+        file_name: str,
+        page_nums: List[int],
+        workers: int,
+        **options,
+    ) -> Iterator[Tuple[Page, float]]:
+        """
+        Parse pages in a process pool, yielding ``(page, seconds)`` in order.
+
+        Workers receive a callback-free copy of this parser and the original
+        payload; spilled payloads pickle as their path, so large files are
+        never copied through the pool.
+        """
+        page_count = len(page_nums)
+        shard = -(-page_count // (workers * self.SHARDS_PER_WORKER))
+        ranges = [
+            page_nums[start : start + shard] for start in range(0, page_count, shard)
+        ]
+        worker_parser = copy.copy(self)
+        worker_parser._callbacks = []
+        worker_parser._pending_ocr = []
+        if self.ocr_engine is not None:
+            worker_parser.ocr_engine = self.ocr_engine.clone_for_worker()
+
+        self._log(
+            f"Parsing {page_count} pages with {workers} workers "
+            f"({len(ranges)} shards)."
+        )
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_page_worker,
+            initargs=(worker_parser, file_bytes),
+        )
+        try:
+            futures = [
+                pool.submit(_parse_page_shard, shard_pages, file_name, options)
+                for shard_pages in ranges
+            ]
+            for future in futures:
+                yield from future.result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _timed_page(
+        self, doc: "fitz.Document", page_num: int, file_name: str, **kwargs
+    ) -> Tuple[Page, float]:
+        start = time.perf_counter()
+        page = self._process_page(doc, page_num, file_name, **kwargs)
+        self._flush_ocr()
+        return page, time.perf_counter() - start
+
+    def _record_page_time(self, page_num: int, seconds: float) -> None:
+        self._log(f"Page {page_num} parsed in {seconds:.3f}s", level="debug")
+        self._emit(
+            "on_event",
+            event_name="page_parsed",
+            payload={"page_num": page_num, "seconds": seconds},
+        )
+
+    # ------------------------------------------------------------------
+    # Page processing
+    # ------------------------------------------------------------------
+
     def _process_page(
-        self, doc: fitz.Document, page_num: int, file_name: str, **kwargs
+        self, doc: "fitz.Document", page_num: int, file_name: str, **kwargs
     ) -> Page:
         """
         Process a single PDF page.
 
         Checks for 'scanned page' condition (empty text) and triggers
-        full-page OCR if necessary. Otherwise, iterates through layout blocks.
+        full-page OCR if necessary. Otherwise, iterates through layout blocks
+        (or, at the ``"text"`` level, keeps the plain page text as a single
+        element).
 
         Args:
             doc (fitz.Document): The open document handle.
@@ -119,9 +360,9 @@ class PdfParser(BaseDocumentParser):
             self._log(f"Page {page_num+1} seems to be scanned. Applying full-page OCR.")
             try:
                 # Render page to high-resolution image for OCR
-                pix = page.get_pixmap(dpi=kwargs.get("ocr_dpi", 200))
-                img_bytes = pix.tobytes("png")
-                ocr_text = self.ocr_engine.ocr(img_bytes, **kwargs)
+                dpi = kwargs.get("ocr_dpi", 200)
+                pix = page.get_pixmap(dpi=dpi)
+                ocr_text = self._ocr_pixmap(pix, **{**kwargs, "ocr_dpi": dpi})
 
                 if ocr_text:
                     # Wrap the full page OCR result in a single TextElement
@@ -147,10 +388,27 @@ class PdfParser(BaseDocumentParser):
                     f"Full-page OCR failed for page {page_num+1}: {e}", level="warning"
                 )
 
-        if not ocr_applied:
-            blocks = page.get_text("dict", flags=fitz.TEXTFLAGS_DICT, sort=True).get(
-                "blocks", []
-            )
+        level = kwargs.get("extraction_level") or self.EXTRACTION_LEVEL
+        if not ocr_applied and level == "text":
+            if page_text_dump.strip():
+                elem_id = f"p{page_num+1}:text"
+                elements_list.append(
+                    TextElement(
+                        id=elem_id,
+                        type="text",
+                        bbox=BoundingBox(
+                            x0=0, y0=0, x1=page.rect.width, y1=page.rect.height
+                        ),
+                        meta=ElementMetadata(page_num=page_num + 1, id=elem_id),
+                        text=page_text_dump.strip(),
+                    )
+                )
+        elif not ocr_applied:
+            flags = fitz.TEXTFLAGS_DICT
+            if level == "layout" or not kwargs.get("extract_images", True):
+                # MuPDF then skips image blocks instead of decoding them.
+                flags &= ~fitz.TEXT_PRESERVE_IMAGES
+            blocks = page.get_text("dict", flags=flags, sort=True).get("blocks", [])
             for block in blocks:
                 element = self._create_element_from_block(
                     block, page_num, file_name, **kwargs
@@ -166,6 +424,12 @@ class PdfParser(BaseDocumentParser):
             text=page_text_dump,
         )
 
+    def _ocr_pixmap(self, pix: "fitz.Pixmap", **kwargs) -> str:
+        """Hand a rendered page to the OCR engine, raw if it accepts pixels."""
+        if isinstance(self.ocr_engine, BaseOCR) and self.ocr_engine.ACCEPTS_RAW:
+            return self.ocr_engine.ocr_pixmap(pix, **kwargs)
+        return self.ocr_engine.ocr(pix.tobytes("png"), **kwargs)
+
     def _create_element_from_block(
         self, block: Dict[str, Any], page_num: int, file_name: str, **kwargs
     ) -> Optional[BaseElement]:
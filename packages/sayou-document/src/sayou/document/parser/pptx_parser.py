@@ -1,19 +1,57 @@
-import io
-
-try:
-    from pptx import Presentation
-    from pptx.enum.shapes import MSO_SHAPE_TYPE
-except ImportError:
-    Presentation = None
-
-from typing import List
+import xml.etree.ElementTree as ET
+import zipfile
+from typing import Dict, Iterator, List, Optional, Tuple
 
+from sayou.core.lazy import optional_from
+from sayou.core.payload import as_stream
 from sayou.core.registry import register_component
 
 from ..interfaces.base_parser import BaseDocumentParser
 from ..models import (BaseElement, BoundingBox, ChartElement, Document,
                       ElementMetadata, ImageElement, Slide, TableCell,
                       TableElement, TextElement)
+from ..utils.ooxml import OoxmlPackage, iter_complete
+
+# python-pptx is imported on first use, not when the parser is registered.
+Presentation = optional_from("pptx", "Presentation")
+MSO_SHAPE_TYPE = optional_from("pptx.enum.shapes", "MSO_SHAPE_TYPE")
+PP_PLACEHOLDER = optional_from("pptx.enum.shapes", "PP_PLACEHOLDER")
+parse_xml = optional_from("pptx.oxml", "parse_xml")
+PlotFactory = optional_from("pptx.chart.plot", "PlotFactory")
+PlotTypeInspector = optional_from("pptx.chart.plot", "PlotTypeInspector")
+
+# PresentationML / DrawingML tags read by the streaming path.
+_P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_C = "{http://schemas.openxmlformats.org/drawingml/2006/chart}"
+_R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_P_SP, _P_PIC, _P_FRAME, _P_GROUP = (
+    _P + "sp",
+    _P + "pic",
+    _P + "graphicFrame",
+    _P + "grpSp",
+)
+_SHAPE_TAGS = {_P_SP, _P_PIC, _P_FRAME, _P_GROUP}
+
+# Master placeholder a layout placeholder inherits its position from
+# (every other placeholder type maps to "body").
+_MASTER_PH_TYPES = {
+    "title": "title",
+    "ctrTitle": "title",
+    "dt": "dt",
+    "ftr": "ftr",
+    "sldNum": "sldNum",
+}
+
+# Image extensions as python-pptx's ``Image.ext`` reports them.
+_IMAGE_EXTS = {
+    "image/bmp": "bmp",
+    "image/gif": "gif",
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/tiff": "tiff",
+    "image/x-wmf": "wmf",
+}
 
 
 @register_component("parser")
@@ -23,10 +61,23 @@ class PptxParser(BaseDocumentParser):
 
     Iterates through slides, extracting shapes (Text, Picture, Table, Chart).
     Recursively handles grouped shapes and extracts speaker notes.
+
+    Large files are parsed in streaming mode instead: slide parts are read
+    with ``iterparse`` straight from the zip, one slide at a time, and
+    python-pptx's object tree is never built.  Elements, ids, positions
+    (including placeholder positions inherited from the layout/master) and
+    notes match the python-pptx path.  python-pptx is only used, if
+    installed, for enum names and chart types; without it those fall back
+    to the raw XML values (e.g. ``"title"``, ``"barChart"``).
+
+    Attributes:
+        STREAMING_MIN_BYTES (int): Files at least this large are streamed
+            unless ``streaming`` is passed explicitly.
     """
 
     component_name = "PptxParser"
     SUPPORTED_TYPES = [".pptx"]
+    STREAMING_MIN_BYTES: int = 4 * 1024 * 1024
 
     @classmethod
     def can_handle(cls, file_bytes: bytes, file_name: str) -> float:
@@ -53,21 +104,45 @@ class PptxParser(BaseDocumentParser):
         Args:
             file_bytes (bytes): Binary content of the .pptx file.
             file_name (str): Original filename.
-            **kwargs: Options like 'ocr_images'.
+            **kwargs: Options like 'ocr_images' and 'extract_images'.
+                - streaming (bool): Force (True) or disable (False) the
+                  streaming path; by default files of
+                  ``STREAMING_MIN_BYTES`` or more are streamed.
 
         Returns:
             Document: A document object with 'doc_type="slide"'.
         """
+        pages_list = list(self._iter_pages(file_bytes, file_name, **kwargs))
+
+        return Document(
+            file_name=file_name,
+            file_id=file_name,
+            doc_type="slide",
+            page_count=len(pages_list),
+            pages=pages_list,
+        )
+
+    def _iter_pages(
+        self, file_bytes: bytes, file_name: str, **kwargs
+    ) -> Iterator[Slide]:
+        """Yield one Slide per slide, in presentation order."""
+        streaming = kwargs.get("streaming")
+        if streaming is None:
+            streaming = len(file_bytes) >= self.STREAMING_MIN_BYTES
+        if streaming and file_bytes[:4] == b"PK\x03\x04":
+            yield from self._stream_slides(file_bytes, **kwargs)
+            return
+
         if Presentation is None:
             raise ImportError("python-pptx is required. (pip install python-pptx)")
 
         try:
-            prs = Presentation(io.BytesIO(file_bytes))
+            # python-pptx reads every part up front; the stream can go.
+            with as_stream(file_bytes) as stream:
+                prs = Presentation(stream)
         except Exception as e:
             raise ValueError(f"Failed to load PPTX: {e}")
 
-        pages_list = []
-
         for slide_idx, slide in enumerate(prs.slides):
             elements_list: List[BaseElement] = []
             page_num = slide_idx + 1
@@ -76,45 +151,42 @@ class PptxParser(BaseDocumentParser):
             for shape in slide.shapes:
                 elements_list.extend(self._process_shape(shape, page_num, **kwargs))
 
-            # 2. Sort by position (top-left reading order)
-            elements_list.sort(
-                key=lambda x: (x.bbox.y0 if x.bbox else 0, x.bbox.x0 if x.bbox else 0)
-            )
-
-            # 3. Extract speaker notes
+            # 2. Extract speaker notes
             note_text = ""
             if slide.has_notes_slide:
                 note_text = slide.notes_slide.notes_text_frame.text.strip()
 
-            page_text_dump = "\n".join(
-                [
-                    (
-                        e.text
-                        if e.type == "text"
-                        else (e.text_representation if e.type == "chart" else "")
-                    )
-                    for e in elements_list
-                ]
-            )
+            yield self._build_slide(page_num, elements_list, note_text)
 
-            if note_text:
-                page_text_dump += "\n[NOTE]: " + note_text
+    def _build_slide(
+        self, page_num: int, elements_list: List[BaseElement], note_text: str
+    ) -> Slide:
+        """Order a slide's elements and assemble its text and notes."""
+        # Sort by position (top-left reading order)
+        elements_list.sort(
+            key=lambda x: (x.bbox.y0 if x.bbox else 0, x.bbox.x0 if x.bbox else 0)
+        )
 
-            page_obj = Slide(
-                page_num=page_num,
-                elements=elements_list,
-                text=page_text_dump,
-                note_text=note_text if note_text else None,
-                has_notes=bool(note_text),
-            )
-            pages_list.append(page_obj)
+        page_text_dump = "\n".join(
+            [
+                (
+                    e.text
+                    if e.type == "text"
+                    else (e.text_representation if e.type == "chart" else "")
+                )
+                for e in elements_list
+            ]
+        )
 
-        return Document(
-            file_name=file_name,
-            file_id=file_name,
-            doc_type="slide",
-            page_count=len(pages_list),
-            pages=pages_list,
+        if note_text:
+            page_text_dump += "\n[NOTE]: " + note_text
+
+        return Slide(
+            page_num=page_num,
+            elements=elements_list,
+            text=page_text_dump,
+            note_text=note_text if note_text else None,
+            has_notes=bool(note_text),
         )
 
     def _process_shape(self, shape, page_num: int, **kwargs) -> List[BaseElement]:
@@ -155,6 +227,7 @@ class PptxParser(BaseDocumentParser):
             page_num=page_num, id=f"p{page_num}:shape:{shape.shape_id}"
         )
         ocr_enabled = kwargs.get("ocr_images", True)
+        extract_images = kwargs.get("extract_images", True)
         placeholder_type = None
         if shape.is_placeholder:
             placeholder_type = str(shape.placeholder_format.type)
@@ -175,7 +248,7 @@ class PptxParser(BaseDocumentParser):
             extracted.append(text_elem)
 
         # 3. Picture
-        if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+        if shape.shape_type == MSO_SHAPE_TYPE.PICTURE and extract_images:
             try:
                 img_elem = self._process_image_data(
                     image_bytes=shape.image.blob,
@@ -240,7 +313,9 @@ class PptxParser(BaseDocumentParser):
                     text_representation=text_rep,
                     raw_attributes={
                         "placeholder_type": placeholder_type,
-                        "category_count": len(chart.categories),
+                        "category_count": (
+                            len(chart.plots[0].categories) if chart.plots else 0
+                        ),
                         "series_count": len(chart.series),
                     },
                 )
@@ -249,3 +324,413 @@ class PptxParser(BaseDocumentParser):
                 self._log(f"PPT Chart Error: {e}", level="warning")
 
         return extracted
+
+    # ------------------------------------------------------------------
+    # Streaming path (iterparse, no python-pptx)
+    # ------------------------------------------------------------------
+
+    def _stream_slides(self, file_bytes: bytes, **kwargs) -> Iterator[Slide]:
+        """
+        Yield slides parsed straight from their zip parts.
+
+        Each slide part is read incrementally and every top-level shape is
+        dropped once converted; only layouts/masters (for inherited
+        placeholder positions) are kept, as position tables.
+        """
+        try:
+            package = OoxmlPackage(file_bytes)
+        except zipfile.BadZipFile as e:
+            raise ValueError(f"Failed to load PPTX: {e}")
+
+        try:
+            main = _related(package, "", "officeDocument") or "ppt/presentation.xml"
+            rels = package.rels(main)
+            slide_parts = []
+            for sld_id in ET.fromstring(package.read(main)).iter(_P + "sldId"):
+                target = rels.get(sld_id.get(_R + "id"), ("", ""))[1]
+                if package.has(target):
+                    slide_parts.append(target)
+
+            ctx = _SlideContext(
+                package,
+                ocr_enabled=kwargs.get("ocr_images", True),
+                extract_images=kwargs.get("extract_images", True),
+            )
+            for slide_idx, part in enumerate(slide_parts):
+                page_num = slide_idx + 1
+                ctx.part = part
+                elements_list: List[BaseElement] = []
+
+                # sld > cSld > spTree > shapes
+                for shape in iter_complete(package.open(part), depth=3):
+                    if shape.tag in _SHAPE_TAGS:
+                        elements_list.extend(self._stream_shape(shape, ctx, page_num))
+
+                note_text = self._stream_notes(package, part)
+                yield self._build_slide(page_num, elements_list, note_text)
+        finally:
+            package.close()
+
+    def _stream_shape(
+        self, shape: ET.Element, ctx: "_SlideContext", page_num: int
+    ) -> List[BaseElement]:
+        """
+        Streaming counterpart of ``_process_shape``.
+
+        Args:
+            shape (Element): ``<p:sp>``, ``<p:pic>``, ``<p:graphicFrame>``
+                or ``<p:grpSp>``.
+            ctx (_SlideContext): Package, current slide part and options.
+            page_num (int): Slide number.
+
+        Returns:
+            List[BaseElement]: Extracted elements (Text, Image, Table, Chart).
+        """
+        extracted: List[BaseElement] = []
+
+        # 1. Group shapes — recurse into children
+        if shape.tag == _P_GROUP:
+            for child in shape:
+                if child.tag in _SHAPE_TAGS:
+                    extracted.extend(self._stream_shape(child, ctx, page_num))
+            return extracted
+
+        nv_pr = shape[0] if len(shape) else ET.Element("")
+        c_nv_pr = nv_pr.find(_P + "cNvPr")
+        ph = nv_pr.find(f"{_P}nvPr/{_P}ph")
+        shape_id = c_nv_pr.get("id", "") if c_nv_pr is not None else ""
+
+        bbox = self._stream_bbox(shape, ph, ctx)
+        meta = ElementMetadata(page_num=page_num, id=f"p{page_num}:shape:{shape_id}")
+        placeholder_type = None
+        if ph is not None:
+            placeholder_type = _placeholder_name(ph.get("type", "obj"))
+
+        # 2. Text frame
+        tx_body = shape.find(_P + "txBody") if shape.tag == _P_SP else None
+        text = _text_frame_text(tx_body).strip() if tx_body is not None else ""
+        if text:
+            extracted.append(
+                TextElement(
+                    id=meta.id,
+                    type="text",
+                    bbox=bbox,
+                    meta=meta,
+                    text=text,
+                    raw_attributes={
+                        "shape_type": _shape_type_name(shape, ph),
+                        "placeholder_type": placeholder_type,
+                    },
+                )
+            )
+
+        # 3. Picture
+        if shape.tag == _P_PIC and ctx.extract_images:
+            try:
+                blip = shape.find(f"{_P}blipFill/{_A}blip")
+                rId = blip.get(_R + "embed") if blip is not None else None
+                target = ctx.package.rels(ctx.part).get(rId, ("", ""))[1]
+                if ctx.package.has(target):
+                    content_type = ctx.package.content_type(target)
+                    img_elem = self._process_image_data(
+                        image_bytes=ctx.package.read(target),
+                        img_format=_IMAGE_EXTS.get(
+                            content_type, content_type.split("/")[-1]
+                        ),
+                        elem_id=meta.id,
+                        page_num=meta.page_num,
+                        bbox=bbox,
+                        ocr_enabled=ctx.ocr_enabled,
+                    )
+                    img_elem.raw_attributes["placeholder_type"] = placeholder_type
+                    extracted.append(img_elem)
+            except Exception as e:
+                self._log(f"PPT Image Error: {e}", level="warning")
+
+        if shape.tag != _P_FRAME:
+            return extracted
+        graphic_data = shape.find(f"{_A}graphic/{_A}graphicData")
+        if graphic_data is None:
+            return extracted
+
+        # 4. Table
+        tbl = graphic_data.find(_A + "tbl")
+        if tbl is not None:
+            rows_data = [
+                [
+                    _text_frame_text(tc.find(_A + "txBody")).strip()
+                    for tc in tr.iterfind(_A + "tc")
+                ]
+                for tr in tbl.iterfind(_A + "tr")
+            ]
+            extracted.append(
+                TableElement(
+                    id=meta.id,
+                    type="table",
+                    bbox=bbox,
+                    meta=meta,
+                    data=rows_data,
+                    cells=[],  # TODO: detailed cells (v0.1.0+)
+                    raw_attributes={"placeholder_type": placeholder_type},
+                )
+            )
+
+        # 5. Chart
+        chart_ref = graphic_data.find(_C + "chart")
+        if chart_ref is not None:
+            try:
+                extracted.append(
+                    self._stream_chart(chart_ref, ctx, meta, bbox, placeholder_type)
+                )
+            except Exception as e:
+                self._log(f"PPT Chart Error: {e}", level="warning")
+
+        return extracted
+
+    def _stream_chart(
+        self,
+        chart_ref: ET.Element,
+        ctx: "_SlideContext",
+        meta: ElementMetadata,
+        bbox: Optional[BoundingBox],
+        placeholder_type: Optional[str],
+    ) -> ChartElement:
+        """Build a ChartElement from the chart part a ``<c:chart>`` refers to."""
+        target = ctx.package.rels(ctx.part)[chart_ref.get(_R + "id")][1]
+        chart_xml = ctx.package.read(target)
+        chart = ET.fromstring(chart_xml).find(_C + "chart")
+
+        title = chart.find(_C + "title")
+        chart_title = _text_frame_text(title) if title is not None else "Chart"
+
+        plots = [el for el in chart.find(_C + "plotArea") if el.tag.endswith("Chart")]
+        chart_type_str = _chart_type_name(
+            chart_xml, plots[0].tag[len(_C) :] if plots else ""
+        )
+
+        series = []
+        for plot in plots:
+            series.extend(
+                sorted(
+                    plot.iterfind(_C + "ser"),
+                    key=lambda ser: int(_child_val(ser, "order") or 0),
+                )
+            )
+
+        text_rep = f"Chart: {chart_title} (Type: {chart_type_str})\n"
+        for i, ser in enumerate(series):
+            names = [v.text for v in ser.iterfind(f"{_C}tx//{_C}pt/{_C}v")]
+            series_name = (names[0] if names else "") or f"Series {i+1}"
+            series_data = ", ".join([str(v) for v in _series_values(ser)])
+            text_rep += f"- {series_name}: [{series_data}]\n"
+
+        category_count = 0
+        if plots:
+            pt_count = plots[0].find(f"{_C}ser//{_C}cat//{_C}ptCount")
+            if pt_count is not None:
+                category_count = int(pt_count.get("val", 0))
+
+        return ChartElement(
+            id=meta.id,
+            type="chart",
+            bbox=bbox,
+            meta=meta,
+            chart_title=chart_title,
+            chart_type=chart_type_str,
+            text_representation=text_rep,
+            raw_attributes={
+                "placeholder_type": placeholder_type,
+                "category_count": category_count,
+                "series_count": len(series),
+            },
+        )
+
+    def _stream_bbox(
+        self, shape: ET.Element, ph: Optional[ET.Element], ctx: "_SlideContext"
+    ) -> Optional[BoundingBox]:
+        """
+        Position of a shape; placeholders without their own ``xfrm``
+        inherit it from the layout (by ``idx``) and then the master (by type).
+        """
+        if shape.tag == _P_FRAME:
+            box = _xfrm_box(shape.find(_P + "xfrm"))
+        else:
+            box = _xfrm_box(shape.find(f"{_P}spPr/{_A}xfrm"))
+
+        if box is None and ph is not None:
+            layout = _related(ctx.package, ctx.part, "slideLayout")
+            if layout:
+                by_idx, _ = ctx.placeholder_boxes(layout)
+                ph_type, box = by_idx.get(ph.get("idx", "0"), (None, None))
+                master = _related(ctx.package, layout, "slideMaster")
+                if box is None and ph_type is not None and master:
+                    _, by_type = ctx.placeholder_boxes(master)
+                    box = by_type.get(_MASTER_PH_TYPES.get(ph_type, "body"))
+
+        if box is None:
+            return None
+        x, y, cx, cy = box
+        return BoundingBox(x0=x, y0=y, x1=x + cx, y1=y + cy)
+
+    @staticmethod
+    def _stream_notes(package: OoxmlPackage, part: str) -> str:
+        """Text of the notes body placeholder of a slide, if it has notes."""
+        notes = _related(package, part, "notesSlide")
+        if not notes:
+            return ""
+        for sp in ET.fromstring(package.read(notes)).iter(_P_SP):
+            ph = sp.find(f"{_P}nvSpPr/{_P}nvPr/{_P}ph")
+            if ph is not None and ph.get("type") == "body":
+                tx_body = sp.find(_P + "txBody")
+                return _text_frame_text(tx_body).strip() if tx_body is not None else ""
+        return ""
+
+
+# ---------------------------------------------------------------------------
+# Streaming helpers
+# ---------------------------------------------------------------------------
+
+
+class _SlideContext:
+    """Package, current slide part and options shared by one streaming parse."""
+
+    def __init__(
+        self, package: OoxmlPackage, ocr_enabled: bool, extract_images: bool
+    ) -> None:
+        self.package = package
+        self.part = ""
+        self.ocr_enabled = ocr_enabled
+        self.extract_images = extract_images
+        self._boxes: Dict[str, Tuple[dict, dict]] = {}
+
+    def placeholder_boxes(self, part: str) -> Tuple[dict, dict]:
+        """
+        Placeholder positions of a layout or master part, cached.
+
+        Returns:
+            Tuple[dict, dict]: ``idx`` → (placeholder type, box) and
+            type → box, where box is ``(x, y, cx, cy)`` or None.
+        """
+        cached = self._boxes.get(part)
+        if cached is not None:
+            return cached
+
+        by_idx: dict = {}
+        by_type: dict = {}
+        for shape in ET.fromstring(self.package.read(part)).iter():
+            if shape.tag not in (_P_SP, _P_PIC, _P_FRAME) or not len(shape):
+                continue
+            ph = shape[0].find(f"{_P}nvPr/{_P}ph")
+            if ph is None:
+                continue
+            if shape.tag == _P_FRAME:
+                box = _xfrm_box(shape.find(_P + "xfrm"))
+            else:
+                box = _xfrm_box(shape.find(f"{_P}spPr/{_A}xfrm"))
+            ph_type = ph.get("type", "obj")
+            by_idx.setdefault(ph.get("idx", "0"), (ph_type, box))
+            by_type.setdefault(ph_type, box)
+
+        self._boxes[part] = (by_idx, by_type)
+        return by_idx, by_type
+
+
+def _related(package: OoxmlPackage, part: str, rel_type: str) -> Optional[str]:
+    """First existing target of ``part``'s relationships of ``rel_type``."""
+    for kind, target in package.rels(part).values():
+        if kind == rel_type and package.has(target):
+            return target
+    return None
+
+
+def _xfrm_box(xfrm: Optional[ET.Element]) -> Optional[Tuple[int, int, int, int]]:
+    """``(x, y, cx, cy)`` in EMU from an ``<a:xfrm>``/``<p:xfrm>``."""
+    if xfrm is None:
+        return None
+    off, ext = xfrm.find(_A + "off"), xfrm.find(_A + "ext")
+    if off is None or ext is None:
+        return None
+    return (
+        int(off.get("x", 0)),
+        int(off.get("y", 0)),
+        int(ext.get("cx", 0)),
+        int(ext.get("cy", 0)),
+    )
+
+
+def _text_frame_text(tx_body: Optional[ET.Element]) -> str:
+    """Paragraph texts joined by newlines; line breaks render as ``\\v``."""
+    if tx_body is None:
+        return ""
+    paragraphs = []
+    for p in tx_body.iter(_A + "p"):
+        parts = []
+        for child in p:
+            if child.tag in (_A + "r", _A + "fld"):
+                t = child.find(_A + "t")
+                parts.append(t.text or "" if t is not None else "")
+            elif child.tag == _A + "br":
+                parts.append("\v")
+        paragraphs.append("".join(parts))
+    return "\n".join(paragraphs)
+
+
+def _child_val(el: ET.Element, name: str) -> Optional[str]:
+    child = el.find(_C + name)
+    return child.get("val") if child is not None else None
+
+
+def _series_values(ser: ET.Element) -> List[Optional[float]]:
+    """Point values of a series, ``None`` where a point is missing."""
+    val = ser.find(_C + "val")
+    if val is None:
+        return []
+    pt_count = val.find(f".//{_C}ptCount")
+    count = int(pt_count.get("val", 0)) if pt_count is not None else 0
+    points: Dict[int, float] = {}
+    for pt in val.iter(_C + "pt"):
+        v = pt.find(_C + "v")
+        if v is not None and v.text is not None:
+            points[int(pt.get("idx", 0))] = float(v.text)
+    return [points.get(idx) for idx in range(count)]
+
+
+def _placeholder_name(ph_type: str) -> str:
+    """Placeholder type as python-pptx reports it (e.g. ``"TITLE (1)"``)."""
+    if PP_PLACEHOLDER is not None:
+        try:
+            return str(PP_PLACEHOLDER.from_xml(ph_type))
+        except ValueError:
+            pass
+    return ph_type
+
+
+def _chart_type_name(chart_xml: bytes, plot_tag: str) -> str:
+    """
+    Chart type as python-pptx reports it (e.g. ``"COLUMN_CLUSTERED (51)"``),
+    or the first plot's element name without python-pptx.
+    """
+    if parse_xml is not None:
+        try:
+            x_chart = next(parse_xml(chart_xml).plotArea.iter_xCharts())
+            return str(PlotTypeInspector.chart_type(PlotFactory(x_chart, None)))
+        except Exception:
+            pass
+    return plot_tag
+
+
+def _shape_type_name(sp: ET.Element, ph: Optional[ET.Element]) -> str:
+    """Shape type of an ``<p:sp>`` as python-pptx reports it."""
+    if ph is not None:
+        name = "PLACEHOLDER"
+    elif sp.find(f"{_P}spPr/{_A}custGeom") is not None:
+        name = "FREEFORM"
+    elif sp.find(f"{_P}nvSpPr/{_P}cNvSpPr[@txBox='1']") is not None:
+        name = "TEXT_BOX"
+    elif sp.find(f"{_P}spPr/{_A}prstGeom") is not None:
+        name = "AUTO_SHAPE"
+    else:
+        name = "TEXT_BOX"
+    if MSO_SHAPE_TYPE is not None:
+        return str(getattr(MSO_SHAPE_TYPE, name))
+    return name
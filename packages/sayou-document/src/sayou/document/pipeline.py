@@ -1,16 +1,152 @@
+import copy
 import importlib
+import os
 import pkgutil
-from typing import Any, Dict, List, Optional, Type
+import posixpath
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
 
 from sayou.core.base_component import BaseComponent
 from sayou.core.decorators import safe_run
+from sayou.core.payload import as_stream
 from sayou.core.registry import COMPONENT_REGISTRY
 
 from .core.exceptions import ParserError
 from .interfaces.base_converter import BaseConverter
 from .interfaces.base_ocr import BaseOCR
 from .interfaces.base_parser import BaseDocumentParser
-from .models import Document
+from .models import BasePage, Document
+
+# Leading bytes → file type.  Zip and OLE containers are resolved separately
+# because one signature covers several formats.
+_SIGNATURES = (
+    (b"%PDF", ".pdf"),
+    (b"\x89PNG\r\n\x1a\n", ".png"),
+    (b"\xff\xd8\xff", ".jpg"),
+    (b"II*\x00", ".tiff"),
+    (b"MM\x00*", ".tiff"),
+    (b"BM", ".bmp"),
+)
+_ZIP_MAGIC = b"PK\x03\x04"
+_OLE_MAGIC = b"\xd0\xcf\x11\xe0"
+
+# Zip-based formats, and the package folder that identifies each one when
+# the file name does not.
+_ZIP_TYPES = {".docx", ".pptx", ".xlsx", ".xlsm", ".xltx", ".xltm", ".hwpx"}
+_ZIP_MARKERS = (
+    ("word/", ".docx"),
+    ("ppt/", ".pptx"),
+    ("xl/", ".xlsx"),
+    ("Contents/", ".hwpx"),
+)
+# OLE compound files carry no format marker in their header.
+_OLE_TYPES = {".hwp", ".doc", ".xls", ".ppt"}
+
+
+def _sniff_type(file_bytes: bytes, file_name: str) -> Optional[str]:
+    """
+    Identify the file type from its magic bytes.
+
+    The file name only disambiguates containers shared by several formats
+    (zip, OLE).  Unknown signatures fall back to the extension.
+
+    Returns:
+        Optional[str]: Lower-case extension (e.g. ``".pdf"``), or None.
+    """
+    ext = posixpath.splitext(file_name.lower())[1] or None
+    for magic, file_type in _SIGNATURES:
+        if file_bytes.startswith(magic):
+            return file_type
+
+    if file_bytes.startswith(_ZIP_MAGIC):
+        if ext in _ZIP_TYPES:
+            return ext
+        try:
+            with as_stream(file_bytes) as stream, zipfile.ZipFile(stream) as zf:
+                names = zf.namelist()
+        except zipfile.BadZipFile:
+            return ext
+        for prefix, file_type in _ZIP_MARKERS:
+            if any(name.startswith(prefix) for name in names):
+                return file_type
+        return ext
+
+    if file_bytes.startswith(_OLE_MAGIC):
+        return ext if ext in _OLE_TYPES else None
+
+    return ext
+
+
+class BatchResult(NamedTuple):
+    """
+    Outcome of one file in ``DocumentPipeline.run_many``.
+
+    Attributes:
+        index (int): Position of the file in the input iterable.
+        file_name (str): Original file name.
+        document (Document): Parsed document, or None on failure.
+        error (str): ``"<ExceptionType>: <message>"`` on failure, else None.
+    """
+
+    index: int
+    file_name: str
+    document: Optional[Document]
+    error: Optional[str]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class _WarmComponents:
+    """Parser/converter instances and the file-type index kept by a batch."""
+
+    __slots__ = ("instances", "parsers_by_type")
+
+    def __init__(self, parser_cls_map: Dict[str, Type[Any]]):
+        self.instances: Dict[Type[Any], Any] = {}
+        self.parsers_by_type: Dict[str, List[Type[Any]]] = {}
+        for cls in set(parser_cls_map.values()):
+            for file_type in getattr(cls, "SUPPORTED_TYPES", []):
+                self.parsers_by_type.setdefault(file_type.lower(), []).append(cls)
+
+
+# Per-process state of batch workers (see DocumentPipeline.run_many).
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_batch_worker(
+    pipeline: "DocumentPipeline",
+    ocr: Optional[Dict[str, Any]],
+    run_config: Dict[str, Any],
+) -> None:
+    _WORKER_STATE["pipeline"] = pipeline
+    _WORKER_STATE["ocr"] = ocr
+    _WORKER_STATE["run_config"] = run_config
+    _WORKER_STATE["warm"] = _WarmComponents(pipeline.parser_cls_map)
+
+
+def _run_batch_task(index: int, file_bytes: bytes, file_name: str) -> BatchResult:
+    return _WORKER_STATE["pipeline"]._run_one(
+        index,
+        file_bytes,
+        file_name,
+        _WORKER_STATE["ocr"],
+        _WORKER_STATE["run_config"],
+        _WORKER_STATE["warm"],
+    )
 
 
 class DocumentPipeline(BaseComponent):
@@ -21,9 +157,16 @@ class DocumentPipeline(BaseComponent):
     1. Discovers all available plugins (Parsers, OCRs, Converters).
     2. Selects the best components based on 'can_handle' scores.
     3. Injects dependencies (OCR Engine) at runtime if configured.
+
+    ``run_many`` parses a batch of files, optionally in worker processes,
+    with one warm parser instance per type (see ``BatchResult``).
+
+    Attributes:
+        BATCH_PREFETCH (int): Files queued per worker process in ``run_many``.
     """
 
     component_name = "DocumentPipeline"
+    BATCH_PREFETCH: int = 2
 
     def __init__(
         self,
@@ -67,6 +210,7 @@ class DocumentPipeline(BaseComponent):
                 self._register_manual(cls)
 
         self.global_config = kwargs
+        self._ocr_engines: Dict[Any, BaseOCR] = {}
 
         self.initialize(**kwargs)
 
@@ -169,6 +313,10 @@ class DocumentPipeline(BaseComponent):
             ocr (dict, optional): OCR configuration. If provided, OCR is enabled.
                                 e.g., {'engine_path': 'C:/...', 'lang': 'kor'}
             **kwargs: Additional runtime options.
+                      ``cache`` (a ``sayou.core.cache.BaseCache``) returns a
+                      previously parsed Document for identical bytes, file
+                      name and config; ``cache_digest`` supplies a
+                      precomputed content digest.
 
         Returns:
             Document: Parsed document object.
@@ -182,16 +330,313 @@ class DocumentPipeline(BaseComponent):
 
         self._emit("on_start", input_data={"filename": file_name})
 
+        # ---------------------------------------------------------------------
+        # Phase 0: Stage Cache (content hash + file name + config)
+        # ---------------------------------------------------------------------
+        cache = run_config.get("cache")
+        cache_key = None
+        if cache is not None:
+            cache_key = self._cache_key(cache, file_bytes, file_name, run_config)
+            cached = cache.get(cache_key, component=self.component_name)
+            if cached is not None:
+                self._log(f"Cache hit for '{file_name}'.", level="debug")
+                self._emit("on_finish", result_data=cached, success=True)
+                return cached
+
+        parser, file_bytes, file_name = self._prepare_parser(
+            file_bytes, file_name, ocr, run_config
+        )
+
+        try:
+            doc = parser.parse(file_bytes, file_name, **run_config)
+            if cache_key is not None:
+                cache.set(cache_key, doc)
+            self._emit("on_finish", result_data=doc, success=True)
+            return doc
+        except Exception as e:
+            self._emit("on_error", error=e)
+            raise e
+
+    def run_stream(
+        self,
+        file_bytes: bytes,
+        file_name: str,
+        ocr: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> Iterator[BasePage]:
+        """
+        Executes the parsing pipeline, yielding pages as they are parsed.
+
+        Component resolution, conversion and OCR injection are identical to
+        ``run``; the parser is then driven through ``parse_iter`` so that
+        downstream stages can consume one page at a time.  Stage caching is
+        not applied to streams.
+
+        Args:
+            file_bytes (bytes): Binary content.
+            file_name (str): Original filename.
+            ocr (dict, optional): OCR configuration (see ``run``).
+            **kwargs: Additional runtime options.
+
+        Yields:
+            BasePage: Parsed pages (or slides/sheets) in document order.
+        """
+        if not file_bytes:
+            raise ParserError("Input file bytes are empty.")
+
+        run_config = {**self.global_config, **kwargs}
+        if ocr:
+            run_config.update(ocr)
+
+        self._emit("on_start", input_data={"filename": file_name})
+
+        parser, file_bytes, file_name = self._prepare_parser(
+            file_bytes, file_name, ocr, run_config
+        )
+
+        page_count = 0
+        try:
+            for page in parser.parse_iter(file_bytes, file_name, **run_config):
+                page_count += 1
+                yield page
+        except Exception as e:
+            self._emit("on_error", error=e)
+            raise e
+
+        self._emit("on_finish", result_data={"pages": page_count}, success=True)
+
+    def run_many(
+        self,
+        files: Iterable[Tuple[bytes, str]],
+        workers: int = 1,
+        ocr: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> Iterator[BatchResult]:
+        """
+        Parse a batch of files, yielding each result as soon as it is ready.
+
+        Unlike calling ``run`` in a loop, every worker keeps one initialised
+        parser (and converter) instance per type for the whole batch, and
+        files are routed by their magic bytes (``_sniff_type``) instead of
+        scoring every parser's ``can_handle``; only files whose type is
+        unknown or ambiguous go through the scoreboard.
+
+        A failing file does not stop the batch: it is reported as a
+        ``BatchResult`` with ``error`` set, and its parser instance is
+        discarded so no partial state leaks into the next file.  If a
+        worker process dies, its in-flight files are reported as failed and
+        the pool is restarted.  With a pool, the number of files in flight
+        is reported as a ``queue_depth`` event (queue ``"document_batch"``).
+
+        Args:
+            files: ``(file_bytes, file_name)`` pairs; consumed lazily, with
+                   at most ``workers * BATCH_PREFETCH`` files in flight.
+            workers (int): Worker processes; ``1`` parses in this process,
+                           ``0`` uses one per CPU.
+            ocr (dict, optional): OCR configuration (see ``run``).
+            **kwargs: Runtime options shared by every file (see ``run``).
+                      ``cache`` is consulted and filled in this process.
+
+        Yields:
+            BatchResult: One per input file, in completion order (use
+            ``index`` to restore input order).
+        """
+        run_config = {**self.global_config, **kwargs}
+        if ocr:
+            run_config.update(ocr)
+        cache = run_config.get("cache")
+        # Caches hold locks and connections: they stay in this process.
+        task_config = {
+            k: v for k, v in run_config.items() if k not in ("cache", "cache_digest")
+        }
+        if workers == 0:
+            workers = os.cpu_count() or 1
+
+        succeeded = failed = 0
+        for result in self._iter_batch(files, max(1, workers), ocr, task_config, cache):
+            if result.ok:
+                succeeded += 1
+                self._emit("on_finish", result_data=result.document, success=True)
+            else:
+                failed += 1
+                self._emit("on_error", error=ParserError(result.error))
+            yield result
+
+        self._log(f"Batch finished: {succeeded} parsed, {failed} failed.")
+
+    def _iter_batch(
+        self,
+        files: Iterable[Tuple[bytes, str]],
+        workers: int,
+        ocr: Optional[Dict[str, Any]],
+        run_config: Dict[str, Any],
+        cache: Any,
+    ) -> Iterator[BatchResult]:
+        """Drive ``run_many`` in-process or through a process pool."""
+        pending_keys: Dict[int, str] = {}
+
+        def lookup(index: int, file_bytes: bytes, file_name: str):
+            self._emit("on_start", input_data={"filename": file_name})
+            if cache is None or not file_bytes:
+                return None
+            key = self._cache_key(cache, file_bytes, file_name, run_config)
+            cached = cache.get(key, component=self.component_name)
+            if cached is not None:
+                self._log(f"Cache hit for '{file_name}'.", level="debug")
+                return BatchResult(index, file_name, cached, None)
+            pending_keys[index] = key
+            return None
+
+        def store(result: BatchResult) -> BatchResult:
+            key = pending_keys.pop(result.index, None)
+            if key is not None and result.document is not None:
+                cache.set(key, result.document)
+            return result
+
+        if workers == 1:
+            warm = _WarmComponents(self.parser_cls_map)
+            for index, (file_bytes, file_name) in enumerate(files):
+                result = lookup(index, file_bytes, file_name)
+                if result is None:
+                    result = store(
+                        self._run_one(
+                            index, file_bytes, file_name, ocr, run_config, warm
+                        )
+                    )
+                yield result
+            return
+
+        # Workers receive a callback-free copy: callbacks fire in this process.
+        worker = copy.copy(self)
+        worker._callbacks = []
+        worker._ocr_engines = {}
+        worker.global_config = run_config
+
+        def start_pool() -> ProcessPoolExecutor:
+            return ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_batch_worker,
+                initargs=(worker, ocr, run_config),
+            )
+
+        pool = start_pool()
+        in_flight: Dict[Any, Tuple[int, str, ProcessPoolExecutor]] = {}
+        items = enumerate(files)
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(in_flight) < workers * self.BATCH_PREFETCH:
+                    try:
+                        index, (file_bytes, file_name) = next(items)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    result = lookup(index, file_bytes, file_name)
+                    if result is not None:
+                        yield result
+                        continue
+                    future = pool.submit(_run_batch_task, index, file_bytes, file_name)
+                    in_flight[future] = (index, file_name, pool)
+
+                if not in_flight:
+                    break
+
+                self._emit(
+                    "on_event",
+                    event_name="queue_depth",
+                    payload=len(in_flight),
+                    queue="document_batch",
+                )
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, file_name, owner = in_flight.pop(future)
+                    try:
+                        result = future.result()
+                    except BrokenProcessPool as e:
+                        result = BatchResult(
+                            index, file_name, None, f"BrokenProcessPool: {e}"
+                        )
+                        if owner is pool:
+                            self._log(
+                                "Batch worker died; restarting the pool.",
+                                level="warning",
+                            )
+                            pool.shutdown(wait=False, cancel_futures=True)
+                            pool = start_pool()
+                    except Exception as e:
+                        result = BatchResult(
+                            index, file_name, None, f"{type(e).__name__}: {e}"
+                        )
+                    yield store(result)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _run_one(
+        self,
+        index: int,
+        file_bytes: bytes,
+        file_name: str,
+        ocr: Optional[Dict[str, Any]],
+        run_config: Dict[str, Any],
+        warm: _WarmComponents,
+    ) -> BatchResult:
+        """Parse one batch file with warm components; never raises."""
+        parser = None
+        try:
+            if not file_bytes:
+                raise ParserError("Input file bytes are empty.")
+            parser, data, name = self._prepare_parser(
+                file_bytes, file_name, ocr, run_config, warm
+            )
+            doc = parser.parse(data, name, **run_config)
+            if doc is None:
+                raise ParserError(f"{parser.component_name} returned no document.")
+            return BatchResult(index, file_name, doc, None)
+        except Exception as e:
+            if parser is not None:
+                warm.instances.pop(type(parser), None)
+            self._log(f"Batch item '{file_name}' failed: {e}", level="warning")
+            return BatchResult(index, file_name, None, f"{type(e).__name__}: {e}")
+
+    def _cache_key(
+        self, cache: Any, file_bytes: bytes, file_name: str, run_config: Dict[str, Any]
+    ) -> str:
+        return cache.key(
+            self.component_name,
+            file_bytes,
+            run_config,
+            digest=run_config.get("cache_digest"),
+            file_name=file_name,
+        )
+
+    def _prepare_parser(
+        self,
+        file_bytes: bytes,
+        file_name: str,
+        ocr: Optional[Dict[str, Any]],
+        run_config: Dict[str, Any],
+        warm: Optional[_WarmComponents] = None,
+    ) -> Tuple[BaseDocumentParser, bytes, str]:
+        """
+        Resolve, configure and instantiate the parser for a file.
+
+        Args:
+            warm: Batch state from ``run_many``.  When given, the parser is
+                  looked up by magic bytes first, and converter / parser
+                  instances are created once and reused from it.
+
+        Returns:
+            Tuple: ``(parser, file_bytes, file_name)``; bytes and name differ
+            from the input when a converter produced a PDF.
+
+        Raises:
+            ParserError: If no parser (or converter) can handle the file.
+        """
         # ---------------------------------------------------------------------
         # Phase 1: Component Resolution (Strategy Pattern)
         # ---------------------------------------------------------------------
         # 1-1. Parser Selection
-        parser_cls = self._resolve_component(
-            self.parser_cls_map,
-            primary_input=file_bytes,
-            secondary_input=file_name,
-            category="Parser",
-        )
+        parser_cls = self._select_parser(file_bytes, file_name, "Parser", warm)
 
         # 1-2. Converter Fallback (If no parser found)
         if not parser_cls:
@@ -206,8 +651,12 @@ class DocumentPipeline(BaseComponent):
                 self._log(
                     f"No direct parser found. Attempting conversion via {converter_cls.component_name}..."
                 )
-                converter = converter_cls()
-                converter.initialize(**run_config)
+                instances = warm.instances if warm is not None else {}
+                converter = instances.get(converter_cls)
+                if converter is None:
+                    converter = converter_cls()
+                    converter.initialize(**run_config)
+                    instances[converter_cls] = converter
                 try:
                     converted_bytes = converter.convert(
                         file_bytes, file_name, **run_config
@@ -216,11 +665,8 @@ class DocumentPipeline(BaseComponent):
                         file_bytes = converted_bytes
                         file_name = f"{file_name}.pdf"
 
-                        parser_cls = self._resolve_component(
-                            self.parser_cls_map,
-                            primary_input=file_bytes,
-                            secondary_input=file_name,
-                            category="Parser (Post-Conversion)",
+                        parser_cls = self._select_parser(
+                            file_bytes, file_name, "Parser (Post-Conversion)", warm
                         )
                 except Exception as e:
                     self._log(f"Conversion warning: {e}", level="warning")
@@ -230,6 +676,14 @@ class DocumentPipeline(BaseComponent):
             self._log(error_msg, level="error")
             raise ParserError(error_msg)
 
+        if warm is not None and parser_cls in warm.instances:
+            parser = warm.instances[parser_cls]
+            self._log(
+                f"Routing '{file_name}' to {parser.component_name} (warm)...",
+                level="debug",
+            )
+            return parser, file_bytes, file_name
+
         # ---------------------------------------------------------------------
         # Phase 2: OCR Injection (Dependency Injection)
         # ---------------------------------------------------------------------
@@ -244,12 +698,11 @@ class DocumentPipeline(BaseComponent):
             )
 
             if ocr_cls:
-                ocr_instance = ocr_cls()
-                ocr_instance.initialize(**ocr)
+                ocr_instance = self._get_ocr_engine(ocr_cls, ocr)
                 self._log(f"OCR Engine enabled: {ocr_cls.component_name}")
 
         # ---------------------------------------------------------------------
-        # Phase 3: Execution
+        # Phase 3: Parser Instantiation
         # ---------------------------------------------------------------------
         parser = parser_cls()
 
@@ -260,15 +713,67 @@ class DocumentPipeline(BaseComponent):
             parser.set_ocr_engine(ocr_instance)
 
         parser.initialize(**run_config)
+        if warm is not None:
+            warm.instances[parser_cls] = parser
         self._log(f"Routing '{file_name}' to {parser.component_name}...")
 
-        try:
-            doc = parser.parse(file_bytes, file_name, **run_config)
-            self._emit("on_finish", result_data=doc, success=True)
-            return doc
-        except Exception as e:
-            self._emit("on_error", error=e)
-            raise e
+        return parser, file_bytes, file_name
+
+    def _select_parser(
+        self,
+        file_bytes: bytes,
+        file_name: str,
+        category: str,
+        warm: Optional[_WarmComponents] = None,
+    ) -> Optional[Type[BaseDocumentParser]]:
+        """
+        Pick the parser class for a file.
+
+        With batch state, the magic-byte type decides; ``can_handle`` is only
+        consulted among several parsers claiming that type, and the full
+        scoreboard only when no parser claims it.
+        """
+        if warm is not None:
+            file_type = _sniff_type(file_bytes, file_name)
+            candidates = warm.parsers_by_type.get(file_type, []) if file_type else []
+            if len(candidates) == 1:
+                return candidates[0]
+            if candidates:
+                best = max(
+                    candidates, key=lambda c: c.can_handle(file_bytes, file_name)
+                )
+                if best.can_handle(file_bytes, file_name) > 0.1:
+                    return best
+
+        return self._resolve_component(
+            self.parser_cls_map,
+            primary_input=file_bytes,
+            secondary_input=file_name,
+            category=category,
+        )
+
+    def _get_ocr_engine(
+        self, ocr_cls: Type[BaseOCR], ocr_config: Dict[str, Any]
+    ) -> BaseOCR:
+        """
+        Return the engine for this OCR config, creating it on first use.
+
+        Engines are reused across runs so that their worker pool and result
+        cache persist for the lifetime of the pipeline (see ``close``).
+        """
+        key = (ocr_cls, repr(sorted(ocr_config.items(), key=lambda kv: kv[0])))
+        engine = self._ocr_engines.get(key)
+        if engine is None:
+            engine = ocr_cls()
+            engine.initialize(**ocr_config)
+            self._ocr_engines[key] = engine
+        return engine
+
+    def close(self) -> None:
+        """Shut down the worker pools of all OCR engines created so far."""
+        for engine in self._ocr_engines.values():
+            engine.close()
+        self._ocr_engines = {}
 
     def _resolve_component(
         self,
@@ -1,15 +1,14 @@
-import io
+import copy
+import os
 import re
 import struct
 import zlib
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, Iterator, List, Optional, Tuple
-
-try:
-    import olefile
-except ImportError:
-    olefile = None
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
+from sayou.core.lazy import optional_import
+from sayou.core.payload import as_stream
 from sayou.core.registry import register_component
 
 from ..interfaces.base_parser import BaseDocumentParser
@@ -25,6 +24,8 @@ from ..models import (
     TextElement,
 )
 
+olefile = optional_import("olefile")
+
 # ---------------------------------------------------------------------------
 # HWP 5.0 binary constants
 # ---------------------------------------------------------------------------
@@ -90,6 +91,46 @@ _LIST_PREFIXES = ("목록", "글머리", "번호", "List", "Bullet", "Number")
 # Font size threshold for heading detection via CHAR_SHAPE (unit: 1/100 pt)
 _HEADING_FONT_SIZE_MIN = 1400  # 14 pt
 
+# Record header: LE UINT32 (tag | level << 10 | size << 20)
+_RECORD_HEADER = struct.Struct("<I")
+
+# Per-process state of section workers (see HwpParser._parse_sections_parallel).
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_section_worker(
+    parser: "HwpParser",
+    file_bytes: Any,
+    styles: Dict[int, "_StyleInfo"],
+    with_images: bool,
+) -> None:
+    """Pool initializer: open the OLE container once per worker process."""
+    ole = parser._open_ole(file_bytes)
+    _WORKER_STATE.update(
+        parser=parser,
+        ole=ole,
+        styles=styles,
+        bin_data=parser._extract_bin_data(ole) if with_images else {},
+    )
+
+
+def _parse_section_in_worker(
+    dir_path: List[str], sec_idx: int, file_name: str, options: Dict[str, Any]
+) -> List["BaseElement"]:
+    """Pool task: decompress and parse one BodyText section."""
+    parser = _WORKER_STATE["parser"]
+    elements = parser._parse_section_stream(
+        _WORKER_STATE["ole"],
+        dir_path,
+        sec_idx,
+        _WORKER_STATE["styles"],
+        _WORKER_STATE["bin_data"],
+        file_name,
+        **options,
+    )
+    parser._flush_ocr()
+    return elements
+
 
 # ---------------------------------------------------------------------------
 # Internal data structures
@@ -254,7 +295,49 @@ class _InlineCtx:
     ctrl_type: str  # semantic label
     ctrl_level: int  # record level of the opening CTRL_HEADER
     texts: List[str] = field(default_factory=list)
-    record_bytes: Optional[bytes] = None  # original CTRL_HEADER payload (GSO only)
+    record_bytes: Optional[memoryview] = None  # CTRL_HEADER payload (GSO only)
+
+
+class _BinData:
+    """
+    ``BinData/BIN*.xxx`` streams by key, read and inflated on first access.
+
+    Only images that a picture control (or the unreferenced-image fallback)
+    actually asks for are decompressed; each at most once.
+    """
+
+    def __init__(self, ole) -> None:
+        self._ole = ole
+        self._paths: Dict[str, List[str]] = {
+            dp[1].split(".")[0]: dp
+            for dp in ole.listdir()
+            if dp[0] == "BinData" and len(dp) >= 2
+        }
+        self._cache: Dict[str, Optional[bytes]] = {}
+
+    def keys(self) -> List[str]:
+        return list(self._paths)
+
+    def get(self, key: str) -> Optional[bytes]:
+        if key not in self._cache:
+            path = self._paths.get(key)
+            self._cache[key] = self._inflate(path) if path else None
+        return self._cache[key]
+
+    def _inflate(self, path: List[str]) -> Optional[bytes]:
+        """Raw deflate (HWP's encoding), zlib, or stored as-is."""
+        try:
+            raw = self._ole.openstream(path).read()
+        except Exception:
+            return None
+        if not raw:
+            return None
+        for wbits in (-15, 15):
+            try:
+                return zlib.decompress(raw, wbits)
+            except zlib.error:
+                pass
+        return raw
 
 
 # ---------------------------------------------------------------------------
@@ -287,6 +370,21 @@ class HwpParser(BaseDocumentParser):
     TableElement — rows and cells derived from the CTRL_END stream.
     ImageElement — from ``BinData/BIN*.xxx`` OLE streams with optional OCR.
 
+    Performance
+    ───────────
+    Records are walked as ``memoryview`` slices of the decompressed
+    section, so no record payload is copied.  BinData streams are inflated
+    only when referenced.  Documents with several BodyText sections can be
+    parsed section-parallel (``section_workers``): each worker opens the
+    container once and decompresses and parses whole sections, and results
+    are merged in section order — identical to the sequential output.
+
+    Attributes:
+        SECTION_WORKERS (int): Default worker processes (1 = sequential).
+            Override per call with ``section_workers``; 0 uses every CPU.
+        PARALLEL_MIN_SECTIONS (int): Fewer sections are parsed sequentially.
+        SECTION_OPTIONS (tuple): Parse options forwarded to workers.
+
     Requires::
 
         pip install olefile
@@ -295,6 +393,10 @@ class HwpParser(BaseDocumentParser):
     component_name = "HwpParser"
     SUPPORTED_TYPES = [".hwp"]
 
+    SECTION_WORKERS: int = 1
+    PARALLEL_MIN_SECTIONS: int = 2
+    SECTION_OPTIONS: Tuple[str, ...] = ("ocr_enabled",)
+
     # ------------------------------------------------------------------
     # can_handle
     # ------------------------------------------------------------------
@@ -314,16 +416,29 @@ class HwpParser(BaseDocumentParser):
     # ------------------------------------------------------------------
 
     def _do_parse(self, file_bytes: bytes, file_name: str, **kwargs) -> Document:
-        if olefile is None:
-            raise ImportError(
-                "The 'olefile' package is required. Install: pip install olefile"
-            )
-
+        """
+        Parse HWP bytes into a structured Document.
+
+        Args:
+            file_bytes (bytes): HWP 5.0 file content.
+            file_name (str): Original filename.
+            **kwargs:
+                - ocr_enabled (bool): OCR embedded images (default: True).
+                - extract_images (bool): Emit images at all (default: True).
+                - section_workers (int): Worker processes for
+                  section-parallel parsing (default: ``SECTION_WORKERS``).
+
+        Returns:
+            Document: A document object with 'doc_type="word"'.
+        """
+        ole = self._open_ole(file_bytes)
         try:
-            ole = olefile.OleFileIO(io.BytesIO(file_bytes))
-        except Exception as exc:
-            raise ValueError(f"Cannot open HWP OLE container: {exc}") from exc
+            return self._parse_ole(ole, file_bytes, file_name, **kwargs)
+        finally:
+            self._close_ole(ole)
 
+    def _parse_ole(self, ole, file_bytes: Any, file_name: str, **kwargs) -> Document:
+        """Build the Document from an open OLE container."""
         if not ole.exists("FileHeader"):
             raise ValueError(f"'{file_name}' is not a valid HWP 5.0 document.")
 
@@ -335,12 +450,14 @@ class HwpParser(BaseDocumentParser):
             except Exception as exc:
                 self._log(f"DocInfo style parsing failed: {exc}", level="warning")
 
-        # 2. Embedded images
-        bin_data: Dict[str, bytes] = {}
-        try:
-            bin_data = self._extract_bin_data(ole)
-        except Exception as exc:
-            self._log(f"BinData extraction failed: {exc}", level="warning")
+        # 2. Embedded images, inflated on reference (none when extract_images=False)
+        with_images = kwargs.get("extract_images", True)
+        bin_data: Union[_BinData, Dict[str, bytes]] = {}
+        if with_images:
+            try:
+                bin_data = self._extract_bin_data(ole)
+            except Exception as exc:
+                self._log(f"BinData extraction failed: {exc}", level="warning")
 
         # 3. BodyText sections
         if not ole.exists("BodyText"):
@@ -351,40 +468,44 @@ class HwpParser(BaseDocumentParser):
 
         all_elements: List[BaseElement] = []
 
-        for sec_idx, dir_path in enumerate(section_streams):
-            try:
-                raw = ole.openstream(dir_path).read()
-            except Exception as exc:
-                self._log(f"Cannot read '{'/'.join(dir_path)}': {exc}", level="warning")
-                continue
-            if not raw:
-                continue
-
-            data = self._decompress(raw, "/".join(dir_path))
-            elems = self._parse_section(
-                data, sec_idx, styles, bin_data, file_name, **kwargs
+        workers = self._section_workers(
+            kwargs.get("section_workers"), len(section_streams)
+        )
+        if workers > 1:
+            options = {k: kwargs[k] for k in self.SECTION_OPTIONS if k in kwargs}
+            section_results = self._parse_sections_parallel(
+                file_bytes,
+                section_streams,
+                styles,
+                file_name,
+                workers,
+                with_images,
+                **options,
             )
+        else:
+            section_results = (
+                self._parse_section_stream(
+                    ole, dir_path, sec_idx, styles, bin_data, file_name, **kwargs
+                )
+                for sec_idx, dir_path in enumerate(section_streams)
+            )
+        for elems in section_results:
             all_elements.extend(elems)
 
         # Emit any BinData streams that were not matched by ctrl_id references.
         # This ensures no embedded images are silently dropped when an unknown
         # ctrl_id is used (e.g., stamp/seal images with non-standard IDs).
-        referenced_keys = {
-            e.id.split(":")[-1] if hasattr(e, "image_base64") else ""
+        emitted_keys = {
+            e.raw_attributes.get("bin_key")
             for e in all_elements
+            if isinstance(e, ImageElement)
         }
         ocr_enabled = kwargs.get("ocr_enabled", True)
-        for bin_idx, (key, raw_img) in enumerate(bin_data.items()):
-            if not raw_img:
+        for key in bin_data.keys():
+            if key in emitted_keys:
                 continue
-            # Skip if already emitted (check image_base64 content match is
-            # expensive; instead track by checking if any ImageElement
-            # references this key via raw_attributes)
-            already_emitted = any(
-                isinstance(e, ImageElement) and e.raw_attributes.get("bin_key") == key
-                for e in all_elements
-            )
-            if already_emitted:
+            raw_img = bin_data.get(key)
+            if not raw_img:
                 continue
             ext = key[-3:].lower() if len(key) >= 3 else "png"
             eid = f"hwp:{file_name}:bin:{key}"
@@ -425,6 +546,101 @@ class HwpParser(BaseDocumentParser):
             pages=[page],
         )
 
+    def _open_ole(self, file_bytes: bytes):
+        if olefile is None:
+            raise ImportError(
+                "The 'olefile' package is required. Install: pip install olefile"
+            )
+        stream = as_stream(file_bytes)
+        try:
+            return olefile.OleFileIO(stream)
+        except Exception as exc:
+            stream.close()
+            raise ValueError(f"Cannot open HWP OLE container: {exc}") from exc
+
+    @staticmethod
+    def _close_ole(ole) -> None:
+        """Close the container and the stream ``_open_ole`` gave it."""
+        ole.close()
+        fp = getattr(ole, "fp", None)
+        if fp is not None:
+            fp.close()
+
+    # ------------------------------------------------------------------
+    # BodyText sections
+    # ------------------------------------------------------------------
+
+    def _parse_section_stream(
+        self,
+        ole,
+        dir_path: List[str],
+        sec_idx: int,
+        styles: Dict[int, _StyleInfo],
+        bin_data: Union[_BinData, Dict[str, bytes]],
+        file_name: str,
+        **kwargs,
+    ) -> List[BaseElement]:
+        """Read, decompress and parse one ``BodyText/SectionN`` stream."""
+        stream_name = "/".join(dir_path)
+        try:
+            raw = ole.openstream(dir_path).read()
+        except Exception as exc:
+            self._log(f"Cannot read '{stream_name}': {exc}", level="warning")
+            return []
+        if not raw:
+            return []
+
+        data = self._decompress(raw, stream_name)
+        return self._parse_section(data, sec_idx, styles, bin_data, file_name, **kwargs)
+
+    def _section_workers(self, requested: Optional[int], section_count: int) -> int:
+        workers = self.SECTION_WORKERS if requested is None else int(requested)
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        if section_count < self.PARALLEL_MIN_SECTIONS:
+            return 1
+        return max(1, min(workers, section_count))
+
+    def _parse_sections_parallel(
+        self,
+        file_bytes: Any,
+        section_streams: List[List[str]],
+        styles: Dict[int, _StyleInfo],
+        file_name: str,
+        workers: int,
+        with_images: bool,
+        **options,
+    ) -> Iterator[List[BaseElement]]:
+        """
+        Parse sections in a process pool, yielding their elements in order.
+
+        Workers receive a callback-free copy of this parser and the original
+        payload, and inflate only the BinData their sections reference.
+        """
+        worker_parser = copy.copy(self)
+        worker_parser._callbacks = []
+        worker_parser._pending_ocr = []
+        if self.ocr_engine is not None:
+            worker_parser.ocr_engine = self.ocr_engine.clone_for_worker()
+
+        self._log(f"Parsing {len(section_streams)} sections with {workers} workers.")
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_section_worker,
+            initargs=(worker_parser, file_bytes, styles, with_images),
+        )
+        try:
+            futures = [
+                pool.submit(
+                    _parse_section_in_worker, dir_path, sec_idx, file_name, options
+                )
+                for sec_idx, dir_path in enumerate(section_streams)
+            ]
+            for future in futures:
+                yield future.result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
     # ------------------------------------------------------------------
     # DocInfo
     # ------------------------------------------------------------------
@@ -460,8 +676,8 @@ class HwpParser(BaseDocumentParser):
         return 0
 
     @staticmethod
-    def _decode_null_term_utf16(data: bytes) -> str:
-        decoded = data.decode("utf-16-le", errors="ignore")
+    def _decode_null_term_utf16(data: memoryview) -> str:
+        decoded = str(data, "utf-16-le", errors="ignore")
         null_pos = decoded.find("\x00")
         return decoded[:null_pos] if null_pos >= 0 else decoded
 
@@ -469,30 +685,11 @@ class HwpParser(BaseDocumentParser):
     # BinData
     # ------------------------------------------------------------------
 
-    def _extract_bin_data(self, ole) -> Dict[str, bytes]:
-        """Extract BinData, decompressing with raw deflate (HWP's encoding)."""
-        result: Dict[str, bytes] = {}
+    def _extract_bin_data(self, ole) -> Union[_BinData, Dict[str, bytes]]:
+        """Index BinData streams; each is inflated when first referenced."""
         if not ole.exists("BinData"):
-            return result
-        for dp in ole.listdir():
-            if dp[0] != "BinData" or len(dp) < 2:
-                continue
-            key = dp[1].split(".")[0]
-            try:
-                raw = ole.openstream(dp).read()
-                if not raw:
-                    continue
-                decompressed = None
-                for wbits in (-15, 15):
-                    try:
-                        decompressed = zlib.decompress(raw, wbits)
-                        break
-                    except zlib.error:
-                        pass
-                result[key] = decompressed if decompressed is not None else raw
-            except Exception as exc:
-                self._log(f"BinData '{dp[1]}': {exc}", level="debug")
-        return result
+            return {}
+        return _BinData(ole)
 
     # ------------------------------------------------------------------
     # Section parsing — state machine
@@ -503,7 +700,7 @@ class HwpParser(BaseDocumentParser):
         data: bytes,
         sec_idx: int,
         styles: Dict[int, _StyleInfo],
-        bin_data: Dict[str, bytes],
+        bin_data: Union[_BinData, Dict[str, bytes]],
         file_name: str,
         **kwargs,
     ) -> List[BaseElement]:
@@ -659,6 +856,7 @@ class HwpParser(BaseDocumentParser):
                         page_num=1,
                         ocr_enabled=ocr_enabled,
                     )
+                    img_elem.raw_attributes["bin_key"] = img_key
                     img_elem.raw_attributes["section_context"] = current_heading_text
                     elements.append(img_elem)
             # Otherwise silently discard (empty control)
@@ -710,7 +908,7 @@ class HwpParser(BaseDocumentParser):
 
             # ── CTRL_HEADER ───────────────────────────────────────────
             elif tag_id == _TAG_CTRL_HEADER and len(record) >= 4:
-                ctrl_id = record[:4]
+                ctrl_id = bytes(record[:4])
 
                 if ctrl_id == _CTRL_TABLE:
                     if not table_stack:
@@ -856,7 +1054,7 @@ class HwpParser(BaseDocumentParser):
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _parse_para_header(data: bytes) -> _ParaInfo:
+    def _parse_para_header(data: memoryview) -> _ParaInfo:
         """
         HWPTAG_PARA_HEADER byte layout:
           0–3   UINT32  nChar
@@ -874,7 +1072,7 @@ class HwpParser(BaseDocumentParser):
         )
 
     @staticmethod
-    def _decode_para_text(data: bytes) -> str:
+    def _decode_para_text(data: memoryview) -> str:
         """
         Decode HWPTAG_PARA_TEXT payload (UTF-16 LE).
 
@@ -884,7 +1082,7 @@ class HwpParser(BaseDocumentParser):
         (e.g. 汤捯, 氠瑢).  We split on the anchor/field chars and strip
         leading CJK Unified Ideograph characters from each segment.
         """
-        decoded = data.decode("utf-16-le", errors="ignore")
+        decoded = str(data, "utf-16-le", errors="ignore")
 
         result_parts = []
         for segment in re.split(r"[\x02\x0b\x0c]", decoded):
@@ -904,7 +1102,7 @@ class HwpParser(BaseDocumentParser):
         return " ".join(result_parts).strip()
 
     @staticmethod
-    def _extract_bin_ref(ctrl_data: bytes) -> Optional[str]:
+    def _extract_bin_ref(ctrl_data: memoryview) -> Optional[str]:
         """Extract BinData key from GSO/picture ctrl record."""
         try:
             if len(ctrl_data) >= 6:
@@ -916,7 +1114,7 @@ class HwpParser(BaseDocumentParser):
         return None
 
     @staticmethod
-    def _walk_records(data: bytes) -> Iterator[Tuple[int, int, bytes]]:
+    def _walk_records(data: bytes) -> Iterator[Tuple[int, int, memoryview]]:
         """
         Walk a flat HWP binary record stream.
 
@@ -925,26 +1123,27 @@ class HwpParser(BaseDocumentParser):
           bits 10–19 : level (nesting depth)
           bits 20–31 : size  (0xFFF → next 4 bytes hold actual size)
 
-        Yields ``(tag_id, level, record_data)``.
+        Yields ``(tag_id, level, record_data)``; ``record_data`` is a
+        zero-copy ``memoryview`` into ``data``, valid while ``data`` is.
         """
+        view = memoryview(data)
+        unpack = _RECORD_HEADER.unpack_from
         offset = 0
-        length = len(data)
-        while offset < length:
-            if offset + 4 > length:
-                break
-            header = int.from_bytes(data[offset : offset + 4], "little")
+        length = len(view)
+        while offset + 4 <= length:
+            (header,) = unpack(view, offset)
             offset += 4
             tag_id = header & 0x3FF
             level = (header >> 10) & 0x3FF
-            size = (header >> 20) & 0xFFF
+            size = header >> 20
             if size == 0xFFF:
                 if offset + 4 > length:
                     break
-                size = int.from_bytes(data[offset : offset + 4], "little")
+                (size,) = unpack(view, offset)
                 offset += 4
             if offset + size > length:
                 break
-            yield tag_id, level, data[offset : offset + size]
+            yield tag_id, level, view[offset : offset + size]
             offset += size
 
     # ------------------------------------------------------------------
@@ -2,13 +2,15 @@ import io
 import re
 import xml.etree.ElementTree as ET
 import zipfile
-from typing import Dict, List, Optional, Tuple
+from typing import IO, Dict, List, Optional, Tuple, Union
 
+from sayou.core.payload import as_stream
 from sayou.core.registry import register_component
 
 from ..interfaces.base_parser import BaseDocumentParser
 from ..models import (BaseElement, Document, DocumentMetadata, ElementMetadata,
                       ImageElement, Page, TableCell, TableElement, TextElement)
+from ..utils.ooxml import iter_complete
 
 # ---------------------------------------------------------------------------
 # HWPX XML namespace roots
@@ -72,6 +74,10 @@ class HwpxParser(BaseDocumentParser):
         Binary image data from the ``BinData/`` ZIP directory, with optional
         OCR via the attached OCR engine.
 
+    Section XML is read incrementally straight from the ZIP: every
+    top-level paragraph or table is converted as soon as it is complete and
+    then dropped, so a section is never held as a whole tree.
+
     Requires no additional dependencies beyond the Python standard library.
     """
 
@@ -97,13 +103,18 @@ class HwpxParser(BaseDocumentParser):
     # ------------------------------------------------------------------
 
     def _do_parse(self, file_bytes: bytes, file_name: str, **kwargs) -> Document:
-        try:
-            zf = zipfile.ZipFile(io.BytesIO(file_bytes))
-        except zipfile.BadZipFile as exc:
-            raise ValueError(
-                f"'{file_name}' is not a valid HWPX (ZIP) file: {exc}"
-            ) from exc
-
+        with as_stream(file_bytes) as source:
+            try:
+                zf = zipfile.ZipFile(source)
+            except zipfile.BadZipFile as exc:
+                raise ValueError(
+                    f"'{file_name}' is not a valid HWPX (ZIP) file: {exc}"
+                ) from exc
+            with zf:
+                return self._parse_package(zf, file_name, **kwargs)
+
+    def _parse_package(self, zf: zipfile.ZipFile, file_name: str, **kwargs) -> Document:
+        """Build the Document from an open HWPX archive."""
         names = zf.namelist()
 
         # 1. Load style definitions from header.xml
@@ -117,7 +128,7 @@ class HwpxParser(BaseDocumentParser):
 
         # 2. Load embedded images from BinData/
         bin_data: Dict[str, bytes] = {}
-        for n in names:
+        for n in names if kwargs.get("extract_images", True) else ():
             parts = n.replace("\\", "/").split("/")
             if any(p.lower() == "bindata" for p in parts):
                 key = parts[-1].split(".")[0].upper()
@@ -141,14 +152,15 @@ class HwpxParser(BaseDocumentParser):
 
         for sec_idx, path in enumerate(section_paths):
             try:
-                xml_bytes = zf.read(path)
+                stream = zf.open(path)
             except Exception as exc:
                 self._log(f"Cannot read '{path}': {exc}", level="warning")
                 continue
 
-            elems, page_count = self._parse_section_xml(
-                xml_bytes, sec_idx, styles, bin_data, file_name, ocr_enabled
-            )
+            with stream:
+                elems, page_count = self._parse_section_xml(
+                    stream, sec_idx, styles, bin_data, file_name, ocr_enabled
+                )
             all_elements.extend(elems)
             total_pages = max(total_pages, page_count)
 
@@ -202,19 +214,23 @@ class HwpxParser(BaseDocumentParser):
 
     def _parse_section_xml(
         self,
-        xml_bytes: bytes,
+        xml_source: Union[bytes, IO[bytes]],
         sec_idx: int,
         styles: Dict[str, "_StyleDef"],
         bin_data: Dict[str, bytes],
         file_name: str,
         ocr_enabled: bool,
     ) -> Tuple[List[BaseElement], int]:
-        """Parse one section XML and return (elements, page_count)."""
-        try:
-            root = ET.fromstring(xml_bytes)
-        except ET.ParseError as exc:
-            self._log(f"XML parse error in section {sec_idx}: {exc}", level="warning")
-            return [], 1
+        """
+        Parse one section XML and return (elements, page_count).
+
+        The section is read incrementally: each top-level paragraph or table
+        is converted once its end tag arrives and is then dropped, so only
+        one block is held as a tree at a time.  Elements parsed before a
+        malformed tag are kept.
+        """
+        if isinstance(xml_source, (bytes, bytearray)):
+            xml_source = io.BytesIO(xml_source)
 
         elements: List[BaseElement] = []
         page_num = 1
@@ -227,24 +243,27 @@ class HwpxParser(BaseDocumentParser):
             return eid
 
         # Walk direct children of the section root
-        for child in root:
-            tag = _local(child.tag)
-
-            if tag == "p":
-                elem = self._parse_paragraph(
-                    child, styles, _next_id, page_num, elements
-                )
-                if elem:
-                    elements.append(elem)
-
-            elif tag == "tbl":
-                tbl = self._parse_table(child, _next_id, page_num)
-                if tbl:
-                    elements.append(tbl)
-
-            elif tag == "secPr":
-                # Section properties may contain page count hints
-                pass
+        try:
+            for child in iter_complete(xml_source, depth=1):
+                tag = _local(child.tag)
+
+                if tag == "p":
+                    elem = self._parse_paragraph(
+                        child, styles, _next_id, page_num, elements
+                    )
+                    if elem:
+                        elements.append(elem)
+
+                elif tag == "tbl":
+                    tbl = self._parse_table(child, _next_id, page_num)
+                    if tbl:
+                        elements.append(tbl)
+
+                elif tag == "secPr":
+                    # Section properties may contain page count hints
+                    pass
+        except ET.ParseError as exc:
+            self._log(f"XML parse error in section {sec_idx}: {exc}", level="warning")
 
         return elements, page_num
 
@@ -265,7 +284,7 @@ class HwpxParser(BaseDocumentParser):
         # Collect all text runs
         text_parts: List[str] = []
         for run in para_el.iter():
-            if _local(run.tag) == "t" and run.text:
+            if run.text and _is_local(run.tag, "t"):
                 text_parts.append(run.text)
 
         text = " ".join(text_parts).strip()
@@ -339,7 +358,7 @@ class HwpxParser(BaseDocumentParser):
     def _extract_font_size_pt(para_el) -> Optional[float]:
         """Read <hp:sz> or <hml:sz> font size from first run in paragraph."""
         for el in para_el.iter():
-            if _local(el.tag) in ("sz", "fontSize"):
+            if _is_local(el.tag, "sz") or _is_local(el.tag, "fontSize"):
                 val = el.get("val") or el.get("value") or el.text
                 if val:
                     try:
@@ -371,7 +390,7 @@ class HwpxParser(BaseDocumentParser):
                 # Collect text from all paragraphs in this cell
                 cell_parts: List[str] = []
                 for p_el in cell_el.iter():
-                    if _local(p_el.tag) == "t" and p_el.text:
+                    if p_el.text and _is_local(p_el.tag, "t"):
                         cell_parts.append(p_el.text)
 
                 cell_text = " ".join(cell_parts).strip()
@@ -427,7 +446,12 @@ class _StyleDef:
 
 def _local(tag: str) -> str:
     """Strip XML namespace from a tag string: '{ns}localname' → 'localname'."""
-    return tag.split("}")[-1] if "}" in tag else tag
+    return tag.rpartition("}")[2]
+
+
+def _is_local(tag: str, name: str) -> bool:
+    """``_local(tag) == name`` without building the local name (hot loops)."""
+    return tag == name or tag.endswith("}" + name)
 
 
 def _heading_level_from_name(name: str) -> int:
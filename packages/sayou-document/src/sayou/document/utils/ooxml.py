@@ -0,0 +1,127 @@
+import posixpath
+import xml.etree.ElementTree as ET
+import zipfile
+from typing import IO, Dict, Iterator, Optional, Tuple, Union
+
+from sayou.core.payload import as_stream
+
+_NS_RELS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_NS_TYPES = "{http://schemas.openxmlformats.org/package/2006/content-types}"
+
+
+def iter_complete(source: Union[str, IO[bytes]], depth: int) -> Iterator[ET.Element]:
+    """
+    Incrementally parse XML and yield every element at ``depth`` once its
+    end tag has been read (the root element is depth 0).
+
+    After the consumer resumes, the element is detached from its parent,
+    so only one such subtree is ever held in memory regardless of the size
+    of the document.
+
+    Args:
+        source: File path or binary file object (e.g. ``ZipFile.open``).
+        depth (int): Nesting level of the elements to yield.
+
+    Yields:
+        xml.etree.ElementTree.Element: Complete subtrees in document order.
+    """
+    level = -1
+    parent = None
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            level += 1
+            if level == depth - 1:
+                parent = elem
+            continue
+        if level == depth:
+            yield elem
+            if parent is not None:
+                parent.remove(elem)
+        level -= 1
+
+
+class OoxmlPackage:
+    """
+    (Utility) Read-only access to the parts of a zip-based office package
+    (OOXML .docx / .pptx).
+
+    Parts are read straight from the archive on demand; relationship and
+    content-type tables are parsed once and cached.
+    """
+
+    def __init__(self, file_bytes: bytes):
+        self._stream = as_stream(file_bytes)
+        try:
+            self.zf = zipfile.ZipFile(self._stream)
+        except Exception:
+            self._stream.close()
+            raise
+        self._names = set(self.zf.namelist())
+        self._rels: Dict[str, Dict[str, Tuple[str, str]]] = {}
+        self._types: Optional[Tuple[Dict[str, str], Dict[str, str]]] = None
+
+    def has(self, part: str) -> bool:
+        return part in self._names
+
+    def read(self, part: str) -> bytes:
+        return self.zf.read(part)
+
+    def open(self, part: str) -> IO[bytes]:
+        return self.zf.open(part)
+
+    def close(self) -> None:
+        self.zf.close()
+        self._stream.close()
+
+    def rels(self, part: str) -> Dict[str, Tuple[str, str]]:
+        """
+        Relationships of ``part``.
+
+        Returns:
+            Dict[str, Tuple[str, str]]: ``rId`` → (relationship type suffix,
+            e.g. ``"image"``, and the target part path). External targets
+            keep their URL.
+        """
+        cached = self._rels.get(part)
+        if cached is not None:
+            return cached
+
+        folder, name = posixpath.split(part)
+        rels_path = posixpath.join(folder, "_rels", name + ".rels")
+        rels: Dict[str, Tuple[str, str]] = {}
+        if rels_path in self._names:
+            for rel in ET.fromstring(self.zf.read(rels_path)).iter(
+                _NS_RELS + "Relationship"
+            ):
+                target = rel.get("Target", "")
+                if rel.get("TargetMode") != "External":
+                    if target.startswith("/"):
+                        target = target[1:]
+                    else:
+                        target = posixpath.normpath(posixpath.join(folder, target))
+                rel_type = rel.get("Type", "").rsplit("/", 1)[-1]
+                rels[rel.get("Id", "")] = (rel_type, target)
+        self._rels[part] = rels
+        return rels
+
+    def content_type(self, part: str) -> str:
+        """MIME type of ``part`` from ``[Content_Types].xml``."""
+        if self._types is None:
+            defaults: Dict[str, str] = {}
+            overrides: Dict[str, str] = {}
+            if "[Content_Types].xml" in self._names:
+                root = ET.fromstring(self.zf.read("[Content_Types].xml"))
+                for el in root.iter(_NS_TYPES + "Default"):
+                    defaults[el.get("Extension", "").lower()] = el.get(
+                        "ContentType", ""
+                    )
+                for el in root.iter(_NS_TYPES + "Override"):
+                    overrides[el.get("PartName", "").lstrip("/")] = el.get(
+                        "ContentType", ""
+                    )
+            self._types = (defaults, overrides)
+
+        defaults, overrides = self._types
+        if part in overrides:
+            return overrides[part]
+        return defaults.get(posixpath.splitext(part)[1][1:].lower(), "")
@@ -28,6 +28,7 @@ What this file does
 from __future__ import annotations
 
 import importlib.util
+import io
 import logging
 import sys
 import types
@@ -188,7 +189,34 @@ if "sayou.core" not in sys.modules:
     _reg.register_component = register_component
     sys.modules["sayou.core.registry"] = _reg
 
+    _payload = types.ModuleType("sayou.core.payload")
+
+    class SpooledPayload:
+        pass
+
+    def as_stream(data):
+        return io.BytesIO(data)
+
+    _payload.SpooledPayload = SpooledPayload
+    _payload.as_stream = as_stream
+    _payload.as_buffer = lambda data: data
+    _payload.payload_path = lambda data: None
+    sys.modules["sayou.core.payload"] = _payload
+
+    # lazy.py has no dependencies: load the real module instead of a stub.
+    _lazy_path = next(
+        _src / "sayou" / "core" / "lazy.py"
+        for _src in _src_dirs
+        if (_src / "sayou" / "core" / "lazy.py").is_file()
+    )
+    _lazy_spec = importlib.util.spec_from_file_location("sayou.core.lazy", _lazy_path)
+    _lazy = importlib.util.module_from_spec(_lazy_spec)
+    _lazy_spec.loader.exec_module(_lazy)
+    sys.modules["sayou.core.lazy"] = _lazy
+
     _core = types.ModuleType("sayou.core")
+    _core.lazy = _lazy
+    _core.payload = _payload
     _core.exceptions = _exc
     _core.schemas = _schemas
     _core.base_component = _bc
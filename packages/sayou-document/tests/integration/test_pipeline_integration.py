@@ -12,8 +12,9 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from sayou.document.converter.image_converter import ImageToPdfConverter
-from sayou.document.models import Document, Page, Sheet, Slide
+from sayou.document.models import Document, ImageElement, Page, Sheet, Slide
 from sayou.document.parser.excel_parser import ExcelParser
+from sayou.document.parser.image_parser import ImageParser
 from sayou.document.parser.pdf_parser import PdfParser
 from sayou.document.parser.pptx_parser import PptxParser
 from sayou.document.pipeline import DocumentPipeline
@@ -143,14 +144,29 @@ class TestExcelIntegration:
 
 
 # ---------------------------------------------------------------------------
-# Image → PDF conversion path
+# Image paths: native ImageParser, PDF conversion as the fallback
 # ---------------------------------------------------------------------------
 
 
 class TestImageConversionIntegration:
+    def test_jpg_routes_to_image_parser(self):
+        import io
+
+        from PIL import Image
+
+        buffer = io.BytesIO()
+        Image.new("RGB", (64, 32), "white").save(buffer, format="JPEG")
+
+        result = DocumentPipeline().run(buffer.getvalue(), "photo.jpg")
+
+        assert result.doc_type == "image"
+        assert isinstance(result.pages[0].elements[0], ImageElement)
+
+    @patch.object(ImageParser, "can_handle", return_value=0.0)
     @patch("sayou.document.converter.image_converter.Image")
     @patch("sayou.document.parser.pdf_parser.fitz")
-    def test_jpg_converts_then_parses(self, mock_fitz, mock_pil):
+    def test_jpg_converts_then_parses(self, mock_fitz, mock_pil, _declined):
+        """Images no parser accepts still reach PdfParser via the converter."""
         # Converter: Image.open → save → return PDF bytes
         mock_img = MagicMock()
         mock_img.mode = "RGB"
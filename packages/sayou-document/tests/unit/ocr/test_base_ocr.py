@@ -0,0 +1,206 @@
+"""
+Unit tests for BaseOCR batching, result caching and the worker pool, and
+for the batched OCR submission in BaseDocumentParser.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from sayou.document.core.exceptions import ParserError
+from sayou.document.interfaces.base_ocr import BaseOCR, RawImage
+from sayou.document.interfaces.base_parser import BaseDocumentParser
+from sayou.document.models import Document, Page
+
+
+class _CountingOCR(BaseOCR):
+    component_name = "CountingOCR"
+
+    def __init__(self):
+        super().__init__()
+        self.lang = "eng"
+        self.calls = []
+
+    def _do_ocr(self, image_bytes, **kwargs):
+        self.calls.append(image_bytes)
+        if image_bytes == b"broken":
+            raise RuntimeError("engine crashed")
+        return f" text:{image_bytes.decode()} "
+
+
+class _DictCache:
+    """Minimal BaseCache stand-in (key / get / set)."""
+
+    def __init__(self):
+        self.data = {}
+
+    def key(self, component, content=None, config=None, digest=None, **extra):
+        return repr((component, digest, sorted((config or {}).items())))
+
+    def get(self, key, component="", default=None):
+        return self.data.get(key, default)
+
+    def set(self, key, value):
+        if value is not None:
+            self.data[key] = value
+
+
+class TestOCRCache:
+    def test_cache_hit_skips_engine(self):
+        engine = _CountingOCR()
+        engine.initialize(ocr_cache=_DictCache())
+
+        assert engine.ocr(b"logo") == "text:logo"
+        assert engine.ocr(b"logo") == "text:logo"
+        assert engine.calls == [b"logo"]
+
+    def test_cache_shared_across_engines_and_keyed_by_lang(self):
+        cache = _DictCache()
+        first, second = _CountingOCR(), _CountingOCR()
+        first.initialize(ocr_cache=cache)
+        second.initialize(ocr_cache=cache)
+
+        first.ocr(b"stamp")
+        second.ocr(b"stamp")
+        assert second.calls == []
+
+        second.lang = "kor"
+        second.ocr(b"stamp")
+        assert second.calls == [b"stamp"]
+
+    def test_cache_keyed_by_dpi(self):
+        engine = _CountingOCR()
+        engine.initialize(ocr_cache=_DictCache())
+
+        engine.ocr(b"page", ocr_dpi=200)
+        engine.ocr(b"page", ocr_dpi=200)
+        engine.ocr(b"page", ocr_dpi=300)
+        assert engine.calls == [b"page", b"page"]
+
+    def test_failures_are_not_cached(self):
+        engine = _CountingOCR()
+        engine.initialize(ocr_cache=_DictCache())
+
+        assert engine.ocr(b"broken") == ""
+        assert engine.ocr(b"broken") == ""
+        assert len(engine.calls) == 2
+
+
+class TestOCRBatch:
+    def test_dedupes_and_preserves_order(self):
+        engine = _CountingOCR()
+        texts = engine.ocr_batch([b"a", b"b", b"a", b"", b"broken"])
+
+        assert texts == ["text:a", "text:b", "text:a", "", ""]
+        assert engine.calls == [b"a", b"b", b"broken"]
+
+    def test_worker_pool(self):
+        engine = _CountingOCR()
+        engine.initialize(ocr_workers=2, ocr_cache=_DictCache())
+        try:
+            texts = engine.ocr_batch([b"x", b"y", b"z"])
+        finally:
+            engine.close()
+
+        assert texts == ["text:x", "text:y", "text:z"]
+        assert engine.calls == []  # recognised in the workers
+        assert engine.ocr_batch([b"y"]) == ["text:y"]  # cached by the parent
+        assert engine.calls == []
+
+
+class _ImageParser(BaseDocumentParser):
+    component_name = "ImageParser"
+
+    def _do_parse(self, file_bytes, file_name, **kwargs):
+        elements = [
+            self._process_image_data(img, "png", f"img{i}", page_num=1)
+            for i, img in enumerate((b"a", b"b", b"a"))
+        ]
+        return Document(
+            file_name=file_name,
+            file_id=file_name,
+            doc_type="unknown",
+            pages=[Page(page_num=1, elements=elements)],
+        )
+
+
+def _record_batches(engine):
+    batches = []
+    original = engine.ocr_batch
+    engine.ocr_batch = lambda images, **kw: batches.append(images) or original(
+        images, **kw
+    )
+    return batches
+
+
+class TestParserBatching:
+    def test_images_ocrd_in_one_batch(self):
+        engine = _CountingOCR()
+        batches = _record_batches(engine)
+
+        parser = _ImageParser(ocr_engine=engine)
+        doc = parser.parse(b"data", "images.bin")
+
+        assert len(batches) == 1
+        assert [e.ocr_text for e in doc.pages[0].elements] == [
+            "text:a",
+            "text:b",
+            "text:a",
+        ]
+        assert engine.calls == [b"a", b"b"]
+
+    def test_batch_size_flushes_early(self):
+        engine = _CountingOCR()
+        batches = _record_batches(engine)
+        parser = _ImageParser(ocr_engine=engine)
+        parser.OCR_BATCH_SIZE = 2
+        doc = parser.parse(b"data", "images.bin")
+
+        assert [len(b) for b in batches] == [2, 1]
+        assert all(e.ocr_text for e in doc.pages[0].elements)
+
+    def test_failed_parse_drops_queued_images(self):
+        class _FailingParser(_ImageParser):
+            fail = True
+
+            def _do_parse(self, file_bytes, file_name, **kwargs):
+                if not self.fail:
+                    return super()._do_parse(file_bytes, file_name, **kwargs)
+                self._process_image_data(b"stale", "png", "img0", page_num=1)
+                raise RuntimeError("corrupt file")
+
+        engine = _CountingOCR()
+        parser = _FailingParser(ocr_engine=engine)
+        with pytest.raises(ParserError):
+            parser.parse(b"data", "broken.bin")
+        with pytest.raises(ParserError):
+            list(parser.parse_iter(b"data", "broken.bin"))
+        assert parser._pending_ocr == []
+
+        parser.fail = False
+        parser.parse(b"data", "images.bin")
+        assert engine.calls == [b"a", b"b"]
+
+
+class TestOCRPixmap:
+    def _pixmap(self):
+        pix = MagicMock(samples=b"\x01\x02\x03", width=1, height=1, n=3, stride=3)
+        pix.tobytes.return_value = b"png"
+        return pix
+
+    def test_encoded_for_regular_engines(self):
+        engine = _CountingOCR()
+        assert engine.ocr_pixmap(self._pixmap()) == "text:png"
+
+    def test_raw_for_raw_engines(self):
+        class _RawOCR(_CountingOCR):
+            ACCEPTS_RAW = True
+
+            def _do_ocr(self, image_bytes, **kwargs):
+                assert isinstance(image_bytes, RawImage)
+                return f"{image_bytes.width}x{image_bytes.height}"
+
+        pix = self._pixmap()
+        assert _RawOCR().ocr_pixmap(pix) == "1x1"
+        pix.tobytes.assert_not_called()
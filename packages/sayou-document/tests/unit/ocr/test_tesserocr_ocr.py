@@ -0,0 +1,89 @@
+"""
+Unit tests for TesserocrOCR.
+
+Patches the tesserocr module so the tests run without the C bindings.
+"""
+
+from __future__ import annotations
+
+import pickle
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sayou.document.interfaces.base_ocr import RawImage
+from sayou.document.ocr.tesserocr_ocr import TesserocrOCR
+
+
+@pytest.fixture
+def mock_tesserocr():
+    with patch("sayou.document.ocr.tesserocr_ocr.tesserocr") as module:
+        module.PyTessBaseAPI.side_effect = lambda **kw: MagicMock(
+            GetUTF8Text=MagicMock(return_value=" recognised \n")
+        )
+        yield module
+
+
+@pytest.fixture
+def engine(mock_tesserocr):
+    ocr = TesserocrOCR()
+    ocr.initialize(lang="kor", tessdata_path="/opt/tessdata")
+    yield ocr
+    ocr.close()
+
+
+class TestTesserocrOCR:
+    def test_raw_pixels_skip_image_decoding(self, engine, mock_tesserocr):
+        raw = RawImage(b"\x00" * 12, width=2, height=2, channels=3, stride=6)
+        with patch("sayou.document.ocr.tesserocr_ocr.Image") as pil:
+            assert engine.ocr(raw) == "recognised"
+            pil.open.assert_not_called()
+
+        api = engine._engine()
+        api.SetImageBytes.assert_called_once_with(raw.samples, 2, 2, 3, 6)
+        mock_tesserocr.PyTessBaseAPI.assert_called_once_with(
+            lang="kor", path="/opt/tessdata"
+        )
+
+    def test_engine_is_resident_per_thread(self, engine, mock_tesserocr):
+        engine.ocr(b"png-1")
+        engine.ocr(b"png-2")
+        assert mock_tesserocr.PyTessBaseAPI.call_count == 1
+
+        worker = threading.Thread(target=engine.ocr, args=(b"png-3",))
+        worker.start()
+        worker.join()
+        assert mock_tesserocr.PyTessBaseAPI.call_count == 2
+
+    def test_close_releases_engines(self, engine):
+        engine.ocr(b"png")
+        api = engine._engine()
+        engine.close()
+        api.End.assert_called_once()
+        assert engine._engines == []
+
+    def test_thread_pool_batch(self, mock_tesserocr):
+        engine = TesserocrOCR()
+        engine.initialize(ocr_workers=3)
+        try:
+            images = [RawImage(bytes([i]) * 3, 1, 1, 3, 3) for i in range(4)]
+            texts = engine.ocr_batch(images)
+        finally:
+            engine.close()
+        assert texts == ["recognised"] * 4
+
+    def test_copies_load_their_own_engines(self, engine):
+        engine.ocr(b"png")
+        clone = pickle.loads(pickle.dumps(engine))
+        assert clone._engines == []
+        assert clone.lang == "kor"
+
+    def test_opt_in_by_engine_name(self, mock_tesserocr):
+        assert TesserocrOCR.can_handle(b"", "default") == 0.0
+        assert TesserocrOCR.can_handle(b"", "tesserocr") == 1.0
+
+    def test_missing_bindings(self):
+        with patch("sayou.document.ocr.tesserocr_ocr.tesserocr", None):
+            assert TesserocrOCR.can_handle(b"", "tesserocr") == 0.0
+            assert TesserocrOCR().ocr(b"png") == ""
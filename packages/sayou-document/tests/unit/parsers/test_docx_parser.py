@@ -174,3 +174,89 @@ class TestDocxParserParse:
         assert result.data[1] == ["Alice", "95"]
         assert result.cells[0][0].is_header is True  # first row
         assert result.cells[1][0].is_header is False  # subsequent rows
+
+
+# ---------------------------------------------------------------------------
+# Streaming path (real .docx built with python-docx)
+# ---------------------------------------------------------------------------
+
+
+def _build_docx() -> bytes:
+    import docx
+    import fitz
+    from docx.shared import Inches
+
+    png = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 4, 4), False).tobytes("png")
+    document = docx.Document()
+    document.add_heading("Report Title", 1)
+    paragraph = document.add_paragraph("Intro ")
+    paragraph.add_run("text bold").bold = True
+    document.add_paragraph("item one", style="List Bullet")
+    table = document.add_table(rows=3, cols=3)
+    for r in range(3):
+        for c in range(3):
+            table.cell(r, c).text = f"r{r}c{c}"
+    table.cell(0, 0).merge(table.cell(0, 1))
+    table.cell(1, 2).merge(table.cell(2, 2))
+    paragraph = document.add_paragraph("before image ")
+    paragraph.add_run().add_picture(BytesIO(png), width=Inches(1))
+    paragraph.add_run(" after image")
+    document.sections[0].header.paragraphs[0].text = "Header text"
+    document.sections[0].footer.paragraphs[0].text = "Footer text"
+    document.add_paragraph("line\twith tab")
+    buffer = BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def _summary(doc: Document) -> list:
+    page = doc.pages[0]
+    return [
+        [
+            (
+                e.type,
+                getattr(e, "text", None),
+                getattr(e, "data", None),
+                e.raw_attributes,
+                getattr(e, "image_bytes", None),
+            )
+            for e in elements
+        ]
+        for elements in (page.elements, page.header_elements, page.footer_elements)
+    ] + [page.text]
+
+
+class TestDocxParserStreaming:
+    def test_matches_python_docx_path(self):
+        file_bytes = _build_docx()
+        parser = DocxParser()
+
+        expected = parser._do_parse(file_bytes, "r.docx", streaming=False)
+        streamed = parser._do_parse(file_bytes, "r.docx", streaming=True)
+
+        assert _summary(streamed) == _summary(expected)
+        body = streamed.pages[0].elements
+        assert body[0].raw_attributes["heading_level"] == 1
+        assert body[2].raw_attributes["semantic_type"] == "list"
+        assert body[3].data[0] == ["r0c0\nr0c1", "r0c0\nr0c1", "r0c2"]
+        assert body[3].data[2][2] == "r1c2\nr2c2"
+        assert body[5].image_format == "png"
+
+    def test_large_files_skip_python_docx(self, monkeypatch):
+        file_bytes = _build_docx()
+        monkeypatch.setattr(DocxParser, "STREAMING_MIN_BYTES", len(file_bytes))
+
+        with patch("sayou.document.parser.docx_parser.DocxDocument") as MockDoc:
+            doc = DocxParser()._do_parse(file_bytes, "r.docx")
+
+        MockDoc.assert_not_called()
+        assert doc.pages[0].elements[0].id == "p1:body:para0:text_end"
+
+    def test_streaming_without_images(self):
+        doc = DocxParser()._do_parse(
+            _build_docx(), "r.docx", streaming=True, extract_images=False
+        )
+        texts = [e.text for e in doc.pages[0].elements if e.type == "text"]
+
+        assert all(e.type != "image" for e in doc.pages[0].elements)
+        assert "before image" in texts and "after image" in texts
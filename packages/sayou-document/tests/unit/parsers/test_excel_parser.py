@@ -157,3 +157,88 @@ class TestExcelParserParse:
         tbl = [e for e in doc.pages[0].elements if isinstance(e, TableElement)][0]
         # Empty row stripped — only header + Alice row
         assert len(tbl.data) == 2
+
+    @patch("sayou.document.parser.excel_parser.openpyxl")
+    def test_parse_iter_yields_sheets_in_order(self, mock_openpyxl):
+        wb = _make_workbook(
+            [
+                {"name": "Alpha", "rows": [["x"]]},
+                {"name": "Empty", "rows": []},
+                {"name": "Beta", "rows": [["y"]]},
+            ]
+        )
+        mock_openpyxl.load_workbook.return_value = wb
+
+        sheets = list(ExcelParser().parse_iter(b"PK", "multi.xlsx"))
+
+        assert [s.sheet_name for s in sheets] == ["Alpha", "Beta"]
+        assert [s.page_num for s in sheets] == [1, 3]
+
+
+# ---------------------------------------------------------------------------
+# Streaming (read-only) mode — real openpyxl
+# ---------------------------------------------------------------------------
+
+
+def _xlsx_bytes() -> bytes:
+    openpyxl = pytest.importorskip("openpyxl")
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Name", "Qty"])
+    ws.append(["Apple", 3])
+    ws.append([None, None])
+    ws.append(["Pear", 1.5])
+    ws.append(["Plum", None])
+    hidden = wb.create_sheet("Secret")
+    hidden.sheet_state = "hidden"
+    hidden.append(["x"])
+    buffer = BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+
+class TestExcelParserStreaming:
+    def test_rows_emitted_in_batches(self):
+        doc = ExcelParser()._do_parse(
+            _xlsx_bytes(), "big.xlsx", read_only=True, row_batch_size=2
+        )
+
+        tables = doc.pages[0].elements
+        assert [t.id for t in tables] == ["sheet:0", "sheet:0:batch1"]
+        assert [t.raw_attributes["row_offset"] for t in tables] == [0, 2]
+        assert tables[0].data == [["Name", "Qty"], ["Apple", "3"]]
+        assert tables[1].data == [["Pear", "1.5"], ["Plum", ""]]
+        assert all(t.cells == [] for t in tables)
+
+    def test_same_values_as_full_mode(self):
+        file_bytes = _xlsx_bytes()
+        full = ExcelParser()._do_parse(file_bytes, "a.xlsx", read_only=False)
+        streamed = ExcelParser()._do_parse(file_bytes, "a.xlsx", read_only=True)
+
+        for full_sheet, streamed_sheet in zip(full.pages, streamed.pages):
+            assert streamed_sheet.sheet_name == full_sheet.sheet_name
+            assert streamed_sheet.is_hidden == full_sheet.is_hidden
+            assert streamed_sheet.elements[0].data == full_sheet.elements[0].data
+
+    def test_large_files_stream_by_default(self, monkeypatch):
+        monkeypatch.setattr(ExcelParser, "STREAMING_MIN_BYTES", 1)
+        parser = ExcelParser()
+        with patch.object(
+            parser, "_stream_sheet", wraps=parser._stream_sheet
+        ) as stream:
+            doc = parser._do_parse(_xlsx_bytes(), "a.xlsx", skip_hidden=True)
+        assert stream.call_count == 1
+        assert [s.sheet_name for s in doc.pages] == ["Data"]
+
+    def test_automatic_streaming_warns(self, monkeypatch):
+        monkeypatch.setattr(ExcelParser, "STREAMING_MIN_BYTES", 1)
+        parser = ExcelParser()
+        with patch.object(parser, "_log") as log:
+            parser._do_parse(_xlsx_bytes(), "a.xlsx")
+            parser._do_parse(_xlsx_bytes(), "b.xlsx", read_only=True)
+
+        warnings = [c for c in log.call_args_list if c.kwargs.get("level") == "warning"]
+        assert len(warnings) == 1
+        assert "a.xlsx" in warnings[0].args[0]
+        assert "read_only=False" in warnings[0].args[0]
@@ -0,0 +1,172 @@
+"""
+Unit tests for HwpParser.
+
+Builds HWP 5.0 record streams in memory and serves them from a fake OLE
+container, so the tests run without olefile or sample documents.
+"""
+
+from __future__ import annotations
+
+import pickle
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from unittest.mock import patch
+
+from sayou.document.models import ImageElement, TextElement
+from sayou.document.plugins.hwp_parser import HwpParser, _BinData
+
+
+def _record(tag: int, payload: bytes, level: int = 0) -> bytes:
+    if len(payload) >= 0xFFF:
+        header = tag | (level << 10) | (0xFFF << 20)
+        return struct.pack("<II", header, len(payload)) + payload
+    return struct.pack("<I", tag | (level << 10) | (len(payload) << 20)) + payload
+
+
+def _paragraph(text: str) -> bytes:
+    return _record(66, bytes(12)) + _record(67, text.encode("utf-16-le"))
+
+
+def _picture(bin_id: int) -> bytes:
+    return _record(71, b"lle$" + struct.pack("<H", bin_id))
+
+
+def _deflate(data: bytes) -> bytes:
+    compressor = zlib.compressobj(wbits=-15)
+    return compressor.compress(data) + compressor.flush()
+
+
+class _FakeOle:
+    def __init__(self, streams: dict):
+        self.streams = streams
+        self.opened: list = []
+        self.closed = False
+
+    def exists(self, name: str) -> bool:
+        return any(k == name or k.startswith(name + "/") for k in self.streams)
+
+    def listdir(self) -> list:
+        return [k.split("/") for k in self.streams]
+
+    def openstream(self, path) -> BytesIO:
+        name = "/".join(path) if isinstance(path, list) else path
+        self.opened.append(name)
+        return BytesIO(self.streams[name])
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeHwpParser(HwpParser):
+    """Reads a pickled ``{stream path: bytes}`` dict instead of an OLE file."""
+
+    def _open_ole(self, file_bytes: bytes) -> _FakeOle:
+        self.ole = _FakeOle(pickle.loads(file_bytes))
+        return self.ole
+
+
+def _hwp_bytes() -> bytes:
+    return pickle.dumps(
+        {
+            "FileHeader": b"HWP Document File",
+            "BodyText/Section0": _deflate(_paragraph("First section") + _picture(1)),
+            "BodyText/Section1": _deflate(_paragraph("Second section")),
+            "BodyText/Section2": _deflate(_paragraph("Third section") + _picture(1)),
+            "BinData/BIN0001.png": _deflate(b"\x89PNG-one"),
+            "BinData/BIN0002.png": _deflate(b"\x89PNG-two"),
+        }
+    )
+
+
+# ---------------------------------------------------------------------------
+# Record walker / BinData
+# ---------------------------------------------------------------------------
+
+
+class TestHwpRecords:
+    def test_records_are_views_into_the_section(self):
+        data = _record(67, b"ab", level=2) + _record(71, b"x" * 5000)
+
+        records = list(HwpParser._walk_records(data))
+
+        assert [(tag, level, len(rec)) for tag, level, rec in records] == [
+            (67, 2, 2),
+            (71, 0, 5000),
+        ]
+        assert all(isinstance(rec, memoryview) for _, _, rec in records)
+        assert records[0][2].obj is data
+        assert records[0][2] == b"ab"
+
+    def test_truncated_record_stops_the_walk(self):
+        data = _record(67, b"abcd")[:-1]
+        assert list(HwpParser._walk_records(data)) == []
+
+    def test_bindata_inflated_on_first_reference(self):
+        ole = _FakeOle({"BinData/BIN0001.png": _deflate(b"img"), "FileHeader": b""})
+        store = _BinData(ole)
+
+        assert store.keys() == ["BIN0001"]
+        assert ole.opened == []
+        assert store.get("BIN0001") == b"img"
+        assert store.get("BIN0001") == b"img"
+        assert ole.opened == ["BinData/BIN0001.png"]
+        assert store.get("BIN0009") is None
+
+
+# ---------------------------------------------------------------------------
+# _do_parse
+# ---------------------------------------------------------------------------
+
+
+class TestHwpParserParse:
+    def test_sections_and_images(self):
+        doc = _FakeHwpParser()._do_parse(_hwp_bytes(), "report.hwp")
+
+        elements = doc.pages[0].elements
+        texts = [e.text for e in elements if isinstance(e, TextElement)]
+        assert texts == ["First section", "Second section", "Third section"]
+
+        images = [e for e in elements if isinstance(e, ImageElement)]
+        assert [e.raw_attributes["bin_key"] for e in images] == [
+            "BIN0001",
+            "BIN0001",
+            "BIN0002",
+        ]
+        assert images[0].image_bytes == b"\x89PNG-one"
+        assert images[2].raw_attributes["source"] == "unmatched_bindata"
+
+    def test_extract_images_false_reads_no_bindata(self):
+        parser = _FakeHwpParser()
+        doc = parser._do_parse(_hwp_bytes(), "report.hwp", extract_images=False)
+
+        assert not any(isinstance(e, ImageElement) for e in doc.pages[0].elements)
+        assert not any(name.startswith("BinData") for name in parser.ole.opened)
+
+    def test_container_closed_after_parse(self):
+        parser = _FakeHwpParser()
+        parser._do_parse(_hwp_bytes(), "report.hwp")
+
+        assert parser.ole.closed
+
+    def test_parallel_sections_match_sequential(self):
+        file_bytes = _hwp_bytes()
+        sequential = _FakeHwpParser()._do_parse(file_bytes, "report.hwp")
+        with patch(
+            "sayou.document.plugins.hwp_parser.ProcessPoolExecutor",
+            wraps=ProcessPoolExecutor,
+        ) as pool:
+            parallel = _FakeHwpParser()._do_parse(
+                file_bytes, "report.hwp", section_workers=2
+            )
+
+        assert pool.call_args.kwargs["max_workers"] == 2
+        assert parallel.model_dump() == sequential.model_dump()
+
+    def test_section_worker_count(self):
+        parser = HwpParser()
+        assert parser._section_workers(None, 8) == 1
+        assert parser._section_workers(4, 1) == 1
+        assert parser._section_workers(4, 3) == 3
+        assert parser._section_workers(0, 2) >= 1
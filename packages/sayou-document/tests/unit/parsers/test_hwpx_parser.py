@@ -0,0 +1,86 @@
+"""
+Unit tests for HwpxParser.
+
+Builds small HWPX (ZIP + OWPML XML) packages in memory.
+"""
+
+from __future__ import annotations
+
+import zipfile
+from io import BytesIO
+
+from sayou.document.models import TableElement, TextElement
+from sayou.document.plugins.hwpx_parser import HwpxParser
+
+_NS = (
+    'xmlns:hs="http://www.hancom.co.kr/hwpml/2011/section" '
+    'xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph"'
+)
+_HEADER = (
+    '<hh:head xmlns:hh="http://www.hancom.co.kr/hwpml/2011/head">'
+    '<hh:style id="0" name="바탕글"/><hh:style id="1" name="제목 1"/>'
+    "</hh:head>"
+)
+
+
+def _para(text: str, style: str = "0") -> str:
+    return (
+        f'<hp:p><hp:pPr><hp:pStyle id="{style}"/></hp:pPr>'
+        f"<hp:run><hp:t>{text}</hp:t></hp:run></hp:p>"
+    )
+
+
+def _table(rows) -> str:
+    body = "".join(
+        "<hp:tr>"
+        + "".join(f"<hp:tc>{_para(cell)}</hp:tc>" for cell in row)
+        + "</hp:tr>"
+        for row in rows
+    )
+    return f"<hp:tbl>{body}</hp:tbl>"
+
+
+def _hwpx(*sections: str) -> bytes:
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("mimetype", "application/hwp+zip")
+        zf.writestr("Contents/header.xml", _HEADER)
+        for idx, body in enumerate(sections):
+            zf.writestr(f"Contents/section{idx}.xml", f"<hs:sec {_NS}>{body}</hs:sec>")
+    return buffer.getvalue()
+
+
+class TestHwpxParserParse:
+    def test_paragraphs_tables_and_headings(self):
+        doc = HwpxParser()._do_parse(
+            _hwpx(
+                _para("개요", "1")
+                + _para("첫 문단")
+                + _para("이어지는 문단")
+                + _table([["이름", "점수"], ["가", "90"]]),
+                _para("두 번째 구역"),
+            ),
+            "report.hwpx",
+        )
+
+        elements = doc.pages[0].elements
+        assert [type(e) for e in elements] == [
+            TextElement,
+            TextElement,
+            TableElement,
+            TextElement,
+        ]
+        assert elements[0].raw_attributes["heading_level"] == 1
+        # Consecutive same-style paragraphs are merged.
+        assert elements[1].text == "첫 문단 이어지는 문단"
+        assert elements[2].data == [["이름", "점수"], ["가", "90"]]
+        assert elements[3].id.startswith("hwpx:report.hwpx:s1:")
+
+    def test_malformed_section_keeps_parsed_blocks(self):
+        truncated = _para("완전한 문단") + "<hp:p><hp:run>"
+        doc = HwpxParser()._do_parse(
+            _hwpx(truncated, _para("다음 구역")), "broken.hwpx"
+        )
+
+        texts = [e.text for e in doc.pages[0].elements]
+        assert texts == ["완전한 문단", "다음 구역"]
@@ -0,0 +1,163 @@
+"""
+Unit tests for ImageParser.
+
+Images are generated with Pillow in memory; OCR engines are stubs that
+record what they receive.
+"""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+from PIL import Image, ImageDraw
+
+from sayou.document.interfaces.base_ocr import BaseOCR, RawImage
+from sayou.document.models import ImageElement, TextElement
+from sayou.document.parser.image_parser import ImageParser
+
+
+class _RecordingOCR(BaseOCR):
+    component_name = "RecordingOCR"
+
+    def __init__(self, text: str = "recognised text", raw: bool = False):
+        super().__init__()
+        self.text = text
+        self.ACCEPTS_RAW = raw
+        self.received: list = []
+        self.options: list = []
+
+    def _do_ocr(self, image_bytes, **kwargs):
+        self.received.append(image_bytes)
+        self.options.append(kwargs)
+        return self.text
+
+
+def _scan(size=(600, 800), mode="RGB") -> "Image.Image":
+    """White page with dark horizontal bars standing in for text lines."""
+    image = Image.new(mode, size, "white")
+    draw = ImageDraw.Draw(image)
+    for top in range(60, size[1] - 60, 40):
+        draw.rectangle((50, top, size[0] - 50, top + 12), fill="black")
+    return image
+
+
+def _encode(image, fmt: str, **options) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt, **options)
+    return buffer.getvalue()
+
+
+# ---------------------------------------------------------------------------
+# can_handle
+# ---------------------------------------------------------------------------
+
+
+class TestImageParserCanHandle:
+    def test_magic_bytes(self):
+        assert ImageParser.can_handle(b"\xff\xd8\xff\xe0", "x") == 1.0
+        assert ImageParser.can_handle(b"\x89PNG\r\n\x1a\n", "x") == 1.0
+        assert ImageParser.can_handle(b"II*\x00", "x") == 1.0
+
+    def test_extension_fallback(self):
+        assert ImageParser.can_handle(b"\x00", "scan.TIF") == 0.8
+        assert ImageParser.can_handle(b"%PDF", "doc.pdf") == 0.0
+
+
+# ---------------------------------------------------------------------------
+# _do_parse
+# ---------------------------------------------------------------------------
+
+
+class TestImageParserParse:
+    def test_without_ocr_keeps_original_image(self):
+        data = _encode(_scan(), "PNG")
+
+        doc = ImageParser()._do_parse(data, "scan.png")
+
+        assert doc.doc_type == "image"
+        (element,) = doc.pages[0].elements
+        assert isinstance(element, ImageElement)
+        assert element.image_bytes == data
+        assert element.image_format == "png"
+        assert (doc.pages[0].width, doc.pages[0].height) == (600, 800)
+
+    def test_ocr_text_replaces_image(self):
+        ocr = _RecordingOCR()
+        doc = ImageParser(ocr_engine=ocr)._do_parse(_encode(_scan(), "PNG"), "a.png")
+
+        (element,) = doc.pages[0].elements
+        assert isinstance(element, TextElement)
+        assert element.id == "p1:full_ocr"
+        assert doc.pages[0].text == "recognised text"
+
+    def test_empty_ocr_falls_back_to_image(self):
+        ocr = _RecordingOCR(text="")
+        doc = ImageParser(ocr_engine=ocr)._do_parse(_encode(_scan(), "PNG"), "a.png")
+        assert isinstance(doc.pages[0].elements[0], ImageElement)
+
+    def test_untouched_pixels_pass_original_bytes(self):
+        data = _encode(_scan(mode="L"), "PNG")
+        ocr = _RecordingOCR()
+
+        ImageParser(ocr_engine=ocr)._do_parse(data, "gray.png")
+
+        assert ocr.received == [data]
+
+    def test_high_dpi_jpeg_downscaled_to_target(self):
+        data = _encode(_scan(size=(1200, 1600)), "JPEG", dpi=(600, 600))
+        ocr = _RecordingOCR()
+
+        doc = ImageParser(ocr_engine=ocr)._do_parse(data, "a.jpg", ocr_dpi=300)
+
+        sent = Image.open(io.BytesIO(ocr.received[0]))
+        assert sent.size == (600, 800)
+        assert sent.mode == "L"
+        # Page geometry still describes the original image.
+        assert doc.pages[0].width == 1200
+
+    def test_target_dpi_passed_to_engine(self):
+        ocr = _RecordingOCR()
+
+        ImageParser(ocr_engine=ocr)._do_parse(_encode(_scan(), "PNG"), "a.png")
+
+        assert ocr.options[0]["ocr_dpi"] == ImageParser.OCR_DPI
+
+    def test_raw_engine_receives_pixels(self):
+        ocr = _RecordingOCR(raw=True)
+
+        ImageParser(ocr_engine=ocr)._do_parse(_encode(_scan(), "PNG"), "a.png")
+
+        (raw,) = ocr.received
+        assert isinstance(raw, RawImage)
+        assert (raw.width, raw.height, raw.channels, raw.stride) == (600, 800, 1, 600)
+        assert len(raw.samples) == 600 * 800
+
+    def test_multi_frame_tiff_yields_page_per_frame(self):
+        frames = [_scan(), _scan(size=(300, 400))]
+        data = _encode(frames[0], "TIFF", save_all=True, append_images=frames[1:])
+
+        doc = ImageParser()._do_parse(data, "fax.tiff")
+
+        assert [p.page_num for p in doc.pages] == [1, 2]
+        assert doc.pages[1].width == 300
+        assert doc.pages[1].elements[0].image_format == "png"
+
+
+# ---------------------------------------------------------------------------
+# Deskew
+# ---------------------------------------------------------------------------
+
+
+class TestImageParserDeskew:
+    def test_estimates_rotation(self):
+        skewed = _scan(mode="L").rotate(-2.5, expand=True, fillcolor=255)
+        assert ImageParser()._estimate_skew(skewed) == pytest.approx(2.5)
+
+    def test_straight_scan_is_left_alone(self):
+        ocr = _RecordingOCR()
+        data = _encode(_scan(mode="L"), "PNG")
+
+        ImageParser(ocr_engine=ocr)._do_parse(data, "a.png", deskew=True)
+
+        assert ocr.received == [data]
@@ -162,6 +162,8 @@ class TestPdfParserParse:
         doc = parser._do_parse(b"%PDF-fake", "scanned.pdf")
 
         mock_ocr.ocr.assert_called_once()
+        # The render resolution reaches the engine (and its cache key).
+        assert mock_ocr.ocr.call_args.kwargs["ocr_dpi"] == 200
         text_elems = [e for e in doc.pages[0].elements if isinstance(e, TextElement)]
         assert any(e.text == "OCR extracted text" for e in text_elems)
 
@@ -184,4 +186,135 @@ class TestPdfParserParse:
 
         img_elems = [e for e in doc.pages[0].elements if isinstance(e, ImageElement)]
         assert len(img_elems) == 1
-        assert img_elems[0].image_base64 is not None
+        assert img_elems[0].image_bytes == image_block["image"]
+        assert img_elems[0].image_base64 is None  # encoded only on demand
+        assert img_elems[0].model_dump()["image_base64"] is not None
+
+    @patch("sayou.document.parser.pdf_parser.fitz")
+    def test_extract_images_false_skips_image_blocks(self, mock_fitz):
+        page = _make_fitz_page(text="text only")
+        mock_fitz.open.return_value = _make_fitz_doc([page])
+        mock_fitz.TEXTFLAGS_DICT = 0b111
+        mock_fitz.TEXT_PRESERVE_IMAGES = 0b100
+
+        PdfParser()._do_parse(b"%PDF-fake", "doc.pdf", extract_images=False)
+
+        assert page.get_text.call_args_list[-1].kwargs["flags"] == 0b011
+
+    @patch("sayou.document.parser.pdf_parser.fitz")
+    def test_text_level_makes_one_call_per_page(self, mock_fitz):
+        page = _make_fitz_page(text="  Plain page text.\n")
+        mock_fitz.open.return_value = _make_fitz_doc([page])
+        mock_fitz.TEXTFLAGS_DICT = 0
+
+        doc = PdfParser()._do_parse(b"%PDF-fake", "a.pdf", extraction_level="text")
+
+        page.get_text.assert_called_once_with()
+        (element,) = doc.pages[0].elements
+        assert element.text == "Plain page text."
+        assert element.id == "p1:text"
+        assert element.bbox.x1 == 612.0
+
+    @patch("sayou.document.parser.pdf_parser.fitz")
+    def test_layout_level_skips_images(self, mock_fitz):
+        page = _make_fitz_page(text="layout")
+        mock_fitz.open.return_value = _make_fitz_doc([page])
+        mock_fitz.TEXTFLAGS_DICT = 0b111
+        mock_fitz.TEXT_PRESERVE_IMAGES = 0b100
+
+        PdfParser()._do_parse(b"%PDF-fake", "a.pdf", extraction_level="layout")
+
+        assert page.get_text.call_args_list[-1].kwargs["flags"] == 0b011
+
+    @patch("sayou.document.parser.pdf_parser.fitz")
+    def test_unknown_extraction_level_raises(self, mock_fitz):
+        mock_fitz.open.return_value = _make_fitz_doc()
+        with pytest.raises(ValueError):
+            PdfParser()._do_parse(b"%PDF-fake", "a.pdf", extraction_level="fast")
+
+    @patch("sayou.document.parser.pdf_parser.fitz")
+    def test_page_selection_and_preview(self, mock_fitz):
+        pages = [_make_fitz_page(f"Page {i}") for i in range(5)]
+        mock_fitz.open.return_value = _make_fitz_doc(pages)
+        mock_fitz.TEXTFLAGS_DICT = 0
+
+        doc = PdfParser()._do_parse(b"%PDF-fake", "a.pdf", pages="2-4", max_pages=2)
+
+        assert [p.page_num for p in doc.pages] == [2, 3]
+        assert doc.page_count == 2
+        assert doc.metadata.extra == {"total_pages": 5}
+
+    def test_select_pages(self):
+        select = PdfParser._select_pages
+        assert select(5) == [0, 1, 2, 3, 4]
+        assert select(10, "1-3, 7,9-") == [0, 1, 2, 6, 8, 9]
+        assert select(5, [5, 1, 1, 42]) == [0, 4]
+        assert select(5, range(2, 6), max_pages=2) == [1, 2]
+        assert select(5, max_pages=0) == []
+        with pytest.raises(ValueError):
+            select(5, "one-two")
+
+
+# ---------------------------------------------------------------------------
+# Page-parallel parsing (real PyMuPDF)
+# ---------------------------------------------------------------------------
+
+
+def _make_pdf(page_count: int) -> bytes:
+    fitz = pytest.importorskip("fitz")
+    pdf = fitz.open()
+    for i in range(page_count):
+        page = pdf.new_page()
+        page.insert_text((72, 72), f"Page {i} heading", fontsize=18)
+        page.insert_text((72, 120), f"Body text of page number {i}.")
+    data = pdf.tobytes()
+    pdf.close()
+    return data
+
+
+class TestPdfParserParallel:
+    def test_worker_count_resolution(self):
+        parser = PdfParser()
+        parser.PARALLEL_MIN_PAGES = 4
+        assert parser._page_workers(None, 100) == 1  # PAGE_WORKERS default
+        assert parser._page_workers(8, 3) == 1  # below the threshold
+        assert parser._page_workers(8, 5) == 5  # capped at page count
+        assert parser._page_workers(0, 100) >= 1
+
+    def test_parallel_matches_sequential(self):
+        data = _make_pdf(9)
+        parser = PdfParser()
+        parser.PARALLEL_MIN_PAGES = 2
+
+        sequential = parser._do_parse(data, "multi.pdf", page_workers=1)
+        parallel = parser._do_parse(data, "multi.pdf", page_workers=2)
+
+        assert [p.page_num for p in parallel.pages] == list(range(1, 10))
+        assert parallel.model_dump() == sequential.model_dump()
+
+    def test_parallel_page_selection(self):
+        data = _make_pdf(9)
+        parser = PdfParser()
+        parser.PARALLEL_MIN_PAGES = 2
+
+        doc = parser._do_parse(
+            data, "multi.pdf", page_workers=2, pages="2-8", extraction_level="text"
+        )
+
+        assert [p.page_num for p in doc.pages] == list(range(2, 9))
+        assert doc.pages[0].elements[0].text.startswith("Page 1 heading")
+
+    def test_page_timings_emitted(self):
+        data = _make_pdf(4)
+        parser = PdfParser()
+        parser.PARALLEL_MIN_PAGES = 2
+        parser._emit = MagicMock()
+        parser._do_parse(data, "timed.pdf", page_workers=2)
+
+        timings = [
+            c.kwargs["payload"]
+            for c in parser._emit.call_args_list
+            if c.kwargs.get("event_name") == "page_parsed"
+        ]
+        assert [t["page_num"] for t in timings] == [1, 2, 3, 4]
+        assert all(t["seconds"] >= 0 for t in timings)
@@ -156,7 +156,15 @@ class TestPptxParserParse:
         doc = parser._do_parse(b"PK", "deck.pptx")
         img_elems = [e for e in doc.pages[0].elements if isinstance(e, ImageElement)]
         assert len(img_elems) == 1
-        assert img_elems[0].image_base64 is not None
+        assert img_elems[0].get_image_base64() is not None
+
+    @patch("sayou.document.parser.pptx_parser.Presentation")
+    def test_picture_shape_skipped_without_image_extraction(self, MockPrs):
+        shapes = [_make_picture_shape()]
+        MockPrs.return_value = _make_prs([{"shapes": shapes}])
+        doc = PptxParser()._do_parse(b"PK", "deck.pptx", extract_images=False)
+        elements = doc.pages[0].elements if doc.pages else []
+        assert not any(isinstance(e, ImageElement) for e in elements)
 
     @patch("sayou.document.parser.pptx_parser.Presentation")
     def test_table_shape_produces_table_element(self, MockPrs):
@@ -180,3 +188,118 @@ class TestPptxParserParse:
         tbl_elems = [e for e in doc.pages[0].elements if isinstance(e, TableElement)]
         assert len(tbl_elems) == 1
         assert tbl_elems[0].data[0] == ["A", "B"]
+
+
+# ---------------------------------------------------------------------------
+# Streaming path (real .pptx built with python-pptx)
+# ---------------------------------------------------------------------------
+
+
+def _build_pptx() -> bytes:
+    import io
+
+    import fitz
+    from pptx import Presentation
+    from pptx.chart.data import CategoryChartData
+    from pptx.enum.chart import XL_CHART_TYPE
+    from pptx.util import Inches
+
+    png = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 4, 4), False).tobytes("png")
+    prs = Presentation()
+    for i in range(2):
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = f"Slide {i} title"
+        slide.placeholders[1].text_frame.text = f"Bullet {i}"
+        box = slide.shapes.add_textbox(Inches(1), Inches(5), Inches(3), Inches(1))
+        box.text_frame.text = "Text\vbox"
+        slide.shapes.add_picture(io.BytesIO(png), Inches(6), Inches(1))
+        table = slide.shapes.add_table(
+            2, 2, Inches(1), Inches(6), Inches(4), Inches(1)
+        ).table
+        for r in range(2):
+            for c in range(2):
+                table.cell(r, c).text = f"t{r}{c}"
+        group = slide.shapes.add_group_shape()
+        grouped = group.shapes.add_textbox(Inches(7), Inches(6), Inches(1), Inches(1))
+        grouped.text_frame.text = "grouped"
+        slide.notes_slide.notes_text_frame.text = f"note {i}"
+
+    chart_data = CategoryChartData()
+    chart_data.categories = ["A", "B", "C"]
+    chart_data.add_series("S1", (1.0, 2.5, 3.0))
+    chart = (
+        prs.slides[0]
+        .shapes.add_chart(
+            XL_CHART_TYPE.COLUMN_CLUSTERED,
+            Inches(5),
+            Inches(3),
+            Inches(4),
+            Inches(3),
+            chart_data,
+        )
+        .chart
+    )
+    chart.has_title = True
+    chart.chart_title.text_frame.text = "Sales"
+
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
+
+
+def _summary(doc: Document) -> list:
+    return [
+        (
+            slide.text,
+            slide.note_text,
+            [
+                (
+                    e.id,
+                    e.type,
+                    e.bbox,
+                    getattr(e, "text", None),
+                    getattr(e, "data", None),
+                    getattr(e, "text_representation", None),
+                    e.raw_attributes,
+                    getattr(e, "image_bytes", None),
+                )
+                for e in slide.elements
+            ],
+        )
+        for slide in doc.pages
+    ]
+
+
+class TestPptxParserStreaming:
+    def test_matches_python_pptx_path(self):
+        file_bytes = _build_pptx()
+        parser = PptxParser()
+
+        expected = parser._do_parse(file_bytes, "deck.pptx", streaming=False)
+        streamed = parser._do_parse(file_bytes, "deck.pptx", streaming=True)
+
+        assert _summary(streamed) == _summary(expected)
+        elements = streamed.pages[0].elements
+        title = elements[0]
+        assert title.raw_attributes["placeholder_type"] == "TITLE (1)"
+        # The title placeholder has no xfrm of its own: inherited from the layout.
+        assert title.bbox is not None
+        chart = next(e for e in elements if isinstance(e, ChartElement))
+        assert chart.chart_type == "COLUMN_CLUSTERED (51)"
+        assert chart.raw_attributes["category_count"] == 3
+        assert "- S1: [1.0, 2.5, 3.0]" in chart.text_representation
+
+    def test_large_files_stream_slide_by_slide(self, monkeypatch):
+        file_bytes = _build_pptx()
+        monkeypatch.setattr(PptxParser, "STREAMING_MIN_BYTES", len(file_bytes))
+        parser = PptxParser()
+        parser._emit = MagicMock()
+
+        with patch("sayou.document.parser.pptx_parser.Presentation") as MockPrs:
+            slides = parser.parse_iter(file_bytes, "deck.pptx")
+            first = next(slides)
+            rest = list(slides)
+
+        MockPrs.assert_not_called()
+        assert first.page_num == 1 and first.note_text == "note 0"
+        assert [s.page_num for s in rest] == [2]
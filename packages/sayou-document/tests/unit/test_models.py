@@ -153,6 +153,35 @@ class TestImageElement:
         img = ImageElement(id="img3", meta=ElementMetadata(page_num=1))
         assert img.text == ""
 
+    def test_attached_bytes_encoded_lazily(self):
+        img = ImageElement(id="img4", meta=ElementMetadata(page_num=1))
+        img.attach_data(b"--PNG--", offset=2, length=3)
+        assert img.has_image
+        assert img.image_base64 is None
+        assert img.image_bytes == b"PNG"
+        assert img.get_image_base64() == "UE5H"
+        assert img.image_base64 is None  # not stored on the element
+
+    def test_serialisation_includes_attached_image(self):
+        img = ImageElement(id="img5", meta=ElementMetadata(page_num=1))
+        img.attach_data(b"PNG")
+        page = Page(page_num=1, elements=[img])
+        assert page.model_dump()["elements"][0]["image_base64"] == "UE5H"
+        assert "UE5H" in page.model_dump_json()
+        assert "image_base64" not in img.model_dump(exclude={"image_base64"})
+
+        restored = Page.model_validate(page.model_dump())
+        assert restored.elements[0].image_bytes == b"PNG"
+
+    def test_pickle_keeps_only_referenced_slice(self):
+        import pickle
+
+        img = ImageElement(id="img6", meta=ElementMetadata(page_num=1))
+        img.attach_data(b"x" * 1000 + b"PNG", offset=1000)
+        data = pickle.dumps(img)
+        assert len(data) < 1000
+        assert pickle.loads(data).image_bytes == b"PNG"
+
 
 # ---------------------------------------------------------------------------
 # ChartElement
@@ -5,11 +5,16 @@ Covers:
 - _register_manual routing (Bug #5 regression)
 - _resolve_component score selection
 - run() orchestration with mocked parsers
+- run_stream() page streaming
+- run_many() batches: warm parsers, magic-byte dispatch, failure isolation
 - process() facade
 """
 
 from __future__ import annotations
 
+import io
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -19,7 +24,7 @@ from sayou.document.interfaces.base_converter import BaseConverter
 from sayou.document.interfaces.base_ocr import BaseOCR
 from sayou.document.interfaces.base_parser import BaseDocumentParser
 from sayou.document.models import Document, Page
-from sayou.document.pipeline import DocumentPipeline
+from sayou.document.pipeline import DocumentPipeline, _sniff_type
 
 # ---------------------------------------------------------------------------
 # Minimal stubs
@@ -44,6 +49,22 @@ class _FakeParser(BaseDocumentParser):
         )
 
 
+class _CountingParser(_FakeParser):
+    """Counts instantiations and fails on bytes starting with ``corrupt``."""
+
+    component_name = "CountingParser"
+    instances = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        type(self).instances += 1
+
+    def _do_parse(self, file_bytes, file_name, **kwargs):
+        if file_bytes.startswith(b"corrupt"):
+            raise ValueError("corrupt file")
+        return super()._do_parse(file_bytes, file_name, **kwargs)
+
+
 class _FakeConverter(BaseConverter):
     component_name = "FakeConverter"
     SUPPORTED_TYPES = [".img"]
@@ -204,6 +225,36 @@ class TestDocumentPipelineRun:
         # add_callback on _FakeParser instances is inherited from BaseComponent
         # We just verify run() completes without AttributeError
 
+    def test_run_stream_yields_pages(self):
+        pipeline = self._pipeline_with_parser(_FakeParser)
+        pages = list(pipeline.run_stream(b"fake content", "report.fake"))
+        assert [p.page_num for p in pages] == [1]
+
+    def test_run_stream_is_lazy(self):
+        calls = []
+
+        class _StreamingParser(_FakeParser):
+            def _iter_pages(self, file_bytes, file_name, **kwargs):
+                for n in (1, 2, 3):
+                    calls.append(n)
+                    yield Page(page_num=n)
+
+        pipeline = self._pipeline_with_parser(_StreamingParser)
+        stream = pipeline.run_stream(b"fake content", "report.fake")
+        assert next(stream).page_num == 1
+        assert calls == [1]
+        assert [p.page_num for p in stream] == [2, 3]
+
+    def test_run_stream_wraps_parser_errors(self):
+        class _BrokenParser(_FakeParser):
+            def _iter_pages(self, file_bytes, file_name, **kwargs):
+                yield Page(page_num=1)
+                raise ValueError("corrupt page")
+
+        pipeline = self._pipeline_with_parser(_BrokenParser)
+        with pytest.raises(ParserError):
+            list(pipeline.run_stream(b"fake content", "report.fake"))
+
 
 # ---------------------------------------------------------------------------
 # process() facade
@@ -220,3 +271,156 @@ class TestDocumentPipelineProcess:
                 result = DocumentPipeline.process.__func__(
                     DocumentPipeline, b"bytes", "f.fake"
                 )
+
+
+# ---------------------------------------------------------------------------
+# run_many()
+# ---------------------------------------------------------------------------
+
+
+def _zip_bytes(member: str) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr(member, b"<x/>")
+    return buffer.getvalue()
+
+
+class TestSniffType:
+    def test_signature_wins_over_extension(self):
+        assert _sniff_type(b"%PDF-1.7", "scan.bin") == ".pdf"
+        assert _sniff_type(b"\x89PNG\r\n\x1a\n....", "photo") == ".png"
+
+    def test_zip_package_detected_from_members(self):
+        assert _sniff_type(_zip_bytes("word/document.xml"), "upload") == ".docx"
+        assert _sniff_type(_zip_bytes("ppt/presentation.xml"), "a.zip") == ".pptx"
+        assert _sniff_type(_zip_bytes("xl/workbook.xml"), "b.xlsm") == ".xlsm"
+
+    def test_ole_needs_extension(self):
+        ole = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+        assert _sniff_type(ole, "report.HWP") == ".hwp"
+        assert _sniff_type(ole, "report.bin") is None
+
+    def test_unknown_signature_uses_extension(self):
+        assert _sniff_type(b"fake content", "report.fake") == ".fake"
+
+
+class TestDocumentPipelineRunMany:
+    def _pipeline(self, *parser_classes):
+        with patch.object(DocumentPipeline, "_register"), patch.object(
+            DocumentPipeline, "_load_from_registry"
+        ), patch.object(DocumentPipeline, "initialize"):
+            p = DocumentPipeline.__new__(DocumentPipeline)
+            p.converter_cls_map = {}
+            p.ocr_cls_map = {}
+            p.parser_cls_map = {c.component_name: c for c in parser_classes}
+            p._callbacks = []
+            p.global_config = {}
+        return p
+
+    def test_one_warm_parser_per_type(self):
+        _CountingParser.instances = 0
+        pipeline = self._pipeline(_CountingParser)
+        files = [(b"fake content", f"doc{i}.fake") for i in range(5)]
+
+        results = list(pipeline.run_many(files))
+
+        assert [r.index for r in results] == [0, 1, 2, 3, 4]
+        assert all(r.ok and isinstance(r.document, Document) for r in results)
+        assert _CountingParser.instances == 1
+
+    def test_dispatch_by_magic_bytes_skips_scoring(self):
+        class _PdfParser(_FakeParser):
+            component_name = "PdfLike"
+            SUPPORTED_TYPES = [".pdf"]
+
+        pipeline = self._pipeline(_PdfParser, _FakeParser)
+        with patch.object(
+            _PdfParser, "can_handle", side_effect=AssertionError("scored")
+        ), patch.object(
+            _FakeParser, "can_handle", side_effect=AssertionError("scored")
+        ):
+            results = list(
+                pipeline.run_many([(b"%PDF-1.7", "scan.bin"), (b"x", "a.fake")])
+            )
+
+        assert [r.document.file_name for r in results] == ["scan.bin", "a.fake"]
+
+    def test_unknown_type_falls_back_to_scoreboard(self):
+        pipeline = self._pipeline(_FakeParser)
+        with patch.object(
+            pipeline, "_resolve_component", wraps=pipeline._resolve_component
+        ) as resolve:
+            results = list(pipeline.run_many([(b"data", "unknown.xyz")]))
+
+        assert resolve.called
+        assert not results[0].ok
+        assert results[0].error.startswith("ParserError")
+
+    def test_failures_are_isolated(self):
+        _CountingParser.instances = 0
+        pipeline = self._pipeline(_CountingParser)
+        files = [
+            (b"fake content", "a.fake"),
+            (b"corrupt bytes", "b.fake"),
+            (b"", "c.fake"),
+            (b"fake content", "d.fake"),
+        ]
+
+        results = list(pipeline.run_many(files))
+
+        assert [r.ok for r in results] == [True, False, False, True]
+        assert "corrupt file" in results[1].error
+        assert "empty" in results[2].error
+        # The parser that failed is replaced rather than reused.
+        assert _CountingParser.instances == 2
+
+    def test_cache_is_applied_in_process(self):
+        cache = MagicMock()
+        cache.key.side_effect = lambda *a, **k: k["file_name"]
+        cache.get.side_effect = lambda key, **k: (
+            Document(file_name="cached", file_id="c", doc_type="pdf")
+            if key == "a.fake"
+            else None
+        )
+        pipeline = self._pipeline(_FakeParser)
+
+        results = list(
+            pipeline.run_many(
+                [(b"fake content", "a.fake"), (b"fake content", "b.fake")],
+                cache=cache,
+            )
+        )
+
+        assert [r.document.file_name for r in results] == ["cached", "b.fake"]
+        cache.set.assert_called_once_with("b.fake", results[1].document)
+
+    def test_process_pool(self):
+        pipeline = self._pipeline(_CountingParser)
+        files = [(b"fake content", f"doc{i}.fake") for i in range(6)]
+        files[3] = (b"corrupt bytes", "doc3.fake")
+
+        with patch(
+            "sayou.document.pipeline.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+        ) as pool:
+            results = sorted(pipeline.run_many(files, workers=2), key=lambda r: r.index)
+
+        assert pool.call_args.kwargs["max_workers"] == 2
+        assert [r.file_name for r in results] == [f"doc{i}.fake" for i in range(6)]
+        assert [r.ok for r in results] == [True, True, True, False, True, True]
+        assert results[0].document.file_name == "doc0.fake"
+
+    def test_process_pool_reports_queue_depth(self):
+        pipeline = self._pipeline(_CountingParser)
+        files = [(b"fake content", f"doc{i}.fake") for i in range(6)]
+
+        with patch.object(pipeline, "_emit") as emit:
+            list(pipeline.run_many(files, workers=2))
+
+        depths = [
+            c.kwargs["payload"]
+            for c in emit.call_args_list
+            if c.kwargs.get("event_name") == "queue_depth"
+        ]
+        limit = 2 * pipeline.BATCH_PREFETCH
+        assert depths[0] == limit
+        assert all(0 < depth <= limit for depth in depths)
@@ -0,0 +1,102 @@
+"""
+Unit tests for the zip-package helpers shared by the OOXML / OWPML parsers.
+"""
+
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+import zipfile
+from io import BytesIO
+
+from sayou.document.utils.ooxml import OoxmlPackage, iter_complete
+
+
+def _package(parts: dict) -> bytes:
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        for name, data in parts.items():
+            zf.writestr(name, data)
+    return buffer.getvalue()
+
+
+class TestIterComplete:
+    def test_yields_complete_children_and_detaches_them(self):
+        xml = b"<root><a><x/><x/></a><b>text</b><a/></root>"
+        seen = []
+        for elem in iter_complete(BytesIO(xml), depth=1):
+            seen.append((elem.tag, len(elem), elem.text))
+
+        assert seen == [("a", 2, None), ("b", 0, "text"), ("a", 0, None)]
+
+    def test_consumed_elements_are_detached(self, monkeypatch):
+        roots = []
+        iterparse = ET.iterparse
+
+        def spy(source, events):
+            for event, elem in iterparse(source, events):
+                if not roots:
+                    roots.append(elem)
+                yield event, elem
+
+        monkeypatch.setattr(ET, "iterparse", spy)
+        xml = b"<root>" + b"<p><r/></p>" * 20_000 + b"</root>"
+
+        held = [len(roots[0]) for _ in iter_complete(BytesIO(xml), depth=1)]
+
+        # Only the elements of the chunk being parsed are ever attached.
+        assert len(held) == 20_000
+        assert max(held) < 5_000
+        assert len(roots[0]) == 0
+
+    def test_nested_depth(self):
+        xml = b"<doc><body><p>1</p><tbl><p>nested</p></tbl><p>2</p></body></doc>"
+        tags = [(e.tag, e.text) for e in iter_complete(BytesIO(xml), depth=2)]
+        assert tags == [("p", "1"), ("tbl", None), ("p", "2")]
+
+
+class TestOoxmlPackage:
+    def test_relationships_and_content_types(self):
+        rels = (
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+            'relationships">'
+            '<Relationship Id="rId1" Type="http://x/relationships/image" '
+            'Target="media/image1.jpeg"/>'
+            '<Relationship Id="rId2" Type="http://x/relationships/styles" '
+            'Target="/word/styles.xml"/>'
+            '<Relationship Id="rId3" Type="http://x/relationships/hyperlink" '
+            'Target="https://example.com" TargetMode="External"/>'
+            "</Relationships>"
+        )
+        types = (
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/'
+            'content-types">'
+            '<Default Extension="jpeg" ContentType="image/jpeg"/>'
+            '<Override PartName="/word/styles.xml" ContentType="text/xml"/>'
+            "</Types>"
+        )
+        package = OoxmlPackage(
+            _package(
+                {
+                    "[Content_Types].xml": types,
+                    "word/document.xml": "<d/>",
+                    "word/_rels/document.xml.rels": rels,
+                    "word/media/image1.jpeg": b"jpg",
+                }
+            )
+        )
+
+        assert package.rels("word/document.xml") == {
+            "rId1": ("image", "word/media/image1.jpeg"),
+            "rId2": ("styles", "word/styles.xml"),
+            "rId3": ("hyperlink", "https://example.com"),
+        }
+        assert package.rels("word/missing.xml") == {}
+        assert package.content_type("word/media/image1.jpeg") == "image/jpeg"
+        assert package.content_type("word/styles.xml") == "text/xml"
+        assert package.read("word/media/image1.jpeg") == b"jpg"
+
+    def test_close_releases_the_source_stream(self):
+        package = OoxmlPackage(_package({"word/document.xml": "<d/>"}))
+        package.close()
+
+        assert package._stream.closed
@@ -2,7 +2,7 @@ from abc import abstractmethod
 from typing import Any
 
 from sayou.core.base_component import BaseComponent
-from sayou.core.decorators import measure_time, retry
+from sayou.core.decorators import endpoint_of, measure_time, retry
 
 from ..core.exceptions import WriterError
 
@@ -12,11 +12,21 @@ class BaseWriter(BaseComponent):
     (Tier 1) Abstract base class for data writers (Loaders).
 
     Implements the Template Method pattern with built-in retries and logging.
+
+    Only ``_do_write`` is retried, and only on transient errors (see
+    ``sayou.core.decorators.is_retryable``).  All writers talking to the same
+    endpoint share one circuit breaker, so once a backend is known to be down
+    further writes fail immediately instead of stalling through back-off.
     """
 
     component_name = "BaseWriter"
     SUPPORTED_TYPES = []
 
+    # True when successive writes to one destination add to it (insert,
+    # upsert, append) instead of replacing it, so a run may load its output
+    # in several batches.  Later batches are written with ``mode="a"``.
+    INCREMENTAL = False
+
     @classmethod
     def can_handle(
         cls, input_data: Any, destination: str, strategy: str = "auto"
@@ -27,7 +37,6 @@ class BaseWriter(BaseComponent):
         return 0.0
 
     @measure_time
-    @retry(max_retries=3, delay=1.0)
     def write(self, input_data: Any, destination: str, **kwargs) -> bool:
         """
         [Template Method] Execute the write operation.
@@ -41,7 +50,8 @@ class BaseWriter(BaseComponent):
             bool: True if successful.
 
         Raises:
-            WriterError: If writing fails after retries.
+            WriterError: If writing fails after retries, on a non-retryable
+                error, or while the destination's circuit breaker is open.
         """
         self._emit("on_start", input_data={"destination": destination})
         self._log(f"Writing to '{destination}' (Type: {type(input_data).__name__})")
@@ -51,7 +61,7 @@ class BaseWriter(BaseComponent):
             return False
 
         try:
-            result = self._do_write(input_data, destination, **kwargs)
+            result = self._write_with_retry(input_data, destination, **kwargs)
             self._emit("on_finish", result_data={"success": result}, success=result)
             if result:
                 self._log("Write completed successfully.")
@@ -62,7 +72,14 @@ class BaseWriter(BaseComponent):
         except Exception as e:
             self._emit("on_error", error=e)
             self.logger.error(f"Write failed: {e}", exc_info=True)
-            raise WriterError(f"[{self.component_name}] Failed: {str(e)}")
+            raise WriterError(f"[{self.component_name}] Failed: {str(e)}") from e
+
+    def _breaker_key(self, input_data: Any, destination: str, **kwargs) -> str:
+        return f"{self.component_name}:{endpoint_of(destination)}"
+
+    @retry(max_retries=3, delay=1.0, timeout=10.0, breaker=_breaker_key)
+    def _write_with_retry(self, input_data: Any, destination: str, **kwargs) -> bool:
+        return self._do_write(input_data, destination, **kwargs)
 
     @abstractmethod
     def _do_write(self, input_data: Any, destination: str, **kwargs) -> bool:
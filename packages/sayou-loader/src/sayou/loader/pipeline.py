@@ -192,6 +192,20 @@ class LoaderPipeline(BaseComponent):
             self._emit("on_error", error=e)
             raise e
 
+    def supports_incremental(self, destination: str, strategy: str = "auto") -> bool:
+        """
+        Whether the writer chosen for ``destination`` can load in batches.
+
+        Args:
+            destination (str): Target location/URI.
+            strategy (str): The writer strategy that will be used.
+
+        Returns:
+            bool: True if the writer's ``INCREMENTAL`` flag is set.
+        """
+        writer_cls = self._resolve_writer(None, destination, strategy)
+        return bool(getattr(writer_cls, "INCREMENTAL", False))
+
     def _resolve_writer(
         self,
         raw_data: Any,
@@ -26,6 +26,7 @@ class BigQueryWriter(BaseWriter):
 
     component_name = "BigQueryWriter"
     SUPPORTED_TYPES = ["bigquery", "bq", "gcp"]
+    INCREMENTAL = True
 
     @classmethod
     def can_handle(
@@ -22,6 +22,7 @@ class ChromaWriter(BaseWriter):
 
     component_name = "ChromaWriter"
     SUPPORTED_TYPES = ["chroma", "chromadb"]
+    INCREMENTAL = True
 
     @classmethod
     def can_handle(
@@ -23,6 +23,7 @@ class ElasticsearchWriter(BaseWriter):
 
     component_name = "ElasticsearchWriter"
     SUPPORTED_TYPES = ["elasticsearch"]
+    INCREMENTAL = True
 
     @classmethod
     def can_handle(
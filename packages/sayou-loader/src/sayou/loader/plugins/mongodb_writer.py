@@ -24,6 +24,7 @@ class MongoDBWriter(BaseWriter):
 
     component_name = "MongoDBWriter"
     SUPPORTED_TYPES = ["mongodb"]
+    INCREMENTAL = True
 
     @classmethod
     def can_handle(
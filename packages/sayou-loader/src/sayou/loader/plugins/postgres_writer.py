@@ -23,6 +23,7 @@ class PostgresWriter(BaseWriter):
     """
 
     component_name = "PostgresWriter"
+    INCREMENTAL = True
 
     @classmethod
     def can_handle(
@@ -14,6 +14,7 @@ class ConsoleWriter(BaseWriter):
 
     component_name = "ConsoleWriter"
     SUPPORTED_TYPES = ["console", "stdout", "print"]
+    INCREMENTAL = True
 
     @classmethod
     def can_handle(
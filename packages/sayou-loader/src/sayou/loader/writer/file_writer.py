@@ -2,8 +2,10 @@ import json
 import os
 import pickle
 import re
+import shutil
 from typing import Any
 
+from sayou.core.payload import SpooledPayload
 from sayou.core.registry import register_component
 
 from ..interfaces.base_writer import BaseWriter
@@ -80,6 +82,14 @@ class FileWriter(BaseWriter):
 
             # 4. Save Logic (Type-based Writing)
 
+            # Case 0: Spilled payload (Connector) - copy it through in chunks
+            # instead of loading a possibly multi-GB file into memory.
+            if isinstance(real_content, SpooledPayload):
+                with real_content.open() as src, open(destination, "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+                self._log(f"💾 Saved to {destination} ({len(real_content)} bytes)")
+                return True
+
             # Case A: Binary (Bytes)
             if isinstance(real_content, bytes):
                 write_mode = "wb"
@@ -193,6 +203,9 @@ class FileWriter(BaseWriter):
             return ".txt"
 
         # [Binary Sniffing]
+        if isinstance(data, SpooledPayload):
+            with data.open() as f:
+                data = f.read(16)
         if isinstance(data, bytes):
             # Magic Numbers (File Header Signature)
             if data.startswith(b"PK\x03\x04"):
@@ -18,6 +18,7 @@ class JsonLineWriter(BaseWriter):
 
     component_name = "JsonLineWriter"
     SUPPORTED_TYPES = ["jsonl", "stream"]
+    INCREMENTAL = True
 
     @classmethod
     def can_handle(
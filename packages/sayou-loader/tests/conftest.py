@@ -157,7 +157,7 @@ if "sayou.core" not in sys.modules:
         w.__name__ = fn.__name__
         return w
 
-    def retry(max_retries=3, delay=1.0):
+    def retry(max_retries=3, delay=1.0, **kwargs):
         """Stub: no-op retry decorator for tests."""
 
         def decorator(fn):
@@ -170,6 +170,7 @@ if "sayou.core" not in sys.modules:
         return decorator
 
     _dec.retry = retry
+    _dec.endpoint_of = str
     _dec.safe_run = safe_run
     _dec.measure_time = measure_time
     sys.modules["sayou.core.decorators"] = _dec
@@ -190,7 +191,33 @@ if "sayou.core" not in sys.modules:
     _reg.register_component = register_component
     sys.modules["sayou.core.registry"] = _reg
 
+    # lazy.py has no dependencies: load the real module instead of a stub.
+    _lazy_path = next(
+        _src / "sayou" / "core" / "lazy.py"
+        for _src in _src_dirs
+        if (_src / "sayou" / "core" / "lazy.py").is_file()
+    )
+    _lazy_spec = importlib.util.spec_from_file_location("sayou.core.lazy", _lazy_path)
+    _lazy = importlib.util.module_from_spec(_lazy_spec)
+    _lazy_spec.loader.exec_module(_lazy)
+    sys.modules["sayou.core.lazy"] = _lazy
+
+    # payload.py is standard-library only as well.
+    _payload_path = next(
+        _src / "sayou" / "core" / "payload.py"
+        for _src in _src_dirs
+        if (_src / "sayou" / "core" / "payload.py").is_file()
+    )
+    _payload_spec = importlib.util.spec_from_file_location(
+        "sayou.core.payload", _payload_path
+    )
+    _payload = importlib.util.module_from_spec(_payload_spec)
+    _payload_spec.loader.exec_module(_payload)
+    sys.modules["sayou.core.payload"] = _payload
+
     _core = types.ModuleType("sayou.core")
+    _core.lazy = _lazy
+    _core.payload = _payload
     _core.exceptions = _exc
     _core.schemas = _schemas
     _core.base_component = _bc
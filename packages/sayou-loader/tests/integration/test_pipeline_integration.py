@@ -62,6 +62,20 @@ class TestFileWriterIntegration:
         assert result is True
         assert not os.path.exists(dest)
 
+    def test_spilled_payload_copied_byte_for_byte(self, tmp_path):
+        from sayou.core.payload import SpooledPayload
+
+        src = tmp_path / "big.dat"
+        body = b"%PDF-1.7\n" + os.urandom(256 * 1024)
+        src.write_bytes(body)
+        payload = SpooledPayload.from_path(str(src), threshold=64 * 1024)
+        assert payload.is_spilled
+
+        pipeline = LoaderPipeline(extra_writers=[FileWriter])
+        dest = tmp_path / "out" / "copy"
+        assert pipeline.run(payload, str(dest), strategy="FileWriter") is True
+        assert (tmp_path / "out" / "copy.pdf").read_bytes() == body
+
 
 # ---------------------------------------------------------------------------
 # JsonLineWriter integration
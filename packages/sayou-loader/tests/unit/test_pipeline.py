@@ -113,6 +113,18 @@ class TestResolveWriter:
         p.writers_cls_map = {"Zero": cls}
         assert p._resolve_writer([], "dst", "auto") is None
 
+    def test_supports_incremental_follows_resolved_writer(self):
+        from sayou.loader.writer.file_writer import FileWriter
+        from sayou.loader.writer.jsonl_writer import JsonLineWriter
+
+        p = _bare_pipeline()
+        p.writers_cls_map = {"FileWriter": FileWriter, "JsonLineWriter": JsonLineWriter}
+        assert p.supports_incremental("out/nodes.jsonl") is True
+        assert p.supports_incremental("out/graph.json") is False
+        assert p.supports_incremental("out/graph.json", "JsonLineWriter") is True
+        p.writers_cls_map = {}
+        assert p.supports_incremental("out/nodes.jsonl") is False
+
 
 # ---------------------------------------------------------------------------
 # run()
@@ -5,7 +5,7 @@ Normalise a `Document` object into Markdown `SayouBlock` objects using
 
 `DocMarkdownNormalizer` accepts the output of `DocumentPipeline` (a Pydantic
 `Document` model or its `.model_dump()` dict) and converts each page into
-one `SayouBlock` of type `"md"`.  Images become separate `"image_base64"`
+one `SayouBlock` of type `"md"`.  A model is walked as-is, never dumped.  Images become separate `"image_base64"`
 blocks that are emitted directly without being merged into the page text.
 
 Element mapping:
@@ -157,7 +157,9 @@ print(md_blocks[0].content)
 # ── Image Blocks
 """
 `image_base64` blocks are emitted as separate entries so downstream
-processes can handle text and images independently.
+processes can handle text and images independently.  Pass
+`include_images=False` to skip them; images attached to a `Document`
+model are then never Base64-encoded.
 """
 img_blocks = [b for b in blocks if b.type == "image_base64"]
 print("\n=== Image Blocks ===")
@@ -15,8 +15,8 @@ Available processors:
 | `PiiMasker`          | text, md         | Mask emails → `[EMAIL]`, phones → `[PHONE]` |
 | `LinkProcessor`      | text             | Extract URLs to metadata; optionally remove  |
 | `Deduplicator`       | any              | Drop blocks with identical content           |
-| `Imputer`            | record (dict)    | Fill `None` fields with default values       |
-| `OutlierHandler`     | record (dict)    | Drop or clamp out-of-range numerical values  |
+| `Imputer`            | record (rows)    | Fill `None` fields with defaults or stats    |
+| `OutlierHandler`     | record (rows)    | Drop or clamp out-of-range numerical values  |
 | `RecursivePruner`    | any              | Remove `None`, `""`, `[]`, `{}`, `"NULL"`    |
 """
 import json
@@ -69,11 +69,15 @@ for b in clean_blocks:
 # ── PiiMasker
 """
 Replaces email addresses with `[EMAIL]` and phone numbers with `[PHONE]`
-using regex.  Operates on `text` and `md` blocks only.
+in a single scan.  Operates on `text` and `md` blocks only.
 
 Config:
 - `mask_email` — default `True`
 - `mask_phone` — default `True`
+- `pii_types` — opt in to `rrn`, `card` (Luhn-checked), `account`,
+  `address`
+- `pii_action` — `mask` (default), `hash` (needs a secret `hash_salt`) or
+  `drop`; spans are recorded in `metadata["pii_spans"]`
 """
 pii_pipeline = RefineryPipeline(
     extra_normalizers=[HtmlTextNormalizer],
@@ -204,10 +208,14 @@ for b in dedup_blocks:
 Fills `None` values in `record`-type blocks using field → default rules.
 Non-record blocks and fields with existing values are left unchanged.
 
-Pair with `RecordNormalizer` for database rows with optional fields.
+Pair with `RecordNormalizer` for database rows with optional fields: a list
+of rows (or a pandas / Arrow table) arrives as one batch block and is
+filled column by column.
 
 Config:
-- `imputation_rules` — `{field_name: default_value, …}`
+- `imputation_rules` — `{field_name: default_value, …}`; a default of
+  `{"strategy": "mean"|"median"|"min"|"max"}` uses the column's running
+  statistics instead
 """
 impute_pipeline = RefineryPipeline(
     extra_normalizers=[RecordNormalizer],
@@ -224,7 +232,7 @@ imputed_blocks = impute_pipeline.run(
     sparse_rows,
     strategy="record",
     processors=["Imputer"],
-    imputation_rules={"category": "Unknown", "score": 0},
+    imputation_rules={"category": "Unknown", "score": {"strategy": "mean"}},
 )
 
 print("\n=== Imputer ===")
@@ -243,9 +251,12 @@ for b in imputed_blocks:
 # ── OutlierHandler
 """
 Validates numerical fields against `min`/`max` rules and either
-drops the block (`action="drop"`) or clamps the value (`action="clamp"`).
+drops the record (`action="drop"`) or clamps the value (`action="clamp"`).
+`"method": "zscore"` or `"iqr"` derives the bounds from the column itself
+once `MIN_SAMPLES` values have been seen.
 
-Only `record`-type blocks with `dict` content are processed.
+Only `record`-type blocks are processed; in a batch block only the
+violating rows are dropped.
 
 Config:
 - `outlier_rules` — `{field: {"min": …, "max": …, "action": "drop"|"clamp"}}`
@@ -1,16 +1,21 @@
-from .normalizer.doc_markdown_normalizer import DocMarkdownNormalizer
-from .normalizer.html_text_normalizer import HtmlTextNormalizer
-from .normalizer.raw_json_normalizer import RawJsonNormalizer
-from .normalizer.record_normalizer import RecordNormalizer
-from .pipeline import RefineryPipeline
-from .plugins.link_processor import LinkProcessor
-from .plugins.white_space_processor import WhiteSpaceProcessor
-from .processor.deduplicator import Deduplicator
-from .processor.imputer import Imputer
-from .processor.outlier_handler import OutlierHandler
-from .processor.pii_masker import PiiMasker
-from .processor.recursive_pruner import RecursivePruner
-from .processor.text_cleaner import TextCleaner
+from typing import TYPE_CHECKING
+
+from sayou.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .normalizer.doc_markdown_normalizer import DocMarkdownNormalizer
+    from .normalizer.html_text_normalizer import HtmlTextNormalizer
+    from .normalizer.raw_json_normalizer import RawJsonNormalizer
+    from .normalizer.record_normalizer import RecordNormalizer
+    from .pipeline import RefineryPipeline
+    from .plugins.link_processor import LinkProcessor
+    from .plugins.white_space_processor import WhiteSpaceProcessor
+    from .processor.deduplicator import Deduplicator
+    from .processor.imputer import Imputer
+    from .processor.outlier_handler import OutlierHandler
+    from .processor.pii_masker import PiiMasker
+    from .processor.recursive_pruner import RecursivePruner
+    from .processor.text_cleaner import TextCleaner
 
 __all__ = [
     "RefineryPipeline",
@@ -27,3 +32,23 @@ __all__ = [
     "RecursivePruner",
     "TextCleaner",
 ]
+
+# Sub-modules (and their heavy dependencies) load on first attribute access.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "DocMarkdownNormalizer": ".normalizer.doc_markdown_normalizer",
+        "HtmlTextNormalizer": ".normalizer.html_text_normalizer",
+        "RawJsonNormalizer": ".normalizer.raw_json_normalizer",
+        "RecordNormalizer": ".normalizer.record_normalizer",
+        "RefineryPipeline": ".pipeline",
+        "LinkProcessor": ".plugins.link_processor",
+        "WhiteSpaceProcessor": ".plugins.white_space_processor",
+        "Deduplicator": ".processor.deduplicator",
+        "Imputer": ".processor.imputer",
+        "OutlierHandler": ".processor.outlier_handler",
+        "PiiMasker": ".processor.pii_masker",
+        "RecursivePruner": ".processor.recursive_pruner",
+        "TextCleaner": ".processor.text_cleaner",
+    },
+)
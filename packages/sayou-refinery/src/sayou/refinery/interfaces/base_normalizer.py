@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Any, List
+from typing import Any, Iterable, Iterator, List
 
 from sayou.core.base_component import BaseComponent
 from sayou.core.decorators import measure_time
@@ -69,6 +69,51 @@ class BaseNormalizer(BaseComponent):
             self.logger.error(wrapped_error, exc_info=True)
             raise wrapped_error
 
+    def normalize_stream(self, items: Iterable[Any], **kwargs) -> Iterator[SayouBlock]:
+        """
+        Normalize a stream of inputs lazily, yielding blocks as they are produced.
+
+        Intended for page streams such as ``DocumentPipeline.run_stream``:
+        each item is normalized and released before the next is pulled.
+
+        Args:
+            items: Iterable of raw inputs (e.g. pages of one document).
+            **kwargs: Normalizer-specific stream options.
+
+        Yields:
+            SayouBlock: Normalized blocks in input order.
+
+        Raises:
+            NormalizationError: If transformation fails.
+        """
+        self._emit("on_start", input_data={"type": "stream"})
+
+        count = 0
+        try:
+            for block in self._do_normalize_stream(items, **kwargs):
+                count += 1
+                yield block
+        except Exception as e:
+            self._emit("on_error", error=e)
+            wrapped_error = NormalizationError(
+                f"[{self.component_name}] Failed: {str(e)}"
+            )
+            self.logger.error(wrapped_error, exc_info=True)
+            raise wrapped_error from e
+
+        self._emit("on_finish", result_data={"blocks": count}, success=True)
+
+    def _do_normalize_stream(
+        self, items: Iterable[Any], **kwargs
+    ) -> Iterator[SayouBlock]:
+        """
+        [Hook] Normalize each item independently.
+
+        Override when items are fragments of a larger input (e.g. pages).
+        """
+        for item in items:
+            yield from self._do_normalize(item)
+
     @abstractmethod
     def _do_normalize(self, raw_data: Any) -> List[SayouBlock]:
         """
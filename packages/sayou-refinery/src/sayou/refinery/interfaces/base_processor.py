@@ -1,5 +1,4 @@
-from abc import abstractmethod
-from typing import List
+from typing import Iterable, Iterator, List, Optional
 
 from sayou.core.base_component import BaseComponent
 from sayou.core.decorators import measure_time
@@ -14,6 +13,20 @@ class BaseProcessor(BaseComponent):
 
     Processors operate on data that is already normalized. They can modify content
     (e.g., PII masking, Imputation) or filter out blocks (e.g., Deduplication).
+
+    Subclasses implement one of two hooks:
+
+    * ``_process_block`` for element-wise processors (each block is handled
+      independently).  These can be streamed and are fused by
+      ``RefineryPipeline`` into a single per-block pass.
+    * ``_do_process`` for processors that need the whole list.  Override
+      ``_do_process_stream`` as well if the logic can still run in one
+      forward pass (e.g. with a seen-set).
+
+    State accumulated across blocks (column statistics, seen-sets) belongs
+    to one pass: reset it in ``_begin_pass``, which runs before every
+    ``process`` / ``process_stream`` call and every ``RefineryPipeline``
+    pass, since pipeline-cached instances are reused across runs.
     """
 
     component_name = "BaseProcessor"
@@ -32,6 +45,19 @@ class BaseProcessor(BaseComponent):
             return 0.5
         return 0.0
 
+    @classmethod
+    def is_elementwise(cls) -> bool:
+        """True if the processor implements ``_process_block``."""
+        return cls._process_block is not BaseProcessor._process_block
+
+    @classmethod
+    def is_streaming(cls) -> bool:
+        """True if ``process_stream`` runs without buffering the input."""
+        return (
+            cls.is_elementwise()
+            or cls._do_process_stream is not BaseProcessor._do_process_stream
+        )
+
     @measure_time
     def process(self, blocks: List[SayouBlock]) -> List[SayouBlock]:
         """
@@ -51,6 +77,7 @@ class BaseProcessor(BaseComponent):
             if not blocks:
                 return []
 
+            self._begin_pass()
             result = self._do_process(blocks)
 
             self._emit("on_finish", result_data={"blocks": len(result)}, success=True)
@@ -63,10 +90,47 @@ class BaseProcessor(BaseComponent):
             self.logger.error(wrapped_error, exc_info=True)
             raise wrapped_error
 
-    @abstractmethod
+    def process_stream(self, blocks: Iterable[SayouBlock]) -> Iterator[SayouBlock]:
+        """
+        Process a stream of blocks lazily, yielding results as they are produced.
+
+        Element-wise and streaming processors hold one block at a time;
+        others buffer the stream and run ``_do_process`` once it is exhausted.
+
+        Args:
+            blocks: Iterable of input SayouBlocks.
+
+        Yields:
+            SayouBlock: Processed blocks in input order.
+
+        Raises:
+            ProcessingError: If processing logic fails.
+        """
+        self._emit("on_start", input_data={"blocks": "stream"})
+
+        self._begin_pass()
+        count = 0
+        try:
+            for block in self._do_process_stream(blocks):
+                count += 1
+                yield block
+        except Exception as e:
+            self._emit("on_error", error=e)
+            wrapped_error = ProcessingError(f"[{self.component_name}] Failed: {str(e)}")
+            self.logger.error(wrapped_error, exc_info=True)
+            raise wrapped_error from e
+
+        self._emit("on_finish", result_data={"blocks": count}, success=True)
+
+    def _begin_pass(self) -> None:
+        """[Hook] Reset state that must not carry over between passes."""
+
     def _do_process(self, blocks: List[SayouBlock]) -> List[SayouBlock]:
         """
-        [Abstract Hook] Implement cleaning/filtering logic.
+        [Hook] Implement cleaning/filtering logic.
+
+        The default maps ``_process_block`` over the list; processors that
+        need the whole list override this instead.
 
         Args:
             blocks: List of input SayouBlocks.
@@ -74,4 +138,39 @@ class BaseProcessor(BaseComponent):
         Returns:
             List[SayouBlock]: Modified list of SayouBlocks.
         """
+        if not self.is_elementwise():
+            raise NotImplementedError
+        return [b for b in map(self._process_block, blocks) if b is not None]
+
+    def _do_process_stream(self, blocks: Iterable[SayouBlock]) -> Iterator[SayouBlock]:
+        """
+        [Hook] Streaming counterpart of ``_do_process``.
+
+        The default maps ``_process_block`` over the stream, or buffers it
+        for list-only processors.  State that must not outlive one pass
+        belongs in local variables here, not on ``self``: pipeline-cached
+        instances are reused across runs.
+        """
+        if self.is_elementwise():
+            for block in blocks:
+                block = self._process_block(block)
+                if block is not None:
+                    yield block
+            return
+
+        buffered = list(blocks)
+        if buffered:
+            yield from self._do_process(buffered)
+
+    def _process_block(self, block: SayouBlock) -> Optional[SayouBlock]:
+        """
+        [Hook] Process a single block.
+
+        Args:
+            block: Input SayouBlock.
+
+        Returns:
+            Optional[SayouBlock]: The (possibly modified) block, or None to
+            drop it.
+        """
         raise NotImplementedError
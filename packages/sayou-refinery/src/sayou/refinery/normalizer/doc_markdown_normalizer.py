@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from sayou.core.registry import register_component
 from sayou.core.schemas import SayouBlock
@@ -6,15 +6,42 @@ from sayou.core.schemas import SayouBlock
 from ..core.exceptions import NormalizationError
 from ..interfaces.base_normalizer import BaseNormalizer
 
+# PowerPoint title placeholders, as python-pptx names them ("TITLE (1)")
+# and as raw OOXML types when python-pptx is not installed.
+_TITLE_PLACEHOLDERS = frozenset({"TITLE", "CENTER_TITLE", "title", "ctrTitle"})
+
+
+def _field(obj: Any, name: str, default: Any = None) -> Any:
+    """Read ``name`` from a document model or its dictionary form."""
+    if isinstance(obj, dict):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+def _as_dict(obj: Any) -> Dict[str, Any]:
+    """Small nested models (e.g. document metadata) as a plain dictionary."""
+    if obj is None:
+        return {}
+    if isinstance(obj, dict):
+        return obj
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    return dict(vars(obj))
+
 
 @register_component("normalizer")
 class DocMarkdownNormalizer(BaseNormalizer):
     """
-    (Tier 2) Normalizes a Sayou Document Dictionary into Markdown SayouBlocks.
+    (Tier 2) Normalizes a Sayou Document into Markdown SayouBlocks.
+
+    This engine walks the output of 'sayou-document' — the typed ``Document``
+    model or its dictionary form — and converts individual elements (Text,
+    Table, Image, Chart) into semantically rich Markdown blocks. It also
+    handles metadata conversion to Frontmatter.
 
-    This engine parses the structured dictionary output from 'sayou-document' and
-    converts individual elements (Text, Table, Image, Chart) into semantically
-    rich Markdown blocks. It also handles metadata conversion to Frontmatter.
+    Models are read attribute by attribute; the document is never dumped
+    as a whole, so page content is not copied and image payloads are only
+    Base64-encoded for image blocks that are actually emitted.
     """
 
     component_name = "DocMarkdownNormalizer"
@@ -42,6 +69,7 @@ class DocMarkdownNormalizer(BaseNormalizer):
         self,
         include_headers: bool = True,
         include_footers: bool = False,
+        include_images: bool = True,
         **kwargs,
     ):
         """
@@ -50,120 +78,155 @@ class DocMarkdownNormalizer(BaseNormalizer):
         Args:
             include_headers (bool): If True, processes elements found in page headers.
             include_footers (bool): If True, processes elements found in page footers.
+            include_images (bool): If False, image elements are skipped without
+                encoding their payload.
             **kwargs: Additional configuration parameters passed to parent.
         """
         super().initialize(**kwargs)
         self.include_headers = include_headers
         self.include_footers = include_footers
+        self.include_images = include_images
 
     def _do_normalize(self, raw_data: Any) -> List[SayouBlock]:
         """
-        Execute the normalization logic on the document dictionary.
+        Execute the normalization logic on the document.
 
         Args:
-            raw_data (Any): The input dictionary adhering to Sayou Document Schema.
+            raw_data (Any): A ``Document`` model, or a dictionary adhering to
+                the Sayou Document Schema.
 
         Returns:
             List[SayouBlock]: A list of normalized content blocks (mostly 'md' type).
 
         Raises:
-            NormalizationError: If `raw_data` is not a valid dictionary.
+            NormalizationError: If `raw_data` is not a document.
         """
-        # 1. Input Handling (Dict/Object/Str Safe Conversion)
         if isinstance(raw_data, str):
             return [SayouBlock(type="md", content=raw_data, metadata={})]
 
-        # Handle Pydantic models or objects safely
-        if hasattr(raw_data, "model_dump"):
-            doc_data = raw_data.model_dump()
-        elif hasattr(raw_data, "dict"):
-            doc_data = raw_data.dict()
-        elif hasattr(raw_data, "__dict__"):
-            doc_data = raw_data.__dict__
-        elif isinstance(raw_data, dict):
-            doc_data = raw_data
-        else:
+        if not isinstance(raw_data, dict) and not hasattr(raw_data, "pages"):
             raise NormalizationError(
-                f"Input must be convertible to Dictionary, got {type(raw_data).__name__}"
+                f"Input must be a Document or a dictionary, got {type(raw_data).__name__}"
             )
 
-        normalized_blocks: List[SayouBlock] = []
-
-        doc_meta = doc_data.get("metadata", {})
-
-        def sanitize_text(text: str) -> str:
-            if not text:
-                return ""
-            text = text.replace("\x0b", "\n")
-            text = text.replace("\r", "\n")
-            text = text.replace("\f", "\n")
-            return text
-
-        # 2. Iterate Pages
-        for page in doc_data.get("pages", []):
-            page_content_buffer = []
-            page_num = page.get("page_num", 0)
-
-            # Helper to extract text from elements using existing logic
-            def collect_text(elements, is_header=False, is_footer=False):
-                if not elements:
-                    return
-                for element in elements:
-                    sub_blocks = self._handle_element(element, is_header, is_footer)
-                    for sb in sub_blocks:
-                        if not sb.content:
-                            continue
-                        # image_base64 blocks are emitted directly, not merged into text
-                        if sb.type == "image_base64":
-                            normalized_blocks.append(sb)
-                            continue
-                        # strip() only for emptiness check — preserve leading whitespace
-                        if not str(sb.content).strip():
-                            continue
-                        page_content_buffer.append(sanitize_text(sb.content))
-
-            # A. Header Elements
-            if self.include_headers:
-                collect_text(page.get("header_elements", []), is_header=True)
-
-            # B. Body Elements (Main Content)
-            collect_text(page.get("elements", []), is_header=False)
-
-            # C. Footer Elements
-            if self.include_footers:
-                collect_text(page.get("footer_elements", []), is_footer=True)
-
-            # 3. Aggregate: Create ONE Block per Page
-            if page_content_buffer:
-                full_page_text = "\n\n".join(page_content_buffer)
-
-                block_meta = doc_meta.copy()
-                block_meta.update(
-                    {
-                        "page_num": page_num,
-                        "origin_type": "page_aggregated",
-                        "source": doc_meta.get("filename", "unknown"),
-                    }
-                )
+        return list(self._iter_document(raw_data))
+
+    def _iter_document(self, doc: Any) -> Iterator[SayouBlock]:
+        """Yield the blocks of a whole document, page by page."""
+        doc_meta = _as_dict(_field(doc, "metadata"))
+        for page in _field(doc, "pages") or []:
+            yield from self._normalize_page(page, doc_meta)
+
+    def _do_normalize_stream(
+        self, items: Iterable[Any], metadata: Optional[Dict[str, Any]] = None
+    ) -> Iterator[SayouBlock]:
+        """
+        Normalize a page stream (e.g. ``DocumentPipeline.run_stream``).
+
+        Blocks are yielded as soon as their page is done, so memory stays
+        bounded by a single page.  Whole documents in the stream are
+        expanded page by page the same way.
+
+        Args:
+            items (Iterable[Any]): Page or document models, or their
+                dictionaries.
+            metadata (Dict[str, Any], optional): Document-level metadata
+                merged into every page block (e.g. ``{"filename": ...}``).
+        """
+        doc_meta = metadata or {}
+        for item in items:
+            if _field(item, "pages") is not None:
+                yield from self._iter_document(item)
+            else:
+                yield from self._normalize_page(item, doc_meta)
+
+    @staticmethod
+    def _sanitize_text(text: str) -> str:
+        if not text:
+            return ""
+        text = text.replace("\x0b", "\n")
+        text = text.replace("\r", "\n")
+        text = text.replace("\f", "\n")
+        return text
+
+    def _normalize_page(self, page: Any, doc_meta: Dict[str, Any]) -> List[SayouBlock]:
+        """
+        Convert one page (model or dictionary) into blocks.
+
+        Image blocks are emitted as-is; all other content is merged into a
+        single 'md' block per page.
+
+        Args:
+            page (Any): The page model or dictionary.
+            doc_meta (Dict[str, Any]): Document-level metadata.
 
-                normalized_blocks.append(
-                    SayouBlock(
-                        type="md",
-                        content=full_page_text,
-                        metadata=block_meta,
-                    )
+        Returns:
+            List[SayouBlock]: Image blocks followed by the aggregated page block.
+        """
+        page_blocks: List[SayouBlock] = []
+        page_content_buffer = []
+        page_num = _field(page, "page_num", 0)
+
+        # Helper to extract text from elements using existing logic
+        def collect_text(elements, is_header=False, is_footer=False):
+            if not elements:
+                return
+            for element in elements:
+                sub_blocks = self._handle_element(element, is_header, is_footer)
+                for sb in sub_blocks:
+                    if not sb.content:
+                        continue
+                    # image_base64 blocks are emitted directly, not merged into text
+                    if sb.type == "image_base64":
+                        page_blocks.append(sb)
+                        continue
+                    # strip() only for emptiness check — preserve leading whitespace
+                    if not str(sb.content).strip():
+                        continue
+                    page_content_buffer.append(self._sanitize_text(sb.content))
+
+        # A. Header Elements
+        if self.include_headers:
+            collect_text(_field(page, "header_elements"), is_header=True)
+
+        # B. Body Elements (Main Content)
+        collect_text(_field(page, "elements"), is_header=False)
+
+        # C. Footer Elements
+        if self.include_footers:
+            collect_text(_field(page, "footer_elements"), is_footer=True)
+
+        # 3. Aggregate: Create ONE Block per Page
+        if page_content_buffer:
+            full_page_text = "\n\n".join(page_content_buffer)
+
+            block_meta = doc_meta.copy()
+            block_meta.update(
+                {
+                    "page_num": page_num,
+                    "origin_type": "page_aggregated",
+                    "source": doc_meta.get("filename", "unknown"),
+                }
+            )
+
+            page_blocks.append(
+                SayouBlock(
+                    type="md",
+                    content=full_page_text,
+                    metadata=block_meta,
                 )
+            )
 
-        return normalized_blocks
+        return page_blocks
 
     def _handle_element(
-        self, element: Dict[str, Any], is_header: bool, is_footer: bool
+        self, element: Any, is_header: bool, is_footer: bool
     ) -> List[SayouBlock]:
         """
         Dispatch the element to specific handlers based on its 'type' field.
 
         Args:
-            element (Dict[str, Any]): The element dictionary.
+            element (Any): The element model or dictionary.
             is_header (bool): True if the element is part of the page header.
             is_footer (bool): True if the element is part of the page footer.
 
@@ -173,7 +236,7 @@ class DocMarkdownNormalizer(BaseNormalizer):
         if is_footer and not self.include_footers:
             return []
 
-        elem_type = element.get("type")
+        elem_type = _field(element, "type")
 
         if elem_type == "text":
             return self._handle_text(element, is_header, is_footer)
@@ -182,6 +245,8 @@ class DocMarkdownNormalizer(BaseNormalizer):
             return self._handle_table(element, is_header, is_footer)
 
         if elem_type == "image":
+            if not self.include_images:
+                return []
             return self._handle_image(element, is_header, is_footer)
 
         if elem_type == "chart":
@@ -200,7 +265,7 @@ class DocMarkdownNormalizer(BaseNormalizer):
             List[SayouBlock]: A single block containing YAML-like frontmatter.
         """
         md_frontmatter = "---\n"
-        metadata = doc_data.get("metadata", {})
+        metadata = _as_dict(_field(doc_data, "metadata"))
 
         title = metadata.get("title")
         author = metadata.get("author")
@@ -219,8 +284,15 @@ class DocMarkdownNormalizer(BaseNormalizer):
             )
         ]
 
+    @staticmethod
+    def _is_title_placeholder(placeholder_type: Any) -> bool:
+        """True for title placeholders, with or without the enum value suffix."""
+        if not placeholder_type:
+            return False
+        return str(placeholder_type).split(" (", 1)[0] in _TITLE_PLACEHOLDERS
+
     def _handle_text(
-        self, element: Dict[str, Any], is_header: bool, is_footer: bool
+        self, element: Any, is_header: bool, is_footer: bool
     ) -> List[SayouBlock]:
         """
         Convert a text element to a Markdown block, handling headings and lists.
@@ -228,11 +300,11 @@ class DocMarkdownNormalizer(BaseNormalizer):
         Uses 'semantic_type' (heading/list) and 'level' attributes to generate
         appropriate Markdown syntax (e.g., '# Title', '- Item').
         """
-        text = element.get("text", "").strip()
+        text = (_field(element, "text") or "").strip()
         if not text:
             return []
 
-        raw_attrs = element.get("raw_attributes", {})
+        raw_attrs = _field(element, "raw_attributes") or {}
         semantic_type = raw_attrs.get("semantic_type")
 
         content = None
@@ -249,8 +321,8 @@ class DocMarkdownNormalizer(BaseNormalizer):
             hashes = "#" * level
             content = f"{hashes} {text}"
 
-        # 3. PPT placeholder title (legacy compatibility)
-        elif raw_attrs.get("placeholder_type") == "TITLE":
+        # 3. PPT title placeholder ("TITLE (1)", "CENTER_TITLE (3)", ...)
+        elif self._is_title_placeholder(raw_attrs.get("placeholder_type")):
             content = f"# {text}"
 
         # 4. Plain text
@@ -262,8 +334,8 @@ class DocMarkdownNormalizer(BaseNormalizer):
                 type="md",
                 content=content,
                 metadata={
-                    "page_num": element.get("meta", {}).get("page_num"),
-                    "id": element.get("id"),
+                    "page_num": _field(_field(element, "meta"), "page_num"),
+                    "id": _field(element, "id"),
                     "style": raw_attrs.get("style"),
                     "is_footer": is_footer,
                 },
@@ -271,7 +343,7 @@ class DocMarkdownNormalizer(BaseNormalizer):
         ]
 
     def _handle_table(
-        self, element: Dict[str, Any], is_header: bool, is_footer: bool
+        self, element: Any, is_header: bool, is_footer: bool
     ) -> List[SayouBlock]:
         """
         Convert a table element into a Markdown table representation.
@@ -280,7 +352,7 @@ class DocMarkdownNormalizer(BaseNormalizer):
             element (Dict[str, Any]): Must contain 'data' (2D list).
         """
         md_table = ""
-        table_data = element.get("data", [])
+        table_data = _field(element, "data") or []
 
         if not table_data:
             return []
@@ -311,15 +383,15 @@ class DocMarkdownNormalizer(BaseNormalizer):
                 type="md",
                 content=md_table.strip(),
                 metadata={
-                    "page_num": element.get("meta", {}).get("page_num"),
-                    "id": element.get("id"),
+                    "page_num": _field(_field(element, "meta"), "page_num"),
+                    "id": _field(element, "id"),
                     "is_footer": is_footer,
                 },
             )
         ]
 
     def _handle_image(
-        self, element: Dict[str, Any], is_header: bool, is_footer: bool
+        self, element: Any, is_header: bool, is_footer: bool
     ) -> List[SayouBlock]:
         """
         Process an image element.
@@ -327,25 +399,29 @@ class DocMarkdownNormalizer(BaseNormalizer):
         Depending on implementation, this might return an 'image_base64' block
         or a Markdown image link if an external URL is provided.
         """
-        image_base64 = element.get("image_base64")
+        if hasattr(element, "get_image_base64"):
+            # Encoded from the attached bytes now, for this block only.
+            image_base64 = element.get_image_base64()
+        else:
+            image_base64 = _field(element, "image_base64")
         if not image_base64:
             return []
 
-        ocr_text = (element.get("ocr_text") or "").strip()
+        ocr_text = (_field(element, "ocr_text") or "").strip()
         if not ocr_text:
             alt_text = "image"
         else:
             alt_text = ocr_text
 
-        img_format = element.get("image_format", "png")
+        img_format = _field(element, "image_format", "png")
 
         return [
             SayouBlock(
                 type="image_base64",
                 content=image_base64,
                 metadata={
-                    "page_num": element.get("meta", {}).get("page_num"),
-                    "id": element.get("id"),
+                    "page_num": _field(_field(element, "meta"), "page_num"),
+                    "id": _field(element, "id"),
                     "is_footer": is_footer,
                     "alt_text": alt_text,
                     "format": img_format,
@@ -354,7 +430,7 @@ class DocMarkdownNormalizer(BaseNormalizer):
         ]
 
     def _handle_chart(
-        self, element: Dict[str, Any], is_header: bool, is_footer: bool
+        self, element: Any, is_header: bool, is_footer: bool
     ) -> List[SayouBlock]:
         """
         Convert a chart element into its text representation.
@@ -362,7 +438,7 @@ class DocMarkdownNormalizer(BaseNormalizer):
         Uses the 'text_representation' field from the element to create
         a descriptive text block for LLM consumption.
         """
-        text_rep = element.get("text_representation")
+        text_rep = _field(element, "text_representation")
         if not text_rep:
             return []
 
@@ -373,8 +449,8 @@ class DocMarkdownNormalizer(BaseNormalizer):
                 type="md",
                 content=content,
                 metadata={
-                    "page_num": element.get("meta", {}).get("page_num"),
-                    "id": element.get("id"),
+                    "page_num": _field(_field(element, "meta"), "page_num"),
+                    "id": _field(element, "id"),
                     "is_footer": is_footer,
                 },
             )
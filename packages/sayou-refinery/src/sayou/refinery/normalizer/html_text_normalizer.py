@@ -1,29 +1,37 @@
-try:
-    from bs4 import BeautifulSoup
-except ImportError:
-    BeautifulSoup = None
-
+import re
 from typing import Any, List
 
+from sayou.core.html import parse_html
 from sayou.core.registry import register_component
 from sayou.core.schemas import SayouBlock
 
 from ..core.exceptions import NormalizationError
 from ..interfaces.base_normalizer import BaseNormalizer
 
+_BLANK_LINES = re.compile(r"\n{3,}")
+
 
 @register_component("normalizer")
 class HtmlTextNormalizer(BaseNormalizer):
     """
     (Tier 2) Converts HTML string into a clean Text SayouBlock.
 
-    Uses BeautifulSoup to strip tags, scripts, and styles, returning only
-    the visible text content while preserving paragraph structure.
+    Strips tags, scripts, and styles, returning only the visible text content
+    while preserving paragraph structure.  Parsing goes through
+    ``sayou.core.html`` with BeautifulSoup; ``html_backend="auto"`` (or
+    "selectolax" / "lxml") opts into a faster parser, whose text can differ
+    on malformed fragments (see the ``sayou.core.html`` docstring).
+
+    Attributes:
+        HTML_BACKEND (str): Default backend name; ``"bs4"`` so output does
+            not depend on which parsers are installed.
     """
 
     component_name = "HtmlTextNormalizer"
     SUPPORTED_TYPES = ["html"]
 
+    HTML_BACKEND: str = "bs4"
+
     @classmethod
     def can_handle(cls, raw_data: Any, strategy: str = "auto") -> float:
         if strategy in ["html"]:
@@ -37,6 +45,18 @@ class HtmlTextNormalizer(BaseNormalizer):
                 return 0.95
         return 0.0
 
+    def initialize(self, html_backend: str = None, **kwargs):
+        """
+        Select the HTML parser.
+
+        Args:
+            html_backend (str, optional): "auto", "selectolax", "lxml" or
+                "bs4"; defaults to ``HTML_BACKEND``.
+            **kwargs: Additional configuration parameters passed to parent.
+        """
+        super().initialize(**kwargs)
+        self.html_backend = html_backend or self.HTML_BACKEND
+
     def _do_normalize(self, raw_data: Any) -> List[SayouBlock]:
         """
         Parse HTML and extract text.
@@ -48,38 +68,25 @@ class HtmlTextNormalizer(BaseNormalizer):
             List[SayouBlock]: A single block of type 'text'.
 
         Raises:
-            ImportError: If BeautifulSoup4 is not installed.
+            ImportError: If no HTML parser is installed.
             NormalizationError: If input is not a string.
         """
-        if not BeautifulSoup:
-            raise ImportError("BeautifulSoup4 is required for HtmlTextNormalizer.")
-
         if not isinstance(raw_data, str):
             raise NormalizationError(
                 f"Input must be HTML string, got {type(raw_data)}."
             )
 
-        soup = BeautifulSoup(raw_data, "html.parser")
+        doc = parse_html(raw_data, getattr(self, "html_backend", self.HTML_BACKEND))
 
         extracted_meta = {"strategy": "html_parsed"}
 
-        if soup.title and soup.title.string:
-            extracted_meta["title"] = soup.title.string.strip()
-            extracted_meta["subject"] = soup.title.string.strip()
-
-        for meta_tag in soup.find_all("meta"):
-            name = meta_tag.get("name") or meta_tag.get("property")
-            content = meta_tag.get("content")
-            if name and content:
-                extracted_meta[name] = content
-
-        for tag in soup(["script", "style", "noscript", "iframe", "head"]):
-            tag.extract()
-
-        text_content = soup.get_text(separator="\n")
+        title = doc.title()
+        if title:
+            extracted_meta["title"] = title.strip()
+            extracted_meta["subject"] = title.strip()
 
-        import re
+        extracted_meta.update(doc.meta())
 
-        text_content = re.sub(r"\n{3,}", "\n\n", text_content).strip()
+        text_content = _BLANK_LINES.sub("\n\n", doc.text()).strip()
 
         return [SayouBlock(type="text", content=text_content, metadata=extracted_meta)]
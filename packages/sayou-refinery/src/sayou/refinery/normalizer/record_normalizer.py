@@ -6,6 +6,9 @@ from sayou.core.schemas import SayouBlock
 from ..core.exceptions import NormalizationError
 from ..interfaces.base_normalizer import BaseNormalizer
 
+# Values that are already plain JSON types and need no conversion.
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
 
 @register_component("normalizer")
 class RecordNormalizer(BaseNormalizer):
@@ -13,7 +16,11 @@ class RecordNormalizer(BaseNormalizer):
     (Tier 2) Converts structured data (Dict/List) into 'record' SayouBlocks.
 
     Suitable for processing database rows, CSV records, or JSON API responses.
-    Each dictionary becomes a separate SayouBlock of type 'record'.
+    A single dictionary becomes one 'record' block; a list of dictionaries
+    becomes one batch block holding every row, which the record processors
+    handle column by column.  Columnar tables (pandas ``DataFrame``, Arrow
+    ``Table`` / ``RecordBatch``) are converted to such a batch by the
+    library itself, with missing values as ``None``.
     """
 
     component_name = "RecordNormalizer"
@@ -26,6 +33,8 @@ class RecordNormalizer(BaseNormalizer):
 
         if isinstance(raw_data, dict):
             return 0.9
+        if cls._is_table(raw_data):
+            return 0.9
         if isinstance(raw_data, list):
             if len(raw_data) > 0 and isinstance(raw_data[0], dict):
                 return 0.9
@@ -37,11 +46,16 @@ class RecordNormalizer(BaseNormalizer):
         Convert dict or list of dicts into record blocks.
 
         Args:
-            raw_data (Any): A Dictionary or a List of Dictionaries.
+            raw_data (Any): A Dictionary, a List of Dictionaries or a
+                columnar table.
 
         Returns:
             List[SayouBlock]: Blocks of type 'record'.
         """
+        if self._is_table(raw_data):
+            rows = self._table_rows(raw_data)
+            return [self._create_list_block(rows)] if rows else []
+
         blocks = []
 
         safe_data = self._ensure_dict_structure(raw_data)
@@ -130,11 +144,15 @@ class RecordNormalizer(BaseNormalizer):
         Recursively convert Pydantic models, Objects, Lists, and Dicts into pure JSON types.
         """
 
+        if type(data) in _SCALAR_TYPES:
+            return data
         # 1. List
         if isinstance(data, list):
             return [self._ensure_dict_structure(item) for item in data]
-        # 2. Dict
+        # 2. Dict (flat rows, the common case, are copied without recursing)
         if isinstance(data, dict):
+            if _SCALAR_TYPES.issuperset(map(type, data.values())):
+                return dict(data)
             return {k: self._ensure_dict_structure(v) for k, v in data.items()}
         # Pydantic v2
         if hasattr(data, "model_dump") and callable(data.model_dump):
@@ -148,6 +166,26 @@ class RecordNormalizer(BaseNormalizer):
 
         return data
 
+    @staticmethod
+    def _is_table(data: Any) -> bool:
+        """Duck-typed check for pandas DataFrames and Arrow tables/batches."""
+        return hasattr(data, "to_pylist") or (
+            hasattr(data, "to_dict") and hasattr(data, "columns")
+        )
+
+    @staticmethod
+    def _table_rows(table: Any) -> List[Dict[str, Any]]:
+        """
+        Convert a columnar table to row dictionaries in one library call.
+
+        Arrow already yields ``None`` for nulls; pandas NaN / NaT are
+        replaced by ``None`` column-wise before the rows are built.
+        """
+        if hasattr(table, "to_pylist"):
+            return table.to_pylist()
+        table = table.astype(object).where(table.notna(), None)
+        return table.to_dict("records")
+
     def _create_list_block(self, data_list: List[Dict]) -> SayouBlock:
         """
         [New] Creates a single block containing a list of records.
@@ -1,8 +1,21 @@
 import importlib
 import pkgutil
-from typing import Any, Dict, List, Optional, Type
+from collections import deque
+from itertools import chain, islice
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
 
 from sayou.core.base_component import BaseComponent
+from sayou.core.cache import config_fingerprint
 from sayou.core.decorators import safe_run
 from sayou.core.registry import COMPONENT_REGISTRY
 from sayou.core.schemas import SayouBlock
@@ -19,10 +32,20 @@ class RefineryPipeline(BaseComponent):
     Workflow:
     1. Normalization: Converts raw input (Document, HTML, JSON) into standard SayouBlocks.
     2. Processing: Applies a chain of processors (Cleaning, Masking, Dedup) to the blocks.
+
+    Normalizer and processor instances are cached per effective config, and
+    consecutive element-wise processors are fused into a single per-block
+    pass, so a chain costs one traversal of the blocks.
+
+    Attributes:
+        STREAM_PROBE_SIZE (int): Blocks read from the head of a stream to
+            score processors' ``can_handle`` in ``run_stream``.
     """
 
     component_name = "RefineryPipeline"
 
+    STREAM_PROBE_SIZE: int = 2
+
     def __init__(
         self,
         extra_normalizers: Optional[List[Type[BaseNormalizer]]] = None,
@@ -41,6 +64,7 @@ class RefineryPipeline(BaseComponent):
 
         self.normalizer_cls_map: Dict[str, Type[BaseNormalizer]] = {}
         self.processor_cls_map: Dict[str, Type[BaseProcessor]] = {}
+        self._instances: Dict[Tuple[type, str], BaseComponent] = {}
 
         self._register("sayou.refinery.normalizer")
         self._register("sayou.refinery.processor")
@@ -139,7 +163,8 @@ class RefineryPipeline(BaseComponent):
         """
         Update global configuration and log component counts.
 
-        Actual component instantiation happens lazily during run().
+        Actual component instantiation happens lazily during run(), once
+        per component class and effective config.
 
         Args:
             **kwargs: Updates to the global configuration.
@@ -167,7 +192,11 @@ class RefineryPipeline(BaseComponent):
             strategy (str): Hint for normalizer (default: 'auto').
             processors (List[str], optional): List of processor names to execute in order.
                                             If None, executes all registered processors (or a default set).
-            **kwargs: Runtime configuration.
+            **kwargs: Runtime configuration.  A ``cache`` entry
+                      (``sayou.core.cache.BaseCache``) short-circuits refinement
+                      of previously seen input; ``cache_digest`` supplies a
+                      precomputed digest, which must cover the source name
+                      as well as the content (blocks carry it as metadata).
 
         Returns:
             List[SayouBlock]: A list of clean, normalized blocks.
@@ -179,6 +208,27 @@ class RefineryPipeline(BaseComponent):
 
         self._emit("on_start", input_data={"strategy": strategy})
 
+        cache = run_config.get("cache")
+        cache_key = None
+        if cache is not None:
+            cache_key = cache.key(
+                self.component_name,
+                raw_data,
+                run_config,
+                digest=run_config.get("cache_digest"),
+                strategy=strategy,
+                processors=processors,
+                file_name=getattr(raw_data, "file_name", None),
+            )
+            cached = cache.get(cache_key, component=self.component_name)
+            if cached is not None:
+                self._emit(
+                    "on_finish",
+                    result_data={"blocks_count": len(cached)},
+                    success=True,
+                )
+                return cached
+
         # ---------------------------------------------------------
         # Step 1: Normalize (Smart Routing)
         # ---------------------------------------------------------
@@ -189,13 +239,7 @@ class RefineryPipeline(BaseComponent):
             self._emit("on_error", error=Exception(error_msg))
             raise RefineryError(error_msg)
 
-        # Instantiate Normalizer
-        normalizer = normalizer_cls()
-
-        for cb in self._callbacks:
-            normalizer.add_callback(cb)
-
-        normalizer.initialize(**run_config)
+        normalizer = self._get_instance(normalizer_cls, run_config)
 
         try:
             self._log(f"Normalizing with {normalizer.component_name}...")
@@ -206,13 +250,137 @@ class RefineryPipeline(BaseComponent):
             return []
 
         # ---------------------------------------------------------
-        # Step 2: Process Chain (Dynamic Execution)
+        # Step 2: Process Chain (Fused, Single Pass)
         # ---------------------------------------------------------
+        active_instances = self._select_processors(
+            processors or kwargs.get("processors"), blocks, run_config
+        )
+        blocks = list(self._refine(blocks, active_instances))
+
+        if cache_key is not None:
+            cache.set(cache_key, blocks)
+
+        self._emit("on_finish", result_data={"blocks_count": len(blocks)}, success=True)
+        return blocks
+
+    def run_stream(
+        self,
+        input_stream: Iterable[Any],
+        strategy: str = "auto",
+        processors: Optional[List[str]] = None,
+        **kwargs,
+    ) -> Iterator[SayouBlock]:
+        """
+        Refine a stream lazily, yielding each block once the whole chain has
+        processed it.
+
+        ``input_stream`` may hold ``SayouBlock`` objects, which go straight
+        to the processors, or raw items (e.g. pages from
+        ``DocumentPipeline.run_stream``), which are routed by the first item
+        and fed through ``BaseNormalizer.normalize_stream``.  Element-wise
+        processors see one block at a time; processors that need the whole
+        list (see ``BaseProcessor.is_streaming``) buffer it.  Processors are
+        scored against the first ``STREAM_PROBE_SIZE`` blocks; stage caching
+        is not applied to streams.
+
+        Args:
+            input_stream (Iterable[Any]): Blocks or raw items.
+            strategy (str): Hint for normalizer (default: 'auto').
+            processors (List[str], optional): Processor names, as in ``run``.
+            **kwargs: Runtime configuration.
+
+        Yields:
+            SayouBlock: Refined blocks in input order.
+
+        Raises:
+            RefineryError: If no normalizer accepts the first raw item.
+        """
+        run_config = {**self.global_config, **kwargs}
+        self._emit("on_start", input_data={"strategy": strategy, "stream": True})
+
+        items = iter(input_stream)
+        head = next(items, None)
+        if head is None:
+            self._emit("on_finish", result_data={"blocks_count": 0}, success=True)
+            return
+        items = chain((head,), items)
+
+        if isinstance(head, SayouBlock):
+            blocks: Iterator[SayouBlock] = items
+        else:
+            normalizer_cls = self._resolve_normalizer(head, strategy)
+            if not normalizer_cls:
+                error_msg = f"No suitable normalizer found for strategy='{strategy}'"
+                self._emit("on_error", error=Exception(error_msg))
+                raise RefineryError(error_msg)
+            normalizer = self._get_instance(normalizer_cls, run_config)
+            self._log(f"Normalizing stream with {normalizer.component_name}...")
+            blocks = normalizer.normalize_stream(items)
+
+        probe = list(islice(blocks, self.STREAM_PROBE_SIZE))
+        active_instances = self._select_processors(
+            processors or kwargs.get("processors"), probe, run_config
+        )
+
+        count = 0
+        for block in self._refine(chain(probe, blocks), active_instances):
+            count += 1
+            yield block
+
+        self._emit("on_finish", result_data={"blocks_count": count}, success=True)
+
+    # ------------------------------------------------------------------
+    # Processor chain
+    # ------------------------------------------------------------------
+
+    def _get_instance(self, cls: type, run_config: Dict[str, Any]) -> BaseComponent:
+        """
+        Return the cached, initialized instance of ``cls`` for this config.
+
+        Pipeline callbacks registered since the instance was created are
+        attached on reuse.  A config holding a value without a stable
+        fingerprint (e.g. a lambda) gets a fresh, uncached instance.
+        """
+        try:
+            key = (cls, config_fingerprint(run_config))
+        except TypeError:
+            key = None
+        instance = self._instances.get(key) if key is not None else None
+        if instance is None:
+            instance = cls()
+            for cb in self._callbacks:
+                instance.add_callback(cb)
+            instance.initialize(**run_config)
+            if key is not None:
+                self._instances[key] = instance
+        else:
+            for cb in self._callbacks:
+                instance.add_callback(cb)
+        return instance
+
+    def _select_processors(
+        self,
+        processors: Any,
+        blocks: List[SayouBlock],
+        run_config: Dict[str, Any],
+    ) -> List[BaseProcessor]:
+        """
+        Resolve the requested processors that accept ``blocks``.
+
+        Args:
+            processors: ``"ALL"``, a list of names, or None / [] (falls back
+                        to ``default_processors`` from the global config).
+            blocks: The blocks (or a sample of them) scored by ``can_handle``.
+            run_config: Effective configuration used to initialize them.
+
+        Returns:
+            List[BaseProcessor]: Initialized instances, in execution order.
+
+        Raises:
+            RefineryError: If an accepted processor rejects its configuration.
+        """
         target_processors = (
-            processors
-            or kwargs.get("processors")
-            or self.global_config.get("default_processors")
-            or []
+            processors or self.global_config.get("default_processors") or []
         )
 
         # 1. Select Processor
@@ -244,39 +412,141 @@ class RefineryPipeline(BaseComponent):
                 "No processors specified. Skipping refinement chain.", level="debug"
             )
 
-        # 2. Execution
+        # 2. Activation
         active_instances = []
 
         for proc_cls in candidate_processors:
             try:
                 score = proc_cls.can_handle(blocks)
-
-                if score > 0.0:
-                    proc = proc_cls()
-                    for cb in self._callbacks:
-                        proc.add_callback(cb)
-
-                    proc.initialize(**run_config)
-                    active_instances.append(proc)
-
             except Exception as e:
                 self._log(f"Check failed for {proc_cls.__name__}: {e}", level="debug")
+                continue
+            if score <= 0.0:
+                continue
+            # A misconfigured processor (e.g. a masker without its salt)
+            # must stop the run rather than let data through unprocessed.
+            try:
+                active_instances.append(self._get_instance(proc_cls, run_config))
+            except Exception as e:
+                raise RefineryError(
+                    f"Failed to initialize {proc_cls.__name__}: {e}"
+                ) from e
 
-        # 3. Chaining
         if not active_instances:
             self._log("No processors activated for this data.", level="debug")
 
-        for proc in active_instances:
-            try:
-                self._log(f"Running Processor: {proc.component_name}")
-                blocks = proc.process(blocks)
-            except Exception as e:
-                self._log(
-                    f"Processor {proc.component_name} crashed: {e}", level="error"
-                )
+        return active_instances
 
-        self._emit("on_finish", result_data={"blocks_count": len(blocks)}, success=True)
-        return blocks
+    def _refine(
+        self, blocks: Iterable[SayouBlock], processors: List[BaseProcessor]
+    ) -> Iterator[SayouBlock]:
+        """
+        Chain ``processors`` over ``blocks`` as lazy stages.
+
+        Runs of element-wise processors become one fused per-block stage;
+        streaming processors wrap the stream; list-only processors buffer it.
+        """
+        stream: Iterable[SayouBlock] = blocks
+        group: List[BaseProcessor] = []
+
+        for proc in processors:
+            if proc.is_elementwise():
+                group.append(proc)
+                continue
+            if group:
+                stream = self._fused_pass(stream, group)
+                group = []
+            if proc.is_streaming():
+                stream = self._streaming_pass(stream, proc)
+            else:
+                stream = self._buffered_pass(stream, proc)
+
+        if group:
+            stream = self._fused_pass(stream, group)
+
+        return iter(stream)
+
+    def _fused_pass(
+        self, blocks: Iterable[SayouBlock], group: List[BaseProcessor]
+    ) -> Iterator[SayouBlock]:
+        """
+        Apply element-wise processors to each block in turn.
+
+        A processor that fails on a block is logged and skipped for that
+        block only; the block continues down the group.
+        """
+        names = " + ".join(proc.component_name for proc in group)
+        self._log(f"Running Processor: {names}")
+        for proc in group:
+            proc._begin_pass()
+            proc._emit("on_start", input_data={"blocks": "stream"})
+
+        steps = [(proc, proc._process_block) for proc in group]
+        count = 0
+        for block in blocks:
+            for proc, step in steps:
+                try:
+                    result = step(block)
+                except Exception as e:
+                    self._log(
+                        f"Processor {proc.component_name} crashed: {e}", level="error"
+                    )
+                    continue
+                if result is None:
+                    break
+                block = result
+            else:
+                count += 1
+                yield block
+
+        for proc in group:
+            proc._emit("on_finish", result_data={"blocks": count}, success=True)
+
+    def _streaming_pass(
+        self, blocks: Iterable[SayouBlock], proc: BaseProcessor
+    ) -> Iterator[SayouBlock]:
+        """
+        Run a streaming processor; if it fails, the rest of its input passes
+        through unprocessed.
+
+        Blocks it has pulled but not yet resolved are kept aside so they
+        are not lost on a crash.  An emitted block resolves itself and,
+        being in input order, every pending block before it (dropped); a
+        block the processor created instead resolves the oldest one.
+        """
+        self._log(f"Running Processor: {proc.component_name} (stream)")
+        pending: Deque[SayouBlock] = deque()
+        upstream = iter(blocks)
+
+        def feed() -> Iterator[SayouBlock]:
+            for block in upstream:
+                pending.append(block)
+                yield block
+
+        try:
+            for block in proc.process_stream(feed()):
+                if any(item is block for item in pending):
+                    while pending.popleft() is not block:
+                        pass
+                elif pending:
+                    pending.popleft()
+                yield block
+        except Exception as e:
+            self._log(f"Processor {proc.component_name} crashed: {e}", level="error")
+            yield from pending
+            yield from upstream
+
+    def _buffered_pass(
+        self, blocks: Iterable[SayouBlock], proc: BaseProcessor
+    ) -> Iterator[SayouBlock]:
+        """Run a list-only processor; on failure its input passes through."""
+        buffered = list(blocks)
+        try:
+            self._log(f"Running Processor: {proc.component_name}")
+            buffered = proc.process(buffered)
+        except Exception as e:
+            self._log(f"Processor {proc.component_name} crashed: {e}", level="error")
+        yield from buffered
 
     def _resolve_normalizer(
         self,
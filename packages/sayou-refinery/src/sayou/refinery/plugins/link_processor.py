@@ -1,11 +1,16 @@
 import re
-from typing import List
 
 from sayou.core.registry import register_component
 from sayou.core.schemas import SayouBlock
 
 from ..interfaces.base_processor import BaseProcessor
 
+# URL regex (http/https)
+_URL_RE = re.compile(r"(https?://[^\s)\]]+)")
+# Markdown link regex [text](url) -> group1: text, group2: url
+_MD_LINK_RE = re.compile(r"\[([^\]]+)\]\((https?://[^\s)]+)\)")
+_SPACE_RE = re.compile(r"\s+")
+
 
 @register_component("processor")
 class LinkProcessor(BaseProcessor):
@@ -26,47 +31,38 @@ class LinkProcessor(BaseProcessor):
         super().initialize(**kwargs)
         self.config = {**getattr(self, "config", {}), "remove_links": remove_links}
 
-    def _do_process(self, blocks: List[SayouBlock]) -> List[SayouBlock]:
-        remove_links = self.config.get("remove_links", False)
-
-        # URL regex (http/https)
-        url_pattern = r"(https?://[^\s)\]]+)"
-        # Markdown link regex [text](url) -> group1: text, group2: url
-        md_link_pattern = r"\[([^\]]+)\]\((https?://[^\s)]+)\)"
-
-        for block in blocks:
-            if block.type != "text" or not isinstance(block.content, str):
-                continue
-
-            text = block.content
-            found_links = []
-
-            # 1. Find Markdown links
-            matches = re.findall(md_link_pattern, text)
-            for title, url in matches:
-                found_links.append({"title": title, "url": url})
-
-            # 2. Find Raw URLs (not included in Markdown)
-            # (For simplicity, duplicate handling is omitted or fine-tuning is needed)
-            raw_matches = re.findall(url_pattern, text)
-            for url in raw_matches:
-                # Add if not already found
-                if not any(l["url"] == url for l in found_links):
-                    found_links.append({"title": "raw_link", "url": url})
-
-            # 3. Extract links to metadata
-            if found_links:
-                if "links" not in block.metadata:
-                    block.metadata["links"] = []
-                block.metadata["links"].extend(found_links)
-
-            # 4. (Option) Remove links from text
-            if remove_links:
-                # Markdown links are left as text: [Google](...) -> Google
-                text = re.sub(md_link_pattern, r"\1", text)
-                # Remaining Raw URLs are removed
-                text = re.sub(url_pattern, "", text)
-                # Clean up whitespace
-                block.content = re.sub(r"\s+", " ", text).strip()
-
-        return blocks
+    def _process_block(self, block: SayouBlock) -> SayouBlock:
+        if block.type != "text" or not isinstance(block.content, str):
+            return block
+
+        text = block.content
+        found_links = []
+
+        # 1. Find Markdown links
+        for title, url in _MD_LINK_RE.findall(text):
+            found_links.append({"title": title, "url": url})
+
+        # 2. Find Raw URLs (not included in Markdown)
+        seen = {link["url"] for link in found_links}
+        for url in _URL_RE.findall(text):
+            # Add if not already found
+            if url not in seen:
+                seen.add(url)
+                found_links.append({"title": "raw_link", "url": url})
+
+        # 3. Extract links to metadata
+        if found_links:
+            if "links" not in block.metadata:
+                block.metadata["links"] = []
+            block.metadata["links"].extend(found_links)
+
+        # 4. (Option) Remove links from text
+        if self.config.get("remove_links", False):
+            # Markdown links are left as text: [Google](...) -> Google
+            text = _MD_LINK_RE.sub(r"\1", text)
+            # Remaining Raw URLs are removed
+            text = _URL_RE.sub("", text)
+            # Clean up whitespace
+            block.content = _SPACE_RE.sub(" ", text).strip()
+
+        return block
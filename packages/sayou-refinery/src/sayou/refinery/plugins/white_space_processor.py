@@ -1,11 +1,14 @@
 import re
-from typing import Any, List
 
 from sayou.core.registry import register_component
 from sayou.core.schemas import SayouBlock
 
 from ..interfaces.base_processor import BaseProcessor
 
+_BLANK_RE = re.compile(r"[ \t]+")
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+_SPACE_RE = re.compile(r"\s+")
+
 
 @register_component("processor")
 class WhiteSpaceProcessor(BaseProcessor):
@@ -28,19 +31,18 @@ class WhiteSpaceProcessor(BaseProcessor):
             "preserve_newlines": preserve_newlines,
         }
 
-    def _do_process(self, blocks: List[SayouBlock]) -> List[SayouBlock]:
+    def _process_block(self, block: SayouBlock) -> SayouBlock:
         preserve_newlines = self.config.get("preserve_newlines", True)
 
-        for block in blocks:
-            if block.type == "text" and isinstance(block.content, str):
-                block.content = self._clean_text(block.content, preserve_newlines)
+        if block.type == "text" and isinstance(block.content, str):
+            block.content = self._clean_text(block.content, preserve_newlines)
 
-            elif block.type == "record" and isinstance(block.content, dict):
-                for k, v in block.content.items():
-                    if isinstance(v, str):
-                        block.content[k] = self._clean_text(v, preserve_newlines)
+        elif block.type == "record" and isinstance(block.content, dict):
+            for k, v in block.content.items():
+                if isinstance(v, str):
+                    block.content[k] = self._clean_text(v, preserve_newlines)
 
-        return blocks
+        return block
 
     def _clean_text(self, text: str, preserve_newlines: bool) -> str:
         if not text:
@@ -52,10 +54,10 @@ class WhiteSpaceProcessor(BaseProcessor):
         if preserve_newlines:
             # 2-A. Preserve newlines, limit consecutive spaces to 1, limit consecutive newlines to 2
             # (Preserve paragraphs, remove unnecessary whitespace)
-            text = re.sub(r"[ \t]+", " ", text)  # Tab/Space -> 1 space
-            text = re.sub(r"\n\s*\n", "\n\n", text)  # 3+ newlines -> 2 newlines
+            text = _BLANK_RE.sub(" ", text)  # Tab/Space -> 1 space
+            text = _PARAGRAPH_RE.sub("\n\n", text)  # 3+ newlines -> 2 newlines
         else:
             # 2-B. Replace all newlines with spaces (complete single line text)
-            text = re.sub(r"\s+", " ", text)
+            text = _SPACE_RE.sub(" ", text)
 
         return text.strip()
@@ -1,10 +1,18 @@
 import json
-from typing import List, Set
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Optional
 
 from sayou.core.registry import register_component
 from sayou.core.schemas import SayouBlock
 
 from ..interfaces.base_processor import BaseProcessor
+from ..utils.dedup_index import (
+    DedupIndex,
+    SqliteDedupIndex,
+    choose_bands,
+    minhash,
+    stable_hash,
+)
 
 
 @register_component("processor")
@@ -12,18 +20,89 @@ class Deduplicator(BaseProcessor):
     """
     (Tier 2) Removes duplicate blocks based on content hashing.
 
-    It computes a hash of the content for each block and filters out
-    subsequent blocks that match an already seen hash.
+    Each block's content is hashed with a stable 64-bit BLAKE2b hash
+    (identical across processes), and blocks whose hash was already seen
+    are filtered out.  Optionally, near-duplicates (e.g. boilerplate that
+    differs only in a date) are dropped too, using MinHash signatures and
+    LSH banding.
+
+    Seen content is kept in a ``DedupIndex``: per pass by default, or in a
+    SQLite file (``index_path``) so duplicates are also caught across runs
+    and between worker processes sharing that file.
+
+    Attributes:
+        MIN_LENGTH (int): Content shorter than this is never deduplicated.
+        BATCH_SIZE (int): Blocks checked against the index per transaction.
+        NUM_PERM (int): Default MinHash signature length.
+        SHINGLE_SIZE (int): Default words per shingle.
+        SIMILARITY_THRESHOLD (float): Default near-duplicate threshold.
+        MAX_CANDIDATES (int): Indexed signatures compared per block at most.
     """
 
     component_name = "Deduplicator"
 
+    MIN_LENGTH: int = 5
+    BATCH_SIZE: int = 512
+    NUM_PERM: int = 64
+    SHINGLE_SIZE: int = 3
+    SIMILARITY_THRESHOLD: float = 0.8
+    MAX_CANDIDATES: int = 32
+
     @classmethod
     def can_handle(cls, blocks: list) -> float:
-        if isinstance(blocks, list) and len(blocks) > 1:
+        # A single block can still repeat one held by a persistent index.
+        if isinstance(blocks, list) and len(blocks) > 0:
             return 1.0
         return 0.0
 
+    def __init__(self):
+        super().__init__()
+        self.near_duplicates = False
+        self.threshold = self.SIMILARITY_THRESHOLD
+        self.num_perm = self.NUM_PERM
+        self.shingle_size = self.SHINGLE_SIZE
+        self.bands = choose_bands(self.num_perm, self.threshold)
+        self._index: Optional[DedupIndex] = None
+
+    def initialize(
+        self,
+        near_duplicates: bool = False,
+        similarity_threshold: Optional[float] = None,
+        num_perm: Optional[int] = None,
+        shingle_size: Optional[int] = None,
+        index_path: Optional[str] = None,
+        **kwargs,
+    ):
+        """
+        Configure duplicate detection.
+
+        Args:
+            near_duplicates (bool): Also drop blocks whose estimated Jaccard
+                similarity to a kept block reaches ``similarity_threshold``.
+            similarity_threshold (float): Near-duplicate threshold.
+            num_perm (int): MinHash signature length.
+            shingle_size (int): Words per shingle.
+            index_path (str, optional): SQLite file for a persistent index.
+            **kwargs: Additional arguments.
+        """
+        self.near_duplicates = near_duplicates
+        self.threshold = similarity_threshold or self.SIMILARITY_THRESHOLD
+        self.num_perm = num_perm or self.NUM_PERM
+        self.shingle_size = shingle_size or self.SHINGLE_SIZE
+        self.bands = choose_bands(self.num_perm, self.threshold)
+
+        if self._index is not None:
+            self._index.close()
+        self._index = None
+        if index_path:
+            self._index = SqliteDedupIndex(
+                index_path,
+                self.bands,
+                self.threshold,
+                self.MAX_CANDIDATES,
+                num_perm=self.num_perm,
+            )
+
     def _do_process(self, blocks: List[SayouBlock]) -> List[SayouBlock]:
         """
         Iterate through blocks and remove duplicates.
@@ -34,24 +113,44 @@ class Deduplicator(BaseProcessor):
         Returns:
             List[SayouBlock]: A new list with duplicates removed.
         """
-        seen_hashes: Set[int] = set()
-        unique_blocks: List[SayouBlock] = []
+        return list(self._do_process_stream(blocks))
+
+    def _do_process_stream(self, blocks: Iterable[SayouBlock]) -> Iterator[SayouBlock]:
+        """
+        Yield each block unless its content was already seen.
+
+        Blocks are checked against the index ``BATCH_SIZE`` at a time; only
+        hashes and signatures are retained, never the blocks themselves.
+        """
+        index = self._index
+        if index is None:
+            index = DedupIndex(self.bands, self.threshold, self.MAX_CANDIDATES)
+        blocks = iter(blocks)
 
-        for block in blocks:
-            # Generate stable hash key
-            if isinstance(block.content, dict):
-                content_str = json.dumps(block.content, sort_keys=True)
-            else:
-                content_str = str(block.content)
+        while True:
+            batch = list(islice(blocks, self.BATCH_SIZE))
+            if not batch:
+                return
 
-            if len(content_str) < 5:
-                unique_blocks.append(block)
-                continue
+            keys = [self._content_key(block.content) for block in batch]
+            checked = [i for i, key in enumerate(keys) if len(key) >= self.MIN_LENGTH]
+            fresh = index.add_batch(
+                [(stable_hash(keys[i]), self._signature(keys[i])) for i in checked]
+            )
+            duplicates = {i for i, new in zip(checked, fresh) if not new}
 
-            content_hash = hash(content_str)
+            for i, block in enumerate(batch):
+                if i not in duplicates:
+                    yield block
 
-            if content_hash not in seen_hashes:
-                seen_hashes.add(content_hash)
-                unique_blocks.append(block)
+    def _signature(self, key: str):
+        if not self.near_duplicates:
+            return None
+        return minhash(key, self.num_perm, self.shingle_size)
 
-        return unique_blocks
+    @staticmethod
+    def _content_key(content: Any) -> str:
+        # Generate stable hash key
+        if isinstance(content, dict):
+            return json.dumps(content, sort_keys=True)
+        return str(content)
@@ -4,6 +4,9 @@ from sayou.core.registry import register_component
 from sayou.core.schemas import SayouBlock
 
 from ..interfaces.base_processor import BaseProcessor
+from ..utils.column_stats import RunningStats, column_stats, numeric_column, to_float
+
+IMPUTE_STRATEGIES = ("mean", "median", "min", "max")
 
 
 @register_component("processor")
@@ -11,7 +14,17 @@ class Imputer(BaseProcessor):
     """
     (Tier 2) Fills missing values in 'record' type blocks using defined rules.
 
-    Only operates on blocks with type='record' where the content is a dictionary.
+    Operates on record blocks whose content is a dictionary (one row) or a
+    list of dictionaries (a batch of rows, as produced by ``RecordNormalizer``
+    for tabular input).  Batches are filled column by column.
+
+    A rule is either a constant default or a statistic of the column,
+    ``{"strategy": "mean" | "median" | "min" | "max", "default": ...}``.
+    Column statistics are accumulated over the records of the current pass
+    (one ``process`` / ``process_stream`` call or pipeline run, see
+    ``RunningStats``), so a batch is filled with its own statistics and a
+    stream of blocks with running ones; ``default`` is used until the
+    column has a value.
     """
 
     component_name = "Imputer"
@@ -27,34 +40,93 @@ class Imputer(BaseProcessor):
         Set imputation rules.
 
         Args:
-            rules (Dict[str, Any]): Mapping of field names to default values.
-                                    Example: {"category": "Unknown", "price": 0.0}
+            rules (Dict[str, Any]): Mapping of field names to default values
+                or strategies.
+                Example: {"category": "Unknown", "price": {"strategy": "median"}}
             **kwargs: Additional arguments.
+
+        Raises:
+            ValueError: If a rule names an unknown strategy.
         """
         self.rules = imputation_rules or {}
         if not self.rules:
             self._log("Imputer initialized with no rules.", level="warning")
 
-    def _do_process(self, blocks: List[SayouBlock]) -> List[SayouBlock]:
+        self._constants: Dict[str, Any] = {}
+        self._strategies: Dict[str, Dict[str, Any]] = {}
+        for field, rule in self.rules.items():
+            if isinstance(rule, dict) and "strategy" in rule:
+                if rule["strategy"] not in IMPUTE_STRATEGIES:
+                    raise ValueError(
+                        f"Unknown imputation strategy for '{field}': "
+                        f"{rule['strategy']!r} (expected one of {IMPUTE_STRATEGIES})"
+                    )
+                self._strategies[field] = rule
+            else:
+                self._constants[field] = rule
+
+        self.reset_statistics()
+
+    def _begin_pass(self) -> None:
+        self.reset_statistics()
+
+    def reset_statistics(self) -> None:
+        """Forget the column statistics gathered so far."""
+        self.stats: Dict[str, RunningStats] = column_stats(
+            self._strategies,
+            [f for f, r in self._strategies.items() if r["strategy"] == "median"],
+        )
+
+    def _process_block(self, block: SayouBlock) -> SayouBlock:
         """
-        Apply imputation rules to record blocks.
+        Apply imputation rules to a record block.
 
         Args:
-            blocks (List[SayouBlock]): Input blocks.
+            block (SayouBlock): Input block.
 
         Returns:
-            List[SayouBlock]: Blocks with missing values filled.
+            SayouBlock: The block with missing values filled.
         """
-        for block in blocks:
-            if block.type != "record" or not isinstance(block.content, dict):
-                continue
-
-            record = block.content
-
-            for field, default_value in self.rules.items():
-                if record.get(field) is None:
-                    record[field] = default_value
-
-            block.content = record
-
-        return blocks
+        if block.type != "record":
+            return block
+
+        if isinstance(block.content, dict):
+            self._fill_record(block.content)
+        elif isinstance(block.content, list):
+            self._fill_rows(block.content)
+
+        return block
+
+    def _fill_record(self, record: Dict[str, Any]) -> None:
+        for field, rule in self._strategies.items():
+            value = record.get(field)
+            stats = self.stats[field]
+            if value is None:
+                value = stats.statistic(rule["strategy"])
+                record[field] = rule.get("default") if value is None else value
+            else:
+                stats.add(to_float(value))
+
+        for field, default_value in self._constants.items():
+            if record.get(field) is None:
+                record[field] = default_value
+
+    def _fill_rows(self, rows: List[Any]) -> None:
+        for field, rule in self._strategies.items():
+            stats = self.stats[field]
+            stats.update(numeric_column(rows, field))
+            value = stats.statistic(rule["strategy"])
+            self._fill_column(
+                rows, field, rule.get("default") if value is None else value
+            )
+
+        for field, value in self._constants.items():
+            self._fill_column(rows, field, value)
+
+    @staticmethod
+    def _fill_column(rows: List[Any], field: str, value: Any) -> None:
+        if value is None:
+            return
+        for row in rows:
+            if isinstance(row, dict) and row.get(field) is None:
+                row[field] = value
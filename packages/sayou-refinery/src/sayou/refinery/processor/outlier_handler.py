@@ -1,9 +1,12 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from sayou.core.registry import register_component
 from sayou.core.schemas import SayouBlock
 
 from ..interfaces.base_processor import BaseProcessor
+from ..utils.column_stats import RunningStats, column_stats, numeric_column, to_float
+
+OUTLIER_METHODS = ("zscore", "iqr")
 
 
 @register_component("processor")
@@ -11,12 +14,32 @@ class OutlierHandler(BaseProcessor):
     """
     (Tier 2) Handles numerical outliers in 'record' blocks.
 
-    Can either 'drop' the entire block or 'clamp' the value to a boundary
-    if a field violates the defined min/max rules.
+    Can either 'drop' the record or 'clamp' the value to a boundary if a
+    field violates the defined rules.  Boundaries are fixed (``min`` /
+    ``max``) or derived from the column itself (``method``):
+
+    * ``"zscore"`` — outside ``mean ± threshold · std``.
+    * ``"iqr"`` — outside ``[Q1 - k · IQR, Q3 + k · IQR]``.
+
+    Record blocks holding a list of rows are handled column by column and
+    only the violating rows are dropped (the block goes when none remain).
+    Column statistics are accumulated over the records of the current pass
+    (one ``process`` / ``process_stream`` call or pipeline run, see
+    ``RunningStats``); derived boundaries apply once a column has
+    ``MIN_SAMPLES`` values.
+
+    Attributes:
+        MIN_SAMPLES (int): Values needed before ``method`` rules apply.
+        ZSCORE_THRESHOLD (float): Default ``threshold`` for ``"zscore"``.
+        IQR_K (float): Default ``k`` for ``"iqr"``.
     """
 
     component_name = "OutlierHandler"
 
+    MIN_SAMPLES: int = 30
+    ZSCORE_THRESHOLD: float = 3.0
+    IQR_K: float = 1.5
+
     @classmethod
     def can_handle(cls, blocks: list) -> float:
         return 0.8 if super().can_handle(blocks) > 0 else 0.0
@@ -30,62 +53,136 @@ class OutlierHandler(BaseProcessor):
                 Example:
                 {
                     "age": {"min": 0, "max": 120, "action": "drop"},
-                    "score": {"min": 0, "max": 100, "action": "clamp"}
+                    "score": {"min": 0, "max": 100, "action": "clamp"},
+                    "price": {"method": "iqr", "k": 3.0, "action": "drop"}
                 }
             **kwargs: Additional arguments.
+
+        Raises:
+            ValueError: If a rule names an unknown method.
         """
         self.rules = outlier_rules or {}
-
-    def _do_process(self, blocks: List[SayouBlock]) -> List[SayouBlock]:
+        for field, rule in self.rules.items():
+            method = rule.get("method")
+            if method is not None and method not in OUTLIER_METHODS:
+                raise ValueError(
+                    f"Unknown outlier method for '{field}': {method!r} "
+                    f"(expected one of {OUTLIER_METHODS})"
+                )
+        self.reset_statistics()
+
+    def _begin_pass(self) -> None:
+        self.reset_statistics()
+
+    def reset_statistics(self) -> None:
+        """Forget the column statistics gathered so far."""
+        methods = {f: r["method"] for f, r in self.rules.items() if r.get("method")}
+        self.stats: Dict[str, RunningStats] = column_stats(
+            methods, [f for f, m in methods.items() if m == "iqr"]
+        )
+
+    def _process_block(self, block: SayouBlock) -> Optional[SayouBlock]:
         """
-        Check numerical fields against rules and filter/modify blocks.
+        Check numerical fields against rules and filter/modify the block.
 
         Args:
-            blocks (List[SayouBlock]): Input blocks.
+            block (SayouBlock): Input block.
 
         Returns:
-            List[SayouBlock]: Filtered or modified list of blocks.
+            Optional[SayouBlock]: The (clamped) block, or None to drop it.
         """
-        valid_blocks = []
-
-        for block in blocks:
-            if block.type != "record" or not isinstance(block.content, dict):
-                valid_blocks.append(block)
+        if block.type != "record":
+            return block
+
+        if isinstance(block.content, dict):
+            return block if self._check_record(block.content) else None
+
+        if isinstance(block.content, list) and block.content:
+            kept = self._apply(block.content)
+            if not kept:
+                return None
+            if len(kept) != len(block.content):
+                block.content[:] = kept
+                if "record_count" in block.metadata:
+                    block.metadata["record_count"] = len(kept)
+
+        return block
+
+    def _check_record(self, record: Dict[str, Any]) -> bool:
+        """Clamp ``record`` in place; False if it must be dropped."""
+        for field, rule in self.rules.items():
+            value = to_float(record.get(field))
+            if value is None:
                 continue
+            stats = self.stats.get(field)
+            if stats is not None:
+                stats.add(value)
+
+            low, high = self._bounds(rule, stats)
+            if low is not None and value < low:
+                bound = low
+            elif high is not None and value > high:
+                bound = high
+            else:
+                continue
+            action = rule.get("action", "drop")
+            if action == "drop":
+                return False
+            if action == "clamp":
+                record[field] = bound
+        return True
+
+    def _apply(self, rows: List[Any]) -> List[Any]:
+        """Clamp ``rows`` in place and return those that are not dropped."""
+        keep: Optional[List[bool]] = None
+
+        for field, rule in self.rules.items():
+            column = numeric_column(rows, field)
+            stats = self.stats.get(field)
+            if stats is not None:
+                stats.update(column)
+
+            low, high = self._bounds(rule, stats)
+            if low is None and high is None:
+                continue
+            action = rule.get("action", "drop")
 
-            record = block.content
-            should_drop = False
-
-            for field, rule in self.rules.items():
-                val = record.get(field)
-                if val is None:
+            for index, value in enumerate(column):
+                if value is None:
                     continue
-
-                try:
-                    val_f = float(val)
-                    min_v = rule.get("min")
-                    max_v = rule.get("max")
-                    action = rule.get("action", "drop")
-
-                    if min_v is not None and val_f < min_v:
-                        if action == "drop":
-                            should_drop = True
-                            break
-                        elif action == "clamp":
-                            record[field] = min_v
-
-                    if max_v is not None and val_f > max_v:
-                        if action == "drop":
-                            should_drop = True
-                            break
-                        elif action == "clamp":
-                            record[field] = max_v
-
-                except (ValueError, TypeError):
+                if low is not None and value < low:
+                    bound = low
+                elif high is not None and value > high:
+                    bound = high
+                else:
                     continue
-
-            if not should_drop:
-                block.content = record
-                valid_blocks.append(block)
-
-        return valid_blocks
+                if action == "drop":
+                    if keep is None:
+                        keep = [True] * len(rows)
+                    keep[index] = False
+                elif action == "clamp":
+                    rows[index][field] = bound
+
+        if keep is None:
+            return rows
+        return [row for row, kept in zip(rows, keep) if kept]
+
+    def _bounds(
+        self, rule: Dict[str, Any], stats: Optional[RunningStats]
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """Effective ``(low, high)``: the tighter of fixed and derived bounds."""
+        low, high = rule.get("min"), rule.get("max")
+        if stats is None or stats.count < self.MIN_SAMPLES:
+            return low, high
+
+        if rule["method"] == "zscore":
+            spread = rule.get("threshold", self.ZSCORE_THRESHOLD) * stats.std
+            derived_low, derived_high = stats.mean - spread, stats.mean + spread
+        else:
+            q1, q3 = stats.quantile(0.25), stats.quantile(0.75)
+            spread = rule.get("k", self.IQR_K) * (q3 - q1)
+            derived_low, derived_high = q1 - spread, q3 + spread
+
+        low = derived_low if low is None else max(low, derived_low)
+        high = derived_high if high is None else min(high, derived_high)
+        return low, high
@@ -1,10 +1,15 @@
-import re
-from typing import List
+import hashlib
+from typing import Dict, List, Optional
 
 from sayou.core.registry import register_component
 from sayou.core.schemas import SayouBlock
 
 from ..interfaces.base_processor import BaseProcessor
+from ..utils.pii_scanner import PII_PATTERNS, PiiScanner
+
+PII_ACTIONS = ("mask", "hash", "drop")
+# Kinds detected unless ``pii_types`` is given; the others are opt-in.
+DEFAULT_PII_TYPES = ("email", "phone")
 
 
 @register_component("processor")
@@ -12,8 +17,23 @@ class PiiMasker(BaseProcessor):
     """
     (Tier 2) Masks Personally Identifiable Information (PII) in text blocks.
 
-    Uses Regex patterns to identify and redact sensitive data like emails
-    and phone numbers in 'text' and 'md' blocks.
+    Identifies emails and phone numbers — and, when listed in ``pii_types``,
+    Korean resident registration numbers (RRN), card numbers, bank account
+    numbers and Korean street addresses — in 'text' and 'md' blocks with a
+    single-pass ``PiiScanner``: all patterns are matched by one compiled
+    alternation, and validators (Luhn, RRN checksum) run only on candidates.
+
+    Each kind is handled by an action:
+
+    * ``mask`` — replace with a token such as ``[EMAIL]``.
+    * ``hash`` — replace with a keyed digest such as ``[EMAIL:1f0c9a2b7d3e]``,
+      so equal values stay joinable without being readable.  Requires a
+      secret ``hash_salt``: phone numbers and RRNs are few enough to be
+      recovered from an unkeyed digest by enumeration.
+    * ``drop`` — discard the whole block.
+
+    Spans of the detected identifiers (offsets into the original content)
+    are recorded in ``metadata["pii_spans"]``.
     """
 
     component_name = "PiiMasker"
@@ -22,38 +42,105 @@ class PiiMasker(BaseProcessor):
     def can_handle(cls, blocks: list) -> float:
         return 1.0 if super().can_handle(blocks) > 0 else 0.0
 
-    def initialize(self, mask_email: bool = True, mask_phone: bool = True, **kwargs):
+    def initialize(
+        self,
+        mask_email: bool = True,
+        mask_phone: bool = True,
+        pii_types: Optional[List[str]] = None,
+        pii_action: str = "mask",
+        pii_actions: Optional[Dict[str, str]] = None,
+        pii_patterns: Optional[Dict[str, str]] = None,
+        rrn_checksum: bool = True,
+        hash_salt: str = "",
+        **kwargs,
+    ):
         """
         Configure masking targets.
 
         Args:
             mask_email (bool): Whether to mask email addresses (default: True).
             mask_phone (bool): Whether to mask phone numbers (default: True).
+            pii_types (List[str], optional): Built-in kinds to detect, from
+                ``email``, ``rrn``, ``card``, ``phone``, ``account`` and
+                ``address`` (default: ``email`` and ``phone``).
+            pii_action (str): Default action: 'mask', 'hash' or 'drop'.
+            pii_actions (Dict[str, str], optional): Per-kind action overrides.
+            pii_patterns (Dict[str, str], optional): Extra ``kind -> regex``
+                patterns (non-capturing groups only).
+            rrn_checksum (bool): Require a valid RRN check digit; disable to
+                catch numbers issued since October 2020.
+            hash_salt (str): Secret key for the 'hash' action.
             **kwargs: Additional arguments.
+
+        Raises:
+            ValueError: On an unknown kind or action, or if a kind uses
+                'hash' without a ``hash_salt``.
         """
-        self.mask_email = mask_email
-        self.mask_phone = mask_phone
-        self._email_re = re.compile(r"[\w\.-]+@[\w\.-]+")
-        # Simple phone regex (customizable)
-        self._phone_re = re.compile(r"\d{3}[-\.\s]??\d{3,4}[-\.\s]??\d{4}")
+        kinds = list(pii_types) if pii_types is not None else list(DEFAULT_PII_TYPES)
+        if not mask_email:
+            kinds = [k for k in kinds if k != "email"]
+        if not mask_phone:
+            kinds = [k for k in kinds if k != "phone"]
 
-    def _do_process(self, blocks: List[SayouBlock]) -> List[SayouBlock]:
+        self.actions = {kind: pii_action for kind in kinds + list(pii_patterns or {})}
+        self.actions.update(pii_actions or {})
+        invalid = {a for a in self.actions.values() if a not in PII_ACTIONS}
+        if invalid:
+            raise ValueError(f"Unknown PII action(s): {sorted(invalid)}")
+        if not hash_salt and "hash" in self.actions.values():
+            raise ValueError("The 'hash' PII action requires a secret hash_salt.")
+
+        self.scanner = PiiScanner(kinds, pii_patterns, rrn_checksum=rrn_checksum)
+        self._salt = hash_salt.encode("utf-8")
+
+    def _process_block(self, block: SayouBlock) -> Optional[SayouBlock]:
         """
-        Apply masking regex to text content.
+        Replace identifiers in text content according to their action.
 
         Args:
-            blocks (List[SayouBlock]): Input blocks.
+            block (SayouBlock): Input block.
 
         Returns:
-            List[SayouBlock]: Blocks with sensitive info replaced by tokens.
+            Optional[SayouBlock]: The block with sensitive info replaced by
+            tokens, or None when a 'drop' kind was found.
         """
-        for block in blocks:
-            if block.type not in ["text", "md"] or not isinstance(block.content, str):
-                continue
+        if block.type not in ("text", "md") or not isinstance(block.content, str):
+            return block
+
+        text = block.content
+        matches = self.scanner.scan(text)
+        if not matches:
+            return block
+
+        parts = []
+        spans = []
+        last = 0
+        for match in matches:
+            action = self.actions.get(match.kind, "mask")
+            if action == "drop":
+                return None
+            parts.append(text[last : match.start])
+            parts.append(self._replacement(match.kind, match.text, action))
+            spans.append(
+                {
+                    "type": match.kind,
+                    "start": match.start,
+                    "end": match.end,
+                    "action": action,
+                }
+            )
+            last = match.end
+        parts.append(text[last:])
 
-            if self.mask_email:
-                block.content = self._email_re.sub("[EMAIL]", block.content)
-            if self.mask_phone:
-                block.content = self._phone_re.sub("[PHONE]", block.content)
+        block.content = "".join(parts)
+        block.metadata.setdefault("pii_spans", []).extend(spans)
+        return block
 
-        return blocks
+    def _replacement(self, kind: str, value: str, action: str) -> str:
+        label = kind.upper()
+        if action == "hash":
+            digest = hashlib.blake2b(
+                value.encode("utf-8"), digest_size=6, key=self._salt
+            ).hexdigest()
+            return f"[{label}:{digest}]"
+        return f"[{label}]"
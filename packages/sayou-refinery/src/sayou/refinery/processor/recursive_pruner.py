@@ -1,4 +1,4 @@
-from typing import Any, List
+from typing import Any, Optional
 
 from sayou.core.registry import register_component
 from sayou.core.schemas import SayouBlock
@@ -16,17 +16,13 @@ class RecursivePruner(BaseProcessor):
             return 1.0
         return 0.0
 
-    def _do_process(self, blocks: List[SayouBlock]) -> List[SayouBlock]:
-        optimized_blocks = []
+    def _process_block(self, block: SayouBlock) -> Optional[SayouBlock]:
+        pruned_content = self._prune_empty(block.content)
 
-        for block in blocks:
-            pruned_content = self._prune_empty(block.content)
-
-            if pruned_content:
-                block.content = pruned_content
-                optimized_blocks.append(block)
-
-        return optimized_blocks
+        if not pruned_content:
+            return None
+        block.content = pruned_content
+        return block
 
     def _prune_empty(self, data: Any) -> Any:
         if isinstance(data, dict):
@@ -38,33 +38,28 @@ class TextCleaner(BaseProcessor):
         self.patterns = [re.compile(p) for p in (patterns or [])]
         self._space_re = re.compile(r"[ \t]+")
 
-    def _do_process(self, blocks: List[SayouBlock]) -> List[SayouBlock]:
+    def _process_block(self, block: SayouBlock) -> SayouBlock:
         """
-        Apply cleaning logic to text blocks.
+        Apply cleaning logic to a text block.
 
         Args:
-            blocks (List[SayouBlock]): Input blocks.
+            block (SayouBlock): Input block.
 
         Returns:
-            List[SayouBlock]: Cleaned blocks.
+            SayouBlock: The cleaned block.
         """
-        for block in blocks:
-            if block.type not in ["text", "md"]:
-                continue
+        if block.type not in ("text", "md") or not isinstance(block.content, str):
+            return block
 
-            if not isinstance(block.content, str):
-                continue
+        text = block.content
 
-            text = block.content
+        # 1. Custom Patterns Removal
+        for pat in self.patterns:
+            text = pat.sub("", text)
 
-            # 1. Custom Patterns Removal
-            for pat in self.patterns:
-                text = pat.sub("", text)
+        # 2. Whitespace Normalization
+        if self.normalize_space:
+            text = self._space_re.sub(" ", text)
 
-            # 2. Whitespace Normalization
-            if self.normalize_space:
-                text = self._space_re.sub(" ", text)
-
-            block.content = text.strip()
-
-        return blocks
+        block.content = text.strip()
+        return block
@@ -0,0 +1,202 @@
+import math
+import random
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sayou.core.lazy import optional_import
+
+# Only used to summarise large batches; every result is also computed
+# without it.
+np = optional_import("numpy")
+
+# Below this many values the NumPy round-trip costs more than it saves.
+_NUMPY_MIN_BATCH = 256
+# Larger reservoir updates re-sort on the next quantile instead.
+_INCREMENTAL_SORT_MAX = 16
+
+
+def to_float(value: Any) -> Optional[float]:
+    """
+    Numeric view of a record value, or None if it has none.
+
+    Numbers and numeric strings convert; ``None``, booleans, NaN and
+    anything ``float()`` rejects do not.
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if number != number else number
+
+
+def numeric_column(rows: Sequence[Any], field: str) -> List[Optional[float]]:
+    """
+    Extract ``field`` from a batch of records as floats, aligned with ``rows``.
+
+    Rows that are not dicts or lack a numeric value yield None.
+    """
+    return [to_float(row.get(field)) if isinstance(row, dict) else None for row in rows]
+
+
+def _summarise(values: Sequence[float]) -> Tuple[int, float, float, float, float]:
+    """``(count, mean, M2, min, max)`` of a non-empty batch."""
+    n = len(values)
+    if np is not None and n >= _NUMPY_MIN_BATCH:
+        arr = np.asarray(values, dtype=np.float64)
+        mean = float(arr.mean())
+        m2 = float(((arr - mean) ** 2).sum())
+        return n, mean, m2, float(arr.min()), float(arr.max())
+    mean = math.fsum(values) / n
+    m2 = math.fsum([(v - mean) ** 2 for v in values])
+    return n, mean, m2, min(values), max(values)
+
+
+class RunningStats:
+    """
+    (Utility) Streaming summary of one numeric column.
+
+    Count, mean and variance are maintained with Welford's algorithm,
+    merged batch by batch (Chan et al.), so statistics over data that does
+    not fit in memory cost O(1) space and are as exact as a two-pass
+    computation.  Each batch is summarised with NumPy when it is installed.
+
+    Quantiles (median, IQR) are read from a uniform reservoir sample of at
+    most ``reservoir_size`` values: exact until that many values have been
+    seen, an unbiased estimate afterwards.  The reservoir is only kept when
+    ``track_quantiles`` is set.
+    """
+
+    __slots__ = (
+        "count",
+        "mean",
+        "_m2",
+        "min",
+        "max",
+        "_reservoir",
+        "_reservoir_size",
+        "_rng",
+        "_sorted",
+    )
+
+    def __init__(self, track_quantiles: bool = False, reservoir_size: int = 10_000):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._reservoir: Optional[List[float]] = [] if track_quantiles else None
+        self._reservoir_size = reservoir_size
+        # Seeded: the same data always yields the same estimates.
+        self._rng = random.Random(0)
+        self._sorted: Optional[List[float]] = None
+
+    def add(self, value: Optional[float]) -> None:
+        """Add a single value (Welford's update); None is ignored."""
+        if value is None:
+            return
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if self._reservoir is not None:
+            self._sample([value], self.count - 1)
+
+    def update(self, values: Iterable[Optional[float]]) -> None:
+        """Add a batch of values; None entries are ignored."""
+        batch = [v for v in values if v is not None]
+        if not batch:
+            return
+
+        n_b, mean_b, m2_b, min_b, max_b = _summarise(batch)
+        n_a = self.count
+        total = n_a + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / total
+        self._m2 += m2_b + delta * delta * n_a * n_b / total
+        self.count = total
+        if min_b < self.min:
+            self.min = min_b
+        if max_b > self.max:
+            self.max = max_b
+
+        if self._reservoir is not None:
+            self._sample(batch, n_a)
+
+    def _sample(self, batch: List[float], seen: int) -> None:
+        """
+        Reservoir sampling (Algorithm R) over the new values.
+
+        The sorted view used by ``quantile`` is patched in place for small
+        updates, so a record-at-a-time stream does not re-sort per value.
+        """
+        reservoir = self._reservoir
+        ordered = self._sorted if len(batch) <= _INCREMENTAL_SORT_MAX else None
+        room = self._reservoir_size - len(reservoir)
+        if room > 0:
+            head = batch[:room]
+            reservoir.extend(head)
+            if ordered is not None:
+                for value in head:
+                    insort(ordered, value)
+            seen += len(head)
+            batch = batch[room:]
+        randrange = self._rng.randrange
+        size = self._reservoir_size
+        for value in batch:
+            seen += 1
+            slot = randrange(seen)
+            if slot < size:
+                if ordered is not None:
+                    del ordered[bisect_left(ordered, reservoir[slot])]
+                    insort(ordered, value)
+                reservoir[slot] = value
+        self._sorted = ordered
+
+    @property
+    def variance(self) -> float:
+        """Population variance (0.0 before two values are seen)."""
+        return self._m2 / self.count if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        The ``q``-quantile (0..1), linearly interpolated like NumPy's default.
+
+        Returns None when nothing has been seen or quantiles are not tracked.
+        """
+        if not self._reservoir:
+            return None
+        if self._sorted is None:
+            self._sorted = sorted(self._reservoir)
+        values = self._sorted
+        position = (len(values) - 1) * q
+        low = math.floor(position)
+        high = min(low + 1, len(values) - 1)
+        return values[low] + (values[high] - values[low]) * (position - low)
+
+    def statistic(self, name: str) -> Optional[float]:
+        """Look up ``mean``, ``median``, ``min``, ``max`` or ``std`` by name."""
+        if not self.count:
+            return None
+        if name == "median":
+            return self.quantile(0.5)
+        if name == "std":
+            return self.std
+        return getattr(self, name)
+
+
+def column_stats(
+    fields: Iterable[str], quantile_fields: Iterable[str] = ()
+) -> Dict[str, RunningStats]:
+    """One ``RunningStats`` per field, tracking quantiles where requested."""
+    wants_quantiles = set(quantile_fields)
+    return {f: RunningStats(track_quantiles=f in wants_quantiles) for f in fields}
@@ -0,0 +1,351 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import zlib
+from array import array
+from contextlib import contextmanager, nullcontext
+from itertools import repeat
+from operator import eq, mod
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+# Marks a MinHash bin that received no shingle (CRC-32 values are >= 0).
+EMPTY_BIN = -1
+_EMPTY_TO_NONE = {EMPTY_BIN: None}
+
+Signature = Tuple[int, ...]
+
+
+def stable_hash(text: str) -> int:
+    """
+    64-bit content hash that is identical across processes and runs.
+
+    Unlike the built-in ``hash()`` of a string, it is not salted per
+    process, so it can be persisted and compared between workers.
+    """
+    digest = hashlib.blake2b(
+        text.encode("utf-8", "surrogatepass"), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def minhash(text: str, num_perm: int = 64, shingle_size: int = 3) -> Signature:
+    """
+    One-permutation MinHash signature over word shingles.
+
+    Each shingle is hashed once and assigned to one of ``num_perm`` bins by
+    its hash; a bin keeps its smallest hash.  Bins no shingle fell into are
+    ``EMPTY_BIN``.  Shingles are hashed with CRC-32 of their UTF-8 bytes,
+    which is fixed by the algorithm, so persisted signatures stay valid
+    across processes, platforms and Python versions.
+
+    Args:
+        text (str): Input text; lower-cased and split on whitespace.
+        num_perm (int): Signature length.
+        shingle_size (int): Words per shingle.
+
+    Returns:
+        Tuple[int, ...]: The signature (empty for blank text).
+    """
+    words = text.lower().encode("utf-8", "replace").split()
+    if not words:
+        return ()
+    if len(words) <= shingle_size:
+        shingles = {zlib.crc32(b" ".join(words))}
+    else:
+        grams = zip(*(words[i:] for i in range(shingle_size)))
+        shingles = set(map(zlib.crc32, map(b" ".join, grams)))
+    # Descending order: the last (smallest) value assigned to a bin wins.
+    hashes = sorted(shingles, reverse=True)
+    bins = dict(zip(map(mod, hashes, repeat(num_perm)), hashes))
+    return tuple(map(bins.get, range(num_perm), repeat(EMPTY_BIN)))
+
+
+def similarity(a: Signature, b: Signature, probe: Optional[tuple] = None) -> float:
+    """
+    Estimated Jaccard similarity of two signatures.
+
+    Bins that are empty in both signatures carry no information and are
+    left out of the estimate.
+
+    Args:
+        a, b: Signatures of equal length.
+        probe: ``empty_probe(a)``; pass it when comparing ``a`` with many
+            signatures.
+    """
+    if probe is None:
+        probe = empty_probe(a)
+    # Equal bins counted with and without the empty ones: the difference
+    # is the number of bins empty in both.
+    matches = sum(map(eq, probe, b))
+    informative = len(a) - (sum(map(eq, a, b)) - matches)
+    return matches / informative if informative else 1.0
+
+
+def empty_probe(signature: Signature) -> tuple:
+    """``signature`` with empty bins replaced by None, which equals nothing."""
+    return tuple(map(_EMPTY_TO_NONE.get, signature, signature))
+
+
+def choose_bands(num_perm: int, threshold: float) -> int:
+    """
+    Number of LSH bands whose detection threshold ``(1/b) ** (1/r)`` is
+    closest to, without exceeding, ``threshold``.
+    """
+    best, best_gap = 1, None
+    for bands in range(1, num_perm + 1):
+        if num_perm % bands:
+            continue
+        rows = num_perm // bands
+        gap = threshold - (1 / bands) ** (1 / rows)
+        if gap >= 0 and (best_gap is None or gap < best_gap):
+            best, best_gap = bands, gap
+    return best
+
+
+def band_keys(signature: Signature, bands: int) -> List[int]:
+    """
+    LSH bucket keys of ``signature``; all-empty bands are skipped.
+
+    Keys are 64-bit blake2b digests of the band number and its rows, so
+    they can be persisted like ``stable_hash`` values.
+    """
+    rows = len(signature) // bands
+    keys = []
+    for band in range(bands):
+        part = signature[band * rows : (band + 1) * rows]
+        if part.count(EMPTY_BIN) < rows:
+            digest = hashlib.blake2b(
+                array("q", (band,) + part).tobytes(), digest_size=8
+            ).digest()
+            keys.append(int.from_bytes(digest, "big", signed=True))
+    return keys
+
+
+class DedupIndex:
+    """
+    (Utility) In-memory index of seen content for ``Deduplicator``.
+
+    Holds exact content hashes and, for near-duplicate detection, MinHash
+    signatures bucketed by LSH band.  Lives as long as the object.
+
+    Templated text fills some buckets with many similar-but-distinct
+    blocks; at most ``max_candidates`` signatures are compared per lookup
+    so such buckets cannot make detection quadratic.
+    """
+
+    def __init__(
+        self, bands: int = 16, threshold: float = 0.8, max_candidates: int = 32
+    ):
+        self.bands = bands
+        self.threshold = threshold
+        self.max_candidates = max_candidates
+        self._exact = set()
+        self._buckets = {}
+        self._signatures: List[Signature] = []
+
+    def add_batch(
+        self, entries: Sequence[Tuple[int, Optional[Signature]]]
+    ) -> List[bool]:
+        """
+        Record a batch of blocks and report which ones are new.
+
+        A block is a duplicate if its exact hash was seen before, or if its
+        signature (when given) is at least ``threshold`` similar to one
+        already indexed.  Duplicates within the batch are caught too; the
+        whole batch is applied atomically.
+
+        Args:
+            entries: ``(stable_hash, signature or None)`` per block.
+
+        Returns:
+            List[bool]: True for each entry seen for the first time.
+        """
+        with self._transaction():
+            return [self._add(h, sig) for h, sig in entries]
+
+    def _add(self, content_hash: int, signature: Optional[Signature]) -> bool:
+        if not self._claim(content_hash):
+            return False
+        if not signature:
+            return True
+        keys = band_keys(signature, self.bands)
+        probe = empty_probe(signature)
+        for other in self._candidates(keys):
+            if similarity(signature, other, probe) >= self.threshold:
+                return False
+        self._insert(keys, signature)
+        return True
+
+    # ------------------------------------------------------------------
+    # Storage primitives
+    # ------------------------------------------------------------------
+
+    def _transaction(self):
+        return nullcontext()
+
+    def _claim(self, content_hash: int) -> bool:
+        if content_hash in self._exact:
+            return False
+        self._exact.add(content_hash)
+        return True
+
+    def _candidates(self, keys: List[int]) -> Iterable[Signature]:
+        seen = set()
+        for key in keys:
+            for doc in self._buckets.get(key, ()):
+                if doc not in seen:
+                    if len(seen) == self.max_candidates:
+                        return
+                    seen.add(doc)
+                    yield self._signatures[doc]
+
+    def _insert(self, keys: List[int], signature: Signature) -> None:
+        doc = len(self._signatures)
+        self._signatures.append(signature)
+        for key in keys:
+            self._buckets.setdefault(key, []).append(doc)
+
+    def close(self) -> None:
+        pass
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+
+class SqliteDedupIndex(DedupIndex):
+    """
+    (Utility) Persistent ``DedupIndex`` in a single SQLite file.
+
+    Duplicates are recognised across runs, and across worker processes
+    sharing the file: each batch is checked and recorded in one
+    ``BEGIN IMMEDIATE`` transaction (WAL mode), so two workers never both
+    keep the same content.
+
+    The file records ``FORMAT_VERSION`` (``PRAGMA user_version``) and the
+    ``num_perm`` / ``bands`` it was built with; opening it with different
+    signature hashing or LSH settings raises instead of silently never
+    matching.
+    """
+
+    FORMAT_VERSION = 2
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS dedup_exact (hash INTEGER PRIMARY KEY)",
+        "CREATE TABLE IF NOT EXISTS dedup_signatures ("
+        "doc INTEGER PRIMARY KEY, sig BLOB NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS dedup_bands ("
+        "key INTEGER NOT NULL, doc INTEGER NOT NULL, PRIMARY KEY (key, doc)"
+        ") WITHOUT ROWID",
+        "CREATE TABLE IF NOT EXISTS dedup_meta ("
+        "name TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+    )
+
+    def __init__(
+        self,
+        path: str,
+        bands: int = 16,
+        threshold: float = 0.8,
+        max_candidates: int = 32,
+        num_perm: int = 64,
+    ):
+        super().__init__(bands, threshold, max_candidates)
+        self.num_perm = num_perm
+        self.path = os.path.abspath(os.path.expanduser(path))
+        parent = os.path.dirname(self.path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, check_same_thread=False, timeout=30, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._check_format()
+        for statement in self._SCHEMA:
+            self._conn.execute(statement)
+        self._conn.execute(f"PRAGMA user_version={self.FORMAT_VERSION}")
+        self._check_settings()
+
+    def _check_format(self) -> None:
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if version == self.FORMAT_VERSION:
+            return
+        (tables,) = self._conn.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE name = 'dedup_signatures'"
+        ).fetchone()
+        if tables:
+            self._conn.close()
+            raise ValueError(
+                f"Dedup index {self.path} has format {version}, expected "
+                f"{self.FORMAT_VERSION}; delete it to rebuild."
+            )
+
+    def _check_settings(self) -> None:
+        """Record ``num_perm`` and ``bands`` in a new file; reject a mismatch."""
+        expected = {"num_perm": self.num_perm, "bands": self.bands}
+        with self._transaction():
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO dedup_meta (name, value) VALUES (?, ?)",
+                expected.items(),
+            )
+            stored = dict(self._conn.execute("SELECT name, value FROM dedup_meta"))
+        mismatched = [
+            f"{name}={stored[name]} (expected {value})"
+            for name, value in expected.items()
+            if stored[name] != value
+        ]
+        if mismatched:
+            self._conn.close()
+            raise ValueError(
+                f"Dedup index {self.path} was built with {', '.join(mismatched)}; "
+                "delete it to rebuild."
+            )
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _claim(self, content_hash: int) -> bool:
+        cursor = self._conn.execute(
+            "INSERT OR IGNORE INTO dedup_exact (hash) VALUES (?)", (content_hash,)
+        )
+        return cursor.rowcount == 1
+
+    def _candidates(self, keys: List[int]) -> Iterable[Signature]:
+        if not keys:
+            return []
+        marks = ",".join("?" * len(keys))
+        rows = self._conn.execute(
+            "SELECT sig FROM dedup_signatures WHERE doc IN "
+            f"(SELECT DISTINCT doc FROM dedup_bands WHERE key IN ({marks}) LIMIT ?)",
+            (*keys, self.max_candidates),
+        )
+        return (tuple(array("q", blob)) for (blob,) in rows)
+
+    def _insert(self, keys: List[int], signature: Signature) -> None:
+        cursor = self._conn.execute(
+            "INSERT INTO dedup_signatures (sig) VALUES (?)",
+            (array("q", signature).tobytes(),),
+        )
+        doc = cursor.lastrowid
+        self._conn.executemany(
+            "INSERT INTO dedup_bands (key, doc) VALUES (?, ?)",
+            [(key, doc) for key in keys],
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM dedup_exact").fetchone()
+        return count
@@ -0,0 +1,240 @@
+import re
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+# ---------------------------------------------------------------------------
+# Validators (run on candidates only)
+# ---------------------------------------------------------------------------
+
+
+def luhn_valid(number: str) -> bool:
+    """Luhn (mod 10) check of the digits in ``number``."""
+    digits = [int(c) for c in number if c.isdigit()]
+    if len(digits) < 13:
+        return False
+    total = 0
+    for i, d in enumerate(reversed(digits)):
+        if i % 2:
+            d *= 2
+            if d > 9:
+                d -= 9
+        total += d
+    return total % 10 == 0
+
+
+def rrn_valid(number: str, checksum: bool = True) -> bool:
+    """
+    Korean resident registration number (주민등록번호) check.
+
+    The first six digits must be a plausible ``YYMMDD`` date and the
+    seventh a sex/century code.  The final digit is verified when
+    ``checksum`` is set; numbers issued since October 2020 no longer carry
+    one.
+    """
+    digits = [int(c) for c in number if c.isdigit()]
+    if len(digits) != 13:
+        return False
+    month = digits[2] * 10 + digits[3]
+    day = digits[4] * 10 + digits[5]
+    if not (1 <= month <= 12 and 1 <= day <= 31) or digits[6] in (0, 9):
+        return False
+    if not checksum:
+        return True
+    weights = (2, 3, 4, 5, 6, 7, 8, 9, 2, 3, 4, 5)
+    total = sum(d * w for d, w in zip(digits, weights))
+    return (11 - total % 11) % 10 == digits[12]
+
+
+def _account_valid(number: str) -> bool:
+    return 10 <= len(number) - number.count("-") <= 14
+
+
+# ---------------------------------------------------------------------------
+# Patterns
+# ---------------------------------------------------------------------------
+
+# Order matters: at a given position the first kind whose pattern matches
+# and whose validator accepts the candidate wins.  Patterns must not use
+# capturing groups.
+PII_PATTERNS: Dict[str, str] = {
+    # Domain as broad as the original masker's: dotless hosts count too.
+    "email": r"[\w.+-]+@[\w.-]+",
+    "rrn": r"(?<!\d)\d{6}[- ]?[1-8]\d{6}(?!\d)",
+    "card": r"(?<!\d)\d{4}(?:[- ]?\d{4}){2}[- ]?\d{1,7}(?!\d)",
+    "phone": r"(?<!\d)(?:\+82[-. ]?)?\d{2,3}[-. ]?\d{3,4}[-. ]?\d{4}(?!\d)",
+    "account": r"(?<!\d)(?=[\d-]{12})\d{2,6}-\d{2,6}-\d{2,7}(?:-\d{1,3})?(?!\d)",
+    "address": (
+        r"(?:[가-힣]+(?:특별시|광역시|특별자치시|특별자치도|도|시)\s+)?"
+        r"[가-힣]+(?:시|군|구)\s+"
+        r"[가-힣0-9]+(?:(?:로|길)\s*\d+(?:-\d+)?|[동리]\s*\d+(?:-\d+)?(?:번지)?)"
+    ),
+}
+
+# Numeric kinds are only tried on runs of digits (and single separators)
+# at least this long; shorter runs cannot hold any of them.
+_NUMERIC_KINDS = ("rrn", "card", "phone", "account")
+_MIN_NUMERIC_RUN = 9
+_DIGIT_RUN = re.compile(r"\d(?:[-. ]?\d)*")
+
+# Emails are anchored on "@"; the local part is found by looking back.
+_EMAIL_LOCAL = re.compile(r"[\w.+-]{1,64}$")
+
+# Addresses are anchored on the road / lot number that must end them.
+_ADDRESS_ANCHOR = re.compile(r"(?:로|길|동|리)\s*\d")
+_ADDRESS_WINDOW = 48
+
+
+class PiiMatch(NamedTuple):
+    """One detected identifier; offsets index the scanned text."""
+
+    kind: str
+    start: int
+    end: int
+    text: str
+
+
+class PiiScanner:
+    """
+    (Utility) Single-pass, multi-pattern PII scanner.
+
+    Python's ``re`` has no multi-pattern automaton: an alternation still
+    tries every branch at every position, so its cost grows with each
+    pattern added.  The scanner therefore looks for cheap *anchors* first,
+    in C-speed searches, and runs the full patterns only around them:
+
+    * numeric kinds (RRN, card, phone, account) — one combined alternation
+      applied only to digit runs long enough to hold any of them;
+    * email — each ``@``;
+    * address — a road (``로``/``길``) or lot (``동``/``리``) number.
+
+    Text without anchors is never touched by the full patterns, so
+    throughput stays flat as built-in kinds are enabled.  Validators (Luhn
+    for cards, the RRN date/checksum, account length) run only on
+    candidates; when one rejects a candidate, the remaining numeric kinds
+    are tried at the same position.  Extra user patterns have no anchor
+    and are scanned as one additional alternation.
+    """
+
+    def __init__(
+        self,
+        kinds: Optional[Iterable[str]] = None,
+        extra_patterns: Optional[Dict[str, str]] = None,
+        rrn_checksum: bool = True,
+    ):
+        """
+        Args:
+            kinds: Built-in kinds to enable (default: all of ``PII_PATTERNS``).
+            extra_patterns: Additional ``kind -> regex`` entries.  Their
+                groups must be non-capturing.
+            rrn_checksum (bool): Require a valid RRN check digit.
+        """
+        enabled = list(PII_PATTERNS) if kinds is None else list(kinds)
+        unknown = [k for k in enabled if k not in PII_PATTERNS]
+        if unknown:
+            raise ValueError(f"Unknown PII kinds: {unknown}")
+
+        self.kinds = enabled + list(extra_patterns or {})
+        self.validators: Dict[str, Callable[[str], bool]] = {
+            "card": luhn_valid,
+            "rrn": lambda s: rrn_valid(s, rrn_checksum),
+            "account": _account_valid,
+        }
+        self._rank = {kind: i for i, kind in enumerate(self.kinds)}
+
+        self._numeric_kinds = [k for k in _NUMERIC_KINDS if k in enabled]
+        self._numeric = self._alternation(
+            {k: PII_PATTERNS[k] for k in self._numeric_kinds}
+        )
+        self._single = {k: re.compile(PII_PATTERNS[k]) for k in self._numeric_kinds}
+        self._email = re.compile(PII_PATTERNS["email"]) if "email" in enabled else None
+        self._address = (
+            re.compile(PII_PATTERNS["address"]) if "address" in enabled else None
+        )
+        self._extra = self._alternation(extra_patterns or {})
+
+    @staticmethod
+    def _alternation(patterns: Dict[str, str]) -> Optional["re.Pattern"]:
+        if not patterns:
+            return None
+        return re.compile("|".join(f"(?P<{k}>{p})" for k, p in patterns.items()))
+
+    def scan(self, text: str) -> List[PiiMatch]:
+        """
+        Find every identifier in ``text``.
+
+        Returns:
+            List[PiiMatch]: Non-overlapping matches in text order; where
+            candidates overlap, the earlier (then higher-priority) one wins.
+        """
+        found: List[PiiMatch] = []
+        if self._numeric is not None:
+            self._scan_numeric(text, found)
+        if self._email is not None and "@" in text:
+            self._scan_email(text, found)
+        if self._address is not None:
+            self._scan_address(text, found)
+        if self._extra is not None:
+            for m in self._extra.finditer(text):
+                found.append(PiiMatch(m.lastgroup, m.start(), m.end(), m.group()))
+
+        if len(found) < 2:
+            return found
+        found.sort(key=lambda m: (m.start, self._rank[m.kind]))
+        merged = [found[0]]
+        for match in found[1:]:
+            if match.start >= merged[-1].end:
+                merged.append(match)
+        return merged
+
+    def _scan_numeric(self, text: str, found: List[PiiMatch]) -> None:
+        for run in _DIGIT_RUN.finditer(text):
+            start, end = run.span()
+            if end - start < _MIN_NUMERIC_RUN:
+                continue
+            # Room for a "+82 " country prefix.
+            for m in self._numeric.finditer(text, max(0, start - 4), end):
+                kind = m.lastgroup
+                candidate = m.group()
+                validate = self.validators.get(kind)
+                if validate is None or validate(candidate):
+                    found.append(PiiMatch(kind, m.start(), m.end(), candidate))
+                    continue
+                retry = self._retry(text, m.start(), end, kind)
+                if retry is not None:
+                    found.append(retry)
+
+    def _retry(
+        self, text: str, pos: int, endpos: int, rejected: str
+    ) -> Optional[PiiMatch]:
+        """Try the numeric kinds after ``rejected`` at ``pos``."""
+        kinds = self._numeric_kinds
+        for kind in kinds[kinds.index(rejected) + 1 :]:
+            m = self._single[kind].match(text, pos, endpos)
+            if m is None:
+                continue
+            validate = self.validators.get(kind)
+            if validate is None or validate(m.group()):
+                return PiiMatch(kind, m.start(), m.end(), m.group())
+        return None
+
+    def _scan_email(self, text: str, found: List[PiiMatch]) -> None:
+        at = text.find("@")
+        while at != -1:
+            local = _EMAIL_LOCAL.search(text, max(0, at - 64), at)
+            if local is not None:
+                m = self._email.match(text, local.start())
+                if m is not None:
+                    found.append(PiiMatch("email", m.start(), m.end(), m.group()))
+                    at = text.find("@", m.end())
+                    continue
+            at = text.find("@", at + 1)
+
+    def _scan_address(self, text: str, found: List[PiiMatch]) -> None:
+        last_end = 0
+        for anchor in _ADDRESS_ANCHOR.finditer(text):
+            if anchor.start() < last_end:
+                continue
+            lo = max(last_end, anchor.start() - _ADDRESS_WINDOW)
+            m = self._address.search(text, lo, anchor.end() + _ADDRESS_WINDOW)
+            if m is not None and m.start() <= anchor.start() < m.end():
+                found.append(PiiMatch("address", m.start(), m.end(), m.group()))
+                last_end = m.end()
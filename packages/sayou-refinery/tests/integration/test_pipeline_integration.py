@@ -7,6 +7,7 @@ Exercises the full normalize → process chain using real plugin instances.
 from __future__ import annotations
 
 import pytest
+from sayou.core.html import available_html_backends
 from sayou.core.schemas import SayouBlock
 
 from sayou.refinery.normalizer.doc_markdown_normalizer import \
@@ -14,6 +15,7 @@ from sayou.refinery.normalizer.doc_markdown_normalizer import \
 from sayou.refinery.normalizer.html_text_normalizer import HtmlTextNormalizer
 from sayou.refinery.normalizer.raw_json_normalizer import RawJsonNormalizer
 from sayou.refinery.normalizer.record_normalizer import RecordNormalizer
+from sayou.refinery.core.exceptions import RefineryError
 from sayou.refinery.pipeline import RefineryPipeline
 from sayou.refinery.plugins.white_space_processor import WhiteSpaceProcessor
 from sayou.refinery.processor.deduplicator import Deduplicator
@@ -66,9 +68,7 @@ class TestDocMarkdownWithProcessors:
 
 class TestHtmlWithPiiMasker:
     def test_html_pii_masked(self):
-        try:
-            from bs4 import BeautifulSoup  # noqa: F401
-        except ImportError:
+        if "bs4" not in available_html_backends():
             pytest.skip("beautifulsoup4 not installed")
 
         pipeline = RefineryPipeline(
@@ -82,6 +82,16 @@ class TestHtmlWithPiiMasker:
         assert "[PHONE]" in combined
 
 
+class TestMisconfiguredPiiMasker:
+    def test_hash_without_salt_fails_the_run(self):
+        with pytest.raises(RefineryError, match="hash_salt"):
+            RefineryPipeline().run(
+                "mail me at a@b.com or 010-1234-5678",
+                processors=["PiiMasker"],
+                pii_action="hash",
+            )
+
+
 # ---------------------------------------------------------------------------
 # RecordNormalizer → RecursivePruner → Deduplicator
 # ---------------------------------------------------------------------------
@@ -8,6 +8,8 @@ Covers:
 - text / table / image / chart element handling
 - Markdown heading/list conversion
 - include_headers / include_footers flags
+- normalize_stream over a page iterator
+- typed Document models walked without model_dump
 """
 
 from __future__ import annotations
@@ -214,6 +216,55 @@ class TestElementHandling:
         img_blocks = [b for b in blocks if b.type == "image_base64"]
         assert len(img_blocks) == 0
 
+    @pytest.mark.parametrize("placeholder", ["TITLE (1)", "CENTER_TITLE (3)", "title"])
+    def test_pptx_title_placeholder_becomes_heading(self, placeholder):
+        doc = self._make_doc(
+            [
+                {
+                    "type": "text",
+                    "id": "s1",
+                    "text": "Quarterly Review",
+                    "raw_attributes": {"placeholder_type": placeholder},
+                    "meta": {"page_num": 1},
+                }
+            ]
+        )
+        norm = DocMarkdownNormalizer()
+        norm.initialize()
+        blocks = norm._do_normalize(doc)
+        assert blocks[0].content == "# Quarterly Review"
+
+    def test_body_placeholder_stays_plain(self):
+        doc = self._make_doc(
+            [
+                {
+                    "type": "text",
+                    "id": "s2",
+                    "text": "Bullet text",
+                    "raw_attributes": {"placeholder_type": "BODY (2)"},
+                    "meta": {"page_num": 1},
+                }
+            ]
+        )
+        norm = DocMarkdownNormalizer()
+        norm.initialize()
+        assert norm._do_normalize(doc)[0].content == "Bullet text"
+
+    def test_images_skipped_when_disabled(self):
+        doc = self._make_doc(
+            [
+                {
+                    "type": "image",
+                    "id": "img3",
+                    "image_base64": "abc123",
+                    "meta": {"page_num": 1},
+                }
+            ]
+        )
+        norm = DocMarkdownNormalizer()
+        norm.initialize(include_images=False)
+        assert norm._do_normalize(doc) == []
+
     def test_chart_element_produces_text_block(self):
         doc = self._make_doc(
             [
@@ -313,3 +364,128 @@ class TestPlainStringInput:
         assert len(blocks) == 1
         assert blocks[0].type == "md"
         assert "# Just a Markdown string" in blocks[0].content
+
+
+# ---------------------------------------------------------------------------
+# normalize_stream (page iterator)
+# ---------------------------------------------------------------------------
+
+
+class TestNormalizeStream:
+    def test_stream_matches_batch(self, minimal_doc_dict):
+        norm = DocMarkdownNormalizer()
+        norm.initialize()
+        batch = norm._do_normalize(minimal_doc_dict)
+        streamed = list(
+            norm.normalize_stream(
+                iter(minimal_doc_dict["pages"]),
+                metadata=minimal_doc_dict["metadata"],
+            )
+        )
+        assert [b.content for b in streamed] == [b.content for b in batch]
+        assert [b.metadata for b in streamed] == [b.metadata for b in batch]
+
+    def test_stream_is_lazy(self, minimal_doc_dict):
+        pulled = []
+
+        def pages():
+            for page in minimal_doc_dict["pages"]:
+                pulled.append(page["page_num"])
+                yield page
+
+        norm = DocMarkdownNormalizer()
+        norm.initialize()
+        stream = norm.normalize_stream(pages())
+        assert next(stream).metadata["page_num"] == 1
+        assert pulled == [1]
+
+
+# ---------------------------------------------------------------------------
+# Typed Document models
+# ---------------------------------------------------------------------------
+
+
+class TestTypedDocument:
+    @pytest.fixture
+    def models(self):
+        return pytest.importorskip("sayou.document.models")
+
+    def _make_doc(self, models):
+        m = models
+        image = m.ImageElement(
+            id="p1:img",
+            type="image",
+            meta=m.ElementMetadata(page_num=1),
+            image_format="png",
+        ).attach_data(b"\x89PNG-bytes")
+        page = m.Page(
+            page_num=1,
+            elements=[
+                m.TextElement(
+                    id="p1:h",
+                    type="text",
+                    meta=m.ElementMetadata(page_num=1),
+                    text="Intro",
+                    raw_attributes={"semantic_type": "heading", "heading_level": 1},
+                ),
+                m.TableElement(
+                    id="p1:t",
+                    type="table",
+                    meta=m.ElementMetadata(page_num=1),
+                    data=[["k", "v"], ["a", "1"]],
+                ),
+                image,
+            ],
+        )
+        return m.Document(
+            file_name="f.pdf",
+            file_id="f",
+            doc_type="pdf",
+            metadata=m.DocumentMetadata(title="T"),
+            page_count=1,
+            pages=[page],
+        )
+
+    def test_model_matches_dumped_dict(self, models):
+        doc = self._make_doc(models)
+        norm = DocMarkdownNormalizer()
+        norm.initialize()
+        from_model = norm._do_normalize(doc)
+        from_dict = norm._do_normalize(doc.model_dump())
+        assert [(b.type, b.content, b.metadata) for b in from_model] == [
+            (b.type, b.content, b.metadata) for b in from_dict
+        ]
+        assert from_model[0].type == "image_base64"
+        assert from_model[0].metadata["format"] == "png"
+
+    def test_document_is_not_dumped(self, models, monkeypatch):
+        doc = self._make_doc(models)
+
+        def forbidden(*args, **kwargs):
+            raise AssertionError("model_dump called")
+
+        monkeypatch.setattr(type(doc), "model_dump", forbidden)
+        monkeypatch.setattr(models.Page, "model_dump", forbidden)
+        norm = DocMarkdownNormalizer()
+        norm.initialize()
+        assert len(norm._do_normalize(doc)) == 2
+
+    def test_images_not_encoded_when_excluded(self, models, monkeypatch):
+        doc = self._make_doc(models)
+        monkeypatch.setattr(
+            models.ImageElement,
+            "get_image_base64",
+            lambda self: pytest.fail("image encoded"),
+        )
+        norm = DocMarkdownNormalizer()
+        norm.initialize(include_images=False)
+        assert [b.type for b in norm._do_normalize(doc)] == ["md"]
+
+    def test_stream_expands_whole_documents(self, models):
+        doc = self._make_doc(models)
+        norm = DocMarkdownNormalizer()
+        norm.initialize()
+        streamed = list(norm.normalize_stream(iter([doc])))
+        assert [b.content for b in streamed] == [
+            b.content for b in norm._do_normalize(doc)
+        ]
@@ -5,6 +5,7 @@ Unit tests for HtmlTextNormalizer, RawJsonNormalizer, and RecordNormalizer.
 from __future__ import annotations
 
 import pytest
+from sayou.core.html import available_html_backends
 from sayou.core.schemas import SayouBlock
 
 from sayou.refinery.normalizer.html_text_normalizer import HtmlTextNormalizer
@@ -37,9 +38,7 @@ class TestHtmlTextNormalizerCanHandle:
 
 class TestHtmlTextNormalizerNormalize:
     def _norm(self, html: str):
-        try:
-            from bs4 import BeautifulSoup  # noqa: F401
-        except ImportError:
+        if "bs4" not in available_html_backends():
             pytest.skip("beautifulsoup4 not installed")
         n = HtmlTextNormalizer()
         n.initialize()
@@ -72,10 +71,12 @@ class TestHtmlTextNormalizerNormalize:
         # Should not have 3+ consecutive newlines
         assert "\n\n\n" not in blocks[0].content
 
+    def test_default_backend_keeps_headless_title_text(self):
+        blocks = self._norm("<title>A</title><p>x</p>")
+        assert blocks[0].content.split() == ["A", "x"]
+
     def test_non_string_input_raises(self):
-        try:
-            from bs4 import BeautifulSoup  # noqa: F401
-        except ImportError:
+        if "bs4" not in available_html_backends():
             pytest.skip("beautifulsoup4 not installed")
         n = HtmlTextNormalizer()
         n.initialize()
@@ -193,3 +194,25 @@ class TestRecordNormalizerNormalize:
         n.initialize()
         with pytest.raises(Exception):
             n._do_normalize("raw string")
+
+    def test_rows_are_copied(self):
+        n = RecordNormalizer()
+        n.initialize()
+        rows = [{"id": "1", "score": 1.5}, {"id": "2", "geo": {"lat": 1.0}}]
+        blocks = n._do_normalize(rows)
+        blocks[0].content[0]["score"] = 0
+        blocks[0].content[1]["geo"]["lat"] = 0
+        assert rows == [{"id": "1", "score": 1.5}, {"id": "2", "geo": {"lat": 1.0}}]
+
+    def test_arrow_like_table_becomes_batch_block(self):
+        class FakeTable:
+            def to_pylist(self):
+                return [{"id": 1, "v": None}, {"id": 2, "v": 3.0}]
+
+        assert RecordNormalizer.can_handle(FakeTable(), "auto") >= 0.8
+        n = RecordNormalizer()
+        n.initialize()
+        blocks = n._do_normalize(FakeTable())
+        assert len(blocks) == 1
+        assert blocks[0].content == [{"id": 1, "v": None}, {"id": 2, "v": 3.0}]
+        assert blocks[0].metadata["record_count"] == 2
@@ -1,17 +1,22 @@
 """
 Unit tests for all Refinery processors:
 - TextCleaner
-- PiiMasker
-- Deduplicator
-- Imputer
+- PiiMasker (+ PiiScanner)
+- Deduplicator (+ DedupIndex / MinHash)
+- Imputer (+ RunningStats)
 - OutlierHandler
 - RecursivePruner
 - LinkProcessor
 - WhiteSpaceProcessor
+- Streaming (process_stream / element-wise hooks)
 """
 
 from __future__ import annotations
 
+import sqlite3
+import subprocess
+import sys
+
 import pytest
 from sayou.core.schemas import SayouBlock
 
@@ -23,6 +28,17 @@ from sayou.refinery.processor.outlier_handler import OutlierHandler
 from sayou.refinery.processor.pii_masker import PiiMasker
 from sayou.refinery.processor.recursive_pruner import RecursivePruner
 from sayou.refinery.processor.text_cleaner import TextCleaner
+from sayou.refinery.utils.column_stats import RunningStats
+from sayou.refinery.utils.dedup_index import (
+    DedupIndex,
+    SqliteDedupIndex,
+    band_keys,
+    choose_bands,
+    minhash,
+    similarity,
+    stable_hash,
+)
+from sayou.refinery.utils.pii_scanner import PII_PATTERNS
 
 
 def _text(content: str, **meta) -> SayouBlock:
@@ -90,6 +106,12 @@ class TestPiiMasker:
         assert "[EMAIL]" in blocks[0].content
         assert "alice@example.com" not in blocks[0].content
 
+    def test_email_domain_without_dot_masked(self):
+        masker = PiiMasker()
+        masker.initialize(mask_phone=False)
+        blocks = masker._do_process([_text("Send to root@localhost please")])
+        assert blocks[0].content == "Send to [EMAIL] please"
+
     def test_masks_phone(self):
         masker = PiiMasker()
         masker.initialize(mask_email=False, mask_phone=True)
@@ -118,6 +140,92 @@ class TestPiiMasker:
         blocks = masker._do_process([_text("user@domain.com stays")])
         assert "user@domain.com" in blocks[0].content
 
+    def test_rrn_masked_only_with_valid_checksum(self):
+        masker = PiiMasker()
+        masker.initialize(pii_types=["rrn"])
+        blocks = masker._do_process([_text("RRN 900101-1234568 / 900101-1234567")])
+        assert blocks[0].content == "RRN [RRN] / 900101-1234567"
+
+    def test_rrn_checksum_can_be_disabled(self):
+        masker = PiiMasker()
+        masker.initialize(pii_types=["rrn"], rrn_checksum=False)
+        blocks = masker._do_process([_text("RRN 900101-1234567")])
+        assert blocks[0].content == "RRN [RRN]"
+
+    def test_card_requires_luhn(self):
+        masker = PiiMasker()
+        masker.initialize(pii_types=["card"])
+        blocks = masker._do_process(
+            [_text("card 4111 1111 1111 1111, order 4111 1111 1111 1112")]
+        )
+        assert blocks[0].content == "card [CARD], order 4111 1111 1111 1112"
+
+    def test_account_and_address_masked(self):
+        masker = PiiMasker()
+        masker.initialize(pii_types=["account", "address"])
+        blocks = masker._do_process(
+            [_text("계좌 110-123-456789, 주소 서울특별시 강남구 테헤란로 123 입니다")]
+        )
+        assert blocks[0].content == "계좌 [ACCOUNT], 주소 [ADDRESS] 입니다"
+
+    def test_dates_are_not_pii(self):
+        masker = PiiMasker()
+        masker.initialize(pii_types=list(PII_PATTERNS))
+        blocks = masker._do_process([_text("Released 2024-01-01, build 20240101")])
+        assert blocks[0].content == "Released 2024-01-01, build 20240101"
+
+    def test_spans_reported_on_original_text(self):
+        masker = PiiMasker()
+        masker.initialize()
+        text = "Mail bob@test.com now"
+        blocks = masker._do_process([_text(text)])
+        (span,) = blocks[0].metadata["pii_spans"]
+        assert text[span["start"] : span["end"]] == "bob@test.com"
+        assert span["type"] == "email" and span["action"] == "mask"
+
+    def test_hash_action_is_keyed_and_deterministic(self):
+        masker = PiiMasker()
+        masker.initialize(pii_action="hash", hash_salt="k1")
+        a, b = masker._do_process([_text("bob@test.com"), _text("bob@test.com")])
+        assert a.content == b.content
+        assert a.content.startswith("[EMAIL:") and "bob" not in a.content
+
+        other = PiiMasker()
+        other.initialize(pii_action="hash", hash_salt="k2")
+        assert other._do_process([_text("bob@test.com")])[0].content != a.content
+
+    def test_drop_action_removes_block(self):
+        masker = PiiMasker()
+        masker.initialize(pii_types=["email", "rrn"], pii_actions={"rrn": "drop"})
+        result = masker._do_process(
+            [_text("RRN 900101-1234568"), _text("mail bob@test.com")]
+        )
+        assert [b.content for b in result] == ["mail [EMAIL]"]
+
+    def test_custom_patterns(self):
+        masker = PiiMasker()
+        masker.initialize(pii_patterns={"employee": r"EMP-\d{6}"})
+        blocks = masker._do_process([_text("badge EMP-123456")])
+        assert blocks[0].content == "badge [EMPLOYEE]"
+
+    def test_default_kinds_are_email_and_phone(self):
+        masker = PiiMasker()
+        masker.initialize()
+        text = "RRN 900101-1234568, card 4111 1111 1111 1111"
+        assert masker._do_process([_text(text)])[0].content == text
+
+    def test_hash_action_requires_salt(self):
+        with pytest.raises(ValueError, match="hash_salt"):
+            PiiMasker().initialize(pii_action="hash")
+        with pytest.raises(ValueError, match="hash_salt"):
+            PiiMasker().initialize(pii_actions={"phone": "hash"})
+
+    def test_invalid_configuration_raises(self):
+        with pytest.raises(ValueError):
+            PiiMasker().initialize(pii_types=["passport"])
+        with pytest.raises(ValueError):
+            PiiMasker().initialize(pii_action="shred")
+
 
 # ===========================================================================
 # Deduplicator
@@ -155,6 +263,134 @@ class TestDeduplicator:
         dedup = Deduplicator()
         assert dedup._do_process([]) == []
 
+    def test_stream_state_does_not_leak_between_passes(self):
+        dedup = Deduplicator()
+        first = list(dedup.process_stream(iter([_text("same content")])))
+        second = list(dedup.process_stream(iter([_text("same content")])))
+        assert len(first) == len(second) == 1
+
+    def test_hash_is_stable_across_processes(self):
+        script = (
+            "from sayou.refinery.utils.dedup_index import stable_hash;"
+            "print(stable_hash('same content'))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True
+        ).stdout
+        assert int(out) == stable_hash("same content")
+
+    def test_near_duplicates_dropped_when_enabled(self):
+        body = " ".join(f"word{i}" for i in range(60))
+        blocks = [
+            _text(f"Report of 2024-01-01. {body}"),
+            _text(f"Report of 2024-02-01. {body}"),
+            _text(" ".join(f"other{i}" for i in range(60))),
+        ]
+        exact = Deduplicator()
+        exact.initialize()
+        assert len(exact._do_process(list(blocks))) == 3
+
+        near = Deduplicator()
+        near.initialize(near_duplicates=True)
+        result = near._do_process(list(blocks))
+        assert [b.content[:20] for b in result] == [
+            "Report of 2024-01-01",
+            "other0 other1 other2",
+        ]
+
+    def test_persistent_index_catches_duplicates_across_runs(self, tmp_path):
+        path = str(tmp_path / "dedup.db")
+        first = Deduplicator()
+        first.initialize(index_path=path)
+        assert len(first._do_process([_text("seen in run one")])) == 1
+
+        second = Deduplicator()
+        second.initialize(index_path=path)
+        result = second._do_process([_text("seen in run one"), _text("brand new")])
+        assert [b.content for b in result] == ["brand new"]
+
+    def test_persistent_index_shared_between_instances(self, tmp_path):
+        path = str(tmp_path / "dedup.db")
+        a, b = Deduplicator(), Deduplicator()
+        a.initialize(index_path=path, near_duplicates=True)
+        b.initialize(index_path=path, near_duplicates=True)
+        body = " ".join(f"word{i}" for i in range(60))
+        assert len(a._do_process([_text(f"2024-01-01 {body}")])) == 1
+        assert b._do_process([_text(f"2024-03-05 {body}")]) == []
+
+
+class TestDedupIndex:
+    def test_minhash_similarity_tracks_overlap(self):
+        words = [f"w{i}" for i in range(100)]
+        base = minhash(" ".join(words))
+        close = minhash(" ".join(words[:95] + ["x"] * 5))
+        far = minhash(" ".join(f"z{i}" for i in range(100)))
+        assert similarity(base, base) == 1.0
+        assert similarity(base, close) > 0.8
+        assert similarity(base, far) < 0.1
+
+    def test_choose_bands_stays_below_threshold(self):
+        bands = choose_bands(64, 0.8)
+        rows = 64 // bands
+        assert (1 / bands) ** (1 / rows) <= 0.8
+
+    def test_batch_catches_duplicates_within_batch(self):
+        index = DedupIndex()
+        assert index.add_batch([(1, None), (2, None), (1, None)]) == [
+            True,
+            True,
+            False,
+        ]
+
+    def test_signatures_and_band_keys_are_pinned(self):
+        # Persisted values: a change here invalidates every existing index.
+        signature = minhash("the quick brown fox jumps", num_perm=4)
+        assert signature == (-1, 1834140213, 1272230570, -1)
+        assert band_keys(signature, 2) == [
+            6937615749366872313,
+            -8476972667931120274,
+        ]
+
+    def test_sqlite_candidates_distinct_before_limit(self, tmp_path):
+        index = SqliteDedupIndex(str(tmp_path / "dedup.db"), max_candidates=2)
+        with index._transaction():
+            index._insert([1, 2], (10, 10))
+            index._insert([3], (20, 20))
+        assert sorted(index._candidates([1, 2, 3])) == [(10, 10), (20, 20)]
+        index.close()
+
+    def test_sqlite_rejects_other_format(self, tmp_path):
+        path = str(tmp_path / "dedup.db")
+        SqliteDedupIndex(path).close()
+        conn = sqlite3.connect(path)
+        conn.execute("PRAGMA user_version=1")
+        conn.close()
+        with pytest.raises(ValueError, match="format"):
+            SqliteDedupIndex(path)
+
+    def test_sqlite_rejects_other_lsh_settings(self, tmp_path):
+        path = str(tmp_path / "dedup.db")
+        SqliteDedupIndex(path, bands=16, num_perm=64).close()
+        SqliteDedupIndex(path, bands=16, num_perm=64).close()
+        with pytest.raises(ValueError, match="num_perm"):
+            SqliteDedupIndex(path, bands=16, num_perm=128)
+        with pytest.raises(ValueError, match="bands"):
+            SqliteDedupIndex(path, bands=8, num_perm=64)
+
+        dedup = Deduplicator()
+        path = str(tmp_path / "processor.db")
+        dedup.initialize(near_duplicates=True, index_path=path)
+        dedup.initialize()
+        with pytest.raises(ValueError, match="num_perm"):
+            dedup.initialize(near_duplicates=True, num_perm=32, index_path=path)
+
+    def test_sqlite_batch_rolls_back_on_error(self, tmp_path):
+        index = SqliteDedupIndex(str(tmp_path / "dedup.db"))
+        with pytest.raises(sqlite3.IntegrityError):
+            index.add_batch([(1, None), ("not-an-int", None)])
+        assert len(index) == 0
+        index.close()
+
 
 # ===========================================================================
 # Imputer
@@ -191,6 +427,77 @@ class TestImputer:
         result = imputer._do_process([block])
         assert result[0].content["a"] is None
 
+    def test_fills_batch_block_column_wise(self):
+        imputer = Imputer()
+        imputer.initialize(imputation_rules={"city": "Seoul"})
+        rows = [{"city": "Busan"}, {"city": None}, {}]
+        result = imputer._do_process([_record(rows)])
+        assert [r["city"] for r in result[0].content] == ["Busan", "Seoul", "Seoul"]
+
+    @pytest.mark.parametrize(
+        "strategy, expected", [("mean", 20.0), ("median", 15.0), ("max", 40)]
+    )
+    def test_statistic_strategies_on_batch(self, strategy, expected):
+        imputer = Imputer()
+        imputer.initialize(imputation_rules={"age": {"strategy": strategy}})
+        rows = [{"age": 10}, {"age": None}, {"age": "20"}, {"age": 40}, {"age": 10}]
+        result = imputer._do_process([_record(rows)])
+        assert result[0].content[1]["age"] == expected
+
+    def test_statistics_run_across_single_records(self):
+        imputer = Imputer()
+        imputer.initialize(imputation_rules={"x": {"strategy": "mean", "default": -1}})
+        blocks = [_record({"x": None}), _record({"x": 2}), _record({"x": 4})]
+        blocks.append(_record({"x": None}))
+        result = imputer._do_process(blocks)
+        assert [b.content["x"] for b in result] == [-1, 2, 4, 3.0]
+
+    def test_statistics_reset_between_process_calls(self):
+        imputer = Imputer()
+        imputer.initialize(imputation_rules={"x": {"strategy": "mean"}})
+        imputer.process([_record({"x": 1000}), _record({"x": None})])
+        result = imputer.process([_record({"x": 1}), _record({"x": None})])
+        assert result[1].content["x"] == 1.0
+
+    def test_unknown_strategy_raises(self):
+        with pytest.raises(ValueError):
+            Imputer().initialize(imputation_rules={"x": {"strategy": "mode"}})
+
+
+class TestRunningStats:
+    def test_batches_match_two_pass_statistics(self):
+        import statistics
+
+        values = [float(v * 7 % 13) for v in range(500)]
+        stats = RunningStats()
+        stats.update(values[:7])
+        stats.update(values[7:300])
+        for v in values[300:]:
+            stats.add(v)
+        assert stats.count == 500
+        assert stats.mean == pytest.approx(statistics.fmean(values))
+        assert stats.std == pytest.approx(statistics.pstdev(values))
+        assert (stats.min, stats.max) == (0.0, 12.0)
+
+    def test_quantiles_exact_within_reservoir(self):
+        stats = RunningStats(track_quantiles=True)
+        stats.update([4.0, 1.0, 3.0, 2.0])
+        stats.add(5.0)
+        assert stats.quantile(0.5) == 3.0
+        assert stats.quantile(0.25) == 2.0
+
+    def test_reservoir_is_bounded(self):
+        stats = RunningStats(track_quantiles=True, reservoir_size=100)
+        for v in range(10_000):
+            stats.add(float(v))
+        assert len(stats._reservoir) == 100
+        assert 2_500 < stats.quantile(0.5) < 7_500
+
+    def test_quantiles_not_tracked_by_default(self):
+        stats = RunningStats()
+        stats.update([1.0, 2.0])
+        assert stats.quantile(0.5) is None
+
 
 # ===========================================================================
 # OutlierHandler
@@ -250,6 +557,61 @@ class TestOutlierHandler:
         result = handler._do_process([block])
         assert len(result) == 1
 
+    def test_batch_block_drops_only_violating_rows(self):
+        handler = OutlierHandler()
+        handler.initialize(
+            outlier_rules={
+                "age": {"min": 0, "max": 120, "action": "drop"},
+                "score": {"min": 0, "max": 100, "action": "clamp"},
+            }
+        )
+        rows = [{"age": 30, "score": 150}, {"age": -1}, {"age": None, "score": -5}]
+        result = handler._do_process([_record(rows, record_count=3)])
+        assert result[0].content == [
+            {"age": 30, "score": 100},
+            {"age": None, "score": 0},
+        ]
+        assert result[0].metadata["record_count"] == 2
+
+    def test_batch_block_dropped_when_empty(self):
+        handler = OutlierHandler()
+        handler.initialize(outlier_rules={"age": {"max": 120}})
+        assert handler._do_process([_record([{"age": 200}, {"age": 300}])]) == []
+
+    def test_zscore_method(self):
+        handler = OutlierHandler()
+        handler.initialize(outlier_rules={"v": {"method": "zscore", "threshold": 3}})
+        rows = [{"v": 10 + i % 3} for i in range(60)] + [{"v": 1000}]
+        result = handler._do_process([_record(rows)])
+        assert len(result[0].content) == 60
+
+    def test_iqr_clamp_method(self):
+        handler = OutlierHandler()
+        handler.initialize(
+            outlier_rules={"v": {"method": "iqr", "k": 1.5, "action": "clamp"}}
+        )
+        rows = [{"v": float(i % 10)} for i in range(40)] + [{"v": 100.0}]
+        result = handler._do_process([_record(rows)])
+        # Q1 = 2, Q3 = 7 -> upper fence 14.5
+        assert result[0].content[-1]["v"] == pytest.approx(14.5)
+
+    def test_method_waits_for_min_samples(self):
+        handler = OutlierHandler()
+        handler.initialize(outlier_rules={"v": {"method": "zscore"}})
+        blocks = [_record({"v": 1}), _record({"v": 1}), _record({"v": 500})]
+        assert len(handler._do_process(blocks)) == 3
+
+    def test_statistics_reset_between_streams(self):
+        handler = OutlierHandler()
+        handler.initialize(outlier_rules={"v": {"method": "zscore"}})
+        list(handler.process_stream(_record({"v": 1}) for _ in range(40)))
+        blocks = [_record({"v": 1}), _record({"v": 500})]
+        assert len(list(handler.process_stream(blocks))) == 2
+
+    def test_unknown_method_raises(self):
+        with pytest.raises(ValueError):
+            OutlierHandler().initialize(outlier_rules={"v": {"method": "mad"}})
+
 
 # ===========================================================================
 # RecursivePruner
@@ -375,3 +737,51 @@ class TestWhiteSpaceProcessor:
         proc.initialize()
         blocks = proc._do_process([_text("invis\u200bible")])
         assert "\u200b" not in blocks[0].content
+
+
+# ===========================================================================
+# Streaming
+# ===========================================================================
+
+
+class TestProcessStream:
+    @pytest.mark.parametrize(
+        "cls",
+        [
+            TextCleaner,
+            PiiMasker,
+            Imputer,
+            OutlierHandler,
+            RecursivePruner,
+            LinkProcessor,
+            WhiteSpaceProcessor,
+        ],
+    )
+    def test_builtin_processors_are_elementwise(self, cls):
+        assert cls.is_elementwise()
+        assert cls.is_streaming()
+
+    def test_deduplicator_streams_without_being_elementwise(self):
+        assert not Deduplicator.is_elementwise()
+        assert Deduplicator.is_streaming()
+
+    def test_stream_is_lazy(self):
+        cleaner = TextCleaner()
+        cleaner.initialize()
+        pulled = []
+
+        def source():
+            for text in ("a  b", "c  d"):
+                pulled.append(text)
+                yield _text(text)
+
+        stream = cleaner.process_stream(source())
+        assert next(stream).content == "a b"
+        assert pulled == ["a  b"]
+
+    def test_stream_drops_blocks_returning_none(self):
+        handler = OutlierHandler()
+        handler.initialize(outlier_rules={"age": {"min": 0, "max": 120}})
+        blocks = [_record({"age": 30}), _record({"age": 999})]
+        result = list(handler.process_stream(blocks))
+        assert [b.content["age"] for b in result] == [30]
@@ -8,6 +8,9 @@ Covers:
 - process() facade
 - ALL processor mode
 - Empty input handling
+- Stage cache short-circuit
+- Component instance cache
+- run_stream() and fused element-wise passes
 """
 
 from __future__ import annotations
@@ -17,6 +20,7 @@ from typing import Any, List
 from unittest.mock import MagicMock, patch
 
 import pytest
+from sayou.core.cache import MemoryCache
 from sayou.core.schemas import SayouBlock
 
 from sayou.refinery.core.exceptions import RefineryError
@@ -61,6 +65,47 @@ class _UpperCaseProcessor(BaseProcessor):
         return blocks
 
 
+class _ExclaimProcessor(BaseProcessor):
+    component_name = "ExclaimProcessor"
+
+    def _process_block(self, block):
+        block.content = f"{block.content}!"
+        return block
+
+
+class _DropShortProcessor(BaseProcessor):
+    component_name = "DropShortProcessor"
+
+    def _process_block(self, block):
+        return block if len(block.content) > 3 else None
+
+
+class _CrashProcessor(BaseProcessor):
+    component_name = "CrashProcessor"
+
+    def _process_block(self, block):
+        raise ValueError("boom")
+
+
+class _StreamCrashProcessor(BaseProcessor):
+    """Reads ahead, marks the first block, drops the second, then fails."""
+
+    component_name = "StreamCrashProcessor"
+
+    def _do_process_stream(self, blocks):
+        first, second, third = next(blocks), next(blocks), next(blocks)
+        first.content = f"{first.content}?"
+        yield first
+        raise RuntimeError("boom")
+
+
+class _ListCrashProcessor(BaseProcessor):
+    component_name = "ListCrashProcessor"
+
+    def _do_process(self, blocks):
+        raise ValueError("boom")
+
+
 class _NullProcessor(BaseProcessor):
     component_name = "NullProcessor"
 
@@ -80,6 +125,7 @@ def _bare_pipeline(**kwargs):
         p = RefineryPipeline.__new__(RefineryPipeline)
         p.normalizer_cls_map = {}
         p.processor_cls_map = {}
+        p._instances = {}
         p._callbacks = []
         p.global_config = {}
         p.logger = logging.getLogger("RefineryPipeline")  # ← 추가
@@ -217,6 +263,237 @@ class TestRefineryPipelineRun:
         assert len(blocks) == 1
 
 
+# ---------------------------------------------------------------------------
+# Stage cache
+# ---------------------------------------------------------------------------
+
+
+class TestRefineryPipelineCache:
+    def _pipeline(self):
+        p = _bare_pipeline()
+        p.normalizer_cls_map = {"TextNormalizer": _TextNormalizer}
+        p.processor_cls_map = {"UpperCaseProcessor": _UpperCaseProcessor}
+        return p
+
+    def test_second_run_served_from_cache(self):
+        cache = MemoryCache()
+        p = self._pipeline()
+
+        first = p.run("hello", processors=["UpperCaseProcessor"], cache=cache)
+        with patch.object(p, "_resolve_normalizer") as resolve:
+            second = p.run("hello", processors=["UpperCaseProcessor"], cache=cache)
+            resolve.assert_not_called()
+
+        assert [b.content for b in second] == [b.content for b in first] == ["HELLO"]
+        assert cache.stats()["hits"] == 1
+
+    def test_config_change_misses(self):
+        cache = MemoryCache()
+        p = self._pipeline()
+        p.run("hello", processors=["UpperCaseProcessor"], cache=cache)
+        blocks = p.run("hello", processors=[], cache=cache)
+        assert blocks[0].content == "hello"
+        assert cache.stats()["hits"] == 0
+
+    def test_file_name_part_of_key(self):
+        class _Named(str):
+            file_name = ""
+
+        cache = MemoryCache()
+        p = self._pipeline()
+        for name in ("a.txt", "b.txt"):
+            data = _Named("hello")
+            data.file_name = name
+            p.run(data, cache=cache, cache_digest="same-bytes")
+        assert cache.stats()["hits"] == 0
+
+
+# ---------------------------------------------------------------------------
+# Component instance cache
+# ---------------------------------------------------------------------------
+
+
+class TestRefineryPipelineInstances:
+    def _pipeline(self):
+        p = _bare_pipeline()
+        p.normalizer_cls_map = {"TextNormalizer": _TextNormalizer}
+        p.processor_cls_map = {"ExclaimProcessor": _ExclaimProcessor}
+        return p
+
+    def test_components_reused_across_runs(self):
+        p = self._pipeline()
+        with patch.object(_ExclaimProcessor, "initialize", autospec=True) as init:
+            p.run("a", processors=["ExclaimProcessor"])
+            p.run("b", processors=["ExclaimProcessor"])
+        assert init.call_count == 1
+        assert len(p._instances) == 2
+
+    def test_config_change_creates_new_instance(self):
+        p = self._pipeline()
+        p.run("a", processors=["ExclaimProcessor"], flag=1)
+        p.run("a", processors=["ExclaimProcessor"], flag=2)
+        assert len(p._instances) == 4
+
+    def test_configs_differing_in_a_set_get_separate_instances(self):
+        from sayou.refinery.processor.pii_masker import PiiMasker
+
+        p = self._pipeline()
+        p.processor_cls_map = {"PiiMasker": PiiMasker}
+        text = "a@b.com 010-1234-5678"
+
+        first = p.run(text, processors=["PiiMasker"], pii_types={"email"})
+        second = p.run(text, processors=["PiiMasker"], pii_types={"phone"})
+        assert first[0].content == "[EMAIL] 010-1234-5678"
+        assert second[0].content == "a@b.com [PHONE]"
+        assert sum(cls is PiiMasker for cls, _ in p._instances) == 2
+
+    def test_unfingerprintable_config_is_not_cached(self):
+        p = self._pipeline()
+        p.run("a", processors=["ExclaimProcessor"], hook=lambda b: b)
+        p.run("a", processors=["ExclaimProcessor"], hook=lambda b: b)
+        assert p._instances == {}
+
+    def test_cached_processor_statistics_do_not_leak_between_runs(self):
+        from sayou.refinery.processor.imputer import Imputer
+
+        p = self._pipeline()
+        p.processor_cls_map = {"Imputer": Imputer}
+        rules = {"imputation_rules": {"x": {"strategy": "mean"}}}
+
+        def _run(values):
+            blocks = [
+                SayouBlock(type="record", content={"x": v}, metadata={}) for v in values
+            ]
+            out = p.run_stream(blocks, processors=["Imputer"], **rules)
+            return [b.content["x"] for b in out]
+
+        assert _run([1000, 1000, None]) == [1000, 1000, 1000.0]
+        assert _run([1, 1, None]) == [1, 1, 1.0]
+        assert len(p._instances) == 1
+
+    def test_new_callbacks_reach_cached_instances(self):
+        p = self._pipeline()
+        p.run("a", processors=["ExclaimProcessor"])
+        cb = MagicMock()
+        p._callbacks = [cb]
+        p.run("a", processors=["ExclaimProcessor"])
+        assert all(cb in inst._callbacks for inst in p._instances.values())
+
+
+# ---------------------------------------------------------------------------
+# run_stream() / fused passes
+# ---------------------------------------------------------------------------
+
+
+class TestRefineryPipelineStream:
+    def _pipeline(self):
+        p = _bare_pipeline()
+        p.normalizer_cls_map = {"TextNormalizer": _TextNormalizer}
+        p.processor_cls_map = {
+            c.component_name: c
+            for c in (
+                _ExclaimProcessor,
+                _DropShortProcessor,
+                _CrashProcessor,
+                _UpperCaseProcessor,
+                _StreamCrashProcessor,
+                _ListCrashProcessor,
+            )
+        }
+        return p
+
+    def test_blocks_pass_through_processors(self):
+        p = self._pipeline()
+        blocks = [SayouBlock(type="text", content=t, metadata={}) for t in "ab"]
+        out = list(p.run_stream(blocks, processors=["ExclaimProcessor"]))
+        assert [b.content for b in out] == ["a!", "b!"]
+
+    def test_raw_items_are_normalized(self):
+        p = self._pipeline()
+        out = list(p.run_stream(["one", "two"], processors=["ExclaimProcessor"]))
+        assert [b.content for b in out] == ["one!", "two!"]
+
+    def test_one_block_in_flight(self):
+        p = self._pipeline()
+        pulled = []
+
+        def source():
+            for i in range(10):
+                pulled.append(i)
+                yield SayouBlock(type="text", content=f"block {i}", metadata={})
+
+        stream = p.run_stream(source(), processors=["ExclaimProcessor"])
+        first = next(stream)
+        assert first.content == "block 0!"
+        assert len(pulled) == p.STREAM_PROBE_SIZE
+
+    def test_fused_group_is_one_stage(self):
+        p = self._pipeline()
+        with patch.object(p, "_fused_pass", wraps=p._fused_pass) as fused:
+            out = p.run(
+                "long text",
+                processors=["ExclaimProcessor", "DropShortProcessor"],
+            )
+        fused.assert_called_once()
+        assert [proc.component_name for proc in fused.call_args.args[1]] == [
+            "ExclaimProcessor",
+            "DropShortProcessor",
+        ]
+        assert out[0].content == "long text!"
+
+    def test_fused_group_drops_blocks(self):
+        p = self._pipeline()
+        out = list(
+            p.run_stream(
+                ["ab", "abcd"], processors=["DropShortProcessor", "ExclaimProcessor"]
+            )
+        )
+        assert [b.content for b in out] == ["abcd!"]
+
+    def test_crashing_processor_skipped_per_block(self):
+        p = self._pipeline()
+        out = list(
+            p.run_stream(["x"], processors=["CrashProcessor", "ExclaimProcessor"])
+        )
+        assert [b.content for b in out] == ["x!"]
+
+    def test_crashing_stream_processor_passes_rest_through(self):
+        p = self._pipeline()
+        names = ["StreamCrashProcessor", "ExclaimProcessor"]
+        out = p.run_stream(list("abcde"), processors=names)
+        assert [b.content for b in out] == ["a?!", "b!", "c!", "d!", "e!"]
+        blocks = p.run("x", processors=["StreamCrashProcessor"])
+        assert [b.content for b in blocks] == ["x"]
+
+    def test_crashing_list_processor_passes_input_through(self):
+        p = self._pipeline()
+        out = p.run_stream(list("ab"), processors=["ListCrashProcessor"])
+        assert [b.content for b in out] == ["a", "b"]
+
+    def test_list_only_processor_between_groups(self):
+        p = self._pipeline()
+        out = list(
+            p.run_stream(
+                ["abcd", "ab"],
+                processors=[
+                    "ExclaimProcessor",
+                    "UpperCaseProcessor",
+                    "DropShortProcessor",
+                ],
+            )
+        )
+        assert [b.content for b in out] == ["ABCD!"]
+
+    def test_empty_stream(self):
+        p = self._pipeline()
+        assert list(p.run_stream(iter([]))) == []
+
+    def test_unroutable_stream_raises(self):
+        p = self._pipeline()
+        with pytest.raises(RefineryError):
+            list(p.run_stream([{"k": "v"}]))
+
+
 # ---------------------------------------------------------------------------
 # process() facade
 # ---------------------------------------------------------------------------
@@ -1,5 +1,18 @@
-from .pipeline import VisualizerPipeline
+from typing import TYPE_CHECKING
+
+from sayou.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .pipeline import VisualizerPipeline
 
 __all__ = [
     "VisualizerPipeline",
 ]
+
+# Sub-modules (and their heavy dependencies) load on first attribute access.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "VisualizerPipeline": ".pipeline",
+    },
+)
@@ -1,5 +1,7 @@
-from pyvis.network import Network
 from sayou.core.base_component import BaseComponent
+from sayou.core.lazy import lazy_from
+
+Network = lazy_from("pyvis.network", "Network")
 
 
 class PyVisRenderer(BaseComponent):
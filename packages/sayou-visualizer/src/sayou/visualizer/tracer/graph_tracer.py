@@ -1,5 +1,7 @@
-import networkx as nx
 from sayou.core.callbacks import BaseCallback
+from sayou.core.lazy import lazy_import
+
+nx = lazy_import("networkx")
 
 
 class GraphTracer(BaseCallback):
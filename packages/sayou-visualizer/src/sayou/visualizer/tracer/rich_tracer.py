@@ -1,9 +1,12 @@
-from rich.console import Console
-from rich.live import Live
-from rich.panel import Panel
-from rich.spinner import Spinner
-from rich.tree import Tree
 from sayou.core.callbacks import BaseCallback
+from sayou.core.lazy import lazy_from
+
+# rich is imported when a tracer is first built, not with the package.
+Console = lazy_from("rich.console", "Console")
+Live = lazy_from("rich.live", "Live")
+Panel = lazy_from("rich.panel", "Panel")
+Spinner = lazy_from("rich.spinner", "Spinner")
+Tree = lazy_from("rich.tree", "Tree")
 
 
 class RichConsoleTracer(BaseCallback):
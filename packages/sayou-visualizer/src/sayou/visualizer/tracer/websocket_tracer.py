@@ -2,8 +2,10 @@ import json
 import queue
 import threading
 
-import websocket
 from sayou.core.callbacks import BaseCallback
+from sayou.core.lazy import lazy_import
+
+websocket = lazy_import("websocket")
 
 
 class WebSocketTracer(BaseCallback):
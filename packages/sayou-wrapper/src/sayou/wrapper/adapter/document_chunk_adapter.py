@@ -46,7 +46,7 @@ class DocumentChunkAdapter(BaseAdapter):
 
         return 0.0
 
-    def _do_adapt(self, input_data: Union[List[Any], Any]) -> SayouOutput:
+    def _do_adapt(self, input_data: Union[List[Any], Any], **kwargs) -> SayouOutput:
         """
         Convert chunks into a list of SayouNodes.
 
@@ -1,5 +1,5 @@
 import random
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 from sayou.core.registry import register_component
 from sayou.core.schemas import SayouNode, SayouOutput
@@ -47,11 +47,18 @@ class EmbeddingAdapter(BaseAdapter):
             External client with ``embed_documents()`` or OpenAI-compatible API.
         embedding_fn : Callable[[List[str]], List[List[float]]]
             Custom embedding function; takes priority over ``client``.
+        cache : sayou.core.cache.BaseCache
+            Optional stage cache.  Vectors are stored per text (keyed by the
+            provider / model / dimension and the qualified name of the
+            ``embedding_fn`` or ``client`` class), so only unseen texts are
+            sent to the embedding backend.  Lambdas and nested functions
+            have no stable name and are never cached.
         """
         provider = kwargs.get("provider", "external")
         dimension = int(kwargs.get("dimension", 1536))
         external_client = kwargs.get("client")
         embedding_fn: Callable = kwargs.get("embedding_fn")
+        cache = kwargs.get("cache")
 
         nodes: List[SayouNode] = []
         texts_to_embed: List[str] = []
@@ -74,14 +81,42 @@ class EmbeddingAdapter(BaseAdapter):
                 texts_to_embed.append(content.replace("\n", " "))
                 mapping_indices.append(i)
 
-        vectors: List[List[float]] = []
-        if texts_to_embed:
+        # Stub vectors are random, so only real providers are cached.
+        if callable(embedding_fn):
+            backend = self._backend_name(embedding_fn)
+        elif external_client is not None:
+            backend = self._backend_name(type(external_client))
+        else:
+            backend = None
+        use_cache = cache is not None and provider == "external" and bool(backend)
+        cache_cfg = {
+            "provider": provider,
+            "model": kwargs.get("model"),
+            "dimension": dimension,
+            "backend": backend,
+        }
+
+        vectors: List[Any] = [None] * len(texts_to_embed)
+        pending: List[int] = []
+        cache_keys: List[str] = []
+        if use_cache:
+            for j, text in enumerate(texts_to_embed):
+                key = cache.key(self.component_name, text, cache_cfg)
+                cache_keys.append(key)
+                vectors[j] = cache.get(key, component=self.component_name)
+                if vectors[j] is None:
+                    pending.append(j)
+        else:
+            pending = list(range(len(texts_to_embed)))
+
+        if pending:
+            pending_texts = [texts_to_embed[j] for j in pending]
             if provider == "external":
                 if embedding_fn and callable(embedding_fn):
-                    vectors = embedding_fn(texts_to_embed)
+                    fresh = embedding_fn(pending_texts)
                 elif external_client:
-                    vectors = self._embed_via_client(
-                        external_client, texts_to_embed, **kwargs
+                    fresh = self._embed_via_client(
+                        external_client, pending_texts, **kwargs
                     )
                 else:
                     raise ValueError(
@@ -93,14 +128,35 @@ class EmbeddingAdapter(BaseAdapter):
                     f"Unknown provider '{provider}', falling back to stub.",
                     level="warning",
                 )
-                vectors = self._embed_stub(texts_to_embed, dimension)
+                fresh = self._embed_stub(pending_texts, dimension)
+
+            for j, vector in zip(pending, fresh):
+                vectors[j] = vector
+                if use_cache:
+                    cache.set(cache_keys[j], vector)
 
         for idx, vector in zip(mapping_indices, vectors):
+            if vector is None:
+                continue
             nodes[idx].attributes["vector"] = vector
             nodes[idx].attributes["vector_dim"] = len(vector)
 
         return SayouOutput(nodes=nodes)
 
+    @staticmethod
+    def _backend_name(backend: Any) -> Optional[str]:
+        """
+        ``module.qualname`` of a function or class, for cache keys.
+
+        Returns None for lambdas, nested functions and objects without a
+        qualified name (e.g. ``functools.partial``): their names do not
+        tell two implementations apart.
+        """
+        qualname = getattr(backend, "__qualname__", None)
+        if not isinstance(qualname, str) or "<" in qualname:
+            return None
+        return f"{getattr(backend, '__module__', None)}.{qualname}"
+
     def _embed_stub(self, texts: List[str], dimension: int) -> List[List[float]]:
         """Generate random unit vectors for testing (no external dependencies)."""
         self._log(f"[Stub] Generated {len(texts)} random vector(s) (dim={dimension}).")
@@ -187,7 +187,19 @@ if "sayou.core" not in sys.modules:
     _reg.register_component = register_component
     sys.modules["sayou.core.registry"] = _reg
 
+    # lazy.py has no dependencies: load the real module instead of a stub.
+    _lazy_path = next(
+        _src / "sayou" / "core" / "lazy.py"
+        for _src in _src_dirs
+        if (_src / "sayou" / "core" / "lazy.py").is_file()
+    )
+    _lazy_spec = importlib.util.spec_from_file_location("sayou.core.lazy", _lazy_path)
+    _lazy = importlib.util.module_from_spec(_lazy_spec)
+    _lazy_spec.loader.exec_module(_lazy)
+    sys.modules["sayou.core.lazy"] = _lazy
+
     _core = types.ModuleType("sayou.core")
+    _core.lazy = _lazy
     _core.exceptions = _exc
     _core.schemas = _schemas
     _core.base_component = _bc
@@ -8,6 +8,27 @@ from sayou.core.schemas import SayouOutput
 from sayou.wrapper.plugins.embedding_adapter import EmbeddingAdapter
 
 
+def _ones(texts):
+    return [[1.0] * 4 for _ in texts]
+
+
+def _twos(texts):
+    return [[2.0] * 4 for _ in texts]
+
+
+class _DictCache(dict):
+    """Minimal stand-in for sayou.core.cache.BaseCache."""
+
+    def key(self, component, content, config):
+        return repr((component, content, sorted(config.items())))
+
+    def get(self, key, component="", default=None):
+        return super().get(key, default)
+
+    def set(self, key, value):
+        self[key] = value
+
+
 def _items(*contents):
     return [
         {"content": c, "metadata": {"chunk_id": f"c{i}"}}
@@ -71,6 +92,21 @@ class TestDoAdapt:
         output = self.adapter._do_adapt(items, provider="stub", dimension=4)
         assert output.nodes[0].node_id == "myid"
 
+    def test_cache_keyed_by_embedding_fn(self):
+        cache = _DictCache()
+        items = _items("same text")
+        first = self.adapter._do_adapt(items, embedding_fn=_ones, cache=cache)
+        second = self.adapter._do_adapt(items, embedding_fn=_twos, cache=cache)
+        assert first.nodes[0].attributes["vector"] == [1.0] * 4
+        assert second.nodes[0].attributes["vector"] == [2.0] * 4
+        assert len(cache) == 2
+
+    def test_lambda_embedding_fn_not_cached(self):
+        cache = _DictCache()
+        fn = lambda texts: [[0.5] * 4 for _ in texts]  # noqa: E731
+        self.adapter._do_adapt(_items("x"), embedding_fn=fn, cache=cache)
+        assert len(cache) == 0
+
     def test_unknown_provider_falls_back_to_stub(self):
         items = _items("x")
         # Should not raise; falls back with a warning log